@@ -9,39 +9,80 @@ Overview: Initializes the CLI application package, defines version number using
     class for library usage, configuration utilities, and direct linter imports for advanced usage.
     Includes nesting depth linter and SRP linter exports for convenient access to code analysis.
     Version is dynamically loaded from package metadata (pyproject.toml) using importlib.metadata.
+    Every name except cli is resolved on first access (PEP 562), so importing the package (which
+    every CLI invocation and pre-commit hook does) does not import the API, the linters, or
+    importlib.metadata. cli is bound eagerly because the src.cli subpackage would otherwise
+    shadow it as a package attribute.
 
-Dependencies: importlib.metadata for dynamic version loading from installed package metadata
+Dependencies: importlib for lazy exports, importlib.metadata for dynamic version loading from
+    installed package metadata
 
 Exports: __version__, Linter (high-level API), cli (CLI entry point), load_config, save_config,
     ConfigError, Orchestrator (advanced usage), file_placement_lint, nesting_lint, NestingDepthRule,
     srp_lint, SRPRule
 
 Interfaces: Package version string, Linter class API, CLI command group, configuration functions
+
+Implementation: Module-level __getattr__ resolving exports from a name -> (module, attribute) table,
+    and computed values such as __version__ from a name -> loader table
 """
 
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+# CLI interface
+from src.cli import cli
+
+# Resolved from package metadata on first access (see __getattr__)
 __version__: str
-try:
-    from importlib.metadata import version
 
-    __version__ = version("thailint")
-except Exception:
-    # Fallback for development when package is not installed
-    __version__ = "dev"
+# Lazily resolved exports: name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    # High-level Library API (primary interface)
+    "Linter": ("src.api", "Linter"),
+    "load_config": ("src.config", "load_config"),
+    "save_config": ("src.config", "save_config"),
+    "ConfigError": ("src.config", "ConfigError"),
+    # Advanced/direct imports (backwards compatibility)
+    "Orchestrator": ("src.orchestrator.core", "Orchestrator"),
+    "file_placement_lint": ("src.linters.file_placement", "lint"),
+    "nesting_lint": ("src.linters.nesting", "lint"),
+    "NestingDepthRule": ("src.linters.nesting", "NestingDepthRule"),
+    "srp_lint": ("src.linters.srp", "lint"),
+    "SRPRule": ("src.linters.srp", "SRPRule"),
+}
 
-# High-level Library API (primary interface)
-from src.api import Linter
 
-# CLI interface
-from src.cli import cli
-from src.config import ConfigError, load_config, save_config
-
-# Advanced/direct imports (backwards compatibility)
-from src.linters.file_placement import lint as file_placement_lint
-from src.linters.nesting import NestingDepthRule
-from src.linters.nesting import lint as nesting_lint
-from src.linters.srp import SRPRule
-from src.linters.srp import lint as srp_lint
-from src.orchestrator.core import Orchestrator
+def _load_version() -> str:
+    """Read the installed package version."""
+    try:
+        from importlib.metadata import version
+
+        return version("thailint")
+    except Exception:
+        # Fallback for development when package is not installed
+        return "dev"
+
+
+# Lazily computed values: name -> zero-argument loader
+_LAZY_VALUES: dict[str, Callable[[], Any]] = {"__version__": _load_version}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a lazy export on first access and cache it on the module."""
+    loader = _LAZY_VALUES.get(name)
+    target = _LAZY_EXPORTS.get(name)
+    if loader is not None:
+        value = loader()
+    elif target is not None:
+        module_name, attribute = target
+        value = getattr(importlib.import_module(module_name), attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "__version__",
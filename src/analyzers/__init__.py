@@ -11,14 +11,15 @@ Overview: Package containing base analyzer classes for different programming lan
 
 Dependencies: tree-sitter, language-specific tree-sitter bindings, ast module
 
-Exports: TypeScriptBaseAnalyzer, build_parent_map
+Exports: TypeScriptBaseAnalyzer, AstIndex, get_ast_index, build_parent_map
 
 Interfaces: Base analyzer classes with parse(), walk_tree(), and extract() methods
 
 Implementation: Composition-based design for linter analyzers to use base utilities
 """
 
+from .ast_index import AstIndex, get_ast_index
 from .ast_utils import build_parent_map
 from .typescript_base import TypeScriptBaseAnalyzer
 
-__all__ = ["TypeScriptBaseAnalyzer", "build_parent_map"]
+__all__ = ["TypeScriptBaseAnalyzer", "AstIndex", "build_parent_map", "get_ast_index"]
@@ -0,0 +1,292 @@
+"""
+Purpose: Per-file index of a Python AST built by a single traversal and shared by every analyzer
+
+Scope: Node-type buckets, parent links, subtree ranges and enclosing scopes for one module AST
+
+Overview: Python analyzers used to run their own ast.walk over the whole module, or over each
+    function or statement body, once per question they asked, so a large generated module paid
+    dozens of full traversals per file. AstIndex walks the tree once, iteratively, numbering
+    nodes in pre-order. It buckets the node positions by node type and records each node's parent,
+    the end of its subtree, and its innermost enclosing function, class and loop. Queries then
+    answer from the buckets: nodes(ast.Call) lists every call in source order, and
+    nodes(ast.Call, within=func) lists the calls inside one function by bisecting the bucket to
+    the function's subtree range instead of walking it (within may also be a statement body,
+    whose consecutive sibling subtrees form one contiguous range). Type queries follow isinstance semantics,
+    so abstract bases such as ast.stmt match every concrete statement type. get_ast_index(tree)
+    memoizes the index by tree identity (the same small in-flight memo PythonSource uses), so every
+    analyzer handed the same parsed module shares one index; PythonSource.index exposes it for a
+    lint context.
+
+Dependencies: ast, bisect, heapq, collections.OrderedDict, collections.abc
+
+Exports: AstIndex, Scope, NodeT, Within, build_ast_index, get_ast_index, clear_ast_index_cache
+
+Interfaces: get_ast_index(tree) -> AstIndex, AstIndex.nodes(node_type, within=None),
+    AstIndex.walk(within=None), AstIndex.parent(node), AstIndex.ancestor(node, node_type),
+    AstIndex.parent_map,
+    AstIndex.enclosing_function(node) / enclosing_class(node) / enclosing_loop(node)
+
+Implementation: Explicit-stack pre-order DFS; buckets hold sorted pre-order positions so subtree
+    queries are two bisects; multi-type queries merge buckets by position
+"""
+
+import ast
+import bisect
+import heapq
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple, TypeVar, cast
+
+NodeT = TypeVar("NodeT", bound=ast.AST)
+
+_FUNCTION_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+_LOOP_TYPES = (ast.For, ast.AsyncFor, ast.While)
+
+# Number of trees kept in the identity memo. Files are linted one at a time per process, so a
+# handful of entries covers the module in flight (mirrors python_source._MEMO_SIZE).
+_MEMO_SIZE = 4
+
+
+class Scope(NamedTuple):
+    """Innermost enclosing function, class and loop of a node (None where there is none).
+
+    The loop is the innermost For/AsyncFor/While within the same function or class body; a
+    nested def, lambda or class starts a fresh loop scope.
+    """
+
+    function: ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda | None
+    class_: ast.ClassDef | None
+    loop: ast.For | ast.AsyncFor | ast.While | None
+
+
+_MODULE_SCOPE = Scope(None, None, None)
+
+# Subtree restriction for queries: one node, a statement body, or None for the whole tree
+Within = ast.AST | Sequence[ast.AST] | None
+
+
+class AstIndex:
+    """Node-type index of one module AST, built by a single traversal."""
+
+    def __init__(self, tree: ast.AST) -> None:
+        """Index the tree.
+
+        Args:
+            tree: Root node (normally the parsed ast.Module)
+        """
+        self.tree = tree
+        self._order: list[ast.AST] = []
+        # Pre-order position range [start, stop) of each node's subtree
+        self._spans: dict[ast.AST, tuple[int, int]] = {}
+        self._parents: dict[ast.AST, ast.AST] = {}
+        self._scopes: dict[ast.AST, Scope] = {}
+        self._buckets: dict[type, list[int]] = {}
+        self._matching_buckets: dict[type | tuple[type, ...], list[list[int]]] = {}
+        self._traverse(tree)
+
+    def _record(self, node: ast.AST, scope: Scope) -> int:
+        """Assign the next pre-order position to a node and return it."""
+        position = len(self._order)
+        self._order.append(node)
+        self._scopes[node] = scope
+        self._buckets.setdefault(type(node), []).append(position)
+        return position
+
+    def _traverse(self, tree: ast.AST) -> None:
+        """Walk the tree once with an explicit stack (no recursion limit on deep trees)."""
+        start = self._record(tree, _MODULE_SCOPE)
+        stack = [(tree, start, ast.iter_child_nodes(tree), _inner_scope(tree, _MODULE_SCOPE))]
+        while stack:
+            node, start, children, child_scope = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                self._spans[node] = (start, len(self._order))
+                continue
+            self._parents[child] = node
+            child_start = self._record(child, child_scope)
+            child_entry = (child, child_start, ast.iter_child_nodes(child))
+            stack.append((*child_entry, _inner_scope(child, child_scope)))
+
+    def nodes(
+        self, node_type: type[NodeT] | tuple[type[NodeT], ...], within: Within = None
+    ) -> list[NodeT]:
+        """Get indexed nodes matching a type, in source (pre-order) order.
+
+        Args:
+            node_type: Node class or tuple of classes, matched like isinstance
+            within: Restrict to one node's subtree (the node itself included) or to a statement
+                body (consecutive siblings); nodes from outside this tree are indexed on their own
+
+        Returns:
+            Matching nodes
+        """
+        roots = _as_roots(within)
+        if not self._contains(roots):
+            return _detached_nodes(roots, node_type)
+        order = self._order
+        return [cast(NodeT, order[position]) for position in self._positions(node_type, roots)]
+
+    def walk(self, within: Within = None) -> list[ast.AST]:
+        """Get every node of the tree, of one subtree or of a statement body, in pre-order.
+
+        Args:
+            within: Subtree root (included), statement body, or None for the whole tree
+
+        Returns:
+            Nodes in the subtree
+        """
+        roots = _as_roots(within)
+        if not self._contains(roots):
+            return _detached_nodes(roots, ast.AST)
+        start, stop = self._span(roots)
+        return self._order[start:stop]
+
+    def parent(self, node: ast.AST) -> ast.AST | None:
+        """Get the parent of a node, or None for the root.
+
+        CPython shares one instance of each context and operator node (ast.Load, ast.Add, ...)
+        across the tree, so for those the last occurrence wins, as with a plain parent map.
+        """
+        return self._parents.get(node)
+
+    def ancestor(
+        self, node: ast.AST, node_type: type[NodeT] | tuple[type[NodeT], ...]
+    ) -> NodeT | None:
+        """Get a node's nearest proper ancestor matching a type (None if there is none).
+
+        Args:
+            node: Starting node (not itself considered)
+            node_type: Node class or tuple of classes, matched like isinstance
+
+        Returns:
+            Nearest matching ancestor
+        """
+        parent = self._parents.get(node)
+        while parent is not None and not isinstance(parent, node_type):
+            parent = self._parents.get(parent)
+        return parent
+
+    @property
+    def parent_map(self) -> dict[ast.AST, ast.AST]:
+        """Node-to-parent map for the whole tree (shared; do not mutate)."""
+        return self._parents
+
+    def scope(self, node: ast.AST) -> Scope:
+        """Get a node's innermost enclosing function, class and loop."""
+        return self._scopes.get(node, _MODULE_SCOPE)
+
+    def enclosing_function(
+        self, node: ast.AST
+    ) -> ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda | None:
+        """Get the innermost function or lambda whose subtree strictly contains the node."""
+        return self.scope(node).function
+
+    def enclosing_class(self, node: ast.AST) -> ast.ClassDef | None:
+        """Get the innermost class whose subtree strictly contains the node."""
+        return self.scope(node).class_
+
+    def enclosing_loop(self, node: ast.AST) -> ast.For | ast.AsyncFor | ast.While | None:
+        """Get the innermost loop containing the node without crossing a def or class."""
+        return self.scope(node).loop
+
+    def _positions(
+        self, node_type: type | tuple[type, ...], roots: Sequence[ast.AST] | None
+    ) -> Iterable[int]:
+        """Sorted positions of matching nodes inside the roots' span (one bisect pair per type)."""
+        start, stop = self._span(roots)
+        ranges = [
+            bucket[bisect.bisect_left(bucket, start) : bisect.bisect_left(bucket, stop)]
+            for bucket in self._buckets_for(node_type)
+        ]
+        return ranges[0] if len(ranges) == 1 else heapq.merge(*ranges)
+
+    def _contains(self, roots: Sequence[ast.AST] | None) -> bool:
+        """Check whether a query's subtree roots belong to this tree (None and [] always do)."""
+        return not roots or roots[0] in self._spans
+
+    def _span(self, roots: Sequence[ast.AST] | None) -> tuple[int, int]:
+        """Pre-order position range [start, stop) covering sibling subtrees (all for None)."""
+        if roots is None:
+            return 0, len(self._order)
+        if not roots:
+            return 0, 0
+        return self._spans[roots[0]][0], self._spans[roots[-1]][1]
+
+    def _buckets_for(self, node_type: type | tuple[type, ...]) -> list[list[int]]:
+        """Position buckets of every node class in the tree matching node_type (memoized)."""
+        buckets = self._matching_buckets.get(node_type)
+        if buckets is None:
+            buckets = [
+                bucket for key, bucket in self._buckets.items() if issubclass(key, node_type)
+            ] or [[]]
+            self._matching_buckets[node_type] = buckets
+        return buckets
+
+
+def _as_roots(within: Within) -> Sequence[ast.AST] | None:
+    """Normalize a within argument to a run of sibling subtree roots (None for the whole tree)."""
+    if within is None or isinstance(within, Sequence):
+        return within
+    return (within,)
+
+
+def _detached_nodes(
+    roots: Sequence[ast.AST] | None, node_type: type[NodeT] | tuple[type[NodeT], ...]
+) -> list[NodeT]:
+    """Query subtrees that are not part of the asking index through their own indexes."""
+    return [node for root in roots or () for node in get_ast_index(root).nodes(node_type)]
+
+
+def _inner_scope(node: ast.AST, scope: Scope) -> Scope:
+    """Scope of a node's children, given the node and its own scope."""
+    if isinstance(node, _FUNCTION_TYPES):
+        return Scope(node, scope.class_, None)
+    if isinstance(node, ast.ClassDef):
+        return Scope(scope.function, node, None)
+    if isinstance(node, _LOOP_TYPES):
+        return Scope(scope.function, scope.class_, node)
+    return scope
+
+
+def build_ast_index(tree: ast.AST) -> AstIndex:
+    """Build a fresh index for a tree (prefer get_ast_index to share one).
+
+    Args:
+        tree: Root node
+
+    Returns:
+        New AstIndex
+    """
+    return AstIndex(tree)
+
+
+_MEMO: OrderedDict[int, AstIndex] = OrderedDict()
+
+
+def get_ast_index(tree: ast.AST) -> AstIndex:
+    """Get the shared index for a tree, building it on first use.
+
+    Keyed by identity: every analyzer given the same parsed tree gets the same index. The memo
+    holds a reference to each tree, so an id is never reused while its entry is alive.
+
+    Args:
+        tree: Root node (normally the module from PythonSource.tree)
+
+    Returns:
+        AstIndex for the tree
+    """
+    index = _MEMO.get(id(tree))
+    if index is not None and index.tree is tree:
+        _MEMO.move_to_end(id(tree))
+        return index
+    index = AstIndex(tree)
+    _MEMO[id(tree)] = index
+    if len(_MEMO) > _MEMO_SIZE:
+        _MEMO.popitem(last=False)
+    return index
+
+
+def clear_ast_index_cache() -> None:
+    """Clear the shared index memo (for test isolation)."""
+    _MEMO.clear()
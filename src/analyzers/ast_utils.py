@@ -6,19 +6,22 @@ Scope: Shared AST traversal utilities for Python code analysis
 Overview: Provides common AST utility functions used across multiple Python linters.
     Centralizes shared patterns like parent map building to eliminate code duplication.
     The build_parent_map function creates a dictionary mapping AST nodes to their parents,
-    enabling upward tree traversal for context detection.
+    enabling upward tree traversal for context detection. The map comes from the shared
+    per-tree AstIndex, so it costs no traversal when the tree is already indexed.
 
-Dependencies: ast module for AST node types
+Dependencies: ast module for AST node types, analyzers.ast_index
 
 Exports: build_parent_map
 
 Interfaces: build_parent_map(tree: ast.AST) -> dict[ast.AST, ast.AST]
 
-Implementation: Recursive AST traversal with parent tracking
+Implementation: Delegates to the memoized single-traversal AstIndex
 """
 
 import ast
 
+from src.analyzers.ast_index import get_ast_index
+
 
 def build_parent_map(tree: ast.AST) -> dict[ast.AST, ast.AST]:
     """Build a map of AST nodes to their parent nodes.
@@ -30,25 +33,7 @@ def build_parent_map(tree: ast.AST) -> dict[ast.AST, ast.AST]:
         tree: Root AST node to build map from
 
     Returns:
-        Dictionary mapping each node to its parent node
+        Dictionary mapping each node to its parent node (shared with the tree's index; do not
+        mutate)
     """
-    parent_map: dict[ast.AST, ast.AST] = {}
-    _build_parent_map_recursive(tree, None, parent_map)
-    return parent_map
-
-
-def _build_parent_map_recursive(
-    node: ast.AST, parent: ast.AST | None, parent_map: dict[ast.AST, ast.AST]
-) -> None:
-    """Recursively build parent map.
-
-    Args:
-        node: Current AST node
-        parent: Parent of current node
-        parent_map: Dictionary to populate
-    """
-    if parent is not None:
-        parent_map[node] = parent
-
-    for child in ast.iter_child_nodes(node):
-        _build_parent_map_recursive(child, node, parent_map)
+    return get_ast_index(tree).parent_map
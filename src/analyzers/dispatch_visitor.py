@@ -0,0 +1,104 @@
+"""
+Purpose: Dispatch-table visitor that runs many node detectors during one pass over a Python AST
+
+Scope: Handler registration by node type and single-pass dispatch for multi-detector linters
+
+Overview: Linters built from several independent detectors (lbyl's eight pattern detectors,
+    collection_pipeline's loop checks) used to subclass ast.NodeVisitor once per detector, so
+    every detector paid its own full traversal of the module. DispatchVisitor inverts that:
+    detectors register interest in node types (ast.If, ast.Compare, ast.Call, ...) with
+    register(node_type, handler), and visit(tree) runs all of them in a single pass. The pass
+    reads the tree's shared AstIndex, merging only the buckets of registered node types in
+    source order, so nodes no detector cares about are never touched. Handlers for a node run
+    in registration order; a handler registered for an abstract base such as ast.stmt receives
+    every concrete subclass. Detectors needing context (the enclosing function, the parent)
+    ask the same index instead of tracking a stack.
+
+Dependencies: ast, collections.abc.Callable, typing, src.analyzers.ast_index
+
+Exports: DispatchVisitor, NodeDetector, NodeHandler, run_detectors
+
+Interfaces: DispatchVisitor.register(node_type, handler), DispatchVisitor.visit(tree, index=None),
+    NodeDetector.register(visitor), run_detectors(tree, detectors, index=None)
+
+Implementation: Type-keyed handler table with a per-concrete-class resolution memo; the traversal
+    itself is AstIndex.nodes over the registered types
+"""
+
+import ast
+from collections.abc import Callable, Iterable
+from typing import Any, Protocol
+
+from src.analyzers.ast_index import AstIndex, get_ast_index
+
+# A handler receives one node of the type it was registered for
+NodeHandler = Callable[[Any], None]
+
+
+class NodeDetector(Protocol):
+    """A detector that registers its node handlers with a DispatchVisitor."""
+
+    def register(self, visitor: "DispatchVisitor") -> None:
+        """Register this detector's handlers."""
+
+
+class DispatchVisitor:
+    """Runs every registered node handler during a single pass over a tree."""
+
+    def __init__(self) -> None:
+        """Initialize an empty dispatch table."""
+        self._handlers: dict[type[ast.AST], list[NodeHandler]] = {}
+        self._resolved: dict[type[ast.AST], tuple[NodeHandler, ...]] = {}
+
+    def register(self, node_type: type[ast.AST], handler: NodeHandler) -> None:
+        """Register a handler for every node of a type (isinstance semantics).
+
+        Args:
+            node_type: Node class the handler is interested in
+            handler: Called with each matching node, in source order
+        """
+        self._handlers.setdefault(node_type, []).append(handler)
+        self._resolved.clear()
+
+    def visit(self, tree: ast.AST, index: AstIndex | None = None) -> None:
+        """Dispatch every node of interest in the tree to its handlers.
+
+        Args:
+            tree: Tree (or subtree of an indexed tree) to visit
+            index: Index containing the tree; the tree's shared index if omitted
+        """
+        if not self._handlers:
+            return
+        index = index if index is not None else get_ast_index(tree)
+        for node in index.nodes(tuple(self._handlers), within=tree):
+            for handler in self._handlers_for(type(node)):
+                handler(node)
+
+    def _handlers_for(self, node_class: type[ast.AST]) -> tuple[NodeHandler, ...]:
+        """Handlers registered for a concrete node class or any of its bases (memoized)."""
+        handlers = self._resolved.get(node_class)
+        if handlers is None:
+            handlers = tuple(
+                handler
+                for node_type, registered in self._handlers.items()
+                if issubclass(node_class, node_type)
+                for handler in registered
+            )
+            self._resolved[node_class] = handlers
+        return handlers
+
+
+def run_detectors(
+    tree: ast.AST, detectors: Iterable[NodeDetector], index: AstIndex | None = None
+) -> None:
+    """Run several detectors over a tree in one pass.
+
+    Args:
+        tree: Tree to visit
+        detectors: Detectors whose handlers should see the tree
+        index: Index containing the tree; the tree's shared index if omitted
+    """
+    visitor = DispatchVisitor()
+    for detector in detectors:
+        detector.register(visitor)
+    visitor.visit(tree, index)
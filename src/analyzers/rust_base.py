@@ -4,44 +4,98 @@ Purpose: Base class for Rust AST analysis with tree-sitter parsing
 Scope: Common tree-sitter initialization, parsing, and traversal utilities for Rust
 
 Overview: Provides shared infrastructure for Rust code analysis using tree-sitter parser.
-    Implements common tree-sitter initialization with language setup and parser configuration.
-    Provides reusable parsing methods that convert Rust source to AST nodes. Includes
-    shared traversal utilities for walking AST trees recursively and finding nodes by type.
+    Implements common tree-sitter initialization with language setup and parser configuration;
+    the Rust grammar is imported and the parser built only when the first file is parsed,
+    so importing a linter that supports Rust costs nothing for runs without Rust files.
+    Provides reusable parsing methods that convert Rust source to AST nodes, sharing one
+    memoized Tree per source (see tree_sitter_source) across every analyzer. Includes
+    shared lookups finding nodes by type, one or several types per pass, through compiled
+    tree-sitter queries (see tree_sitter_query) instead of a recursive Python walk.
     Delegates context-specific detection (test functions, async functions) to rust_context
     module. Serves as foundation for specialized Rust analyzers (unwrap abuse, clone abuse).
 
-Dependencies: tree-sitter, tree-sitter-rust (optional), src.analyzers.rust_context
+Dependencies: tree-sitter, tree-sitter-rust (optional), src.analyzers.rust_context,
+    src.analyzers.tree_sitter_source
 
-Exports: RustBaseAnalyzer class with parsing and traversal utilities,
+Exports: RustBaseAnalyzer class with parsing and traversal utilities, get_rust_source,
     TREE_SITTER_RUST_AVAILABLE constant for runtime detection
 
-Interfaces: parse_rust(code), walk_tree(node, node_type), extract_node_text(node),
+Interfaces: parse_rust(code), walk_tree(node, node_type),
+    walk_tree_by_types(node, node_types), extract_node_text(node),
     is_inside_test(node), is_async_function(node)
 
-Implementation: Tree-sitter parser singleton, recursive AST traversal, composition pattern
-    with rust_context helpers
+Implementation: Tree-sitter parser singleton built on first use, query-based node lookup,
+    composition pattern with rust_context helpers
 
 Suppressions:
-    - type:ignore[assignment]: Tree-sitter RUST_PARSER fallback when import fails
     - type:ignore[assignment,misc]: Tree-sitter Node type alias (optional dependency fallback)
 """
 
+import importlib.util
+from collections.abc import Iterable
 from typing import Any
 
 from src.analyzers import rust_context
+from src.analyzers.tree_sitter_query import find_nodes, find_nodes_by_type
+from src.analyzers.tree_sitter_source import TreeSitterSource, get_tree_sitter_source
 
 try:
-    import tree_sitter_rust as tsrust
     from tree_sitter import Language, Node, Parser
 
-    RUST_LANGUAGE = Language(tsrust.language())
-    RUST_PARSER = Parser(RUST_LANGUAGE)
-    TREE_SITTER_RUST_AVAILABLE = True
+    TREE_SITTER_RUST_AVAILABLE = importlib.util.find_spec("tree_sitter_rust") is not None
 except ImportError:
     TREE_SITTER_RUST_AVAILABLE = False
-    RUST_PARSER = None  # type: ignore[assignment]
     Node = Any  # type: ignore[assignment,misc]
 
+# Built by _load_grammar on first use; loading the grammar is the slow part of importing
+RUST_LANGUAGE: "Language"
+RUST_PARSER: "Parser"
+
+
+def _load_grammar() -> None:
+    """Import the Rust grammar and build the shared language and parser."""
+    global RUST_LANGUAGE, RUST_PARSER
+    import tree_sitter_rust as tsrust
+
+    RUST_LANGUAGE = Language(tsrust.language())
+    RUST_PARSER = Parser(RUST_LANGUAGE)
+
+
+def _language() -> "Language":
+    """The Rust Language, loading the grammar on first use."""
+    if "RUST_LANGUAGE" not in globals():
+        _load_grammar()
+    return RUST_LANGUAGE
+
+
+def _parser() -> "Parser":
+    """The shared Rust Parser, loading the grammar on first use."""
+    if "RUST_PARSER" not in globals():
+        _load_grammar()
+    return RUST_PARSER
+
+
+def __getattr__(name: str) -> Any:
+    """Load the grammar when RUST_LANGUAGE or RUST_PARSER is first read from outside the module."""
+    if name in ("RUST_LANGUAGE", "RUST_PARSER") and TREE_SITTER_RUST_AVAILABLE:
+        _load_grammar()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_rust_source(code: str) -> TreeSitterSource | None:
+    """Get the shared, lazily parsed Rust source for code.
+
+    Args:
+        code: Rust source code
+
+    Returns:
+        TreeSitterSource shared across analyzers, or None if tree-sitter-rust is unavailable
+    """
+    if not TREE_SITTER_RUST_AVAILABLE:
+        return None
+    return get_tree_sitter_source(code, _parser())
+
 
 class RustBaseAnalyzer:
     """Base analyzer for Rust code using tree-sitter."""
@@ -59,44 +113,38 @@ class RustBaseAnalyzer:
         Returns:
             Tree-sitter AST root node, or None if parsing fails or tree-sitter unavailable
         """
-        if not TREE_SITTER_RUST_AVAILABLE or RUST_PARSER is None:
-            return None
-
-        tree = RUST_PARSER.parse(bytes(code, "utf8"))
-        return tree.root_node
+        source = get_rust_source(code)
+        return source.root_node if source is not None else None
 
-    def walk_tree(self, node: Node, node_type: str) -> list[Node]:
-        """Find all nodes of a specific type in the AST.
-
-        Recursively walks the tree and collects all nodes matching the given type.
+    def walk_tree(self, node: Node, node_type: str | tuple[str, ...]) -> list[Node]:
+        """Find all nodes of a specific type (or of any of several types) in the AST.
 
         Args:
-            node: Root tree-sitter node to search from
-            node_type: Tree-sitter node type to find (e.g., "function_item")
+            node: Root tree-sitter node to search from (included if it matches)
+            node_type: Tree-sitter node type to find (e.g., "function_item"), or a tuple of types
 
         Returns:
-            List of all matching nodes
+            List of all matching nodes, in source order
         """
         if not TREE_SITTER_RUST_AVAILABLE or node is None:
             return []
+        types = (node_type,) if isinstance(node_type, str) else node_type
+        return find_nodes(_language(), node, types)
 
-        nodes: list[Node] = []
-        self._walk_tree_recursive(node, node_type, nodes)
-        return nodes
-
-    def _walk_tree_recursive(self, node: Node, node_type: str, nodes: list[Node]) -> None:
-        """Recursively walk tree to find nodes of specific type.
+    def walk_tree_by_types(self, node: Node, node_types: Iterable[str]) -> dict[str, list[Node]]:
+        """Find all nodes of several types in one pass over the AST.
 
         Args:
-            node: Current tree-sitter node
-            node_type: Node type to find
-            nodes: List to accumulate matching nodes
-        """
-        if node.type == node_type:
-            nodes.append(node)
+            node: Root tree-sitter node to search from
+            node_types: Tree-sitter node types to find
 
-        for child in node.children:
-            self._walk_tree_recursive(child, node_type, nodes)
+        Returns:
+            Matching nodes grouped by type, each list in source order
+        """
+        types = list(node_types)
+        if not TREE_SITTER_RUST_AVAILABLE or node is None:
+            return {node_type: [] for node_type in types}
+        return find_nodes_by_type(_language(), node, types)
 
     def extract_node_text(self, node: Node) -> str:
         """Extract text content from a tree-sitter node.
@@ -0,0 +1,151 @@
+"""
+Purpose: Fast tree-sitter node lookup by type using compiled queries, with an iterative fallback
+
+Scope: Node-type searches over TypeScript and Rust trees for the tree-sitter base analyzers
+
+Overview: TypeScriptBaseAnalyzer.walk_tree and RustBaseAnalyzer.walk_tree used to recurse in Python
+    over every node's children for each node type requested, building a child list and crossing
+    the Python/C boundary at every node, once per call. find_nodes instead runs a tree-sitter Query
+    that matches every requested type in one pass inside the C library. Queries are compiled once
+    per grammar and set of node types and memoized. A type is matched both as a named node and as
+    an anonymous token when the grammar has both ("string" in TypeScript is a literal and a
+    keyword), exactly as the old type comparison did, and types the grammar lacks are dropped
+    before compiling. Query captures are not returned in tree order, so results are sorted back
+    into pre-order (start byte, then widest span, then most descendants, which puts an ancestor
+    before a child sharing its span). When a query cannot be compiled the lookup falls back to an
+    iterative TreeCursor walk, so very deep files never approach the recursion limit either way.
+
+Dependencies: tree-sitter (optional; callers pass in the grammar's Language), collections.abc
+
+Exports: find_nodes, find_nodes_by_type, clear_query_cache
+
+Interfaces: find_nodes(language, node, node_types) -> list[Node],
+    find_nodes_by_type(language, node, node_types) -> dict[str, list[Node]]
+
+Implementation: Alternation query "[(a) (b) \"c\"] @node" per (grammar, types), memoized by
+    language identity; QueryError or a missing QueryCursor selects the cursor walk
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    from tree_sitter import Query, QueryCursor, QueryError
+
+    QUERIES_AVAILABLE = True
+except ImportError:
+    QUERIES_AVAILABLE = False
+
+_CAPTURE = "node"
+
+# Compiled query per (grammar, node types), or None where the cursor walk is used instead.
+# Languages are module-level singletons per grammar, so the id identifies the grammar.
+_QUERIES: dict[tuple[int, tuple[str, ...]], Any] = {}
+
+
+def find_nodes(language: Any, node: Any, node_types: Iterable[str]) -> list[Any]:
+    """Find every node of the given types in a subtree (the node itself included), in pre-order.
+
+    Args:
+        language: tree_sitter.Language of the tree's grammar
+        node: Root of the subtree to search
+        node_types: Node type names to match (named nodes or anonymous tokens)
+
+    Returns:
+        Matching nodes in source (pre-order) order
+    """
+    types = tuple(sorted(set(node_types)))
+    query = _compiled_query(language, types)
+    if query is None:
+        return _walk_matching(node, frozenset(types))
+    found = QueryCursor(query).captures(node).get(_CAPTURE, [])
+    return sorted(found, key=_preorder_key)
+
+
+def find_nodes_by_type(language: Any, node: Any, node_types: Iterable[str]) -> dict[str, list[Any]]:
+    """Find nodes of several types in one pass, grouped by type.
+
+    Args:
+        language: tree_sitter.Language of the tree's grammar
+        node: Root of the subtree to search
+        node_types: Node type names to match
+
+    Returns:
+        Mapping of every requested type to its matching nodes in pre-order (empty if none)
+    """
+    types = list(node_types)
+    grouped: dict[str, list[Any]] = {node_type: [] for node_type in types}
+    for found in find_nodes(language, node, types):
+        grouped[found.type].append(found)
+    return grouped
+
+
+def _preorder_key(node: Any) -> tuple[int, int, int]:
+    """Sort key putting nodes in pre-order (ancestors before descendants with the same span)."""
+    return node.start_byte, -node.end_byte, -node.descendant_count
+
+
+def _compiled_query(language: Any, types: tuple[str, ...]) -> Any:
+    """Get the memoized query matching any of the types (None selects the cursor walk)."""
+    key = (id(language), types)
+    if key not in _QUERIES:
+        _QUERIES[key] = _compile(language, types)
+    return _QUERIES[key]
+
+
+def _compile(language: Any, types: tuple[str, ...]) -> Any:
+    """Compile an alternation query over the types the grammar defines."""
+    source = _query_source(language, types)
+    if source is None or not QUERIES_AVAILABLE:
+        return None
+    try:
+        return Query(language, source)
+    except QueryError:
+        return None
+
+
+def _query_source(language: Any, types: tuple[str, ...]) -> str | None:
+    """Query text capturing any of the types (None if the grammar defines none of them)."""
+    alternatives = [pattern for node_type in types for pattern in _patterns(language, node_type)]
+    if not alternatives:
+        return None
+    return f"[{' '.join(alternatives)}] @{_CAPTURE}"
+
+
+def _patterns(language: Any, node_type: str) -> list[str]:
+    """Query patterns matching a type as a named node and as an anonymous token, where defined."""
+    patterns = []
+    if language.id_for_node_kind(node_type, True) is not None:
+        patterns.append(f"({node_type})")
+    if language.id_for_node_kind(node_type, False) is not None:
+        escaped = node_type.replace("\\", "\\\\").replace('"', '\\"')
+        patterns.append(f'"{escaped}"')
+    return patterns
+
+
+def _walk_matching(node: Any, types: frozenset[str]) -> list[Any]:
+    """Collect matching nodes with an iterative pre-order TreeCursor walk (no recursion)."""
+    found: list[Any] = []
+    cursor = node.walk()
+    while True:
+        if cursor.node.type in types:
+            found.append(cursor.node)
+        if not cursor.goto_first_child() and not _advance(cursor):
+            return found
+
+
+def _advance(cursor: Any) -> bool:
+    """Move to the next sibling of the current node or of its nearest ancestor that has one.
+
+    A cursor created from a node never leaves that node's subtree, so this returns False once
+    the walk is back at the cursor's root.
+    """
+    while not cursor.goto_next_sibling():
+        if not cursor.goto_parent():
+            return False
+    return True
+
+
+def clear_query_cache() -> None:
+    """Clear the compiled query memo (for test isolation)."""
+    _QUERIES.clear()
@@ -0,0 +1,100 @@
+"""
+Purpose: Shared, memoized tree-sitter parse results so each TypeScript/Rust file is parsed once
+
+Scope: Per-file tree-sitter Tree and utf-8 source bytes caching used by every TS/Rust rule
+
+Overview: TypeScriptBaseAnalyzer.parse_typescript and RustBaseAnalyzer.parse_rust used to re-encode
+    the source to bytes and re-parse it on every call, and around twenty analyzers call them for
+    the same file. TreeSitterSource wraps one source string, encodes it to utf-8 once, and lazily
+    parses it once with the given grammar's parser, keeping the bytes alongside the Tree so node
+    text can be sliced straight from the original buffer. FileLintContext owns one
+    TreeSitterSource per file; base analyzers (which only receive source text) reach the same
+    instance through get_tree_sitter_source, a small bounded memo keyed by parser
+    and source text, mirroring the Python-side memo in src.core.python_source.
+
+Dependencies: tree-sitter (optional; callers pass in the parser), collections.OrderedDict
+
+Exports: TreeSitterSource, get_tree_sitter_source, clear_tree_sitter_source_cache
+
+Interfaces: get_tree_sitter_source(content, parser) -> TreeSitterSource,
+    TreeSitterSource.tree / .root_node / .source_bytes / node_text(node)
+
+Implementation: Lazy Tree construction, bounded OrderedDict memo keyed by (parser id, content);
+    parsers are module-level singletons per grammar, so the id identifies the grammar
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+# Number of distinct (parser, source) pairs kept in the memo. Files are linted one at a time
+# per process, so a handful of entries covers the file in flight.
+_MEMO_SIZE = 4
+
+
+class TreeSitterSource:
+    """Source text with its utf-8 bytes and a lazily parsed, memoized tree-sitter Tree."""
+
+    def __init__(self, content: str, parser: Any) -> None:
+        """Initialize with source text and the grammar's parser; parsing is deferred.
+
+        Args:
+            content: Source code
+            parser: tree_sitter.Parser configured for the source's grammar
+        """
+        self.content = content
+        self.source_bytes = content.encode("utf-8")
+        self._parser = parser
+        self._tree: Any = None
+
+    @property
+    def tree(self) -> Any:
+        """Get the parsed tree-sitter Tree (parsed on first access)."""
+        if self._tree is None:
+            self._tree = self._parser.parse(self.source_bytes)
+        return self._tree
+
+    @property
+    def root_node(self) -> Any:
+        """Get the root node of the parsed tree."""
+        return self.tree.root_node
+
+    def node_text(self, node: Any) -> str:
+        """Get a node's source text by slicing the retained utf-8 buffer.
+
+        Args:
+            node: Tree-sitter node from this source's tree
+
+        Returns:
+            Decoded source text spanned by the node
+        """
+        return self.source_bytes[node.start_byte : node.end_byte].decode("utf-8")
+
+
+_MEMO: OrderedDict[tuple[int, str], TreeSitterSource] = OrderedDict()
+
+
+def get_tree_sitter_source(content: str, parser: Any) -> TreeSitterSource:
+    """Get the shared TreeSitterSource for a source string and grammar parser.
+
+    Args:
+        content: Source code
+        parser: Module-level tree_sitter.Parser singleton for the source's grammar
+
+    Returns:
+        TreeSitterSource shared by every caller asking for the same parser and source
+    """
+    key = (id(parser), content)
+    source = _MEMO.get(key)
+    if source is not None:
+        _MEMO.move_to_end(key)
+        return source
+    source = TreeSitterSource(content, parser)
+    _MEMO[key] = source
+    if len(_MEMO) > _MEMO_SIZE:
+        _MEMO.popitem(last=False)
+    return source
+
+
+def clear_tree_sitter_source_cache() -> None:
+    """Clear the shared source memo (for test isolation)."""
+    _MEMO.clear()
@@ -4,40 +4,95 @@ Purpose: Base class for TypeScript AST analysis with tree-sitter parsing
 Scope: Common tree-sitter initialization, parsing, and traversal utilities for TypeScript
 
 Overview: Provides shared infrastructure for TypeScript code analysis using tree-sitter parser.
-    Implements common tree-sitter initialization with language setup and parser configuration.
-    Provides reusable parsing methods that convert TypeScript source to AST nodes. Includes
-    shared traversal utilities for walking AST trees recursively and finding nodes by type.
+    Implements common tree-sitter initialization with language setup and parser configuration;
+    the TypeScript grammar is imported and the parser built only when the first file is parsed,
+    so importing a linter that supports TypeScript costs nothing for runs without TypeScript files.
+    Provides reusable parsing methods that convert TypeScript source to AST nodes, sharing one
+    memoized Tree per source (see tree_sitter_source) across every analyzer. Includes
+    shared lookups finding nodes by type, one or several types per pass, through compiled
+    tree-sitter queries (see tree_sitter_query) instead of a recursive Python walk.
     Centralizes node extraction patterns including name extraction from identifiers and
     type identifiers. Serves as foundation for specialized analyzers (SRP, nesting, DRY)
     to eliminate duplicate tree-sitter boilerplate.
 
-Dependencies: tree-sitter, tree-sitter-typescript
+Dependencies: tree-sitter, tree-sitter-typescript, src.analyzers.tree_sitter_source
 
-Exports: TypeScriptBaseAnalyzer class with parsing and traversal utilities
+Exports: TypeScriptBaseAnalyzer class with parsing and traversal utilities, get_typescript_source
 
-Interfaces: parse_typescript(code), walk_tree(node, node_type), extract_node_text(node)
+Interfaces: parse_typescript(code), walk_tree(node, node_type),
+    walk_tree_by_types(node, node_types), extract_node_text(node)
 
-Implementation: Tree-sitter parser singleton, recursive AST traversal, composition pattern
+Implementation: Tree-sitter parser singleton built on first use, query-based node lookup,
+    composition pattern
 
 Suppressions:
-    - type:ignore[assignment]: Tree-sitter TS_PARSER fallback when import fails
     - type:ignore[assignment,misc]: Tree-sitter Node type alias (optional dependency fallback)
 """
 
+import importlib.util
+from collections.abc import Iterable
 from typing import Any
 
+from src.analyzers.tree_sitter_query import find_nodes, find_nodes_by_type
+from src.analyzers.tree_sitter_source import TreeSitterSource, get_tree_sitter_source
+
 try:
-    import tree_sitter_typescript as tstypescript
     from tree_sitter import Language, Node, Parser
 
-    TS_LANGUAGE = Language(tstypescript.language_typescript())
-    TS_PARSER = Parser(TS_LANGUAGE)
-    TREE_SITTER_AVAILABLE = True
+    TREE_SITTER_AVAILABLE = importlib.util.find_spec("tree_sitter_typescript") is not None
 except ImportError:
     TREE_SITTER_AVAILABLE = False
-    TS_PARSER = None  # type: ignore[assignment]
     Node = Any  # type: ignore[assignment,misc]
 
+# Built by _load_grammar on first use; loading the grammar is the slow part of importing
+TS_LANGUAGE: "Language"
+TS_PARSER: "Parser"
+
+
+def _load_grammar() -> None:
+    """Import the TypeScript grammar and build the shared language and parser."""
+    global TS_LANGUAGE, TS_PARSER
+    import tree_sitter_typescript as tstypescript
+
+    TS_LANGUAGE = Language(tstypescript.language_typescript())
+    TS_PARSER = Parser(TS_LANGUAGE)
+
+
+def _language() -> "Language":
+    """The TypeScript Language, loading the grammar on first use."""
+    if "TS_LANGUAGE" not in globals():
+        _load_grammar()
+    return TS_LANGUAGE
+
+
+def _parser() -> "Parser":
+    """The shared TypeScript Parser, loading the grammar on first use."""
+    if "TS_PARSER" not in globals():
+        _load_grammar()
+    return TS_PARSER
+
+
+def __getattr__(name: str) -> Any:
+    """Load the grammar when TS_LANGUAGE or TS_PARSER is first read from outside the module."""
+    if name in ("TS_LANGUAGE", "TS_PARSER") and TREE_SITTER_AVAILABLE:
+        _load_grammar()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_typescript_source(code: str) -> TreeSitterSource | None:
+    """Get the shared, lazily parsed TypeScript source for code.
+
+    Args:
+        code: TypeScript source code
+
+    Returns:
+        TreeSitterSource shared across analyzers, or None if tree-sitter is unavailable
+    """
+    if not TREE_SITTER_AVAILABLE:
+        return None
+    return get_tree_sitter_source(code, _parser())
+
 
 class TypeScriptBaseAnalyzer:
     """Base analyzer for TypeScript code using tree-sitter."""
@@ -55,44 +110,38 @@ class TypeScriptBaseAnalyzer:
         Returns:
             Tree-sitter AST root node, or None if parsing fails or tree-sitter unavailable
         """
-        if not TREE_SITTER_AVAILABLE or TS_PARSER is None:
-            return None
-
-        tree = TS_PARSER.parse(bytes(code, "utf8"))
-        return tree.root_node
-
-    def walk_tree(self, node: Node, node_type: str) -> list[Node]:
-        """Find all nodes of a specific type in the AST.
+        source = get_typescript_source(code)
+        return source.root_node if source is not None else None
 
-        Recursively walks the tree and collects all nodes matching the given type.
+    def walk_tree(self, node: Node, node_type: str | tuple[str, ...]) -> list[Node]:
+        """Find all nodes of a specific type (or of any of several types) in the AST.
 
         Args:
-            node: Root tree-sitter node to search from
-            node_type: Tree-sitter node type to find (e.g., "class_declaration")
+            node: Root tree-sitter node to search from (included if it matches)
+            node_type: Tree-sitter node type to find (e.g., "class_declaration"), or a tuple of types
 
         Returns:
-            List of all matching nodes
+            List of all matching nodes, in source order
         """
         if not TREE_SITTER_AVAILABLE or node is None:
             return []
+        types = (node_type,) if isinstance(node_type, str) else node_type
+        return find_nodes(_language(), node, types)
 
-        nodes: list[Node] = []
-        self._walk_tree_recursive(node, node_type, nodes)
-        return nodes
-
-    def _walk_tree_recursive(self, node: Node, node_type: str, nodes: list[Node]) -> None:
-        """Recursively walk tree to find nodes of specific type.
+    def walk_tree_by_types(self, node: Node, node_types: Iterable[str]) -> dict[str, list[Node]]:
+        """Find all nodes of several types in one pass over the AST.
 
         Args:
-            node: Current tree-sitter node
-            node_type: Node type to find
-            nodes: List to accumulate matching nodes
-        """
-        if node.type == node_type:
-            nodes.append(node)
+            node: Root tree-sitter node to search from
+            node_types: Tree-sitter node types to find
 
-        for child in node.children:
-            self._walk_tree_recursive(child, node_type, nodes)
+        Returns:
+            Matching nodes grouped by type, each list in source order
+        """
+        types = list(node_types)
+        if not TREE_SITTER_AVAILABLE or node is None:
+            return {node_type: [] for node_type in types}
+        return find_nodes_by_type(_language(), node, types)
 
     def extract_node_text(self, node: Node) -> str:
         """Extract text content from a tree-sitter node.
@@ -10,18 +10,23 @@ Overview: Provides high-level Linter class that serves as the primary entry poin
     autodiscovery of .thailint.yaml/.thailint.json in project directory, and flexible linting
     with optional rule filtering. Designed for embedding in editors, CI/CD pipelines, testing
     frameworks, and automation tools. Maintains backwards compatibility with existing direct
-    imports while providing improved ergonomics for library users.
+    imports while providing improved ergonomics for library users. With profile=True each
+    lint() call is timed per rule and per phase (the CLI's --profile) and the result is kept
+    in last_profile.
 
 Dependencies: pathlib for path handling, Orchestrator from orchestrator.core for linting engine,
-    LinterConfigLoader from linter_config.loader for configuration, Violation from core.types
+    LinterConfigLoader from linter_config.loader for configuration, Violation from core.types,
+    RunProfile from orchestrator.profiler
 
 Exports: Linter class as primary library API
 
-Interfaces: Linter(config_file=None, project_root=None) initialization,
-    lint(path, rules=None) -> list[Violation] method
+Interfaces: Linter(config_file=None, project_root=None, profile=False) initialization,
+    lint(path, rules=None) -> list[Violation] method,
+    last_profile -> RunProfile | None (to_dict() gives the JSON-ready report)
 
 Implementation: Thin wrapper around Orchestrator with enhanced configuration handling,
-    path normalization (str/Path support), rule filtering by name, and graceful error handling
+    path normalization (str/Path support), rule pre-selection (one Orchestrator per requested
+    rule set, so unrequested rules never run), and graceful error handling
 """
 
 from pathlib import Path
@@ -29,6 +34,7 @@ from pathlib import Path
 from src.core.types import Violation
 from src.linter_config.loader import LinterConfigLoader
 from src.orchestrator.core import Orchestrator
+from src.orchestrator.profiler import RunProfile
 
 
 class Linter:
@@ -47,6 +53,7 @@ class Linter:
         self,
         config_file: str | Path | None = None,
         project_root: str | Path | None = None,
+        profile: bool = False,
     ):
         """Initialize linter with configuration.
 
@@ -54,6 +61,8 @@ class Linter:
             config_file: Path to config file (.thailint.yaml or .thailint.json).
                 If not provided, will autodiscover in project_root.
             project_root: Root directory of project. Defaults to current directory.
+            profile: Whether to time each lint() call per rule and per phase
+                (available afterwards as last_profile).
         """
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.config_loader = LinterConfigLoader()
@@ -61,6 +70,9 @@ class Linter:
         config_path = self._resolve_config_path(config_file)
         self.config = self.config_loader.load(config_path)
         self.orchestrator = Orchestrator(project_root=self.project_root, config=self.config)
+        self._selected_orchestrators: dict[tuple[str, ...], Orchestrator] = {}
+        self.profile = profile
+        self.last_profile: RunProfile | None = None
 
     def _resolve_config_path(self, config_file: str | Path | None) -> Path:
         """Resolve configuration file path."""
@@ -98,17 +110,47 @@ class Linter:
         if not path_obj.exists():
             return []
 
-        violations = self._lint_path(path_obj)
+        orchestrator = self._get_orchestrator(rules)
+        if self.profile:
+            violations = self._profiled_lint_path(path_obj, orchestrator)
+        else:
+            violations = self._lint_path(path_obj, orchestrator)
         return self._filter_violations(violations, rules)
 
-    def _lint_path(self, path_obj: Path) -> list[Violation]:
+    def _get_orchestrator(self, rules: list[str] | None) -> Orchestrator:
+        """Get an orchestrator that only registers the requested rules.
+
+        Orchestrators are cached per rule set so repeated lint() calls with the
+        same rules reuse one rule registry.
+        """
+        if not rules:
+            return self.orchestrator
+        key = tuple(rules)
+        if key not in self._selected_orchestrators:
+            self._selected_orchestrators[key] = Orchestrator(
+                project_root=self.project_root, config=self.config, rules=key
+            )
+        return self._selected_orchestrators[key]
+
+    def _lint_path(self, path_obj: Path, orchestrator: Orchestrator) -> list[Violation]:
         """Lint a path (file or directory)."""
         if path_obj.is_file():
-            return self.orchestrator.lint_file(path_obj)
+            return orchestrator.lint_file(path_obj)
         if path_obj.is_dir():
-            return self.orchestrator.lint_directory(path_obj, recursive=True)
+            return orchestrator.lint_directory(path_obj, recursive=True)
         return []
 
+    def _profiled_lint_path(self, path_obj: Path, orchestrator: Orchestrator) -> list[Violation]:
+        """Lint a path with a fresh profile, keeping it as last_profile."""
+        profile = RunProfile()
+        orchestrator.profile = profile
+        try:
+            return self._lint_path(path_obj, orchestrator)
+        finally:
+            orchestrator.profile = None
+            profile.finish()
+            self.last_profile = profile
+
     def _filter_violations(
         self, violations: list[Violation], rules: list[str] | None
     ) -> list[Violation]:
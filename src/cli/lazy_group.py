@@ -0,0 +1,53 @@
+"""
+Purpose: Click group that imports each subcommand's module only when the command is used
+
+Scope: Deferred command registration for the thai-lint CLI group
+
+Overview: Every linter command module used to be imported when the CLI started, pulling in the
+    orchestrator, the linters behind each command and their dependencies even though one
+    invocation runs a single command. LazyGroup knows which module defines each command name and
+    imports that module the first time the command is resolved; the module's @cli.command
+    decorators then register the command on the group as usual. Listing commands (for --help)
+    reports every known name without importing anything until the help text itself is rendered.
+
+Dependencies: click, importlib
+
+Exports: LazyGroup
+
+Interfaces: LazyGroup(lazy_commands={name: module_path}, **group_kwargs), get_command(ctx, name),
+    list_commands(ctx)
+
+Implementation: click.Group subclass overriding get_command/list_commands; the defining module
+    registers the command through its decorators, so there is one registration path
+"""
+
+import importlib
+from typing import Any
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Click group resolving subcommands by importing their defining module on demand."""
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, str] | None = None, **kwargs: Any):
+        """Initialize the group.
+
+        Args:
+            *args: Positional click.Group arguments
+            lazy_commands: Command name -> module that registers the command when imported
+            **kwargs: Keyword click.Group arguments
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, str] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List registered and not yet imported commands, sorted by name."""
+        return sorted(set(self.commands) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a command, importing the module that defines it on first use."""
+        module_name = self.lazy_commands.get(cmd_name)
+        if cmd_name not in self.commands and module_name is not None:
+            importlib.import_module(module_name)
+        return super().get_command(ctx, cmd_name)
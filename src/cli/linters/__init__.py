@@ -1,82 +1,71 @@
 """
-Purpose: CLI linters package that registers all linter commands to the main CLI group
+Purpose: CLI linters package holding the linter command modules of the main CLI group
 
-Scope: Export and registration of all linter CLI commands (nesting, srp, dry, magic-numbers,
-    unwrap-abuse, clone-abuse, blocking-async, version-freshness, etc.)
+Scope: Export of all linter CLI commands (nesting, srp, dry, magic-numbers, unwrap-abuse,
+    clone-abuse, blocking-async, version-freshness, etc.)
 
-Overview: Package initialization that imports all linter command modules to trigger their registration
-    with the main CLI group via Click decorators. Each submodule defines commands using @cli.command()
-    decorators that automatically register with the CLI when imported. Organized by logical grouping:
-    structure_quality (nesting, srp), code_smells (dry, magic-numbers), code_patterns (improper-logging,
-    method-property, stateless-class), structure (file-placement, pipeline), documentation (file-header).
+Overview: Package of the linter command modules. Each submodule defines commands using @cli.command()
+    decorators that register with the CLI when the submodule is imported; the main group imports a
+    submodule only when one of its commands is invoked (see src.cli.main.COMMAND_MODULES), so this
+    package does not import them itself. Organized by logical grouping: structure_quality
+    (nesting, srp), code_smells (dry, magic-numbers), code_patterns (improper-logging,
+    method-property, stateless-class), structure (file-placement, pipeline), documentation
+    (file-header), and check (several linters in one pass). The command functions are still
+    importable from the package; each name imports its submodule on first access.
     Note: print-statements is a deprecated alias for improper-logging.
 
-Dependencies: Click for CLI framework, src.cli.main for CLI group, individual linter modules
+Dependencies: importlib, individual linter command modules (lazily)
 
 Exports: All linter command functions for reference and testing
 
 Interfaces: Click command decorators, integration with main CLI group
 
-Implementation: Module imports trigger command registration via Click decorator side effects
-
-Suppressions:
-    - F401: Module imports trigger Click command registration via decorator side effects
+Implementation: Module-level __getattr__ resolving command functions from their submodules
 """
 
-# Import all linter command modules to register them with the CLI
-# Each module uses @cli.command() decorators that register on import
-from src.cli.linters import (  # noqa: F401
-    code_patterns,
-    code_smells,
-    documentation,
-    infrastructure,
-    performance,
-    rust,
-    structure,
-    structure_quality,
-)
-
-# Re-export command functions for testing and reference
-from src.cli.linters.code_patterns import (
-    improper_logging,
-    method_property,
-    print_statements,
-    stateless_class,
-)
-from src.cli.linters.code_smells import dry, magic_numbers
-from src.cli.linters.documentation import file_header
-from src.cli.linters.infrastructure import version_freshness
-from src.cli.linters.performance import perf, regex_in_loop, string_concat_loop
-from src.cli.linters.rust import blocking_async, clone_abuse, unwrap_abuse
-from src.cli.linters.structure import file_placement, pipeline
-from src.cli.linters.structure_quality import law_of_demeter, nesting, srp
+import importlib
+from typing import Any
 
-__all__ = [
+# Command function -> (submodule, attribute), for reference and testing
+_COMMAND_EXPORTS: dict[str, tuple[str, str]] = {
     # Structure quality commands
-    "nesting",
-    "srp",
-    "law_of_demeter",
+    "nesting": ("structure_quality", "nesting"),
+    "srp": ("structure_quality", "srp"),
+    "law_of_demeter": ("structure_quality", "law_of_demeter"),
     # Code smell commands
-    "dry",
-    "magic_numbers",
+    "dry": ("code_smells", "dry"),
+    "magic_numbers": ("code_smells", "magic_numbers"),
     # Code pattern commands
-    "improper_logging",
-    "print_statements",  # deprecated alias for improper_logging
-    "method_property",
-    "stateless_class",
+    "improper_logging": ("code_patterns", "improper_logging"),
+    "print_statements": ("code_patterns", "print_statements"),  # deprecated alias
+    "method_property": ("code_patterns", "method_property"),
+    "stateless_class": ("code_patterns", "stateless_class"),
     # Structure commands
-    "file_placement",
-    "pipeline",
+    "file_placement": ("structure", "file_placement"),
+    "pipeline": ("structure", "pipeline"),
     # Documentation commands
-    "file_header",
+    "file_header": ("documentation", "file_header"),
     # Performance commands
-    "perf",
-    "string_concat_loop",
-    "regex_in_loop",
+    "perf": ("performance", "perf"),
+    "string_concat_loop": ("performance", "string_concat_loop"),
+    "regex_in_loop": ("performance", "regex_in_loop"),
     # Infrastructure commands
-    "version_freshness",
+    "version_freshness": ("infrastructure", "version_freshness"),
     # Rust commands
-    "unwrap_abuse",
-    "clone_abuse",
-    "blocking_async",
-]
+    "unwrap_abuse": ("rust", "unwrap_abuse"),
+    "clone_abuse": ("rust", "clone_abuse"),
+    "blocking_async": ("rust", "blocking_async"),
+    # Multi-linter commands
+    "check_command": ("check", "check"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining a command function on first access."""
+    if name not in _COMMAND_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    submodule, attribute = _COMMAND_EXPORTS[name]
+    return getattr(importlib.import_module(f"{__name__}.{submodule}"), attribute)
+
+
+__all__ = list(_COMMAND_EXPORTS)
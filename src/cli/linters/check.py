@@ -0,0 +1,285 @@
+"""
+Purpose: CLI command running any set of linters in a single pass over the tree
+
+Scope: thailint check command: linter selection, combined report, per-linter exit status
+
+Overview: CI pipelines used to invoke a dozen or more single-linter commands, each doing its own
+    directory walk, config load, file reads, parses and (with --parallel) process pool. The check
+    command runs every requested linter through one rule-selected Orchestrator instead, so the
+    tree is walked once, each file is read and parsed once, and one worker pool is shared. It
+    prints one combined report in the text, JSON, JSON-lines or SARIF formats, annotated with
+    each linter's own pass/fail status, and exits non-zero if any requested linter found
+    violations.
+
+Dependencies: click for CLI framework, src.cli.main for CLI group, src.cli.utils for orchestrator
+    setup and execution, src.core.cli_utils for violation output, src.formatters.sarif for SARIF
+
+Exports: check command, CHECK_LINTERS, DEFAULT_CHECK_LINTERS, LinterResult, LinterTally,
+    group_violations_by_linter
+
+Interfaces: thailint check [--linters NAME[,NAME...]] [--config PATH]
+    [--format text|json|jsonl|sarif]
+    [--recursive/--no-recursive] [--parallel] [PATHS...]
+
+Implementation: Maps linter names (the single-linter command names) to rule selections, lints
+    with the union of the selections, and counts violations per linter by rule id as they stream
+    out of the orchestrator; text and jsonl reports print each violation when its file is linted
+
+Suppressions:
+    - too-many-arguments,too-many-positional-arguments: Click command with standard options
+"""
+
+import json
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from functools import partial
+from typing import NoReturn
+
+import click
+from loguru import logger
+
+from src.cli.linters.shared import (
+    ExecuteParams,
+    prepare_standard_command,
+    run_linter_command,
+    standard_linter_options,
+)
+from src.cli.main import cli
+from src.cli.utils import iter_linting_on_paths, setup_base_orchestrator, validate_paths_exist
+from src.core.cli_utils import stream_violations, violations_to_json
+from src.core.registry import is_rule_selected
+from src.core.types import Violation
+
+# Linter name (same as its single-linter command) -> rule ids/categories it runs
+CHECK_LINTERS: dict[str, tuple[str, ...]] = {
+    "nesting": ("nesting",),
+    "srp": ("srp",),
+    "law-of-demeter": ("law-of-demeter",),
+    "dry": ("dry",),
+    "magic-numbers": ("magic-numbers",),
+    "stringly-typed": ("stringly-typed",),
+    "improper-logging": ("improper-logging",),
+    "method-property": ("method-property",),
+    "stateless-class": ("stateless-class",),
+    "lazy-ignores": ("lazy-ignores",),
+    "lbyl": ("lbyl",),
+    "cqs": ("cqs",),
+    "pipeline": ("collection-pipeline",),
+    "file-placement": ("file-placement",),
+    "file-header": ("file-header",),
+    "perf": ("performance",),
+    "unwrap-abuse": ("unwrap-abuse",),
+    "clone-abuse": ("clone-abuse",),
+    "blocking-async": ("blocking-async",),
+    # Narrower names accepted by --linters; covered by the defaults above
+    "print-statements": ("improper-logging",),
+    "string-concat-loop": ("performance.string-concat-loop",),
+    "regex-in-loop": ("performance.regex-in-loop",),
+}
+
+# Linters run when --linters is not given (every linter, without the overlapping names)
+DEFAULT_CHECK_LINTERS: tuple[str, ...] = tuple(
+    name
+    for name in CHECK_LINTERS
+    if name not in ("print-statements", "string-concat-loop", "regex-in-loop")
+)
+
+
+@dataclass
+class LinterResult:
+    """Outcome of one linter in a check run."""
+
+    name: str
+    total: int
+
+    @property
+    def exit_code(self) -> int:
+        """Exit status this linter's own command would have returned."""
+        return 1 if self.total else 0
+
+
+class LinterTally:
+    """Per-linter violation counts, updated while violations stream past."""
+
+    def __init__(self, linters: tuple[str, ...]) -> None:
+        """Initialize zero counts for the linters being run.
+
+        Args:
+            linters: Linter names that are run
+        """
+        self.linters = linters
+        self._counts: Counter[str] = Counter()
+
+    def count(self, violations: Iterable[Violation]) -> Iterator[Violation]:
+        """Pass violations through unchanged, counting each against its linters."""
+        for violation in violations:
+            self._counts.update(
+                name
+                for name in self.linters
+                if is_rule_selected(violation.rule_id, CHECK_LINTERS[name])
+            )
+            yield violation
+
+    def results(self) -> list[LinterResult]:
+        """Get one LinterResult per linter, in the order given."""
+        return [LinterResult(name, self._counts[name]) for name in self.linters]
+
+
+def group_violations_by_linter(
+    violations: Iterable[Violation], linters: tuple[str, ...]
+) -> list[LinterResult]:
+    """Count a combined run's violations per linter.
+
+    Args:
+        violations: Violations from the combined run
+        linters: Linter names that were run
+
+    Returns:
+        One LinterResult per linter, in the order given
+    """
+    tally = LinterTally(linters)
+    for _ in tally.count(violations):
+        pass
+    return tally.results()
+
+
+def _parse_linter_names(
+    ctx: click.Context, param: click.Parameter, value: tuple[str, ...]
+) -> tuple[str, ...]:
+    """Click callback: split comma-separated --linters values and validate the names."""
+    names = _split_names(value)
+    unknown = [n for n in names if n not in CHECK_LINTERS]
+    if unknown:
+        valid = ", ".join(CHECK_LINTERS)
+        raise click.BadParameter(f"Unknown linter(s): {', '.join(unknown)}. Valid: {valid}")
+    return names or DEFAULT_CHECK_LINTERS
+
+
+def _split_names(values: tuple[str, ...]) -> tuple[str, ...]:
+    """Flatten repeated and comma-separated option values, dropping blanks and duplicates."""
+    names = (name.strip() for value in values for name in value.split(","))
+    return tuple(dict.fromkeys(name for name in names if name))
+
+
+@cli.command("check")
+@standard_linter_options
+@click.option(
+    "--linters",
+    "-l",
+    "linters",
+    multiple=True,
+    callback=_parse_linter_names,
+    help="Linters to run (repeatable or comma-separated). Defaults to all linters.",
+)
+def check(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    ctx: click.Context,
+    paths: tuple[str, ...],
+    config_file: str | None,
+    format: str,
+    recursive: bool,
+    parallel: bool,
+    linters: tuple[str, ...],
+) -> None:
+    """Run several linters in a single pass over the tree.
+
+    Walks the tree once, reads and parses each file once, and runs every
+    requested linter on it. Prints one combined report with each linter's
+    pass/fail status; exits 1 if any linter found violations.
+
+    PATHS: Files or directories to lint (defaults to current directory if none provided)
+
+    Examples:
+
+        \b
+        # Run every linter on the current directory
+        thai-lint check
+
+        \b
+        # Run a subset of linters
+        thai-lint check --linters dry,srp,nesting src/
+
+        \b
+        # Combined SARIF report for GitHub Code Scanning
+        thai-lint check --format sarif --parallel . > thailint.sarif
+    """
+    params = prepare_standard_command(ctx, paths, config_file, format, recursive, parallel)
+    run_linter_command(partial(_execute_check, linters=linters), params)
+
+
+def _execute_check(params: ExecuteParams, linters: tuple[str, ...]) -> NoReturn:
+    """Lint once with every requested linter and report per-linter results."""
+    validate_paths_exist(params.path_objs)
+    selection = [rule for name in linters for rule in CHECK_LINTERS[name]]
+    orchestrator = setup_base_orchestrator(
+        params.path_objs, params.config_file, params.verbose, params.project_root, rules=selection
+    )
+    tally = LinterTally(linters)
+    violations = tally.count(
+        iter_linting_on_paths(orchestrator, params.path_objs, params.recursive, params.parallel)
+    )
+    reporter = _REPORTERS.get(params.format, _output_check_text)
+    results = reporter(violations, tally)
+
+    logger.debug(
+        f"Found {sum(r.total for r in results)} violation(s) across {len(linters)} linter(s)"
+    )
+
+    sys.exit(max((r.exit_code for r in results), default=0))
+
+
+def _linter_summary(results: list[LinterResult]) -> dict[str, dict[str, int]]:
+    """Build the per-linter violation count and exit code mapping."""
+    return {r.name: {"total": r.total, "exit_code": r.exit_code} for r in results}
+
+
+def _output_check_json(violations: Iterator[Violation], tally: LinterTally) -> list[LinterResult]:
+    """Print the combined JSON report with a per-linter summary."""
+    output = violations_to_json(list(violations))
+    results = tally.results()
+    output["linters"] = _linter_summary(results)
+    click.echo(json.dumps(output, indent=2))
+    return results
+
+
+def _output_check_jsonl(violations: Iterator[Violation], tally: LinterTally) -> list[LinterResult]:
+    """Stream one JSON line per violation, then one line with the per-linter summary."""
+    stream_violations(violations, "jsonl")
+    results = tally.results()
+    click.echo(json.dumps({"linters": _linter_summary(results)}))
+    return results
+
+
+def _output_check_sarif(violations: Iterator[Violation], tally: LinterTally) -> list[LinterResult]:
+    """Print one SARIF run with per-linter exit codes in the run's property bag."""
+    from src.formatters.sarif import SarifFormatter
+
+    sarif_doc = SarifFormatter().format(list(violations))
+    results = tally.results()
+    run = sarif_doc["runs"][0]
+    exit_code = max((r.exit_code for r in results), default=0)
+    run["invocations"] = [{"executionSuccessful": True, "exitCode": exit_code}]
+    run["properties"] = {"linters": _linter_summary(results)}
+    click.echo(json.dumps(sarif_doc, indent=2))
+    return results
+
+
+def _output_check_text(violations: Iterator[Violation], tally: LinterTally) -> list[LinterResult]:
+    """Stream the violations as they are found, then one status line per linter."""
+    stream_violations(violations, "text")
+    results = tally.results()
+    click.echo("Linter results:")
+    width = max(len(r.name) for r in results)
+    for result in results:
+        status = f"FAIL ({result.total})" if result.total else "PASS"
+        click.echo(f"  {result.name.ljust(width)}  {status}")
+    return results
+
+
+# Output format -> report printer (text is the fallback)
+_REPORTERS: dict[str, Callable[[Iterator[Violation], LinterTally], list[LinterResult]]] = {
+    "json": _output_check_json,
+    "jsonl": _output_check_jsonl,
+    "sarif": _output_check_sarif,
+}
@@ -21,14 +21,15 @@ Implementation: Click decorators for command definition, orchestrator-based lint
 """
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
 from loguru import logger
 
 from src.cli.linters.shared import ExecuteParams, create_linter_command
-from src.cli.utils import execute_linting_on_paths, setup_base_orchestrator, validate_paths_exist
-from src.core.cli_utils import format_violations
+from src.cli.utils import iter_linting_on_paths, setup_base_orchestrator, validate_paths_exist
+from src.core.cli_utils import stream_violations
 from src.core.types import Violation
 
 if TYPE_CHECKING:
@@ -44,15 +45,17 @@ def _setup_improper_logging_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for improper-logging command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["improper-logging"]
+    )
 
 
 def _run_improper_logging_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute improper-logging lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id.startswith("improper-logging.")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id.startswith("improper-logging."))
 
 
 def _execute_improper_logging_lint(params: ExecuteParams) -> NoReturn:
@@ -64,11 +67,10 @@ def _execute_improper_logging_lint(params: ExecuteParams) -> NoReturn:
     improper_logging_violations = _run_improper_logging_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(improper_logging_violations, params.format)
 
-    logger.debug(f"Found {len(improper_logging_violations)} improper logging violation(s)")
-
-    format_violations(improper_logging_violations, params.format)
-    sys.exit(1 if improper_logging_violations else 0)
+    logger.debug(f"Found {count} improper logging violation(s)")
+    sys.exit(1 if count else 0)
 
 
 # Primary command
@@ -99,15 +101,17 @@ def _setup_method_property_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for method-property command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["method-property"]
+    )
 
 
 def _run_method_property_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute method-property lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "method-property" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "method-property" in v.rule_id)
 
 
 def _execute_method_property_lint(params: ExecuteParams) -> NoReturn:
@@ -119,11 +123,10 @@ def _execute_method_property_lint(params: ExecuteParams) -> NoReturn:
     method_property_violations = _run_method_property_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(method_property_violations, params.format)
 
-    logger.debug(f"Found {len(method_property_violations)} method-property violation(s)")
-
-    format_violations(method_property_violations, params.format)
-    sys.exit(1 if method_property_violations else 0)
+    logger.debug(f"Found {count} method-property violation(s)")
+    sys.exit(1 if count else 0)
 
 
 method_property = create_linter_command(
@@ -145,15 +148,17 @@ def _setup_stateless_class_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for stateless-class command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["stateless-class"]
+    )
 
 
 def _run_stateless_class_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute stateless-class lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "stateless-class" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "stateless-class" in v.rule_id)
 
 
 def _execute_stateless_class_lint(params: ExecuteParams) -> NoReturn:
@@ -165,11 +170,10 @@ def _execute_stateless_class_lint(params: ExecuteParams) -> NoReturn:
     stateless_class_violations = _run_stateless_class_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(stateless_class_violations, params.format)
 
-    logger.debug(f"Found {len(stateless_class_violations)} stateless-class violation(s)")
-
-    format_violations(stateless_class_violations, params.format)
-    sys.exit(1 if stateless_class_violations else 0)
+    logger.debug(f"Found {count} stateless-class violation(s)")
+    sys.exit(1 if count else 0)
 
 
 stateless_class = create_linter_command(
@@ -191,15 +195,17 @@ def _setup_lazy_ignores_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for lazy-ignores command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["lazy-ignores"]
+    )
 
 
 def _run_lazy_ignores_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute lazy-ignores lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id.startswith("lazy-ignores")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id.startswith("lazy-ignores"))
 
 
 def _execute_lazy_ignores_lint(params: ExecuteParams) -> NoReturn:
@@ -211,11 +217,10 @@ def _execute_lazy_ignores_lint(params: ExecuteParams) -> NoReturn:
     lazy_ignores_violations = _run_lazy_ignores_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(lazy_ignores_violations, params.format)
 
-    logger.debug(f"Found {len(lazy_ignores_violations)} lazy-ignores violation(s)")
-
-    format_violations(lazy_ignores_violations, params.format)
-    sys.exit(1 if lazy_ignores_violations else 0)
+    logger.debug(f"Found {count} lazy-ignores violation(s)")
+    sys.exit(1 if count else 0)
 
 
 lazy_ignores = create_linter_command(
@@ -237,15 +242,15 @@ def _setup_lbyl_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for lbyl command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(path_objs, config_file, verbose, project_root, rules=["lbyl"])
 
 
 def _run_lbyl_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute lbyl lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id.startswith("lbyl")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id.startswith("lbyl"))
 
 
 def _execute_lbyl_lint(params: ExecuteParams) -> NoReturn:
@@ -257,11 +262,10 @@ def _execute_lbyl_lint(params: ExecuteParams) -> NoReturn:
     lbyl_violations = _run_lbyl_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(lbyl_violations, params.format)
 
-    logger.debug(f"Found {len(lbyl_violations)} LBYL violation(s)")
-
-    format_violations(lbyl_violations, params.format)
-    sys.exit(1 if lbyl_violations else 0)
+    logger.debug(f"Found {count} LBYL violation(s)")
+    sys.exit(1 if count else 0)
 
 
 lbyl = create_linter_command(
@@ -24,6 +24,7 @@ Suppressions:
 """
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NoReturn
 
@@ -39,17 +40,19 @@ from src.cli.linters.shared import (
 )
 from src.cli.main import cli
 from src.cli.utils import (
-    execute_linting_on_paths,
     format_option,
     get_project_root_from_context,
     handle_linting_error,
+    iter_linting_on_paths,
     parallel_option,
+    profile_options,
     setup_base_orchestrator,
     validate_paths_exist,
 )
-from src.core.cli_utils import format_violations
+from src.core.cli_utils import stream_violations
+from src.core.constants import DEFAULT_CACHE_DIR_NAME
 from src.core.types import Violation
-from src.linters.dry.storage_initializer import DEFAULT_CACHE_DIR_NAME, DEFAULT_CACHE_FILE_NAME
+from src.linters.dry.storage_initializer import DEFAULT_CACHE_FILE_NAME
 
 if TYPE_CHECKING:
     from src.orchestrator.core import Orchestrator
@@ -66,7 +69,7 @@ def _setup_dry_orchestrator(
     project_root: Path | None = None,
 ) -> "Orchestrator":
     """Set up orchestrator for DRY linting."""
-    return setup_base_orchestrator(path_objs, None, verbose, project_root)
+    return setup_base_orchestrator(path_objs, None, verbose, project_root, rules=["dry"])
 
 
 def _load_dry_config_file(orchestrator: "Orchestrator", config_file: str, verbose: bool) -> None:
@@ -132,10 +135,10 @@ def _clear_dry_cache(orchestrator: "Orchestrator", verbose: bool) -> None:
 
 def _run_dry_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Run DRY linting and return violations."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id.startswith("dry.")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id.startswith("dry."))
 
 
 @cli.command("dry")
@@ -147,6 +150,7 @@ def _run_dry_lint(
 @click.option("--clear-cache", is_flag=True, help="Clear cache before running")
 @click.option("--recursive/--no-recursive", default=True, help="Scan directories recursively")
 @parallel_option
+@profile_options
 @click.pass_context
 def dry(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -232,6 +236,14 @@ def dry(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         handle_linting_error(e, verbose)
 
 
+def _log_dry_index_stats(orchestrator: "Orchestrator") -> None:
+    """Report how many files the persistent index reused versus rescanned."""
+    rule = orchestrator.registry.get("dry.duplicate-code")
+    stats = getattr(rule, "index_stats", None)
+    if stats is not None:
+        logger.debug(f"DRY index: {stats.reused} file(s) reused, {stats.rescanned} rescanned")
+
+
 def _execute_dry_lint(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     path_objs: list[Path],
     config_file: str | None,
@@ -257,11 +269,11 @@ def _execute_dry_lint(  # pylint: disable=too-many-arguments,too-many-positional
         _clear_dry_cache(orchestrator, verbose)
 
     dry_violations = _run_dry_lint(orchestrator, path_objs, recursive, parallel)
+    count = stream_violations(dry_violations, format)
 
-    logger.debug(f"Found {len(dry_violations)} DRY violation(s)")
-
-    format_violations(dry_violations, format)
-    sys.exit(1 if dry_violations else 0)
+    _log_dry_index_stats(orchestrator)
+    logger.debug(f"Found {count} DRY violation(s)")
+    sys.exit(1 if count else 0)
 
 
 # =============================================================================
@@ -273,15 +285,17 @@ def _setup_magic_numbers_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for magic-numbers command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["magic-numbers"]
+    )
 
 
 def _run_magic_numbers_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute magic-numbers lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "magic-number" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "magic-number" in v.rule_id)
 
 
 def _execute_magic_numbers_lint(params: ExecuteParams) -> NoReturn:
@@ -293,11 +307,10 @@ def _execute_magic_numbers_lint(params: ExecuteParams) -> NoReturn:
     magic_numbers_violations = _run_magic_numbers_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(magic_numbers_violations, params.format)
 
-    logger.debug(f"Found {len(magic_numbers_violations)} magic number violation(s)")
-
-    format_violations(magic_numbers_violations, params.format)
-    sys.exit(1 if magic_numbers_violations else 0)
+    logger.debug(f"Found {count} magic number violation(s)")
+    sys.exit(1 if count else 0)
 
 
 magic_numbers = create_linter_command(
@@ -318,15 +331,17 @@ def _setup_stringly_typed_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for stringly-typed command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["stringly-typed"]
+    )
 
 
 def _run_stringly_typed_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute stringly-typed lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "stringly-typed" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "stringly-typed" in v.rule_id)
 
 
 def _execute_stringly_typed_lint(params: ExecuteParams) -> NoReturn:
@@ -338,11 +353,10 @@ def _execute_stringly_typed_lint(params: ExecuteParams) -> NoReturn:
     stringly_violations = _run_stringly_typed_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(stringly_violations, params.format)
 
-    logger.debug(f"Found {len(stringly_violations)} stringly-typed violation(s)")
-
-    format_violations(stringly_violations, params.format)
-    sys.exit(1 if stringly_violations else 0)
+    logger.debug(f"Found {count} stringly-typed violation(s)")
+    sys.exit(1 if count else 0)
 
 
 stringly_typed = create_linter_command(
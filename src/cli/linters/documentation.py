@@ -19,14 +19,15 @@ Implementation: Click decorators for command definition, orchestrator-based lint
 """
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
 from loguru import logger
 
 from src.cli.linters.shared import ExecuteParams, create_linter_command
-from src.cli.utils import execute_linting_on_paths, setup_base_orchestrator, validate_paths_exist
-from src.core.cli_utils import format_violations
+from src.cli.utils import iter_linting_on_paths, setup_base_orchestrator, validate_paths_exist
+from src.core.cli_utils import stream_violations
 from src.core.types import Violation
 
 if TYPE_CHECKING:
@@ -42,15 +43,17 @@ def _setup_file_header_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for file-header command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["file-header"]
+    )
 
 
 def _run_file_header_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute file-header lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "file-header" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "file-header" in v.rule_id)
 
 
 def _execute_file_header_lint(params: ExecuteParams) -> NoReturn:
@@ -62,11 +65,10 @@ def _execute_file_header_lint(params: ExecuteParams) -> NoReturn:
     file_header_violations = _run_file_header_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(file_header_violations, params.format)
 
-    logger.debug(f"Found {len(file_header_violations)} file header violation(s)")
-
-    format_violations(file_header_violations, params.format)
-    sys.exit(1 if file_header_violations else 0)
+    logger.debug(f"Found {count} file header violation(s)")
+    sys.exit(1 if count else 0)
 
 
 file_header = create_linter_command(
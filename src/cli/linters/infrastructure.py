@@ -33,7 +33,13 @@ from loguru import logger
 
 from src.cli.linters.shared import extract_command_context, load_linter_config_section
 from src.cli.main import cli
-from src.cli.utils import format_option, parallel_option, validate_paths_exist
+from src.cli.utils import (
+    format_option,
+    parallel_option,
+    profile_options,
+    start_profiling,
+    validate_paths_exist,
+)
 from src.core.cli_utils import format_violations
 
 
@@ -53,6 +59,7 @@ from src.core.cli_utils import format_violations
 )
 @click.option("--recursive/--no-recursive", default=True, help="Scan directories recursively")
 @parallel_option
+@profile_options
 @click.pass_context
 def version_freshness(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -100,6 +107,7 @@ def version_freshness(  # pylint: disable=too-many-arguments,too-many-positional
     """
     from src.linters.version_freshness.config import VersionFreshnessConfig
     from src.linters.version_freshness.linter import VersionFreshnessRule
+    from src.orchestrator.profiler import OUTPUT_FORMATTING, check_timer, phase_timer
 
     cmd_ctx = extract_command_context(ctx, paths)
     validate_paths_exist(cmd_ctx.path_objs)
@@ -128,9 +136,12 @@ def version_freshness(  # pylint: disable=too-many-arguments,too-many-positional
         )
 
     rule = VersionFreshnessRule(config)
-    violations = rule.check_paths(cmd_ctx.path_objs)
+    profile = start_profiling()
+    with check_timer(profile, rule.rule_id, None):
+        violations = rule.check_paths(cmd_ctx.path_objs)
 
     logger.debug(f"Found {len(violations)} version-freshness violation(s)")
 
-    format_violations(violations, format)
+    with phase_timer(profile, OUTPUT_FORMATTING):
+        format_violations(violations, format)
     sys.exit(1 if violations else 0)
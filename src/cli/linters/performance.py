@@ -25,6 +25,7 @@ Suppressions:
 """
 
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
@@ -39,8 +40,8 @@ from src.cli.linters.shared import (
     standard_linter_options,
 )
 from src.cli.main import cli
-from src.cli.utils import execute_linting_on_paths, setup_base_orchestrator, validate_paths_exist
-from src.core.cli_utils import format_violations
+from src.cli.utils import iter_linting_on_paths, setup_base_orchestrator, validate_paths_exist
+from src.core.cli_utils import stream_violations
 from src.core.types import Violation
 
 if TYPE_CHECKING:
@@ -53,42 +54,51 @@ if TYPE_CHECKING:
 
 
 def _setup_performance_orchestrator(
-    path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
+    path_objs: list[Path],
+    config_file: str | None,
+    verbose: bool,
+    project_root: Path | None = None,
+    rules: list[str] | None = None,
 ) -> "Orchestrator":
-    """Set up orchestrator for performance linting."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    """Set up orchestrator for performance linting, running only the given rules."""
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=rules or ["performance"]
+    )
 
 
-def _setup_and_validate(params: ExecuteParams) -> "Orchestrator":
+def _setup_and_validate(params: ExecuteParams, rules: list[str] | None = None) -> "Orchestrator":
     """Validate paths and set up orchestrator for linting.
 
     Common setup code extracted to avoid DRY violations across execute functions.
+
+    Args:
+        params: Command execution parameters
+        rules: Performance rule ids to run (defaults to every performance rule)
     """
     validate_paths_exist(params.path_objs)
     return _setup_performance_orchestrator(
-        params.path_objs, params.config_file, params.verbose, params.project_root
+        params.path_objs, params.config_file, params.verbose, params.project_root, rules
     )
 
 
 def _run_string_concat_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute string-concat-loop lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id == "performance.string-concat-loop"]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id == "performance.string-concat-loop")
 
 
 def _execute_string_concat_lint(params: ExecuteParams) -> NoReturn:
     """Execute string-concat-loop lint."""
-    orchestrator = _setup_and_validate(params)
+    orchestrator = _setup_and_validate(params, ["performance.string-concat-loop"])
     violations = _run_string_concat_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(violations, params.format)
 
-    logger.debug(f"Found {len(violations)} string-concat-loop violation(s)")
-
-    format_violations(violations, params.format)
-    sys.exit(1 if violations else 0)
+    logger.debug(f"Found {count} string-concat-loop violation(s)")
+    sys.exit(1 if count else 0)
 
 
 string_concat_loop = create_linter_command(
@@ -107,23 +117,22 @@ string_concat_loop = create_linter_command(
 
 def _run_regex_in_loop_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute regex-in-loop lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id == "performance.regex-in-loop"]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id == "performance.regex-in-loop")
 
 
 def _execute_regex_in_loop_lint(params: ExecuteParams) -> NoReturn:
     """Execute regex-in-loop lint."""
-    orchestrator = _setup_and_validate(params)
+    orchestrator = _setup_and_validate(params, ["performance.regex-in-loop"])
     violations = _run_regex_in_loop_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(violations, params.format)
 
-    logger.debug(f"Found {len(violations)} regex-in-loop violation(s)")
-
-    format_violations(violations, params.format)
-    sys.exit(1 if violations else 0)
+    logger.debug(f"Found {count} regex-in-loop violation(s)")
+    sys.exit(1 if count else 0)
 
 
 regex_in_loop = create_linter_command(
@@ -150,15 +159,15 @@ PERF_RULES = {
 }
 
 
-def _filter_by_rule(violations: list[Violation], rule: str | None) -> list[Violation]:
+def _filter_by_rule(violations: Iterable[Violation], rule: str | None) -> Iterable[Violation]:
     """Filter violations by rule name if specified.
 
     Args:
-        violations: List of violations to filter
+        violations: Violations to filter
         rule: Optional rule name (string-concat, regex-loop, or full rule names)
 
     Returns:
-        Filtered list of violations
+        Filtered violations (lazily, so output can stream)
     """
     if not rule:
         return violations
@@ -168,7 +177,7 @@ def _filter_by_rule(violations: list[Violation], rule: str | None) -> list[Viola
         logger.warning(f"Unknown rule '{rule}'. Valid rules: {', '.join(PERF_RULES.keys())}")
         return violations
 
-    return [v for v in violations if v.rule_id == rule_id]
+    return (v for v in violations if v.rule_id == rule_id)
 
 
 def _run_all_perf_lint(
@@ -177,7 +186,7 @@ def _run_all_perf_lint(
     recursive: bool,
     rule: str | None,
     parallel: bool = False,
-) -> list[Violation]:
+) -> Iterable[Violation]:
     """Execute all performance lints on files or directories.
 
     Args:
@@ -188,24 +197,24 @@ def _run_all_perf_lint(
         parallel: Whether to use parallel processing
 
     Returns:
-        List of performance-related violations
+        Performance-related violations, as they are found
     """
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    perf_violations = [v for v in all_violations if v.rule_id.startswith("performance.")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    perf_violations = (v for v in all_violations if v.rule_id.startswith("performance."))
     return _filter_by_rule(perf_violations, rule)
 
 
 def _execute_perf_lint(params: ExecuteParams, rule: str | None) -> NoReturn:
     """Execute combined performance lint."""
-    orchestrator = _setup_and_validate(params)
+    selected = PERF_RULES.get(rule) if rule else None
+    orchestrator = _setup_and_validate(params, [selected] if selected else None)
     violations = _run_all_perf_lint(
         orchestrator, params.path_objs, params.recursive, rule, params.parallel
     )
+    count = stream_violations(violations, params.format)
 
-    logger.debug(f"Found {len(violations)} performance violation(s)")
-
-    format_violations(violations, params.format)
-    sys.exit(1 if violations else 0)
+    logger.debug(f"Found {count} performance violation(s)")
+    sys.exit(1 if count else 0)
 
 
 @cli.command(
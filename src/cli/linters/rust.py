@@ -20,14 +20,15 @@ Implementation: Click decorators for command definition, orchestrator-based lint
 """
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
 from loguru import logger
 
 from src.cli.linters.shared import ExecuteParams, create_linter_command
-from src.cli.utils import execute_linting_on_paths, setup_base_orchestrator, validate_paths_exist
-from src.core.cli_utils import format_violations
+from src.cli.utils import iter_linting_on_paths, setup_base_orchestrator, validate_paths_exist
+from src.core.cli_utils import stream_violations
 from src.core.types import Violation
 
 if TYPE_CHECKING:
@@ -43,15 +44,17 @@ def _setup_unwrap_abuse_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for unwrap-abuse command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["unwrap-abuse"]
+    )
 
 
 def _run_unwrap_abuse_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute unwrap-abuse lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id.startswith("unwrap-abuse")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id.startswith("unwrap-abuse"))
 
 
 def _execute_unwrap_abuse_lint(params: ExecuteParams) -> NoReturn:
@@ -63,11 +66,10 @@ def _execute_unwrap_abuse_lint(params: ExecuteParams) -> NoReturn:
     unwrap_abuse_violations = _run_unwrap_abuse_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(unwrap_abuse_violations, params.format)
 
-    logger.debug(f"Found {len(unwrap_abuse_violations)} unwrap abuse violation(s)")
-
-    format_violations(unwrap_abuse_violations, params.format)
-    sys.exit(1 if unwrap_abuse_violations else 0)
+    logger.debug(f"Found {count} unwrap abuse violation(s)")
+    sys.exit(1 if count else 0)
 
 
 unwrap_abuse = create_linter_command(
@@ -90,15 +92,17 @@ def _setup_clone_abuse_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for clone-abuse command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["clone-abuse"]
+    )
 
 
 def _run_clone_abuse_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute clone-abuse lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id.startswith("clone-abuse")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id.startswith("clone-abuse"))
 
 
 def _execute_clone_abuse_lint(params: ExecuteParams) -> NoReturn:
@@ -110,11 +114,10 @@ def _execute_clone_abuse_lint(params: ExecuteParams) -> NoReturn:
     clone_abuse_violations = _run_clone_abuse_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(clone_abuse_violations, params.format)
 
-    logger.debug(f"Found {len(clone_abuse_violations)} clone abuse violation(s)")
-
-    format_violations(clone_abuse_violations, params.format)
-    sys.exit(1 if clone_abuse_violations else 0)
+    logger.debug(f"Found {count} clone abuse violation(s)")
+    sys.exit(1 if count else 0)
 
 
 clone_abuse = create_linter_command(
@@ -138,15 +141,17 @@ def _setup_blocking_async_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for blocking-async command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["blocking-async"]
+    )
 
 
 def _run_blocking_async_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute blocking-async lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if v.rule_id.startswith("blocking-async")]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if v.rule_id.startswith("blocking-async"))
 
 
 def _execute_blocking_async_lint(params: ExecuteParams) -> NoReturn:
@@ -158,11 +163,10 @@ def _execute_blocking_async_lint(params: ExecuteParams) -> NoReturn:
     blocking_async_violations = _run_blocking_async_lint(
         orchestrator, params.path_objs, params.recursive, params.parallel
     )
+    count = stream_violations(blocking_async_violations, params.format)
 
-    logger.debug(f"Found {len(blocking_async_violations)} blocking-async violation(s)")
-
-    format_violations(blocking_async_violations, params.format)
-    sys.exit(1 if blocking_async_violations else 0)
+    logger.debug(f"Found {count} blocking-async violation(s)")
+    sys.exit(1 if count else 0)
 
 
 blocking_async = create_linter_command(
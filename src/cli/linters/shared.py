@@ -39,6 +39,7 @@ from src.cli.utils import (
     get_project_root_from_context,
     handle_linting_error,
     parallel_option,
+    profile_options,
 )
 from src.core.types import Violation
 
@@ -57,6 +58,7 @@ def standard_linter_options(f: Any) -> Any:
     - format option
     - recursive option
     - parallel option
+    - profile options (--profile, --profile-format)
     - pass_context
 
     Usage:
@@ -66,6 +68,7 @@ def standard_linter_options(f: Any) -> Any:
             ...
     """
     f = click.pass_context(f)
+    f = profile_options(f)
     f = parallel_option(f)
     f = click.option(
         "--recursive/--no-recursive", default=True, help="Scan directories recursively"
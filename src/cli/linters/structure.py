@@ -26,6 +26,7 @@ Suppressions:
 
 import json
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NoReturn
 
@@ -39,16 +40,17 @@ from src.cli.linters.shared import (
 )
 from src.cli.main import cli
 from src.cli.utils import (
-    execute_linting_on_paths,
     format_option,
     get_or_detect_project_root,
     handle_linting_error,
+    iter_linting_on_paths,
     load_config_file,
     parallel_option,
+    profile_options,
     setup_base_orchestrator,
     validate_paths_exist,
 )
-from src.core.cli_utils import format_violations
+from src.core.cli_utils import stream_violations
 from src.core.types import Violation
 
 if TYPE_CHECKING:
@@ -70,7 +72,7 @@ def _setup_orchestrator(
     from src.orchestrator.core import Orchestrator
 
     project_root = get_or_detect_project_root(path_objs, project_root)
-    orchestrator = Orchestrator(project_root=project_root)
+    orchestrator = Orchestrator(project_root=project_root, rules=["file-placement"])
     _apply_orchestrator_config(orchestrator, config_file, rules, verbose)
     return orchestrator
 
@@ -109,6 +111,7 @@ def _parse_json_rules(rules: str) -> dict[str, Any]:
 @format_option
 @click.option("--recursive/--no-recursive", default=True, help="Scan directories recursively")
 @parallel_option
+@profile_options
 @click.pass_context
 def file_placement(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -185,15 +188,14 @@ def _execute_file_placement_lint(  # pylint: disable=too-many-arguments,too-many
     """Execute file placement linting."""
     validate_paths_exist(path_objs)
     orchestrator = _setup_orchestrator(path_objs, config_file, rules, verbose, project_root)
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
 
     # Filter to only file-placement violations
-    violations = [v for v in all_violations if v.rule_id.startswith("file-placement")]
+    violations = (v for v in all_violations if v.rule_id.startswith("file-placement"))
+    count = stream_violations(violations, format)
 
-    logger.debug(f"Found {len(violations)} violation(s)")
-
-    format_violations(violations, format)
-    sys.exit(1 if violations else 0)
+    logger.debug(f"Found {count} violation(s)")
+    sys.exit(1 if count else 0)
 
 
 # =============================================================================
@@ -205,7 +207,9 @@ def _setup_pipeline_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for pipeline command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["collection-pipeline"]
+    )
 
 
 def _apply_pipeline_config_override(
@@ -221,10 +225,10 @@ def _apply_pipeline_config_override(
 
 def _run_pipeline_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute collection-pipeline lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "collection-pipeline" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "collection-pipeline" in v.rule_id)
 
 
 @cli.command("pipeline")
@@ -234,6 +238,7 @@ def _run_pipeline_lint(
 @click.option("--min-continues", type=int, help="Override min continue guards to flag (default: 1)")
 @click.option("--recursive/--no-recursive", default=True, help="Scan directories recursively")
 @parallel_option
+@profile_options
 @click.pass_context
 def pipeline(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -313,8 +318,7 @@ def _execute_pipeline_lint(  # pylint: disable=too-many-arguments,too-many-posit
     orchestrator = _setup_pipeline_orchestrator(path_objs, config_file, verbose, project_root)
     _apply_pipeline_config_override(orchestrator, min_continues, verbose)
     pipeline_violations = _run_pipeline_lint(orchestrator, path_objs, recursive, parallel)
+    count = stream_violations(pipeline_violations, format)
 
-    logger.debug(f"Found {len(pipeline_violations)} collection-pipeline violation(s)")
-
-    format_violations(pipeline_violations, format)
-    sys.exit(1 if pipeline_violations else 0)
+    logger.debug(f"Found {count} collection-pipeline violation(s)")
+    sys.exit(1 if count else 0)
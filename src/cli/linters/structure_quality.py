@@ -26,6 +26,7 @@ Suppressions:
 """
 
 import sys
+from collections.abc import Iterator
 from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
@@ -40,14 +41,15 @@ from src.cli.linters.shared import (
 )
 from src.cli.main import cli
 from src.cli.utils import (
-    execute_linting_on_paths,
     format_option,
     handle_linting_error,
+    iter_linting_on_paths,
     parallel_option,
+    profile_options,
     setup_base_orchestrator,
     validate_paths_exist,
 )
-from src.core.cli_utils import format_violations
+from src.core.cli_utils import stream_violations
 from src.core.types import Violation
 
 if TYPE_CHECKING:
@@ -62,7 +64,7 @@ def _setup_nesting_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for nesting command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(path_objs, config_file, verbose, project_root, rules=["nesting"])
 
 
 def _apply_nesting_config_override(
@@ -88,10 +90,10 @@ def _apply_nesting_to_languages(nesting_config: dict, max_depth: int) -> None:
 
 def _run_nesting_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute nesting lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "nesting" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "nesting" in v.rule_id)
 
 
 @cli.command("nesting")
@@ -101,6 +103,7 @@ def _run_nesting_lint(
 @click.option("--max-depth", type=int, help="Override max nesting depth (default: 4)")
 @click.option("--recursive/--no-recursive", default=True, help="Scan directories recursively")
 @parallel_option
+@profile_options
 @click.pass_context
 def nesting(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -184,11 +187,10 @@ def _execute_nesting_lint(  # pylint: disable=too-many-arguments,too-many-positi
     orchestrator = _setup_nesting_orchestrator(path_objs, config_file, verbose, project_root)
     _apply_nesting_config_override(orchestrator, max_depth, verbose)
     nesting_violations = _run_nesting_lint(orchestrator, path_objs, recursive, parallel)
+    count = stream_violations(nesting_violations, format)
 
-    logger.debug(f"Found {len(nesting_violations)} nesting violation(s)")
-
-    format_violations(nesting_violations, format)
-    sys.exit(1 if nesting_violations else 0)
+    logger.debug(f"Found {count} nesting violation(s)")
+    sys.exit(1 if count else 0)
 
 
 # =============================================================================
@@ -200,7 +202,7 @@ def _setup_srp_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for SRP command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(path_objs, config_file, verbose, project_root, rules=["srp"])
 
 
 def _apply_srp_config_override(
@@ -217,10 +219,10 @@ def _apply_srp_config_override(
 
 def _run_srp_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute SRP lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "srp" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "srp" in v.rule_id)
 
 
 @cli.command("srp")
@@ -231,6 +233,7 @@ def _run_srp_lint(
 @click.option("--max-loc", type=int, help="Override max lines of code per class (default: 200)")
 @click.option("--recursive/--no-recursive", default=True, help="Scan directories recursively")
 @parallel_option
+@profile_options
 @click.pass_context
 def srp(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -315,11 +318,10 @@ def _execute_srp_lint(  # pylint: disable=too-many-arguments,too-many-positional
     orchestrator = _setup_srp_orchestrator(path_objs, config_file, verbose, project_root)
     _apply_srp_config_override(orchestrator, max_methods, max_loc, verbose)
     srp_violations = _run_srp_lint(orchestrator, path_objs, recursive, parallel)
+    count = stream_violations(srp_violations, format)
 
-    logger.debug(f"Found {len(srp_violations)} SRP violation(s)")
-
-    format_violations(srp_violations, format)
-    sys.exit(1 if srp_violations else 0)
+    logger.debug(f"Found {count} SRP violation(s)")
+    sys.exit(1 if count else 0)
 
 
 # =============================================================================
@@ -331,7 +333,9 @@ def _setup_lod_orchestrator(
     path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
 ) -> "Orchestrator":
     """Set up orchestrator for law-of-demeter command."""
-    return setup_base_orchestrator(path_objs, config_file, verbose, project_root)
+    return setup_base_orchestrator(
+        path_objs, config_file, verbose, project_root, rules=["law-of-demeter"]
+    )
 
 
 def _apply_lod_config_override(
@@ -351,10 +355,10 @@ def _apply_lod_config_override(
 
 def _run_lod_lint(
     orchestrator: "Orchestrator", path_objs: list[Path], recursive: bool, parallel: bool = False
-) -> list[Violation]:
+) -> Iterator[Violation]:
     """Execute law-of-demeter lint on files or directories."""
-    all_violations = execute_linting_on_paths(orchestrator, path_objs, recursive, parallel)
-    return [v for v in all_violations if "law-of-demeter" in v.rule_id]
+    all_violations = iter_linting_on_paths(orchestrator, path_objs, recursive, parallel)
+    return (v for v in all_violations if "law-of-demeter" in v.rule_id)
 
 
 @cli.command("law-of-demeter")
@@ -369,6 +373,7 @@ def _run_lod_lint(
 )
 @click.option("--recursive/--no-recursive", default=True, help="Scan directories recursively")
 @parallel_option
+@profile_options
 @click.pass_context
 def law_of_demeter(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     ctx: click.Context,
@@ -451,8 +456,7 @@ def _execute_lod_lint(  # pylint: disable=too-many-arguments,too-many-positional
     orchestrator = _setup_lod_orchestrator(path_objs, config_file, verbose, project_root)
     _apply_lod_config_override(orchestrator, min_depth, check_test_files, verbose)
     lod_violations = _run_lod_lint(orchestrator, path_objs, recursive, parallel)
+    count = stream_violations(lod_violations, format)
 
-    logger.debug(f"Found {len(lod_violations)} Law of Demeter violation(s)")
-
-    format_violations(lod_violations, format)
-    sys.exit(1 if lod_violations else 0)
+    logger.debug(f"Found {count} Law of Demeter violation(s)")
+    sys.exit(1 if count else 0)
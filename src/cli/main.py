@@ -4,21 +4,29 @@ Purpose: Main CLI group definition and core setup for thai-lint command-line int
 Scope: Core Click group configuration, version handling, global options, and context setup
 
 Overview: Defines the root CLI command group using Click framework with version option and global
-    options (verbose, config, project-root). Handles context initialization, logging setup, and
-    configuration loading. Serves as the central entry point that other CLI modules register
-    commands against. Provides the foundation for modular CLI architecture where commands are
-    defined in separate modules but registered to this main group.
+    options (verbose, config, project-root, and the git changed-files selectors changed-since and
+    staged, which linter commands apply to their paths). Handles context initialization, logging
+    setup, and configuration loading. Serves as the central entry point that other CLI modules
+    register commands against. Provides the foundation for modular CLI architecture where commands
+    are defined in separate modules but registered to this main group. The group is a LazyGroup:
+    COMMAND_MODULES maps each command name to the module defining it, and only the module of the
+    command being run is imported. The version is likewise read only when --version is given.
 
 Dependencies: click for CLI framework, src.config for configuration loading, src.__version__ for
-    version info
+    version info, src.cli.lazy_group for deferred command imports
 
-Exports: cli (main Click command group), setup_logging function
+Exports: cli (main Click command group), setup_logging function, COMMAND_MODULES
 
-Interfaces: Click context object with config, verbose, project_root options stored in ctx.obj
+Interfaces: Click context object with config, verbose, project_root, changed_since, staged options
+    stored in ctx.obj
 
 Implementation: Uses Click decorators for group definition, stores parsed options in context
     for child commands to access. Defers project root determination to avoid import issues
     in test environments.
+
+Suppressions:
+    - too-many-arguments,too-many-positional-arguments: The group callback receives one parameter
+        per global option by Click design
 """
 
 import sys
@@ -27,9 +35,43 @@ from pathlib import Path
 import click
 from loguru import logger
 
-from src import __version__
+from src.cli.lazy_group import LazyGroup
 from src.config import ConfigError, load_config
 
+_CONFIG_COMMANDS = "src.cli.config"
+_LINTERS = "src.cli.linters"
+
+# Command name -> module registering it; keep in sync when adding a command
+COMMAND_MODULES: dict[str, str] = {
+    "config": _CONFIG_COMMANDS,
+    "init-config": _CONFIG_COMMANDS,
+    "hello": _CONFIG_COMMANDS,
+    "serve": "src.cli.serve",
+    "check": f"{_LINTERS}.check",
+    "improper-logging": f"{_LINTERS}.code_patterns",
+    "print-statements": f"{_LINTERS}.code_patterns",
+    "method-property": f"{_LINTERS}.code_patterns",
+    "stateless-class": f"{_LINTERS}.code_patterns",
+    "lazy-ignores": f"{_LINTERS}.code_patterns",
+    "lbyl": f"{_LINTERS}.code_patterns",
+    "dry": f"{_LINTERS}.code_smells",
+    "magic-numbers": f"{_LINTERS}.code_smells",
+    "stringly-typed": f"{_LINTERS}.code_smells",
+    "file-header": f"{_LINTERS}.documentation",
+    "version-freshness": f"{_LINTERS}.infrastructure",
+    "perf": f"{_LINTERS}.performance",
+    "string-concat-loop": f"{_LINTERS}.performance",
+    "regex-in-loop": f"{_LINTERS}.performance",
+    "unwrap-abuse": f"{_LINTERS}.rust",
+    "clone-abuse": f"{_LINTERS}.rust",
+    "blocking-async": f"{_LINTERS}.rust",
+    "file-placement": f"{_LINTERS}.structure",
+    "pipeline": f"{_LINTERS}.structure",
+    "nesting": f"{_LINTERS}.structure_quality",
+    "srp": f"{_LINTERS}.structure_quality",
+    "law-of-demeter": f"{_LINTERS}.structure_quality",
+}
+
 
 def setup_logging(verbose: bool = False) -> None:
     """Configure loguru for the CLI application.
@@ -47,8 +89,25 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-@click.group()
-@click.version_option(version=__version__)
+def _print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    """Print the version and exit (the --version option callback)."""
+    if not value or ctx.resilient_parsing:
+        return
+    from src import __version__
+
+    click.echo(f"{ctx.find_root().info_name}, version {__version__}")
+    ctx.exit()
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMAND_MODULES)
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
 @click.option("--config", "-c", type=click.Path(), help="Path to config file")
 @click.option(
@@ -56,8 +115,21 @@ def setup_logging(verbose: bool = False) -> None:
     type=click.Path(),
     help="Explicitly specify project root directory (overrides auto-detection)",
 )
+@click.option(
+    "--changed-since",
+    metavar="REF",
+    help="Lint only files changed since the merge base with a git ref (e.g. main)",
+)
+@click.option("--staged", is_flag=True, help="Lint only files with staged changes")
 @click.pass_context
-def cli(ctx: click.Context, verbose: bool, config: str | None, project_root: str | None) -> None:
+def cli(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    ctx: click.Context,
+    verbose: bool,
+    config: str | None,
+    project_root: str | None,
+    changed_since: str | None,
+    staged: bool,
+) -> None:
     """thai-lint - AI code linter and governance tool
 
     Lint and governance for AI-generated code across multiple languages.
@@ -81,6 +153,10 @@ def cli(ctx: click.Context, verbose: bool, config: str | None, project_root: str
         # Specify project root explicitly (useful in Docker)
         thai-lint --project-root /workspace/root magic-numbers backend/
 
+        \b
+        # Lint only the files a branch changed since main
+        thai-lint --changed-since main dry .
+
         \b
         # Get JSON output
         thai-lint file-placement --format json .
@@ -99,6 +175,8 @@ def cli(ctx: click.Context, verbose: bool, config: str | None, project_root: str
     # (deferred to avoid pyprojroot import issues in test environments)
     ctx.obj["cli_project_root"] = project_root
     ctx.obj["cli_config_path"] = config
+    ctx.obj["changed_since"] = changed_since
+    ctx.obj["staged"] = staged
 
     # Load configuration
     try:
@@ -0,0 +1,89 @@
+"""
+Purpose: CLI command running the long-lived thailint daemon for a project
+
+Scope: thailint serve: start the daemon in the foreground, or stop/check a running one
+
+Overview: Starts a LintServer for the project root (from --project-root, else the current
+    directory) and serves lint requests on its Unix domain socket until stopped. While it runs,
+    the thailint console script forwards linter commands started anywhere inside the project to
+    it (see src.daemon.client), so editor integrations and pre-commit hooks skip process start-up
+    work. --status reports whether a daemon is serving the project and --stop asks it to shut
+    down. Unavailable on platforms without Unix domain sockets.
+
+Dependencies: click, src.cli.main for CLI group, src.cli.utils for project root resolution,
+    src.daemon for the server, client and protocol
+
+Exports: serve command
+
+Interfaces: thailint serve [--status | --stop]
+
+Implementation: Foreground process; Ctrl-C or a shutdown request stops it and removes the socket
+"""
+
+import contextlib
+import sys
+from pathlib import Path
+
+import click
+
+from src.cli.main import cli
+from src.cli.utils import get_project_root_from_context
+from src.daemon.client import send_request
+from src.daemon.protocol import OP_PING, OP_SHUTDOWN, daemon_supported, socket_path
+
+
+@cli.command("serve")
+@click.option("--status", "show_status", is_flag=True, help="Report whether a daemon is serving")
+@click.option("--stop", is_flag=True, help="Stop the daemon serving the project")
+@click.pass_context
+def serve(ctx: click.Context, show_status: bool, stop: bool) -> None:
+    """Serve lint requests from a warm, long-running process.
+
+    Keeps linters, configuration and parse caches loaded and answers the
+    linter commands run inside the project over a local socket, so each
+    invocation skips start-up work. Set THAILINT_NO_DAEMON=1 to bypass it.
+
+    Examples:
+
+        \b
+        # Serve the current project until Ctrl-C
+        thailint serve
+
+        \b
+        # Stop the daemon
+        thailint serve --stop
+    """
+    if not daemon_supported():
+        click.echo("Error: thailint serve requires Unix domain sockets", err=True)
+        sys.exit(2)
+
+    project_root = (get_project_root_from_context(ctx) or Path.cwd()).resolve()
+    if show_status or stop:
+        sys.exit(_control_daemon(project_root, OP_SHUTDOWN if stop else OP_PING))
+    _run_daemon(project_root)
+
+
+def _control_daemon(project_root: Path, op: str) -> int:
+    """Send a ping or shutdown request, returning 0 if a daemon answered."""
+    reply = send_request(socket_path(project_root), {"op": op})
+    if reply is None:
+        click.echo(f"No thailint daemon is serving {project_root}")
+        return 1
+    action = "Stopping" if op == OP_SHUTDOWN else "Serving"
+    click.echo(f"{action} {project_root}")
+    return 0
+
+
+def _run_daemon(project_root: Path) -> None:
+    """Serve the project in the foreground until stopped."""
+    from src.daemon.server import DaemonAlreadyRunningError, InsecureSocketDirError, LintServer
+
+    try:
+        server = LintServer(project_root)
+    except (DaemonAlreadyRunningError, InsecureSocketDirError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(2)
+
+    click.echo(f"Serving {project_root} on {server.socket_file}", err=True)
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_until_stopped()
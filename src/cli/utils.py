@@ -5,25 +5,34 @@ Scope: Project root resolution, path validation, common decorators, and orchestr
 
 Overview: Provides reusable utilities for CLI commands including project root determination with
     precedence rules (explicit > config-inferred > auto-detected), path existence validation,
-    common Click option decorators (format, project-root), and orchestrator setup helpers.
+    common Click option decorators (format, project-root), orchestrator setup helpers, and the
+    linting entry point every linter command uses, which switches to a git changed-files run when
+    the global --changed-since or --staged option is given. The --profile options every linter
+    command takes are stored in ctx.obj; start_profiling turns them into a RunProfile whose
+    report is written to stderr when the command ends, so it never mixes with the results.
     Centralizes shared logic to reduce duplication across linter command modules while
     maintaining consistent behavior for all CLI operations.
 
 Dependencies: click for CLI framework, pathlib for file paths, logging for debug output,
-    src.orchestrator for linting execution, src.utils.project_root for auto-detection
+    src.orchestrator for linting execution, src.orchestrator.git_changes for changed-files runs,
+    src.orchestrator.profiler and src.formatters.profile_report for --profile,
+    src.utils.project_root for auto-detection
 
-Exports: format_option decorator, get_project_root_from_context, validate_paths_exist,
-    setup_base_orchestrator, execute_linting_on_paths, handle_linting_error
+Exports: format_option decorator, parallel_option decorator, profile_options decorator,
+    get_project_root_from_context, validate_paths_exist, setup_base_orchestrator,
+    execute_linting_on_paths, iter_linting_on_paths, start_profiling, handle_linting_error
 
 Interfaces: Click context integration via ctx.obj, Path objects for file operations
 
 Implementation: Uses Click decorators for option definitions, deferred imports for orchestrator
-    to support test environments, caches project root in context for efficiency
+    to support test environments, caches project root in context for efficiency, reuses loaded
+    configs across requests when running under thailint serve (src.daemon.warm_state)
 """
 
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import suppress
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
@@ -32,6 +41,8 @@ from loguru import logger
 
 if TYPE_CHECKING:
     from src.orchestrator.core import Orchestrator
+    from src.orchestrator.git_changes import ChangeSet
+    from src.orchestrator.profiler import RunProfile
 
 
 # =============================================================================
@@ -47,7 +58,7 @@ def format_option(func: F) -> F:
     return click.option(
         "--format",
         "-f",
-        type=click.Choice(["text", "json", "sarif"]),
+        type=click.Choice(["text", "json", "jsonl", "sarif"]),
         default="text",
         help="Output format",
     )(func)
@@ -64,6 +75,32 @@ def parallel_option(func: F) -> F:
     )(func)
 
 
+def _store_in_context_obj(ctx: click.Context, param: click.Parameter, value: Any) -> None:
+    """Keep an option's value in ctx.obj under the option's name (not a command argument)."""
+    if param.name is not None:
+        ctx.ensure_object(dict)[param.name] = value
+
+
+def profile_options(func: F) -> F:
+    """Add --profile and --profile-format to a linter command (read by start_profiling)."""
+    func = click.option(
+        "--profile-format",
+        type=click.Choice(["table", "json"]),
+        default="table",
+        expose_value=False,
+        callback=_store_in_context_obj,
+        help="Format of the --profile report",
+    )(func)
+    return click.option(
+        "--profile",
+        is_flag=True,
+        default=False,
+        expose_value=False,
+        callback=_store_in_context_obj,
+        help="Report wall/CPU time per rule and per phase on stderr",
+    )(func)
+
+
 # =============================================================================
 # Project Root Determination
 # =============================================================================
@@ -286,7 +323,11 @@ def get_or_detect_project_root(path_objs: list[Path], project_root: Path | None)
 
 
 def setup_base_orchestrator(
-    path_objs: list[Path], config_file: str | None, verbose: bool, project_root: Path | None = None
+    path_objs: list[Path],
+    config_file: str | None,
+    verbose: bool,
+    project_root: Path | None = None,
+    rules: Sequence[str] | None = None,
 ) -> "Orchestrator":
     """Set up orchestrator for linter commands.
 
@@ -295,17 +336,27 @@ def setup_base_orchestrator(
         config_file: Optional config file path
         verbose: Whether verbose logging is enabled
         project_root: Optional explicit project root
+        rules: Optional rule ids/categories to run (single-linter commands pass their own
+            linter so the other rules are never executed)
 
     Returns:
         Configured Orchestrator instance
     """
+    from src.daemon.warm_state import active_warm_configs
     from src.orchestrator.core import Orchestrator
 
     root = get_or_detect_project_root(path_objs, project_root)
-    orchestrator = Orchestrator(project_root=root)
+    # Under thailint serve, reuse the config loaded by an earlier request
+    warm_configs = active_warm_configs()
+    config = warm_configs.get(root, config_file) if warm_configs is not None else None
+    orchestrator = Orchestrator(project_root=root, rules=rules, config=config)
+    if config is not None:
+        return orchestrator
 
     if config_file:
         load_config_file(orchestrator, config_file, verbose)
+    if warm_configs is not None:
+        warm_configs.put(root, config_file, orchestrator.config)
 
     return orchestrator
 
@@ -365,22 +416,91 @@ def execute_linting_on_paths(
     Returns:
         List of violations from all paths
     """
-    files, dirs = separate_files_and_dirs(path_objs)
+    return list(iter_linting_on_paths(orchestrator, path_objs, recursive, parallel))
 
-    violations = []
 
-    # Lint files
-    if files:
-        if parallel:
-            violations.extend(orchestrator.lint_files_parallel(files))
-        else:
-            violations.extend(orchestrator.lint_files(files))
+def iter_linting_on_paths(
+    orchestrator: "Orchestrator",
+    path_objs: list[Path],
+    recursive: bool,
+    parallel: bool = False,
+) -> Iterator[Any]:
+    """Lint file/directory paths, yielding violations as each file finishes.
 
-    # Lint directories
-    for dir_path in dirs:
-        if parallel:
-            violations.extend(orchestrator.lint_directory_parallel(dir_path, recursive=recursive))
-        else:
-            violations.extend(orchestrator.lint_directory(dir_path, recursive=recursive))
+    Files and directories are linted in one pass, so cross-file rules are
+    finalized once for the whole run. With the global --changed-since or --staged
+    option, only the files under the paths that git reports as changed are linted
+    (see src.orchestrator.changed_files), and --parallel does not apply.
+
+    Args:
+        orchestrator: Orchestrator instance
+        path_objs: List of Path objects (files or directories)
+        recursive: Whether to scan directories recursively
+        parallel: Whether to use parallel processing for multiple files
 
-    return violations
+    Returns:
+        Iterator of violations in completion order (finalize() results last)
+    """
+    change_set = _collect_change_set(path_objs, recursive)
+    profile = start_profiling()
+    orchestrator.profile = profile
+    if change_set is not None:
+        from src.orchestrator.changed_files import iter_changed_violations
+
+        logger.debug(f"Linting {len(change_set.changed)} changed file(s)")
+        violations = iter_changed_violations(orchestrator, change_set)
+    else:
+        violations = orchestrator.iter_violations(path_objs, recursive=recursive, parallel=parallel)
+    return profile.time_output(violations) if profile is not None else violations
+
+
+def start_profiling() -> "RunProfile | None":
+    """Start profiling the command when --profile was given.
+
+    The report is written to stderr when the command's context closes, which also
+    happens when the command exits through sys.exit.
+
+    Returns:
+        The run's profile, or None when the command is not profiled
+    """
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.obj if ctx is not None and isinstance(ctx.obj, dict) else {}
+    if ctx is None or not obj.get("profile"):
+        return None
+
+    from src.orchestrator.profiler import RunProfile
+
+    profile = RunProfile()
+    ctx.call_on_close(partial(_report_profile, profile, obj.get("profile_format", "table")))
+    return profile
+
+
+def _report_profile(profile: "RunProfile", report_format: str) -> None:
+    """Write a finished run's profile report to stderr."""
+    profile.finish()
+
+    from src.formatters.profile_report import format_profile_json, format_profile_table
+
+    render = format_profile_json if report_format == "json" else format_profile_table
+    click.echo(render(profile.to_dict()), err=True)
+
+
+def _collect_change_set(path_objs: list[Path], recursive: bool) -> "ChangeSet | None":
+    """Collect the git change set requested by the global options, if any.
+
+    Raises:
+        SystemExit: If the changed files cannot be determined from git (exit code 2)
+    """
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.obj if ctx is not None and isinstance(ctx.obj, dict) else {}
+    since, staged = obj.get("changed_since"), obj.get("staged", False)
+    if not since and not staged:
+        return None
+
+    from src.orchestrator.git_changes import GitChangesError, collect_change_set
+
+    try:
+        return collect_change_set(path_objs, recursive, since=since, staged=staged)
+    except GitChangesError as e:
+        click.echo(f"Error: Cannot determine changed files: {e}", err=True)
+        sys.exit(2)
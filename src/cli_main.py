@@ -1,37 +1,52 @@
 """
 Purpose: Main CLI entrypoint for thai-lint command-line interface
 
-Scope: CLI package initialization and command registration via module imports
+Scope: Console script entry point for the thai-lint CLI group
 
-Overview: Thin entry point that imports and re-exports the fully configured CLI from the modular
-    src.cli package. All linter commands are registered via decorator side effects when their
-    modules are imported. Configuration commands (hello, config group, init-config) are in
-    src.cli.config, and linter commands (nesting, srp, dry, magic-numbers, file-placement,
-    print-statements, file-header, method-property, stateless-class, pipeline) are in
-    src.cli.linters submodules.
+Overview: Thin entry point that re-exports the CLI from the modular src.cli package. Linter
+    commands are registered via decorator side effects when their modules are imported, which
+    the group does lazily for the one command being run (see src.cli.main.COMMAND_MODULES).
+    Configuration commands (hello, config group, init-config) are in src.cli.config, and linter
+    commands (nesting, srp, dry, magic-numbers, file-placement, print-statements, file-header,
+    method-property, stateless-class, pipeline) are in src.cli.linters submodules. The console
+    script runs main, which first offers linter commands to a thailint serve daemon serving the
+    working directory and only runs the CLI in-process when there is none.
 
-Dependencies: click for CLI framework, src.cli for modular CLI package
+Dependencies: click for CLI framework, src.cli for modular CLI package, src.daemon.client for
+    forwarding to a running daemon
 
-Exports: cli (main command group with all commands registered)
+Exports: cli (main command group; commands resolve on first use), main (console script)
 
 Interfaces: Click CLI commands, integration with Orchestrator for linting execution
 
-Implementation: Module imports trigger command registration via Click decorator side effects
-
-Suppressions:
-    - F401: Module re-exports and imports trigger Click command registration via decorator side effects
+Implementation: Re-export of the lazily populated command group plus a forwarding entry point
 """
 
-# Import the main CLI group from the modular package
-# Import config module to register configuration commands
-# (hello, config group, init-config)
-from src.cli import config as _config_module  # noqa: F401
+import sys
+from pathlib import Path
+
+from src.cli import cli
+from src.cli.main import COMMAND_MODULES
+from src.daemon.client import forward_to_daemon
+
+# Linter commands, the ones a daemon runs on the client's behalf
+_FORWARDABLE_COMMANDS = frozenset(
+    name for name, module in COMMAND_MODULES.items() if module.startswith("src.cli.linters.")
+)
+
+
+def main() -> None:
+    """Run the CLI, through a serving thailint daemon when there is one."""
+    response = forward_to_daemon(sys.argv[1:], Path.cwd(), _FORWARDABLE_COMMANDS)
+    if response is None:
+        cli()
+        return
+    sys.stdout.write(response.stdout)
+    sys.stderr.write(response.stderr)
+    sys.exit(response.exit_code)
+
 
-# Import linters package to register all linter commands
-# (nesting, srp, dry, magic-numbers, file-placement, print-statements,
-#  file-header, method-property, stateless-class, pipeline)
-from src.cli import linters as _linters_module  # noqa: F401
-from src.cli.main import cli  # noqa: F401
+__all__ = ["cli", "main"]
 
 if __name__ == "__main__":
-    cli()
+    main()
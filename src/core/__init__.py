@@ -14,7 +14,7 @@ from .rule_aliases import (
     resolve_linter_name,
     resolve_rule_id,
 )
-from .types import Severity, Violation
+from .types import Severity, Violation, ViolationBatch
 
 __all__ = [
     "BaseLintContext",
@@ -24,6 +24,7 @@ __all__ = [
     "RuleRegistry",
     "Severity",
     "Violation",
+    "ViolationBatch",
     "is_deprecated_linter",
     "is_deprecated_rule_id",
     "resolve_linter_name",
@@ -6,7 +6,9 @@ Scope: Foundation interfaces for all linting rules, contexts, and plugin impleme
 Overview: Establishes the contract that all linting plugins must follow through abstract base
     classes, enabling the plugin architecture that allows dynamic rule discovery and execution.
     Defines BaseLintRule which all concrete linting rules inherit from, specifying required
-    properties (rule_id, rule_name, description) and the check() method for violation detection.
+    properties (rule_id, rule_name, description) and the check() method for violation detection,
+    plus an optional supported_languages declaration the rule registry uses to dispatch each file
+    only to the rules that handle its language.
     Provides BaseLintContext as the interface for accessing file information during analysis,
     exposing file_path, file_content, and language properties. Includes MultiLanguageLintRule
     intermediate class implementing template method pattern for language dispatch, eliminating
@@ -20,7 +22,11 @@ Dependencies: abc for abstract base class support, pathlib for Path types, Viola
 Exports: BaseLintRule (abstract rule interface), BaseLintContext (abstract context interface),
     MultiLanguageLintRule (template method base for multi-language linters)
 
-Interfaces: BaseLintRule.check(context) -> list[Violation], BaseLintContext properties
+Interfaces: BaseLintRule.check(context) -> list[Violation], BaseLintRule.supported_languages
+    -> frozenset[str] | None, BaseLintRule.results_cacheable -> bool,
+    BaseLintRule.honors_ignore_directives -> bool,
+    BaseLintRule.select_unchanged_files(candidates) -> list[Path],
+    BaseLintRule.ignored_path_patterns(raw_config) -> list[str] | None, BaseLintContext properties
     (file_path, file_content, language), all abstract methods must be implemented by subclasses
 
 Implementation: ABC-based interface definitions with @abstractmethod decorators, property-based
@@ -28,12 +34,18 @@ Implementation: ABC-based interface definitions with @abstractmethod decorators,
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 from .constants import Language
 from .types import Violation
 
+_PYTHON_AND_TYPESCRIPT: frozenset[str] = frozenset(
+    {Language.PYTHON, Language.TYPESCRIPT, Language.JAVASCRIPT}
+)
+_PYTHON_TYPESCRIPT_AND_RUST: frozenset[str] = _PYTHON_AND_TYPESCRIPT | {Language.RUST}
+
 
 class BaseLintContext(ABC):
     """Base class for lint context.
@@ -114,6 +126,49 @@ class BaseLintRule(ABC):
         """
         raise NotImplementedError("Subclasses must implement description")
 
+    @property
+    def supported_languages(self) -> frozenset[str] | None:
+        """Languages this rule analyzes, used to dispatch files to rules.
+
+        The orchestrator only calls check() for files whose detected language is in
+        this set, and never reads a file that no rule wants. Rules that look at every
+        file regardless of language (e.g. file placement) keep the default of None.
+
+        Returns:
+            Set of language identifiers (see Language), or None for any language.
+        """
+        return None
+
+    @property
+    def results_cacheable(self) -> bool:
+        """Whether check() results can be reused while the file and config are unchanged.
+
+        The opt-in result cache stores a rule's check() violations per file, keyed by
+        the file's content hash and the effective config, and skips check() entirely
+        on a hit. That is only sound for rules whose check() depends on nothing but the
+        file and the config. Rules that override finalize() accumulate cross-file state
+        in check(), so they are never served from the cache.
+
+        Returns:
+            True if this rule's per-file results may be cached.
+        """
+        return type(self).finalize is BaseLintRule.finalize
+
+    @property
+    def honors_ignore_directives(self) -> bool:
+        """Whether the orchestrator drops this rule's violations covered by ignore directives.
+
+        After check() and finalize() return, the orchestrator applies the file's
+        thailint ignore directives (ignore-file, ignore-start/ignore-end,
+        ignore-next-line, inline ignore) to every violation in one place. Rules that
+        report on the directives themselves (e.g. lazy-ignores) return False so a
+        directive cannot hide its own violation.
+
+        Returns:
+            True if ignore directives suppress this rule's violations.
+        """
+        return True
+
     @abstractmethod
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for violations in the given context.
@@ -138,6 +193,24 @@ class BaseLintRule(ABC):
         """
         return []
 
+    def select_unchanged_files(self, candidates: Sequence[Path]) -> list[Path]:
+        """Pick the unchanged files this rule must also check() in a changed-files run.
+
+        Optional hook consulted after the changed files were checked when linting only
+        the files that differ from a git ref (--changed-since/--staged). Per-file rules
+        need none. A rule with cross-file state compares the changed files against every
+        other file, so by default it gets all of them; a rule that keeps those files in
+        a persistent index can return just the ones missing from it. Violations from
+        finalize() are reported only for the changed files either way.
+
+        Args:
+            candidates: Unchanged files in scope whose language this rule handles.
+
+        Returns:
+            Files to pass to check() before finalize().
+        """
+        return [] if self.results_cacheable else list(candidates)
+
     def get_parallel_shared_config(self, shared_dir: Path) -> dict[str, Any] | None:
         """Return a config-section override to share state across --parallel workers.
 
@@ -158,6 +231,24 @@ class BaseLintRule(ABC):
         """
         return None
 
+    def ignored_path_patterns(self, raw_config: dict[str, Any]) -> list[str] | None:
+        """Return patterns covering every path this rule is configured to skip.
+
+        Optional hook consulted before directory traversal in runs limited to selected
+        rules. A directory covered by the patterns of every selected rule is pruned from
+        the walk, just like one the global ignore patterns cover, so its contents are
+        never enumerated. The default of None means the rule may report on any path and
+        keeps every directory walked. A rule that is disabled reports nothing anywhere
+        and may return ["**"].
+
+        Args:
+            raw_config: The full raw config dict used for this run.
+
+        Returns:
+            Gitignore-style patterns, or None if the rule cannot rule out any path.
+        """
+        return None
+
     def finalize_after_parallel(self, raw_config: dict[str, Any]) -> list[Violation]:
         """Finalize after a --parallel run, for rules that returned a shared config.
 
@@ -194,6 +285,17 @@ class MultiLanguageLintRule(BaseLintRule):
         """Initialize the multi-language lint rule."""
         pass  # Base class for multi-language linters
 
+    @property
+    def supported_languages(self) -> frozenset[str] | None:
+        """Languages reachable through _dispatch_by_language.
+
+        Python, TypeScript and JavaScript always; Rust only when the subclass
+        overrides _check_rust.
+        """
+        if type(self)._check_rust is MultiLanguageLintRule._check_rust:
+            return _PYTHON_AND_TYPESCRIPT
+        return _PYTHON_TYPESCRIPT_AND_RUST
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for violations with automatic language dispatch.
 
@@ -220,6 +322,19 @@ class MultiLanguageLintRule(BaseLintRule):
 
         return self._dispatch_by_language(context, config)
 
+    def ignored_path_patterns(self, raw_config: dict[str, Any]) -> list[str] | None:
+        """Return the ignore patterns check() applies for every language it dispatches.
+
+        None when a subclass overrides check(), or when the languages' configs ignore
+        different paths.
+        """
+        from .linter_utils import load_rule_ignore_patterns
+
+        if type(self).check is not MultiLanguageLintRule.check:
+            return None
+        languages = self.supported_languages or frozenset()
+        return load_rule_ignore_patterns(self._load_config, raw_config, languages)
+
     def _dispatch_by_language(self, context: BaseLintContext, config: Any) -> list[Violation]:
         """Dispatch to language-specific check method.
 
@@ -5,13 +5,15 @@ Scope: CLI command decorators, config loading, and violation output formatting
 
 Overview: Provides reusable utilities for CLI commands to eliminate duplication across linter
     commands (dry, srp, nesting, file-placement). Includes common option decorators for consistent
-    CLI interfaces, configuration file loading helpers, and violation output formatting for both
-    text and JSON formats. Standardizes CLI patterns across all linter commands for maintainability
+    CLI interfaces, configuration file loading helpers, and violation output formatting for text,
+    JSON, JSON-lines and SARIF formats, including streaming output that prints violations as the
+    orchestrator produces them. Standardizes CLI patterns across all linter commands for maintainability
     and consistency.
 
 Dependencies: click for CLI framework, pathlib for file paths, json for JSON output
 
-Exports: common_linter_options decorator, load_linter_config, format_violations
+Exports: common_linter_options decorator, load_linter_config, format_violations,
+    stream_violations, violations_to_json, violation_to_json
 
 Interfaces: Click decorators, config dict, violation list formatting
 
@@ -20,7 +22,7 @@ Implementation: Decorator composition for Click options, shared formatting logic
 
 import json
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -166,37 +168,75 @@ def format_violations(violations: list, output_format: str) -> None:
 
     Args:
         violations: List of violation objects with rule_id, file_path, line, column, message, severity
-        output_format: Output format ("text", "json", or "sarif")
+        output_format: Output format ("text", "json", "jsonl", or "sarif")
     """
-    if output_format == "json":
-        _output_json(violations)
-    elif output_format == "sarif":
-        _output_sarif(violations)
-    else:
-        _output_text(violations)
+    formatter = _FORMATTERS.get(output_format, _output_text)
+    formatter(violations)
 
 
-def _output_json(violations: list) -> None:
-    """Output violations in JSON format.
+def stream_violations(violations: Iterable, output_format: str) -> int:
+    """Print violations as they arrive, without holding them all in memory.
+
+    Text prints each violation as soon as it is produced and a summary line at the
+    end; jsonl prints one JSON object per line. JSON and SARIF are single documents,
+    so those formats collect the violations first and print them with format_violations.
+
+    Args:
+        violations: Iterable of violation objects (typically Orchestrator.iter_violations)
+        output_format: Output format ("text", "json", "jsonl", or "sarif")
+
+    Returns:
+        Number of violations printed
+    """
+    streamer = _STREAMERS.get(output_format)
+    if streamer is not None:
+        return streamer(violations)
+    collected = list(violations)
+    format_violations(collected, output_format)
+    return len(collected)
+
+
+def violation_to_json(v: Any) -> dict[str, Any]:
+    """Serialize one violation for JSON and JSON-lines output.
+
+    Args:
+        v: Violation object
+
+    Returns:
+        Dict with rule_id, file_path, line, column, message and severity
+    """
+    return {
+        "rule_id": v.rule_id,
+        "file_path": _sanitize_string(str(v.file_path)),
+        "line": v.line,
+        "column": v.column,
+        "message": _sanitize_string(v.message),
+        "severity": v.severity.name,
+    }
+
+
+def violations_to_json(violations: list) -> dict[str, Any]:
+    """Build the JSON output document for a list of violations.
 
     Args:
         violations: List of violation objects
+
+    Returns:
+        Dict with "violations" (serialized violations) and "total" keys
     """
-    output = {
-        "violations": [
-            {
-                "rule_id": v.rule_id,
-                "file_path": _sanitize_string(str(v.file_path)),
-                "line": v.line,
-                "column": v.column,
-                "message": _sanitize_string(v.message),
-                "severity": v.severity.name,
-            }
-            for v in violations
-        ],
+    return {
+        "violations": [violation_to_json(v) for v in violations],
         "total": len(violations),
     }
-    click.echo(json.dumps(output, indent=2))
+
+
+def _output_json(violations: list) -> None:
+    """Output violations in JSON format.
+
+    Args:
+        violations: List of violation objects
+    """
+    click.echo(json.dumps(violations_to_json(violations), indent=2))
 
 
 def _output_sarif(violations: list) -> None:
@@ -212,6 +252,39 @@ def _output_sarif(violations: list) -> None:
     click.echo(json.dumps(sarif_doc, indent=2))
 
 
+def _output_jsonl(violations: Iterable) -> int:
+    """Output violations as JSON lines, one object per violation, as they arrive.
+
+    Args:
+        violations: Iterable of violation objects
+
+    Returns:
+        Number of violations printed
+    """
+    count = 0
+    for v in violations:
+        click.echo(json.dumps(violation_to_json(v)))
+        count += 1
+    return count
+
+
+def _stream_text(violations: Iterable) -> int:
+    """Output violations in text format as they arrive, with the total at the end.
+
+    Args:
+        violations: Iterable of violation objects
+
+    Returns:
+        Number of violations printed
+    """
+    count = 0
+    for v in violations:
+        _print_violation(v)
+        count += 1
+    click.echo(f"Found {count} violation(s)" if count else "✓ No violations found")
+    return count
+
+
 def _output_text(violations: list) -> None:
     """Output violations in human-readable text format.
 
@@ -241,3 +314,17 @@ def _print_violation(v: Any) -> None:
     click.echo(f"  {location}")
     click.echo(f"    [{v.severity.name}] {v.rule_id}: {message}")
     click.echo()
+
+
+# Output format -> printer for a complete violation list (text is the fallback)
+_FORMATTERS: dict[str, Callable[[list], Any]] = {
+    "json": _output_json,
+    "jsonl": _output_jsonl,
+    "sarif": _output_sarif,
+}
+
+# Output format -> incremental printer (other formats are collected first)
+_STREAMERS: dict[str, Callable[[Iterable], int]] = {
+    "text": _stream_text,
+    "jsonl": _output_jsonl,
+}
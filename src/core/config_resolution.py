@@ -0,0 +1,122 @@
+"""
+Purpose: Resolve typed linter configs from the raw config once per run
+
+Scope: Config-class construction for load_linter_config and the per-run ResolvedConfigs memo
+
+Overview: Every rule turns its section of the raw config into a typed config object on every
+    check(), for every file. Construction is cheap once but not once per file per rule, and the
+    old TypeError fallback built a config twice for classes whose from_dict takes no language.
+    resolve_linter_config builds a config once, passing the language only to from_dict methods
+    that accept one (decided once per class from its signature). ResolvedConfigs memoizes the
+    result per (config key, config class, language) for one orchestrator run; the orchestrator
+    hands it to rules on each FileLintContext, and load_linter_config reads through it. Config
+    classes are frozen dataclasses, so one shared instance per language is safe to hand out.
+    An entry is rebuilt when its config section has been replaced since it was resolved.
+
+Dependencies: inspect, functools.cache, typing Protocol/TypeVar/cast
+
+Exports: ConfigProtocol, ConfigType, resolve_linter_config, ResolvedConfigs
+
+Interfaces: resolve_linter_config(config_dict, config_class, language) -> ConfigType,
+    ResolvedConfigs(config).resolve(config_key, config_class, language) -> ConfigType,
+    ResolvedConfigs.config (the raw config it resolves from)
+
+Implementation: Dict memo keyed by (key, class, language) storing the section object each entry
+    came from, checked by identity on every lookup
+
+Suppressions:
+    - invalid-name: ConfigType type variable follows Python generic naming convention
+    - type:ignore[return-value]: Generic config factory with runtime type checking
+"""
+
+import inspect
+from functools import cache
+from typing import Any, Protocol, TypeVar, cast
+
+
+# Protocol for config classes that support from_dict
+class ConfigProtocol(Protocol):
+    """Protocol for configuration classes with from_dict class method."""
+
+    @classmethod
+    def from_dict(
+        cls, config_dict: dict[str, Any], language: str | None = None
+    ) -> "ConfigProtocol":
+        """Create config instance from dictionary."""
+
+
+# Type variable for config classes
+ConfigType = TypeVar("ConfigType", bound=ConfigProtocol)  # pylint: disable=invalid-name
+
+# Stands in for a config key missing from the raw config
+_MISSING_SECTION = object()
+
+
+@cache
+def _accepts_language(config_class: type[ConfigProtocol]) -> bool:
+    """Check whether a config class's from_dict takes a language argument."""
+    try:
+        parameters = inspect.signature(config_class.from_dict).parameters
+    except (TypeError, ValueError):
+        return False
+    return "language" in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
+def resolve_linter_config(
+    config_dict: Any, config_class: type[ConfigType], language: str | None
+) -> ConfigType:
+    """Build a typed config from a raw config section.
+
+    Args:
+        config_dict: The linter's raw config section (anything but a dict yields defaults)
+        config_class: Configuration class with a from_dict() class method
+        language: Language for language-specific overrides, if from_dict supports them
+
+    Returns:
+        Configuration instance
+    """
+    if not isinstance(config_dict, dict):
+        return config_class()
+    if _accepts_language(config_class):
+        return config_class.from_dict(config_dict, language=language)  # type: ignore[return-value]
+    return config_class.from_dict(config_dict)  # type: ignore[return-value]
+
+
+class ResolvedConfigs:
+    """Typed linter configs resolved at most once per key, class and language."""
+
+    __slots__ = ("_resolved", "config")
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize an empty memo over a raw config.
+
+        Args:
+            config: The raw config dict the run's contexts carry as metadata
+        """
+        self.config = config
+        self._resolved: dict[tuple[str, type, str | None], tuple[object, Any]] = {}
+
+    def resolve(
+        self, config_key: str, config_class: type[ConfigType], language: str | None
+    ) -> ConfigType:
+        """Get the typed config for a linter section, building it on first use.
+
+        Args:
+            config_key: Key of the linter's section in the raw config
+            config_class: Configuration class with a from_dict() class method
+            language: Language for language-specific overrides
+
+        Returns:
+            Configuration instance shared by every file of the language
+        """
+        section = self.config.get(config_key, _MISSING_SECTION)
+        memo_key = (config_key, config_class, language)
+        cached = self._resolved.get(memo_key)
+        if cached is not None and cached[0] is section:
+            return cast(ConfigType, cached[1])
+        raw = {} if section is _MISSING_SECTION else section
+        resolved = resolve_linter_config(raw, config_class, language)
+        self._resolved[memo_key] = (section, resolved)
+        return resolved
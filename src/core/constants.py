@@ -11,7 +11,7 @@ Overview: Provides type-safe enums and constants for consistent stringly-typed p
 Dependencies: enum module
 
 Exports: Language enum, StorageMode enum, CONFIG_EXTENSIONS, JSON_EXTENSION, IgnoreDirective enum,
-    HEADER_SCAN_LINES, MAX_ATTRIBUTE_CHAIN_DEPTH
+    HEADER_SCAN_LINES, MAX_ATTRIBUTE_CHAIN_DEPTH, DEFAULT_CACHE_DIR_NAME
 
 Interfaces: Use enum values instead of string literals throughout codebase
 
@@ -58,3 +58,7 @@ HEADER_SCAN_LINES: int = 10
 
 # Maximum depth for attribute chain traversal (e.g., obj.attr.attr2.attr3)
 MAX_ATTRIBUTE_CHAIN_DEPTH: int = 3
+
+# Directory, relative to project root, holding the persistent DRY and stringly-typed indexes
+# and the result cache
+DEFAULT_CACHE_DIR_NAME: str = ".thailint-cache"
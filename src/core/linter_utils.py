@@ -5,32 +5,42 @@ Scope: Common config loading, metadata access, context validation, and AST parsi
 
 Overview: Provides reusable helper functions to eliminate duplication across linter implementations.
     Includes utilities for loading configuration from context metadata with language-specific overrides,
-    extracting metadata fields safely with type validation, validating context state, and parsing
-    Python AST with syntax error handling. Standardizes common patterns used by srp, nesting, dry,
-    performance, and file_placement linters. Reduces boilerplate code while maintaining type safety
-    and proper error handling.
+    extracting metadata fields safely with type validation, validating context state, and reading
+    the shared per-file Python AST (parsed once per file) with syntax error handling. Standardizes
+    common patterns used by srp, nesting, dry, performance, and file_placement linters. Checks
+    paths against config ignore lists through memoized compiled matchers, and resolves a rule's
+    ignore patterns from the run's config without a file so directory traversal can prune what
+    the selected rules all skip. Reduces boilerplate code while maintaining type safety and
+    proper error handling.
 
-Dependencies: BaseLintContext from src.core.base, ast for Python parsing
+Dependencies: BaseLintContext from src.core.base, PythonSource from src.core.python_source, ast,
+    ResolvedConfigs and resolve_linter_config from src.core.config_resolution
 
 Exports: get_metadata, get_metadata_value, load_linter_config, has_file_content, parse_python_ast,
-    with_parsed_python, resolve_file_path, is_ignored_path, get_line_context
+    with_parsed_python, get_context_python_source, get_python_ast, get_python_index,
+    get_python_parent_map,
+    resolve_file_path, is_ignored_path, is_file_ignored_by_config, get_config_ignore_patterns,
+    load_rule_ignore_patterns, get_line_context
 
 Interfaces: All functions take BaseLintContext and return typed values (dict, str, bool, Any)
 
 Implementation: Type-safe metadata access with fallbacks, generic config loading with language support
+    read through the run's ResolvedConfigs memo when the context carries one
 
 Suppressions:
-    - invalid-name: T type variable follows Python generic naming convention
-    - type:ignore[return-value]: Generic config factory with runtime type checking
     - unnecessary-ellipsis: Protocol method bodies use ellipsis per PEP 544
     - B101: Assert used to narrow type after parse_python_ast returns non-None tree
 """
 
 import ast
-from collections.abc import Callable
-from typing import Any, Protocol, TypeVar
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, Protocol
 
+from src.analyzers.ast_index import AstIndex
 from src.core.base import BaseLintContext
+from src.core.config_resolution import ConfigType, ResolvedConfigs, resolve_linter_config
+from src.core.python_source import PythonSource, get_python_source
 from src.core.types import Violation
 
 
@@ -45,21 +55,6 @@ class SyntaxErrorViolationBuilder(Protocol):
         ...  # pylint: disable=unnecessary-ellipsis
 
 
-# Protocol for config classes that support from_dict
-class ConfigProtocol(Protocol):
-    """Protocol for configuration classes with from_dict class method."""
-
-    @classmethod
-    def from_dict(
-        cls, config_dict: dict[str, Any], language: str | None = None
-    ) -> "ConfigProtocol":
-        """Create config instance from dictionary."""
-
-
-# Type variable for config classes
-ConfigType = TypeVar("ConfigType", bound=ConfigProtocol)  # pylint: disable=invalid-name
-
-
 def get_metadata(context: BaseLintContext) -> dict[str, Any]:
     """Get metadata dictionary from context with safe fallback.
 
@@ -123,6 +118,10 @@ def load_linter_config(
 ) -> ConfigType:
     """Load linter configuration from context metadata with language-specific overrides.
 
+    Contexts built by the orchestrator carry the run's ResolvedConfigs, so each config is
+    constructed once per run and language rather than once per file; other contexts
+    (e.g. test doubles) build it from their metadata on every call.
+
     Args:
         context: Lint context containing metadata
         config_key: Key to look up in metadata (e.g., "srp", "nesting", "dry")
@@ -134,24 +133,12 @@ def load_linter_config(
     Example:
         config = load_linter_config(context, "srp", SRPConfig)
     """
-    metadata = get_metadata(context)
-    config_dict = metadata.get(config_key, {})
-
-    if not isinstance(config_dict, dict):
-        return config_class()
-
-    # Get language for language-specific thresholds
     language = get_language(context)
-
-    # Call from_dict with language if config class supports it
-    # This works for SRPConfig, NestingConfig, etc.
-    try:
-        result = config_class.from_dict(config_dict, language=language)
-        return result  # type: ignore[return-value]
-    except TypeError:
-        # Fallback for config classes that don't support language parameter
-        result_fallback = config_class.from_dict(config_dict)
-        return result_fallback  # type: ignore[return-value]
+    resolved_configs = getattr(context, "resolved_configs", None)
+    if isinstance(resolved_configs, ResolvedConfigs):
+        return resolved_configs.resolve(config_key, config_class, language)
+    config_dict = get_metadata(context).get(config_key, {})
+    return resolve_linter_config(config_dict, config_class, language)
 
 
 def has_file_content(context: BaseLintContext) -> bool:
@@ -214,12 +201,66 @@ def parse_python_ast(
             return errors
         # ... use tree for analysis
     """
-    try:
-        tree = ast.parse(context.file_content or "")
-        return tree, []
-    except SyntaxError as e:
-        violation = violation_builder.create_syntax_error_violation(e, context)
+    source = get_context_python_source(context)
+    if source.syntax_error is not None:
+        violation = violation_builder.create_syntax_error_violation(source.syntax_error, context)
         return None, [violation]
+    return source.tree, []
+
+
+def get_context_python_source(context: BaseLintContext) -> PythonSource:
+    """Get the shared, lazily parsed Python source for a lint context.
+
+    Uses the context's own PythonSource when it provides one (FileLintContext does), so
+    every rule linting the file shares a single ast.parse. Falls back to the module-level
+    source memo for other contexts (e.g. test doubles).
+
+    Args:
+        context: Lint context containing file content
+
+    Returns:
+        PythonSource for the context's file content
+    """
+    source = getattr(context, "python_source", None)
+    if isinstance(source, PythonSource):
+        return source
+    return get_python_source(context.file_content or "")
+
+
+def get_python_ast(context: BaseLintContext) -> ast.Module | None:
+    """Get the memoized Python AST for a lint context.
+
+    Args:
+        context: Lint context containing file content
+
+    Returns:
+        Parsed module, or None if the file has a syntax error
+    """
+    return get_context_python_source(context).tree
+
+
+def get_python_index(context: BaseLintContext) -> AstIndex | None:
+    """Get the shared single-traversal node index for a lint context's Python AST.
+
+    Args:
+        context: Lint context containing file content
+
+    Returns:
+        Index of the parsed module, or None if the file has a syntax error
+    """
+    return get_context_python_source(context).index
+
+
+def get_python_parent_map(context: BaseLintContext) -> dict[ast.AST, ast.AST]:
+    """Get the memoized node-to-parent map for a lint context's Python AST.
+
+    Args:
+        context: Lint context containing file content
+
+    Returns:
+        Dictionary mapping each node to its parent (empty if the file does not parse)
+    """
+    return get_context_python_source(context).parent_map
 
 
 def with_parsed_python(
@@ -272,6 +313,9 @@ def resolve_file_path(context: BaseLintContext) -> str:
 def is_ignored_path(file_path: str, ignore_patterns: list[str]) -> bool:
     """Check if file path matches any ignore pattern.
 
+    The pattern list is compiled once (and memoized) into a PatternMatcher, so checking
+    every file of a run against a rule's list does not re-translate the patterns.
+
     Args:
         file_path: Path to check
         ignore_patterns: List of gitignore-style glob patterns to match against
@@ -279,9 +323,9 @@ def is_ignored_path(file_path: str, ignore_patterns: list[str]) -> bool:
     Returns:
         True if the path should be ignored
     """
-    from src.linter_config.pattern_utils import matches_pattern
+    from src.linter_config.pattern_matcher import compile_patterns
 
-    return any(matches_pattern(file_path, pattern) for pattern in ignore_patterns)
+    return compile_patterns(tuple(ignore_patterns)).matches(file_path)
 
 
 def is_file_ignored_by_config(context: BaseLintContext, config: Any) -> bool:
@@ -298,8 +342,76 @@ def is_file_ignored_by_config(context: BaseLintContext, config: Any) -> bool:
         True if the file should be ignored
     """
     file_path = str(context.file_path) if context.file_path else ""
-    patterns = getattr(config, "ignore", None) or getattr(config, "ignore_patterns", None) or []
-    return is_ignored_path(file_path, patterns)
+    return is_ignored_path(file_path, get_config_ignore_patterns(config))
+
+
+def get_config_ignore_patterns(config: Any) -> list[str]:
+    """Get whichever of a config's `ignore` or `ignore_patterns` lists it exposes.
+
+    Args:
+        config: Linter configuration instance
+
+    Returns:
+        The config's ignore patterns, or an empty list if it has none
+    """
+    return getattr(config, "ignore", None) or getattr(config, "ignore_patterns", None) or []
+
+
+class _ConfigProbeContext(BaseLintContext):
+    """Context carrying only a run's config, for loading a rule's config without a file."""
+
+    def __init__(self, metadata: dict[str, Any], language: str) -> None:
+        """Initialize with the raw config as metadata and the language to resolve for."""
+        self.metadata = metadata
+        self._language = language
+
+    @property
+    def file_path(self) -> Path | None:
+        """No file is being analyzed."""
+        return None
+
+    @property
+    def file_content(self) -> str | None:
+        """No file is being analyzed."""
+        return None
+
+    @property
+    def language(self) -> str:
+        """Language whose overrides the config is resolved with."""
+        return self._language
+
+
+def load_rule_ignore_patterns(
+    load_config: Callable[[BaseLintContext], Any],
+    raw_config: dict[str, Any],
+    languages: Iterable[str],
+) -> list[str] | None:
+    """Get the ignore patterns a rule's config applies to every language it checks.
+
+    Loads the config once per language through the rule's own loader, so language
+    overrides apply exactly as they do in check(). Languages the config disables are
+    left out since they report nothing.
+
+    Args:
+        load_config: The rule's config loader, called with a file-less context
+        raw_config: The full raw config dict used for the run
+        languages: Languages the rule checks
+
+    Returns:
+        The shared ignore patterns, ["**"] if every language is disabled, or None if the
+        enabled languages ignore different paths
+    """
+    configs = [load_config(_ConfigProbeContext(raw_config, language)) for language in languages]
+    pattern_lists = {
+        tuple(get_config_ignore_patterns(config))
+        for config in configs
+        if getattr(config, "enabled", True)
+    }
+    if not pattern_lists:
+        return ["**"]
+    if len(pattern_lists) > 1:
+        return None
+    return list(pattern_lists.pop())
 
 
 def get_line_context(code: str, line_index: int) -> str:
@@ -8,11 +8,13 @@ Overview: Provides PythonOnlyLintRule abstract base class that handles common bo
     method while the base class handles language checking, config loading, and enabled
     checking. This eliminates duplicate code across Python-only linters like CQS and LBYL.
 
-Dependencies: BaseLintRule, BaseLintContext, Language, load_linter_config, has_file_content
+Dependencies: BaseLintRule, BaseLintContext, Language, load_linter_config, has_file_content,
+    load_rule_ignore_patterns
 
 Exports: PythonOnlyLintRule
 
-Interfaces: Subclasses implement _config_key, _config_class, _analyze, and rule metadata
+Interfaces: Subclasses implement _config_key, _config_class, _analyze, and rule metadata;
+    ignored_path_patterns(raw_config) reports the configured ignore patterns for pruning
 
 Implementation: Template method pattern for Python linter boilerplate
 """
@@ -27,6 +29,7 @@ from .linter_utils import (
     has_file_content,
     is_file_ignored_by_config,
     load_linter_config,
+    load_rule_ignore_patterns,
 )
 from .types import Violation
 
@@ -46,6 +49,11 @@ class PythonOnlyLintRule(BaseLintRule, Generic[ConfigType]):
         """
         self._config_override = config
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Python only."""
+        return frozenset({Language.PYTHON})
+
     @property
     @abstractmethod
     def _config_key(self) -> str:
@@ -93,6 +101,12 @@ class PythonOnlyLintRule(BaseLintRule, Generic[ConfigType]):
 
         return self._run_analysis(context, config)
 
+    def ignored_path_patterns(self, raw_config: dict[str, Any]) -> list[str] | None:
+        """Return the ignore patterns check() applies, or None if check() is overridden."""
+        if type(self).check is not PythonOnlyLintRule.check:
+            return None
+        return load_rule_ignore_patterns(self._get_config, raw_config, [Language.PYTHON])
+
     def _run_analysis(self, context: BaseLintContext, config: ConfigType) -> list[Violation]:
         """Run the linter-specific analysis on already-validated, non-ignored content."""
         file_path = str(context.file_path) if context.file_path else "unknown"
@@ -0,0 +1,147 @@
+"""
+Purpose: Shared, memoized Python parse results so each file is parsed with ast.parse once per run
+
+Scope: Per-file Python AST, node index, parent map, and syntax error caching used by every
+    Python rule
+
+Overview: Nearly every Python linter needs the module AST of the file being linted. Parsing it
+    independently inside each rule costs one full ast.parse per rule per file. PythonSource wraps
+    a single source string and lazily computes its AST, its single-traversal node index (which
+    also supplies the node-to-parent map), and any SyntaxError exactly once; FileLintContext
+    owns one PythonSource per file so all rules share it.
+    Analyzers that only receive source text (not a lint context) go through parse_python_source,
+    which consults a small bounded memo keyed by source text, so they hit the same
+    PythonSource the context already built instead of re-parsing. The memo is deliberately tiny:
+    files are linted one at a time per process, so it only needs to cover the file in flight.
+
+Dependencies: ast, collections.OrderedDict, analyzers.ast_index
+
+Exports: PythonSource, get_python_source, parse_python_source, clear_python_source_cache
+
+Interfaces: get_python_source(content) -> PythonSource, parse_python_source(content) -> ast.Module
+    (raises SyntaxError), PythonSource.tree / .syntax_error / .index / .parent_map
+
+Implementation: Lazy properties with flag-based memoization, bounded OrderedDict MRU memo
+"""
+
+import ast
+from collections import OrderedDict
+
+from src.analyzers.ast_index import AstIndex, get_ast_index
+
+# Number of distinct sources kept in the module-level memo. Files are linted one at a time per
+# process, so a handful of entries covers the file in flight plus any nested re-entrancy.
+_MEMO_SIZE = 4
+
+
+class PythonSource:
+    """Python source text with a lazily computed, memoized AST and parent map."""
+
+    def __init__(self, content: str) -> None:
+        """Initialize with source text; nothing is parsed until first access.
+
+        Args:
+            content: Python source code
+        """
+        self.content = content
+        self._parsed = False
+        self._tree: ast.Module | None = None
+        self._syntax_error: SyntaxError | None = None
+
+    @property
+    def tree(self) -> ast.Module | None:
+        """Get the parsed module, or None if the source has a syntax error."""
+        self._ensure_parsed()
+        return self._tree
+
+    @property
+    def syntax_error(self) -> SyntaxError | None:
+        """Get the SyntaxError raised while parsing, or None if parsing succeeded."""
+        self._ensure_parsed()
+        return self._syntax_error
+
+    @property
+    def index(self) -> AstIndex | None:
+        """Get the shared node index for the tree, or None if the source does not parse."""
+        tree = self.tree
+        return get_ast_index(tree) if tree is not None else None
+
+    @property
+    def parent_map(self) -> dict[ast.AST, ast.AST]:
+        """Get the node-to-parent map for the tree (empty if the source does not parse)."""
+        index = self.index
+        return index.parent_map if index is not None else {}
+
+    def require_tree(self) -> ast.Module:
+        """Get the parsed module, re-raising the cached SyntaxError if parsing failed.
+
+        Returns:
+            Parsed module AST
+
+        Raises:
+            SyntaxError: If the source does not parse
+        """
+        tree = self.tree
+        if tree is None:
+            raise self._cached_error()
+        return tree
+
+    def _cached_error(self) -> SyntaxError:
+        """Get the cached error with a fresh traceback so repeated raises don't accumulate."""
+        error = self._syntax_error or SyntaxError("invalid syntax")
+        return error.with_traceback(None)
+
+    def _ensure_parsed(self) -> None:
+        """Parse the source on first access, caching either the tree or the error."""
+        if self._parsed:
+            return
+        self._parsed = True
+        try:
+            self._tree = ast.parse(self.content)
+        except SyntaxError as e:
+            self._syntax_error = e
+
+
+_MEMO: OrderedDict[str, PythonSource] = OrderedDict()
+
+
+def get_python_source(content: str) -> PythonSource:
+    """Get the shared PythonSource for a source string, creating it if needed.
+
+    Args:
+        content: Python source code
+
+    Returns:
+        PythonSource shared by every caller asking for the same source text
+    """
+    source = _MEMO.get(content)
+    if source is not None:
+        _MEMO.move_to_end(content)
+        return source
+    source = PythonSource(content)
+    _MEMO[content] = source
+    if len(_MEMO) > _MEMO_SIZE:
+        _MEMO.popitem(last=False)
+    return source
+
+
+def parse_python_source(content: str) -> ast.Module:
+    """Parse Python source, reusing the tree of a file that is already being linted.
+
+    Drop-in replacement for ast.parse(content) for whole-file parses.
+
+    Args:
+        content: Python source code
+
+    Returns:
+        Parsed module AST
+
+    Raises:
+        SyntaxError: If the source does not parse
+    """
+    return get_python_source(content).require_tree()
+
+
+def clear_python_source_cache() -> None:
+    """Clear the shared source memo (for test isolation)."""
+    _MEMO.clear()
@@ -5,22 +5,77 @@ Scope: Dynamic rule management and discovery across all linter plugin packages
 
 Overview: Implements rule registry that maintains a collection of registered linting rules indexed
     by rule_id. Provides methods to register individual rules, retrieve rules by identifier, list
-    all available rules, and discover rules from packages using the RuleDiscovery helper. Enables
-    the extensible plugin architecture by allowing dynamic rule registration without framework
-    modifications. Validates rule uniqueness and handles registration errors gracefully.
-
-Dependencies: BaseLintRule, RuleDiscovery
-
-Exports: RuleRegistry class with register(), get(), list_all(), and discover_rules() methods
+    all available rules, and discover rules from packages using the RuleDiscovery helper. Discovery
+    accepts an optional rule selection (rule ids or category prefixes, matched like ignore
+    directives) so callers that only want one linter never register, check, or finalize the rest.
+    Maintains a language dispatch table built from each rule's supported_languages as rules are
+    registered, so the orchestrator looks up the rules for a file's language in one dict access.
+    For src.linters, discovery reads the precomputed rule manifest (see rule_manifest) instead of
+    importing every linter: selected rules are held as pending entries and imported the first
+    time a file of one of their languages is dispatched, or when requested by id or listed, so a
+    run only imports the linters its files need. Dispatch keeps discovery order regardless of
+    the order rules happen to be loaded in.
+    Enables the extensible plugin architecture by allowing dynamic rule registration without
+    framework modifications. Validates rule uniqueness and handles registration errors gracefully.
+
+Dependencies: BaseLintRule, RuleDiscovery, rule_manifest, rule_matches from
+    linter_config.rule_matcher
+
+Exports: RuleRegistry class with register(), get(), list_all(), list_loaded(),
+    rules_for_language(), and discover_rules() methods, is_rule_selected function
 
 Interfaces: register(rule: BaseLintRule) -> None, get(rule_id: str) -> BaseLintRule | None,
-    list_all() -> list[BaseLintRule], discover_rules(package_path: str) -> int
+    list_all() -> list[BaseLintRule], list_loaded() -> list[BaseLintRule],
+    rules_for_language(language: str) -> list[BaseLintRule],
+    discover_rules(package_path: str, selection) -> int,
+    is_rule_selected(rule_id, selection) -> bool
 
-Implementation: Dictionary-based registry with RuleDiscovery delegation, duplicate validation
+Implementation: Dictionary-based registry with RuleDiscovery delegation, duplicate validation,
+    manifest entries loaded on demand and ordered by registration slot
 """
 
+from collections.abc import Sequence
+
+from src.linter_config.rule_matcher import rule_matches
+
 from .base import BaseLintRule
 from .rule_discovery import RuleDiscovery
+from .rule_manifest import ManifestEntry, load_manifest
+
+
+def is_rule_selected(rule_id: str, selection: Sequence[str] | None) -> bool:
+    """Check if a rule is part of a rule selection.
+
+    Selection entries use the same matching as ignore directives: an exact rule id
+    ("performance.regex-in-loop"), a category ("performance" matches every
+    "performance.*" rule), a trailing wildcard, or a deprecated alias.
+
+    Args:
+        rule_id: Rule identifier to check
+        selection: Selected rule ids/categories, or None to select every rule
+
+    Returns:
+        True if the rule should run
+    """
+    if selection is None:
+        return True
+    return any(rule_matches(rule_id, pattern) for pattern in selection)
+
+
+def _handles_language(rule: BaseLintRule, language: str) -> bool:
+    """Check if a rule should be dispatched files of a language."""
+    languages = rule.supported_languages
+    return languages is None or language in languages
+
+
+def _rules_handling(rules: list[BaseLintRule], language: str) -> list[BaseLintRule]:
+    """Filter rules to those dispatched files of a language, preserving order."""
+    return [rule for rule in rules if _handles_language(rule, language)]
+
+
+def _declared_languages(rules: list[BaseLintRule]) -> set[str]:
+    """Collect every language explicitly declared by the given rules."""
+    return set().union(*(rule.supported_languages or () for rule in rules))
 
 
 class RuleRegistry:
@@ -34,6 +89,13 @@ class RuleRegistry:
         """Initialize empty registry."""
         self._rules: dict[str, BaseLintRule] = {}
         self._discovery = RuleDiscovery()
+        # language -> rules that handle it; languages no rule declares fall back to
+        # the rules that accept any language
+        self._dispatch: dict[str, list[BaseLintRule]] = {}
+        self._any_language: list[BaseLintRule] = []
+        # Manifest entries not imported yet, and each rule id's position in registration order
+        self._pending: dict[str, ManifestEntry] = {}
+        self._slots: dict[str, int] = {}
 
     def register(self, rule: BaseLintRule) -> None:
         """Register a new rule.
@@ -46,10 +108,12 @@ class RuleRegistry:
         """
         rule_id = rule.rule_id
 
-        if rule_id in self._rules:
+        if rule_id in self._rules or rule_id in self._pending:
             raise ValueError(f"Rule {rule_id} already registered")
 
+        self._slots.setdefault(rule_id, len(self._slots))
         self._rules[rule_id] = rule
+        self._rebuild_dispatch()
 
     def get(self, rule_id: str) -> BaseLintRule | None:
         """Get a rule by ID.
@@ -60,30 +124,99 @@ class RuleRegistry:
         Returns:
             The rule instance if found, None otherwise.
         """
+        entry = self._pending.get(rule_id)
+        if entry is not None:
+            self._load([entry])
         return self._rules.get(rule_id)
 
     def list_all(self) -> list[BaseLintRule]:
-        """Get all registered rules.
+        """Get all registered rules, importing any not loaded yet.
 
         Returns:
             List of all registered rule instances.
         """
-        return list(self._rules.values())
+        self._load(list(self._pending.values()))
+        return self.list_loaded()
+
+    def list_loaded(self) -> list[BaseLintRule]:
+        """Get the registered rules that have been loaded (every rule that saw a file).
+
+        Returns:
+            Loaded rule instances in registration order.
+        """
+        return sorted(self._rules.values(), key=self._slot)
+
+    def rules_for_language(self, language: str) -> list[BaseLintRule]:
+        """Get the registered rules that handle a language, in registration order.
 
-    def discover_rules(self, package_path: str) -> int:
+        Args:
+            language: Language identifier from detect_language (e.g. 'python', 'markdown')
+
+        Returns:
+            Rules whose supported_languages include the language, plus rules that
+            accept any language. Empty when no rule wants files of this language.
+        """
+        if self._pending:
+            self._load([entry for entry in self._pending.values() if entry.handles(language)])
+        return self._dispatch.get(language, self._any_language)
+
+    def _slot(self, rule: BaseLintRule) -> int:
+        """Position of a rule in registration (discovery) order."""
+        return self._slots[rule.rule_id]
+
+    def _load(self, entries: list[ManifestEntry]) -> None:
+        """Import pending manifest entries and add the rules they define."""
+        if not entries:
+            return
+        for entry in entries:
+            del self._pending[entry.rule_id]
+            self._add_loaded(entry.load())
+        self._rebuild_dispatch()
+
+    def _add_loaded(self, rule: BaseLintRule | None) -> None:
+        """Add a rule loaded from the manifest (None when it failed to load)."""
+        if rule is None or rule.rule_id in self._rules:
+            return
+        self._slots.setdefault(rule.rule_id, len(self._slots))
+        self._rules[rule.rule_id] = rule
+
+    def _rebuild_dispatch(self) -> None:
+        """Rebuild the language dispatch table from every registered rule."""
+        rules = self.list_loaded()
+        self._any_language = [r for r in rules if r.supported_languages is None]
+        self._dispatch = {lang: _rules_handling(rules, lang) for lang in _declared_languages(rules)}
+
+    def discover_rules(self, package_path: str, selection: Sequence[str] | None = None) -> int:
         """Discover and register rules from a package.
 
         This method automatically discovers all concrete BaseLintRule
-        subclasses in the specified package and registers them.
+        subclasses in the specified package and registers them. When the
+        package has an up-to-date rule manifest, rules are registered from
+        it and only imported once needed.
 
         Args:
             package_path: Python package path (e.g., 'src.linters').
+            selection: Optional rule ids/categories to keep; rules outside the
+                selection are discarded instead of registered. None keeps all.
 
         Returns:
             Number of rules discovered and registered.
         """
+        entries = load_manifest(package_path)
+        if entries is not None:
+            chosen = (e for e in entries if is_rule_selected(e.rule_id, selection))
+            return sum(1 for entry in chosen if self._defer(entry))
         discovered_rules = self._discovery.discover_from_package(package_path)
-        return sum(1 for rule in discovered_rules if self._try_register(rule))
+        selected = (r for r in discovered_rules if is_rule_selected(r.rule_id, selection))
+        return sum(1 for rule in selected if self._try_register(rule))
+
+    def _defer(self, entry: ManifestEntry) -> bool:
+        """Register a manifest entry to load on demand, return True if it was new."""
+        if entry.rule_id in self._rules or entry.rule_id in self._pending:
+            return False
+        self._slots.setdefault(entry.rule_id, len(self._slots))
+        self._pending[entry.rule_id] = entry
+        return True
 
     def _try_register(self, rule: BaseLintRule) -> bool:
         """Try to register a rule, return True if successful."""
@@ -0,0 +1,216 @@
+"""
+Purpose: Precomputed rule manifest so rule registration does not import every linter
+
+Scope: Generating, validating, and reading the manifest of rules discovered under src.linters
+
+Overview: Rule discovery imports every module under src.linters and instantiates every rule to
+    learn its rule id and languages, so even a single-file, single-linter run paid for importing
+    all linters (and the TypeScript/Rust grammars behind them). The manifest records, in
+    discovery order, each rule's id, defining module, class name and supported languages, and is
+    generated into rule_manifest_data by running this module. RuleRegistry.discover_rules reads it
+    to register rules as pending entries, filtered by rule selection without importing anything;
+    an entry's module is imported the first time a file of one of its languages is dispatched (or
+    the rule is requested by id). The manifest also lists the linter packages it was generated
+    from; when that list no longer matches the package directory (a linter added or removed
+    without regenerating) the manifest is ignored and full discovery runs instead. A test checks
+    the manifest against live discovery so a stale manifest fails CI.
+
+Dependencies: importlib, pkgutil, dataclasses, src.core.base, src.core.rule_discovery
+
+Exports: ManifestEntry, load_manifest, build_manifest, render_manifest, main
+
+Interfaces: load_manifest(package_path) -> list[ManifestEntry] | None,
+    ManifestEntry.handles(language) -> bool, ManifestEntry.load() -> BaseLintRule | None,
+    python -m src.core.rule_manifest [--check]
+
+Implementation: Generated Python data module (tuples, bytecode-cached) validated against a
+    pkgutil listing of the linter package; entries import lazily through importlib
+"""
+
+import importlib
+import json
+import logging
+import pkgutil
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from .base import BaseLintRule
+from .rule_discovery import discover_from_package
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PACKAGE = "src.linters"
+_DATA_MODULE = "src.core.rule_manifest_data"
+_DATA_PATH = Path(__file__).with_name("rule_manifest_data.py")
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """A rule known from the manifest, imported only when first needed."""
+
+    rule_id: str
+    module: str
+    class_name: str
+    languages: tuple[str, ...] | None
+
+    def handles(self, language: str) -> bool:
+        """Check if files of a language are dispatched to this rule."""
+        return self.languages is None or language in self.languages
+
+    def load(self) -> BaseLintRule | None:
+        """Import and instantiate the rule, or None if it cannot be loaded."""
+        try:
+            rule_class = getattr(importlib.import_module(self.module), self.class_name)
+            rule: BaseLintRule = rule_class()
+            return rule
+        except (ImportError, AttributeError, TypeError) as e:
+            logger.debug("Failed to load rule %s from %s: %s", self.rule_id, self.module, e)
+            return None
+
+
+def load_manifest(package_path: str) -> list[ManifestEntry] | None:
+    """Read the manifest for a package.
+
+    Args:
+        package_path: Package whose rules are being discovered (e.g. 'src.linters')
+
+    Returns:
+        Entries in discovery order, or None when the package has no manifest or the manifest
+        is stale and full discovery must run
+    """
+    if package_path != MANIFEST_PACKAGE:
+        return None
+    try:
+        data = importlib.import_module(_DATA_MODULE)
+    except ImportError:
+        return None
+    if tuple(data.MODULES) != _package_modules(package_path):
+        logger.debug("Rule manifest for %s is stale, running full discovery", package_path)
+        return None
+    return [ManifestEntry(*row) for row in data.RULES]
+
+
+def _package_modules(package_path: str) -> tuple[str, ...]:
+    """List the modules of a package without importing them."""
+    package = importlib.import_module(package_path)
+    return tuple(sorted(name for _, name, _ in pkgutil.iter_modules(package.__path__)))
+
+
+def build_manifest(package_path: str = MANIFEST_PACKAGE) -> list[ManifestEntry]:
+    """Build manifest entries by running full discovery.
+
+    Args:
+        package_path: Package to discover rules in
+
+    Returns:
+        One entry per rule id, in the order discovery registers them
+    """
+    entries: dict[str, ManifestEntry] = {}
+    for rule in discover_from_package(package_path):
+        entries.setdefault(rule.rule_id, _entry_for(rule))
+    return list(entries.values())
+
+
+def _entry_for(rule: BaseLintRule) -> ManifestEntry:
+    """Describe a discovered rule instance."""
+    rule_class = type(rule)
+    return ManifestEntry(
+        rule.rule_id, rule_class.__module__, rule_class.__name__, _language_names(rule)
+    )
+
+
+def _language_names(rule: BaseLintRule) -> tuple[str, ...] | None:
+    """Plain, sorted language names a rule supports (None for any language)."""
+    languages = rule.supported_languages
+    if languages is None:
+        return None
+    return tuple(sorted(str(getattr(language, "value", language)) for language in languages))
+
+
+def render_manifest(package_path: str = MANIFEST_PACKAGE) -> str:
+    """Render the manifest data module for a package.
+
+    Args:
+        package_path: Package to discover rules in
+
+    Returns:
+        Python source of the generated data module
+    """
+    rows = "".join(_format_row(entry) for entry in build_manifest(package_path))
+    modules = "".join(f"    {_quote(name)},\n" for name in _package_modules(package_path))
+    return _TEMPLATE.format(
+        package_name=package_path, package=_quote(package_path), modules=modules, rows=rows
+    )
+
+
+def _format_row(entry: ManifestEntry) -> str:
+    """Format an entry as a row tuple, one field per line as the formatter lays it out."""
+    fields = (_quote(entry.rule_id), _quote(entry.module), _quote(entry.class_name))
+    lines = [f"        {field},\n" for field in (*fields, _format_languages(entry.languages))]
+    return f"    (\n{''.join(lines)}    ),\n"
+
+
+def _format_languages(languages: tuple[str, ...] | None) -> str:
+    """Format a languages tuple (or None) as source."""
+    if languages is None:
+        return "None"
+    if len(languages) == 1:
+        return f"({_quote(languages[0])},)"
+    return f"({', '.join(_quote(language) for language in languages)})"
+
+
+def _quote(text: str) -> str:
+    """Double-quoted string literal."""
+    return json.dumps(text)
+
+
+_TEMPLATE = '''"""
+Purpose: Generated rule manifest for {package_name} (do not edit by hand)
+
+Scope: Rule ids, defining modules, class names and languages of every discovered rule
+
+Overview: Generated by `python -m src.core.rule_manifest` (just rule-manifest). Read by
+    src.core.rule_manifest.load_manifest so rules are registered without importing every linter.
+    Regenerate after adding, removing or renaming a rule or changing its supported languages.
+
+Dependencies: None
+
+Exports: PACKAGE, MODULES, RULES
+
+Interfaces: Module-level constants only
+
+Implementation: Tuples of (rule_id, module, class name, languages or None)
+"""
+
+PACKAGE = {package}
+
+MODULES = (
+{modules})
+
+RULES = (
+{rows})
+'''
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Write the manifest, or with --check report whether it is up to date.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+    rendered = render_manifest()
+    if "--check" in args:
+        current = _DATA_PATH.read_text(encoding="utf-8") if _DATA_PATH.exists() else ""
+        return 0 if current == rendered else 1
+    _DATA_PATH.write_text(rendered, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
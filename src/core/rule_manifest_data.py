@@ -0,0 +1,177 @@
+"""
+Purpose: Generated rule manifest for src.linters (do not edit by hand)
+
+Scope: Rule ids, defining modules, class names and languages of every discovered rule
+
+Overview: Generated by `python -m src.core.rule_manifest` (just rule-manifest). Read by
+    src.core.rule_manifest.load_manifest so rules are registered without importing every linter.
+    Regenerate after adding, removing or renaming a rule or changing its supported languages.
+
+Dependencies: None
+
+Exports: PACKAGE, MODULES, RULES
+
+Interfaces: Module-level constants only
+
+Implementation: Tuples of (rule_id, module, class name, languages or None)
+"""
+
+PACKAGE = "src.linters"
+
+MODULES = (
+    "blocking_async",
+    "clone_abuse",
+    "collection_pipeline",
+    "cqs",
+    "dry",
+    "file_header",
+    "file_placement",
+    "law_of_demeter",
+    "lazy_ignores",
+    "lbyl",
+    "magic_numbers",
+    "method_property",
+    "nesting",
+    "performance",
+    "print_statements",
+    "srp",
+    "stateless_class",
+    "stringly_typed",
+    "unwrap_abuse",
+    "version_freshness",
+)
+
+RULES = (
+    (
+        "blocking-async",
+        "src.linters.blocking_async.linter",
+        "BlockingAsyncRule",
+        ("rust",),
+    ),
+    (
+        "clone-abuse",
+        "src.linters.clone_abuse.linter",
+        "CloneAbuseRule",
+        ("rust",),
+    ),
+    (
+        "collection-pipeline.embedded-filter",
+        "src.linters.collection_pipeline.linter",
+        "CollectionPipelineRule",
+        ("python",),
+    ),
+    (
+        "cqs",
+        "src.linters.cqs.linter",
+        "CQSRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "dry.duplicate-code",
+        "src.linters.dry.linter",
+        "DRYRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "file-header.validation",
+        "src.linters.file_header.linter",
+        "FileHeaderRule",
+        ("bash", "css", "html", "javascript", "markdown", "python", "typescript"),
+    ),
+    (
+        "file-placement",
+        "src.linters.file_placement.linter",
+        "FilePlacementRule",
+        None,
+    ),
+    (
+        "law-of-demeter.chain-depth",
+        "src.linters.law_of_demeter.linter",
+        "LawOfDemeterRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "lazy-ignores",
+        "src.linters.lazy_ignores.linter",
+        "LazyIgnoresRule",
+        ("python",),
+    ),
+    (
+        "lbyl",
+        "src.linters.lbyl.linter",
+        "LBYLRule",
+        ("python",),
+    ),
+    (
+        "magic-numbers.numeric-literal",
+        "src.linters.magic_numbers.linter",
+        "MagicNumberRule",
+        ("javascript", "python", "rust", "typescript"),
+    ),
+    (
+        "method-property.should-be-property",
+        "src.linters.method_property.linter",
+        "MethodPropertyRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "nesting.excessive-depth",
+        "src.linters.nesting.linter",
+        "NestingDepthRule",
+        ("javascript", "python", "rust", "typescript"),
+    ),
+    (
+        "performance.regex-in-loop",
+        "src.linters.performance.regex_linter",
+        "RegexInLoopRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "performance.string-concat-loop",
+        "src.linters.performance.linter",
+        "StringConcatLoopRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "improper-logging.conditional-verbose",
+        "src.linters.print_statements.conditional_verbose_rule",
+        "ConditionalVerboseRule",
+        ("python",),
+    ),
+    (
+        "improper-logging.print-statement",
+        "src.linters.print_statements.linter",
+        "PrintStatementRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "srp.violation",
+        "src.linters.srp.linter",
+        "SRPRule",
+        ("javascript", "python", "rust", "typescript"),
+    ),
+    (
+        "stateless-class.violation",
+        "src.linters.stateless_class.linter",
+        "StatelessClassRule",
+        ("python",),
+    ),
+    (
+        "stringly-typed.repeated-validation",
+        "src.linters.stringly_typed.linter",
+        "StringlyTypedRule",
+        ("javascript", "python", "typescript"),
+    ),
+    (
+        "unwrap-abuse",
+        "src.linters.unwrap_abuse.linter",
+        "UnwrapAbuseRule",
+        ("rust",),
+    ),
+    (
+        "version-freshness",
+        "src.linters.version_freshness.linter",
+        "VersionFreshnessRule",
+        (),
+    ),
+)
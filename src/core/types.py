@@ -9,18 +9,26 @@ Overview: Defines the essential data structures that form the foundation of the
     information, and the Severity enum implementing a binary error model (violations are
     either errors or not violations). These types are used throughout the framework by
     rules, orchestrators, and output formatters to maintain consistent violation reporting
-    and severity handling across all linting operations.
+    and severity handling across all linting operations. Violations are frozen and slotted, with
+    rule_id and file_path interned, since noisy rules on legacy code produce them by the hundred
+    thousand. ViolationBatch is the columnar form --parallel workers send back to the main
+    process: every distinct string once, plus one compact integer array per field.
 
-Dependencies: dataclasses for Violation structure, enum for Severity classification
+Dependencies: array, sys, dataclasses for Violation structure, enum for Severity classification
 
-Exports: Severity enum (ERROR level), Violation dataclass with serialization support
+Exports: Severity enum (ERROR level), Violation dataclass with serialization support,
+    ViolationBatch columnar cross-process transfer form
 
-Interfaces: Violation.to_dict() -> dict for JSON serialization, Severity.ERROR constant
+Interfaces: Violation.to_dict() -> dict for JSON serialization, Severity.ERROR constant,
+    ViolationBatch.from_violations(violations), ViolationBatch.to_violations()
 
 Implementation: Binary severity model (errors only), dataclass-based violation structure
     with comprehensive field set (rule_id, file_path, line, column, message, severity, suggestion)
 """
 
+import sys
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -36,13 +44,14 @@ class Severity(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Violation:
     """Represents a linting violation.
 
     A violation contains all the information needed to report a linting
     issue to the user, including location, message, and optional suggestion
-    for how to fix it.
+    for how to fix it. Instances are immutable; use dataclasses.replace to
+    derive a modified copy.
     """
 
     rule_id: str
@@ -66,6 +75,13 @@ class Violation:
     suggestion: str | None = None
     """Optional suggestion for how to fix the violation."""
 
+    def __post_init__(self) -> None:
+        """Intern the fields every violation of a rule or file repeats."""
+        object.__setattr__(self, "rule_id", sys.intern(self.rule_id))
+        # Rules built outside this package may pass a Path; keep it as given
+        if isinstance(self.file_path, str):
+            object.__setattr__(self, "file_path", sys.intern(self.file_path))
+
     def to_dict(self) -> dict[str, str | int | None]:
         """Convert violation to dictionary for JSON serialization.
 
@@ -94,3 +110,97 @@ class Violation:
             severity=Severity(data["severity"]),
             suggestion=data.get("suggestion"),
         )
+
+
+# Index stored in place of a missing suggestion
+_NO_STRING = -1
+
+
+@dataclass(frozen=True, slots=True)
+class ViolationBatch:
+    """Violations in columnar form, for cheap transfer between processes.
+
+    Pickling a list of violations (or of their dicts) repeats every field name per
+    violation and rebuilds every object on the other side. A batch stores each distinct
+    string once in strings and every field as an int32 array (of indexes into strings,
+    or the line and column themselves), so its pickle is a handful of byte buffers
+    however many violations it carries.
+    """
+
+    strings: tuple[str, ...]
+    rule_ids: array
+    file_paths: array
+    lines: array
+    columns: array
+    messages: array
+    severities: array
+    suggestions: array
+
+    def __len__(self) -> int:
+        """Number of violations in the batch."""
+        return len(self.lines)
+
+    @classmethod
+    def from_violations(cls, violations: Iterable[Violation]) -> "ViolationBatch":
+        """Pack violations into a batch.
+
+        Args:
+            violations: Violations to pack
+
+        Returns:
+            Batch holding the same violations, in order
+        """
+        items = list(violations)
+        table: dict[str, int] = {}
+
+        def column(values: Iterable[str]) -> array:
+            return array("i", [table.setdefault(value, len(table)) for value in values])
+
+        return cls(
+            rule_ids=column(v.rule_id for v in items),
+            file_paths=column(v.file_path for v in items),
+            lines=array("i", [v.line for v in items]),
+            columns=array("i", [v.column for v in items]),
+            messages=column(v.message for v in items),
+            severities=column(v.severity.value for v in items),
+            suggestions=array(
+                "i",
+                [
+                    _NO_STRING
+                    if v.suggestion is None
+                    else table.setdefault(v.suggestion, len(table))
+                    for v in items
+                ],
+            ),
+            strings=tuple(table),
+        )
+
+    def to_violations(self) -> list[Violation]:
+        """Unpack the batch; violations share one string object per distinct value.
+
+        Returns:
+            The violations, in the order they were packed
+        """
+        strings = self.strings
+        severities = {index: Severity(strings[index]) for index in set(self.severities)}
+        return [
+            Violation(
+                rule_id=strings[rule_id],
+                file_path=strings[file_path],
+                line=line,
+                column=column,
+                message=strings[message],
+                severity=severities[severity],
+                suggestion=None if suggestion == _NO_STRING else strings[suggestion],
+            )
+            for rule_id, file_path, line, column, message, severity, suggestion in zip(
+                self.rule_ids,
+                self.file_paths,
+                self.lines,
+                self.columns,
+                self.messages,
+                self.severities,
+                self.suggestions,
+                strict=True,
+            )
+        ]
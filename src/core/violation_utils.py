@@ -7,9 +7,10 @@ Overview: Provides shared utility functions for working with violations, includi
     extracting line text and checking for ignore directives. These patterns were
     previously duplicated across multiple linter modules (magic_numbers, print_statements,
     method_property). Centralizing them here improves maintainability and ensures
-    consistent behavior across all linters.
+    consistent behavior across all linters. Line text comes from the file's shared DirectiveIndex,
+    so checking many violations against one file splits it once rather than once per violation.
 
-Dependencies: BaseLintContext, Violation types
+Dependencies: BaseLintContext, Violation types, linter_config.directive_index
 
 Exports: get_violation_line, has_python_noqa, has_typescript_noqa
 
@@ -23,6 +24,7 @@ Implementation: Simple text extraction and pattern matching
 
 from src.core.base import BaseLintContext
 from src.core.types import Violation
+from src.linter_config.directive_index import index_for_content
 
 
 def get_violation_line(violation: Violation, context: BaseLintContext) -> str | None:
@@ -38,11 +40,8 @@ def get_violation_line(violation: Violation, context: BaseLintContext) -> str |
     if not context.file_content:
         return None
 
-    lines = context.file_content.splitlines()
-    if violation.line <= 0 or violation.line > len(lines):
-        return None
-
-    return lines[violation.line - 1].lower()
+    line_text = index_for_content(context.file_content).line_text(violation.line)
+    return line_text.lower() if line_text is not None else None
 
 
 def has_python_noqa(line_text: str) -> bool:
@@ -0,0 +1,5 @@
+"""Daemon package for the long-running thailint serve mode.
+
+This package provides the local-socket server that keeps linting state warm between
+invocations and the thin client the CLI uses to forward commands to it.
+"""
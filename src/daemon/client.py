@@ -0,0 +1,137 @@
+"""
+Purpose: Thin client forwarding thailint CLI invocations to a running thailint serve daemon
+
+Scope: Command detection in argv, daemon lookup by working directory, request round trip
+
+Overview: When a daemon is serving the project, running a linter command in-process would redo all
+    the start-up work the daemon has already done. The console script entry point therefore calls
+    forward_to_daemon first: it picks the subcommand out of argv (skipping the global --verbose,
+    --config, --project-root, --changed-since and --staged options), and if it is one of the
+    forwardable linter commands, looks for a daemon socket for the --project-root or for the working
+    directory and each of its parents, sends the argv and working directory, and returns the
+    daemon's exit code and output. Any failure (no daemon, stale socket, socket directory not
+    private to the user, protocol mismatch, unsupported platform, THAILINT_NO_DAEMON set) returns
+    None and the CLI simply runs locally, so the daemon is never required. The daemon runs with its
+    own environment; only argv and the working directory are forwarded.
+
+Dependencies: os, socket, pathlib, src.daemon.protocol
+
+Exports: forward_to_daemon, send_request, find_daemon_socket, parse_global_options
+
+Interfaces: forward_to_daemon(argv, cwd, commands) -> DaemonResponse | None,
+    send_request(socket_path, message) -> dict | None
+
+Implementation: One short-lived AF_UNIX connection per request, newline-delimited JSON
+"""
+
+import os
+import socket
+from collections.abc import Collection, Sequence
+from pathlib import Path
+from typing import Any
+
+from .protocol import (
+    NO_DAEMON_ENV,
+    OP_LINT,
+    DaemonResponse,
+    daemon_supported,
+    decode_message,
+    encode_message,
+    is_private_dir,
+    socket_path,
+)
+
+# Global CLI options that take a value, and the flags, that may precede the subcommand
+_VALUE_OPTIONS = ("--config", "-c", "--project-root", "--changed-since")
+_FLAG_OPTIONS = ("--verbose", "-v", "--staged")
+
+
+def parse_global_options(argv: Sequence[str]) -> tuple[str | None, dict[str, str]]:
+    """Split the global options off a thailint command line.
+
+    Args:
+        argv: Arguments after the program name
+
+    Returns:
+        The subcommand and the global option values given before it. The subcommand is None
+        when argv has none or uses options the client does not know (such as --help or
+        --version, which are always handled locally).
+    """
+    options: dict[str, str] = {}
+    args = iter(argv)
+    for arg in args:
+        name, has_value, value = arg.partition("=")
+        if name in _VALUE_OPTIONS:
+            options[name] = value if has_value else next(args, "")
+        elif arg in _FLAG_OPTIONS:
+            options[arg] = ""
+        else:
+            return (None if arg.startswith("-") else arg), options
+    return None, options
+
+
+def find_daemon_socket(cwd: Path, project_root: str | None = None) -> Path | None:
+    """Find the socket of a daemon serving the working directory.
+
+    Args:
+        cwd: Working directory of the invocation
+        project_root: Explicit --project-root, checked instead of cwd and its parents
+
+    Returns:
+        Socket path that exists in a private socket directory, or None
+    """
+    candidates = [cwd / project_root] if project_root else [cwd, *cwd.parents]
+    paths = [socket_path(directory) for directory in candidates]
+    if not is_private_dir(paths[0].parent):
+        return None
+    return next((path for path in paths if path.exists()), None)
+
+
+def send_request(path: Path, message: dict[str, Any]) -> dict[str, Any] | None:
+    """Send one request to a daemon and read its response.
+
+    Args:
+        path: Daemon socket
+        message: Request fields (op and its arguments)
+
+    Returns:
+        Decoded response, or None if the socket directory is not private, the daemon could
+        not be reached or it replied with an incompatible message
+    """
+    if not is_private_dir(path.parent):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(path))
+            conn.sendall(encode_message(message))
+            with conn.makefile("rb") as reader:
+                return decode_message(reader.readline())
+    except OSError:
+        return None
+
+
+def forward_to_daemon(
+    argv: Sequence[str], cwd: Path, commands: Collection[str]
+) -> DaemonResponse | None:
+    """Run a command line through a serving daemon if there is one.
+
+    Args:
+        argv: Arguments after the program name
+        cwd: Working directory of the invocation
+        commands: Subcommands that may be forwarded
+
+    Returns:
+        The daemon's result, or None to run the command locally
+    """
+    if os.environ.get(NO_DAEMON_ENV) or not daemon_supported():
+        return None
+    command, options = parse_global_options(argv)
+    if command not in commands:
+        return None
+    path = find_daemon_socket(cwd, options.get("--project-root"))
+    if path is None:
+        return None
+    reply = send_request(path, {"op": OP_LINT, "argv": list(argv), "cwd": str(cwd)})
+    if reply is None or "exit_code" not in reply:
+        return None
+    return DaemonResponse(int(reply["exit_code"]), str(reply["stdout"]), str(reply["stderr"]))
@@ -0,0 +1,128 @@
+"""
+Purpose: Wire protocol and socket location shared by the thailint serve daemon and its client
+
+Scope: Socket path per project root, JSON-lines message encoding, response record
+
+Overview: The daemon and the CLI client talk over a Unix domain socket using one JSON object per
+    line: the client sends a request and reads back a single response. A lint request carries the
+    command-line arguments and working directory of the client invocation; the response carries
+    the exit code and the captured stdout and stderr. Every message includes PROTOCOL_VERSION so a
+    client talking to a daemon started from a different thailint version falls back to running
+    locally instead of misreading the reply. Each project root gets its own socket under a
+    per-user directory ($XDG_RUNTIME_DIR/thailint when set, else thailint-<uid> in the system
+    temp dir), named by a hash of the root so that paths stay under the Unix socket path length
+    limit; the client finds a daemon by checking the socket of its working directory and each
+    parent directory. The temp dir name is predictable, so both sides only use the socket
+    directory when it is a real directory owned by the current user with mode 0700; otherwise
+    another local user could plant a socket there and answer every forwarded run. Kept free of
+    heavy imports because the client reads it on every CLI start.
+
+Dependencies: hashlib, json, os, socket, stat, tempfile, dataclasses, pathlib
+
+Exports: PROTOCOL_VERSION, NO_DAEMON_ENV, SOCKET_DIR_MODE, DaemonResponse, daemon_supported,
+    socket_path, is_private_dir, encode_message, decode_message
+
+Interfaces: socket_path(project_root) -> Path, is_private_dir(directory) -> bool,
+    encode_message(dict) -> bytes, decode_message(bytes) -> dict | None
+
+Implementation: Newline-delimited JSON over AF_UNIX stream sockets
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Bumped whenever request or response fields change
+PROTOCOL_VERSION = 1
+
+# Set to a non-empty value to always run in-process, even when a daemon is serving
+NO_DAEMON_ENV = "THAILINT_NO_DAEMON"
+
+# Permissions of the per-user socket directory: owner only
+SOCKET_DIR_MODE = 0o700
+
+# Hex digits of the project root hash used as the socket file name
+_SOCKET_NAME_DIGITS = 16
+
+# Request operations
+OP_LINT = "lint"
+OP_PING = "ping"
+OP_SHUTDOWN = "shutdown"
+
+
+@dataclass(frozen=True)
+class DaemonResponse:
+    """Outcome of a CLI invocation run by the daemon."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def daemon_supported() -> bool:
+    """Check if the platform provides Unix domain sockets and user ids to secure them."""
+    return hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+
+
+def socket_path(project_root: Path) -> Path:
+    """Get the socket a daemon serving a project root listens on.
+
+    Args:
+        project_root: Project root directory (resolved before hashing)
+
+    Returns:
+        Socket path in the per-user socket directory
+    """
+    root = str(project_root.resolve()).encode("utf-8")
+    digest = hashlib.sha256(root).hexdigest()[:_SOCKET_NAME_DIGITS]
+    return _socket_dir() / f"{digest}.sock"
+
+
+def _socket_dir() -> Path:
+    """Per-user directory holding daemon sockets."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "thailint"
+    return Path(tempfile.gettempdir()) / f"thailint-{os.getuid()}"
+
+
+def is_private_dir(directory: Path) -> bool:
+    """Check if a directory is safe to hold daemon sockets.
+
+    Args:
+        directory: Socket directory
+
+    Returns:
+        True if it is a directory (not a symlink) owned by the current user with mode 0700
+    """
+    try:
+        info = directory.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and stat.S_IMODE(info.st_mode) == SOCKET_DIR_MODE
+    )
+
+
+def encode_message(message: dict[str, Any]) -> bytes:
+    """Encode a message as one JSON line tagged with the protocol version."""
+    return json.dumps({**message, "version": PROTOCOL_VERSION}).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> dict[str, Any] | None:
+    """Decode one JSON line, or None if it is malformed or from another protocol version."""
+    try:
+        message = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(message, dict) or message.get("version") != PROTOCOL_VERSION:
+        return None
+    return message
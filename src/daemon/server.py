@@ -0,0 +1,267 @@
+"""
+Purpose: Long-running thailint daemon serving lint requests over a Unix domain socket
+
+Scope: Socket server lifecycle, request dispatch, in-process CLI execution with captured output
+
+Overview: Editor integrations and pre-commit hooks start thailint many times in a row, and each
+    start pays for importing the CLI and the linters, loading tree-sitter grammars, loading the
+    config and building the ignore patterns before the first file is read. LintServer does that
+    work once: it pre-imports every command module and every rule in the rule manifest, keeps
+    loaded configs warm (see warm_state), and then answers requests on the project's socket. A
+    lint request carries the argv and working directory of a client invocation; the server runs
+    the same Click CLI in-process with that working directory, captures stdout and stderr, and
+    replies with them and the exit code, so forwarded commands behave exactly like local ones.
+    Requests are handled one at a time because running a command swaps the process-wide working
+    directory and standard streams. Parse memos are keyed by file content and the result cache by
+    content hash, so edited files are re-linted; config and ignore-file changes drop the warm
+    config. A lint request without a string argv list and cwd, or whose cwd cannot be entered, is
+    answered with an error, on which the client runs the command locally. The server also answers
+    ping and shutdown requests, and removes its socket on exit.
+    It refuses to start when the socket directory is not private to the user (see protocol), and
+    a client that connects but stalls before sending its request is dropped after a timeout so it
+    cannot block the clients queued behind it.
+
+Dependencies: contextlib, importlib, io, logging, socket, socketserver, traceback, click, src.cli,
+    src.core.rule_manifest, src.daemon.protocol, src.daemon.warm_state
+
+Exports: LintServer, DaemonAlreadyRunningError, InsecureSocketDirError, run_cli
+
+Interfaces: LintServer(project_root).serve_until_stopped(), run_cli(argv, cwd) -> DaemonResponse
+
+Implementation: socketserver.UnixStreamServer with a JSON-lines StreamRequestHandler, polling
+    serve loop with a stop flag so a shutdown request can end it from the handler
+
+Suppressions:
+    - broad-exception-caught: A failing command must become an exit code and a traceback in the
+        captured stderr of that request, never an exception that takes the daemon down
+"""
+
+import contextlib
+import importlib
+import io
+import logging
+import socket
+import socketserver
+import traceback
+from pathlib import Path
+from typing import Any
+
+import click
+
+from .protocol import (
+    OP_LINT,
+    OP_PING,
+    OP_SHUTDOWN,
+    SOCKET_DIR_MODE,
+    DaemonResponse,
+    decode_message,
+    encode_message,
+    is_private_dir,
+    socket_path,
+)
+from .warm_state import activate_warm_configs
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of the stop flag while idle
+_POLL_INTERVAL = 0.5
+
+# Permissions of the socket file: owner only
+_SOCKET_FILE_MODE = 0o600
+
+# Seconds a connected client may take to send its request line
+_REQUEST_READ_TIMEOUT = 10.0
+
+
+class DaemonAlreadyRunningError(Exception):
+    """Raised when another daemon is already serving the project root."""
+
+
+class InsecureSocketDirError(Exception):
+    """Raised when the socket directory is not owned by the user with mode 0700."""
+
+
+def run_cli(argv: list[str], cwd: str) -> DaemonResponse:
+    """Run a thailint command line in this process and capture its result.
+
+    Args:
+        argv: Arguments after the program name (e.g. ["nesting", "src/"])
+        cwd: Working directory of the client invocation
+
+    Returns:
+        Exit code and captured stdout/stderr of the command
+
+    Raises:
+        OSError: If cwd cannot be entered (missing, not a directory, no permission)
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with (
+        contextlib.chdir(cwd),
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+    ):
+        exit_code = _invoke_cli(argv)
+    return DaemonResponse(exit_code, stdout.getvalue(), stderr.getvalue())
+
+
+def _invoke_cli(argv: list[str]) -> int:
+    """Invoke the CLI group without letting it exit the process."""
+    from src.cli import cli
+
+    try:
+        result = cli.main(args=argv, prog_name="thailint", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return _exit_status(e.code)
+    except Exception:  # pylint: disable=broad-exception-caught
+        traceback.print_exc()
+        return 2
+    return result if isinstance(result, int) else 0
+
+
+def _exit_status(code: Any) -> int:
+    """Translate a SystemExit code the way the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    click.echo(str(code), err=True)
+    return 1
+
+
+def _prewarm() -> None:
+    """Import every command module and linter so the first request is already fast."""
+    from src.cli.main import COMMAND_MODULES
+    from src.core.rule_manifest import MANIFEST_PACKAGE, load_manifest
+
+    for module in sorted(set(COMMAND_MODULES.values())):
+        importlib.import_module(module)
+    for entry in load_manifest(MANIFEST_PACKAGE) or []:
+        entry.load()
+
+
+class _RequestConnection(socketserver.StreamRequestHandler):
+    """Handle one JSON-lines request per connection."""
+
+    server: "LintServer"
+    # Applied to the connection in setup(), so a stalled client cannot hold the server
+    timeout = _REQUEST_READ_TIMEOUT
+
+    def handle(self) -> None:
+        """Read a request, dispatch it, and write the response."""
+        try:
+            line = self.rfile.readline()
+        except TimeoutError:
+            logger.debug("Dropping a client that sent no request within the timeout")
+            return
+        if not line:
+            return  # Connection closed without a request (e.g. a liveness probe)
+        request = decode_message(line)
+        if request is None:
+            self.wfile.write(encode_message({"error": "unsupported request"}))
+            return
+        self.wfile.write(encode_message(self.server.dispatch(request)))
+
+
+class LintServer(socketserver.UnixStreamServer):
+    """Daemon answering lint requests for one project root."""
+
+    def __init__(self, project_root: Path, prewarm: bool = True) -> None:
+        """Bind the project's socket and warm up the linting state.
+
+        Args:
+            project_root: Project root this daemon serves
+            prewarm: Whether to import every command module and linter up front
+
+        Raises:
+            DaemonAlreadyRunningError: If a live daemon already owns the socket
+            InsecureSocketDirError: If the socket directory is not private to the user
+        """
+        self.project_root = project_root.resolve()
+        self.socket_file = socket_path(self.project_root)
+        self.stopping = False
+        _claim_socket(self.socket_file)
+        super().__init__(str(self.socket_file), _RequestConnection)
+        self.socket_file.chmod(_SOCKET_FILE_MODE)
+        activate_warm_configs()
+        if prewarm:
+            _prewarm()
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run one request and build its response message."""
+        op = request.get("op")
+        if op == OP_PING:
+            return {"project_root": str(self.project_root)}
+        if op == OP_SHUTDOWN:
+            self.stopping = True
+            return {"stopping": True}
+        if op == OP_LINT:
+            return _run_lint_request(request)
+        return {"error": f"unknown op {op!r}"}
+
+    def serve_until_stopped(self) -> None:
+        """Serve requests until a shutdown request arrives, then remove the socket."""
+        self.timeout = _POLL_INTERVAL
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+
+    def server_close(self) -> None:
+        """Close the listening socket and remove its file."""
+        super().server_close()
+        self.socket_file.unlink(missing_ok=True)
+
+
+def _run_lint_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Run a lint request, answering a malformed one with an error instead of raising.
+
+    An error reply makes the client run the command locally, so a bad request or a working
+    directory the daemon cannot enter never leaves the client without an answer.
+    """
+    argv, cwd = request.get("argv"), request.get("cwd")
+    if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+        return {"error": "lint request needs an 'argv' list of strings"}
+    if not isinstance(cwd, str):
+        return {"error": "lint request needs a 'cwd' string"}
+    try:
+        response = run_cli(argv, cwd)
+    except OSError as e:
+        return {"error": f"cannot run in {cwd}: {e}"}
+    return {
+        "exit_code": response.exit_code,
+        "stdout": response.stdout,
+        "stderr": response.stderr,
+    }
+
+
+def _claim_socket(path: Path) -> None:
+    """Prepare a socket path, removing a stale socket left by a daemon that died."""
+    path.parent.mkdir(mode=SOCKET_DIR_MODE, parents=True, exist_ok=True)
+    if not is_private_dir(path.parent):
+        raise InsecureSocketDirError(
+            f"Refusing to use socket directory {path.parent}: "
+            "it must be owned by the current user with mode 0700"
+        )
+    if not path.exists():
+        return
+    if _is_live(path):
+        raise DaemonAlreadyRunningError(f"A thailint daemon is already listening on {path}")
+    logger.debug("Removing stale daemon socket %s", path)
+    path.unlink()
+
+
+def _is_live(path: Path) -> bool:
+    """Check if a daemon accepts connections on a socket path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(path))
+        except OSError:
+            return False
+    return True
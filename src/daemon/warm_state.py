@@ -0,0 +1,143 @@
+"""
+Purpose: Loaded configurations kept warm across requests served by the thailint daemon
+
+Scope: Per project root and config file cache of loaded config, invalidated when the files change
+
+Overview: Every CLI invocation loads and parses the thailint config (.thailint.yaml, .thailint.json
+    or pyproject.toml) and builds the repository ignore patterns before linting a single file. In
+    the daemon, setup_base_orchestrator asks the active WarmConfigs for the config instead and
+    only loads it when missing; each entry records the size and modification time of the config
+    files and of .thailintignore, and the entries of a project root (plus the shared ignore
+    parser) are dropped whenever one of them has changed. Callers get a deep copy so per-command
+    overrides (e.g. --max-depth) never leak into later requests. Orchestrators themselves are
+    built fresh for each request from the warm config, because cross-file rules such as DRY keep
+    per-run state on their instances; everything expensive behind them (imported linters,
+    tree-sitter grammars, the rule manifest, parse memos keyed by file content, the ignore parser)
+    stays loaded in the process. Outside the daemon there is no active WarmConfigs and nothing
+    is cached.
+
+Dependencies: copy, dataclasses, pathlib, src.linter_config.ignore (lazily, on invalidation)
+
+Exports: WarmConfigs, activate_warm_configs, active_warm_configs, WATCHED_FILES
+
+Interfaces: WarmConfigs.get(project_root, config_file) -> dict | None,
+    WarmConfigs.put(project_root, config_file, config) -> None, activate_warm_configs(),
+    active_warm_configs() -> WarmConfigs | None
+
+Implementation: Dict keyed by (resolved root, resolved config file) holding a config snapshot and
+    a stat signature; module-level active instance set by the daemon
+
+Suppressions:
+    - global-statement: The daemon's warm state is process-wide, like the worker pool's
+"""
+
+import copy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Files under the project root whose changes invalidate its warm configs
+WATCHED_FILES = (
+    ".thailint.yaml",
+    ".thailint.yml",
+    ".thailint.json",
+    "pyproject.toml",
+    ".thailintignore",
+)
+
+_Signature = tuple[tuple[int, int] | None, ...]
+_Key = tuple[Path, Path | None]
+
+
+@dataclass
+class _WarmConfig:
+    """A loaded config and the state of the files it was loaded from."""
+
+    config: dict[str, Any]
+    signature: _Signature
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    """Modification time and size of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _signature(key: _Key) -> _Signature:
+    """Stat signature of the files a config was loaded from."""
+    root, config_file = key
+    watched = [root / name for name in WATCHED_FILES]
+    if config_file is not None:
+        watched.append(config_file)
+    return tuple(_stat(path) for path in watched)
+
+
+def _make_key(project_root: Path, config_file: str | None) -> _Key:
+    """Cache key for a project root and optional explicit config file."""
+    return (project_root.resolve(), Path(config_file).resolve() if config_file else None)
+
+
+class WarmConfigs:
+    """Loaded configs reused across daemon requests until their files change."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[_Key, _WarmConfig] = {}
+
+    def get(self, project_root: Path, config_file: str | None) -> dict[str, Any] | None:
+        """Get a copy of the warm config, or None if it must be loaded.
+
+        Args:
+            project_root: Project root the config is loaded for
+            config_file: Explicit config file given on the command line, if any
+
+        Returns:
+            Deep copy of the cached config, or None when not cached or its files changed
+        """
+        key = _make_key(project_root, config_file)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.signature != _signature(key):
+            self._invalidate(key[0])
+            return None
+        return copy.deepcopy(entry.config)
+
+    def put(self, project_root: Path, config_file: str | None, config: dict[str, Any]) -> None:
+        """Remember a freshly loaded config.
+
+        Args:
+            project_root: Project root the config was loaded for
+            config_file: Explicit config file given on the command line, if any
+            config: Loaded config (copied, so later mutation does not affect the cache)
+        """
+        key = _make_key(project_root, config_file)
+        self._entries[key] = _WarmConfig(copy.deepcopy(config), _signature(key))
+
+    def _invalidate(self, root: Path) -> None:
+        """Drop every entry of a project root and the ignore patterns read from it."""
+        from src.linter_config.ignore import clear_ignore_parser_cache
+
+        for key in [key for key in self._entries if key[0] == root]:
+            del self._entries[key]
+        clear_ignore_parser_cache()
+
+
+# WarmConfigs of the daemon running in this process (None outside the daemon)
+_ACTIVE: WarmConfigs | None = None
+
+
+def activate_warm_configs() -> WarmConfigs:
+    """Start keeping configs warm in this process (called by the daemon)."""
+    global _ACTIVE  # pylint: disable=global-statement
+    if _ACTIVE is None:
+        _ACTIVE = WarmConfigs()
+    return _ACTIVE
+
+
+def active_warm_configs() -> WarmConfigs | None:
+    """Get the process's WarmConfigs, or None when not running as the daemon."""
+    return _ACTIVE
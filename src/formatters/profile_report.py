@@ -0,0 +1,102 @@
+"""
+Purpose: Render a lint run's --profile report as a text table or JSON
+
+Scope: Text and JSON rendering of RunProfile.to_dict() reports
+
+Overview: Turns the per-phase and per-rule timings collected by RunProfile into the report the
+    --profile option prints. The table lists the run phases, then every rule ordered by total
+    wall time with its check() and finalize() wall/CPU seconds, then each rule's slowest files.
+    The JSON form is the to_dict() report itself, stable enough to store and compare across runs.
+
+Dependencies: json
+
+Exports: format_profile_table, format_profile_json
+
+Interfaces: format_profile_table(report: dict) -> str, format_profile_json(report: dict) -> str
+
+Implementation: Fixed-width columns sized to the longest rule id
+"""
+
+import json
+from typing import Any
+
+_SECONDS = "{:>10.3f}"
+
+
+def format_profile_json(report: dict[str, Any]) -> str:
+    """Render a profile report as indented JSON.
+
+    Args:
+        report: RunProfile.to_dict() output
+
+    Returns:
+        JSON document
+    """
+    return json.dumps(report, indent=2)
+
+
+def format_profile_table(report: dict[str, Any]) -> str:
+    """Render a profile report as text tables.
+
+    Args:
+        report: RunProfile.to_dict() output
+
+    Returns:
+        Phase table, rule table and slowest files, one line per row
+    """
+    lines = [_title(report["total_wall"]), ""]
+    lines.extend(_phase_rows(report["phases"]))
+    lines.append("")
+    lines.extend(_rule_rows(report["rules"]))
+    lines.extend(_slowest_file_rows(report["rules"]))
+    return "\n".join(lines)
+
+
+def _title(total_wall: float | None) -> str:
+    """Get the report heading with the run's elapsed time."""
+    if total_wall is None:
+        return "Profile"
+    return f"Profile (elapsed {total_wall:.3f}s wall)"
+
+
+def _phase_rows(phases: dict[str, dict[str, Any]]) -> list[str]:
+    """Get the phase table (header first)."""
+    width = max([len("Phase"), *(len(name) for name in phases)])
+    rows = [f"{'Phase'.ljust(width)}  {'Wall (s)':>10}  {'CPU (s)':>10}  {'Calls':>8}"]
+    for name, timing in phases.items():
+        rows.append(f"{name.ljust(width)}  {_seconds(timing)}  {timing['calls']:>8}")
+    return rows
+
+
+def _rule_rows(rules: dict[str, dict[str, Any]]) -> list[str]:
+    """Get the rule table (header first), in report order."""
+    width = max([len("Rule"), *(len(rule_id) for rule_id in rules)])
+    header = (
+        f"{'Rule'.ljust(width)}  {'Check wall':>10}  {'Check CPU':>10}  {'Files':>8}"
+        f"  {'Final wall':>10}  {'Final CPU':>10}"
+    )
+    rows = [header]
+    for rule_id, timings in rules.items():
+        check, finalize = timings["check"], timings["finalize"]
+        rows.append(
+            f"{rule_id.ljust(width)}  {_seconds(check)}  {check['calls']:>8}  {_seconds(finalize)}"
+        )
+    return rows
+
+
+def _slowest_file_rows(rules: dict[str, dict[str, Any]]) -> list[str]:
+    """Get each rule's slowest files, skipping rules that timed none."""
+    rows: list[str] = []
+    for rule_id, timings in rules.items():
+        if timings["slowest_files"]:
+            rows.extend(["", f"Slowest files for {rule_id}:"])
+            rows.extend(
+                f"  {_SECONDS.format(entry['wall'])}s  {entry['file']}"
+                for entry in timings["slowest_files"]
+            )
+    return rows
+
+
+def _seconds(timing: dict[str, Any]) -> str:
+    """Format a timing's wall and CPU seconds as two columns."""
+    return f"{_SECONDS.format(timing['wall'])}  {_SECONDS.format(timing['cpu'])}"
@@ -0,0 +1,308 @@
+"""
+Purpose: Per-file index of thailint ignore directives, built in one pass over the file
+
+Scope: File-level, block, next-line and inline ignore directives of one file's content
+
+Overview: Suppression checks used to start from the raw file content for every violation: the
+    file-level check split the whole file to look at its header, block checks replayed the
+    ignore-start/ignore-end state machine, and rule-specific fallbacks split the file again to read
+    the violation's line. DirectiveIndex.build scans the content once and keeps only the lines that
+    carry a directive: ignore-file lines within the header, ignore-next-line lines keyed by the line
+    they cover, lines with an inline ignore, and the ignore-start/ignore-end outcomes (_BlockIndex).
+    A violation is then answered with dictionary lookups that re-check the rule list of at most a
+    few directive lines. Content without a directive keyword is recognized with a single search and
+    never scanned line by line. index_for_content memoizes the index per content object, so the
+    orchestrator's suppression stage and the rules' own checks against the same file share one
+    index. The index covers thailint/design-lint directives only. "# noqa" is a per-rule convention
+    that magic-numbers and print-statements honor on top of it, and "# type: ignore" is a
+    type-checker directive that only lazy-ignores inspects, as the thing it reports on; indexing
+    either here would make it suppress every rule. DRY's own "# dry:" directives stay in
+    dry.inline_ignore. Rules that check thailint directives themselves, so rule.check() honors them
+    outside the orchestrator, answer from the same memoized index, so the orchestrator's second pass
+    is a lookup, not a rescan.
+
+Dependencies: re, collections.OrderedDict, functools.cached_property, HEADER_SCAN_LINES,
+    directive_markers, rule_matcher
+
+Exports: DirectiveIndex, index_for_content, check_line_for_ignore, check_specific_rule_in_line
+
+Interfaces: DirectiveIndex.build(content) -> DirectiveIndex, is_suppressed(rule_id, line) -> bool,
+    ignores_file(rule_id) -> bool, ignores_line(line, rule_id) -> bool,
+    line_text(line) -> str | None, lines, file_directives, index_for_content(content),
+    check_line_for_ignore(line, rule_id) -> bool, check_specific_rule_in_line(code, rule_id) -> bool
+
+Implementation: Directives are matched per line (not with tokenize) because the same comment
+    syntax is honored in Python, TypeScript, Rust and Markdown; the rule-matching helpers are the
+    ones the per-violation checks always used, plus the bare-ignore case (_GENERIC_IGNORE), so no
+    rule has to special-case it
+"""
+
+import re
+from collections import OrderedDict
+from functools import cached_property
+
+from src.core.constants import HEADER_SCAN_LINES
+from src.linter_config.directive_markers import (
+    check_general_ignore,
+    has_ignore_directive_marker,
+    has_ignore_end_marker,
+    has_ignore_next_line_marker,
+    has_ignore_start_marker,
+    has_line_ignore_marker,
+)
+from src.linter_config.rule_matcher import (
+    check_bracket_rules,
+    check_space_separated_rules,
+    rules_match_violation,
+)
+
+# Every directive marker contains one of these keywords; content without them has no directives
+_DIRECTIVE_HINT = re.compile(r"thailint|design-lint", re.IGNORECASE)
+_BLOCK_HINT = re.compile(r"ignore-start|ignore-end", re.IGNORECASE)
+# A bare "thailint: ignore" with no rule list covers every rule on its line
+_GENERIC_IGNORE = re.compile(r"(?:thailint|design-lint):\s*ignore(?![\w\[-])", re.IGNORECASE)
+
+# Indexes kept by index_for_content; rules and the orchestrator work on one file at a time
+_INDEX_CACHE_SIZE = 32
+
+
+class DirectiveIndex:
+    """Ignore directives of one file, looked up by line and rule id."""
+
+    def __init__(
+        self,
+        content: str,
+        file_directives: tuple[str, ...] = (),
+        next_line_directives: dict[int, str] | None = None,
+        inline_directives: dict[int, str] | None = None,
+        blocks: "_BlockIndex | None" = None,
+    ) -> None:
+        """Initialize from the directive lines found by build()."""
+        self._content = content
+        self.file_directives = file_directives
+        self._next_line_directives = next_line_directives or {}
+        self._inline_directives = inline_directives or {}
+        self._blocks = blocks
+
+    @classmethod
+    def build(cls, content: str) -> "DirectiveIndex":
+        """Scan content once and index every ignore directive in it.
+
+        Args:
+            content: Full text of the file
+
+        Returns:
+            Index answering suppression lookups for this content
+        """
+        if _DIRECTIVE_HINT.search(content) is None:
+            return cls(content)
+        index = cls(content)
+        file_directives: list[str] = []
+        for number, line in enumerate(index.lines, 1):
+            if _DIRECTIVE_HINT.search(line) is not None:
+                index._record(number, line, file_directives)
+        index.file_directives = tuple(file_directives)
+        if _BLOCK_HINT.search(content) is not None:
+            index._blocks = _BlockIndex.build(index.lines)
+        return index
+
+    def _record(self, number: int, line: str, file_directives: list[str]) -> None:
+        """Record the directives a single line carries."""
+        if number <= HEADER_SCAN_LINES and has_ignore_directive_marker(line):
+            file_directives.append(line)
+        if has_ignore_next_line_marker(line):
+            self._next_line_directives[number + 1] = line
+        if has_line_ignore_marker(line):
+            self._inline_directives[number] = line
+
+    @cached_property
+    def lines(self) -> list[str]:
+        """Lines of the content, split on first use."""
+        return self._content.splitlines()
+
+    def line_text(self, line: int) -> str | None:
+        """Get the text of a 1-based line, or None if the file has no such line."""
+        if 0 < line <= len(self.lines):
+            return self.lines[line - 1]
+        return None
+
+    def is_suppressed(self, rule_id: str, line: int) -> bool:
+        """Check if a violation of rule_id at line is suppressed by any directive."""
+        return self.ignores_file(rule_id) or self.ignores_line(line, rule_id)
+
+    def ignores_file(self, rule_id: str | None) -> bool:
+        """Check for an ignore-file directive in the header covering rule_id."""
+        return any(check_line_for_ignore(line, rule_id) for line in self.file_directives)
+
+    def ignores_line(self, line: int, rule_id: str) -> bool:
+        """Check for a block, ignore-next-line or inline directive covering this line."""
+        if self._blocks is not None and self._blocks.is_ignored(line, rule_id):
+            return True
+        previous = self._next_line_directives.get(line)
+        if previous is not None and _matches_ignore_next_line_rules(previous, rule_id):
+            return True
+        current = self._inline_directives.get(line)
+        if current is None:
+            return False
+        return check_specific_rule_in_line(current, rule_id) if rule_id else True
+
+
+_index_cache: "OrderedDict[int, tuple[str, DirectiveIndex]]" = OrderedDict()
+
+
+def index_for_content(content: str) -> DirectiveIndex:
+    """Get the directive index for a content string, building it once per content object.
+
+    Keyed by id(content), with the content object stored alongside so a lookup can verify
+    (via `is`) that the id still refers to the same object: id() is only unique among live
+    objects, and a long-lived --parallel worker frees each file's content before reading the
+    next, so a recycled id must never serve another file's index.
+
+    Args:
+        content: Full text of the file, as held by its lint context
+
+    Returns:
+        Directive index shared by every caller holding the same content object
+    """
+    key = id(content)
+    cached = _index_cache.get(key)
+    if cached is not None and cached[0] is content:
+        _index_cache.move_to_end(key)
+        return cached[1]
+    index = DirectiveIndex.build(content)
+    _index_cache[key] = (content, index)
+    if len(_index_cache) > _INDEX_CACHE_SIZE:
+        _index_cache.popitem(last=False)
+    return index
+
+
+def check_line_for_ignore(line: str, rule_id: str | None) -> bool:
+    """Check if line has matching ignore directive."""
+    if not has_ignore_directive_marker(line):
+        return False
+    if rule_id:
+        return _check_specific_rule_ignore(line, rule_id)
+    return check_general_ignore(line)
+
+
+def _check_specific_rule_ignore(line: str, rule_id: str) -> bool:
+    """Check if line ignores a specific rule."""
+    bracket_match = re.search(r"ignore-file\[([^\]]+)\]", line, re.IGNORECASE)
+    if bracket_match:
+        return check_bracket_rules(bracket_match.group(1), rule_id)
+    space_match = re.search(r"ignore-file\s+([^\s#]+(?:\s+[^\s#]+)*)", line, re.IGNORECASE)
+    if space_match:
+        return check_space_separated_rules(space_match.group(1), rule_id)
+    return False
+
+
+def check_specific_rule_in_line(code: str, rule_id: str) -> bool:
+    """Check if line's ignore directive matches specific rule."""
+    bracket_match = re.search(r"ignore\[([^\]]+)\]", code, re.IGNORECASE)
+    if bracket_match:
+        return check_bracket_rules(bracket_match.group(1), rule_id)
+    space_match = re.search(r"ignore\s+([^\s#]+(?:\s+[^\s#]+)*)", code, re.IGNORECASE)
+    if space_match:
+        return check_space_separated_rules(space_match.group(1), rule_id)
+    return "ignore-all" in code.lower() or _GENERIC_IGNORE.search(code) is not None
+
+
+def _matches_ignore_next_line_rules(prev_line: str, rule_id: str) -> bool:
+    """Check if ignore-next-line directive matches the rule."""
+    match = re.search(r"ignore-next-line\[([^\]]+)\]", prev_line)
+    if match:
+        return check_bracket_rules(match.group(1), rule_id)
+    return True
+
+
+class _BlockIndex:
+    """Precomputed ignore-start/ignore-end block data for O(1)-ish per-violation lookup.
+
+    Replays the line-by-line state machine the original per-violation scan used, but
+    records every outcome instead of stopping at one target line.
+
+    The original scan terminates the instant it reaches the violation's own line while
+    inside an open block (returning whatever that block's rules say, win or lose) - later
+    blocks are never considered for that violation once that happens. Otherwise, it only
+    reconsiders the violation retroactively once a later ignore-end marker is reached.
+    `_open_lines` captures the first case; `_closed_spans` captures the second.
+    """
+
+    def __init__(
+        self,
+        line_count: int,
+        open_lines: dict[int, frozenset[str]],
+        closed_spans: list[tuple[int, frozenset[str]]],
+    ) -> None:
+        self._line_count = line_count
+        self._open_lines = open_lines
+        self._closed_spans = closed_spans
+
+    @classmethod
+    def build(cls, lines: list[str]) -> "_BlockIndex":
+        """Scan lines once, recording every open-line and closed-span outcome."""
+        open_lines: dict[int, frozenset[str]] = {}
+        closed_spans: list[tuple[int, frozenset[str]]] = []
+        state = _BlockScanState()
+        for i, line in enumerate(lines, 1):
+            _scan_line(line, i, state, open_lines, closed_spans)
+        return cls(len(lines), open_lines, closed_spans)
+
+    def is_ignored(self, violation_line: int, rule_id: str) -> bool:
+        """Check whether a violation at this line/rule is block-ignored."""
+        if not 0 < violation_line <= self._line_count:
+            return False
+        rules_at_line = self._open_lines.get(violation_line)
+        if rules_at_line is not None:
+            return rules_match_violation(rules_at_line, rule_id)
+        return any(
+            violation_line < end_line and rules_match_violation(rules, rule_id)
+            for end_line, rules in self._closed_spans
+        )
+
+
+class _BlockScanState:
+    """Mutable state carried across lines while building a _BlockIndex."""
+
+    def __init__(self) -> None:
+        self.in_block = False
+        self.rules: set[str] = set()
+
+
+def _scan_line(
+    line: str,
+    line_num: int,
+    state: _BlockScanState,
+    open_lines: dict[int, frozenset[str]],
+    closed_spans: list[tuple[int, frozenset[str]]],
+) -> None:
+    """Process one line's effect on block-scan state, recording index entries."""
+    if has_ignore_start_marker(line):
+        state.rules = _parse_ignore_start_rules(line)
+        state.in_block = True
+        return
+    if has_ignore_end_marker(line):
+        _close_block(line_num, state, closed_spans)
+        return
+    if state.in_block:
+        open_lines[line_num] = frozenset(state.rules)
+
+
+def _close_block(
+    line_num: int, state: _BlockScanState, closed_spans: list[tuple[int, frozenset[str]]]
+) -> None:
+    """Record a closed-span entry (if a block was open) and reset scan state."""
+    if state.in_block:
+        closed_spans.append((line_num, frozenset(state.rules)))
+    state.in_block = False
+    state.rules = set()
+
+
+def _parse_ignore_start_rules(line: str) -> set[str]:
+    """Extract rule names from ignore-start directive."""
+    match = re.search(r"ignore-start\s+([^\s#]+(?:\s+[^\s#]+)*)", line)
+    if match:
+        rules_text = match.group(1).strip()
+        rules = [r.strip() for r in re.split(r"[,\s]+", rules_text) if r.strip()]
+        return set(rules)
+    return {"*"}
@@ -0,0 +1,288 @@
+"""
+Purpose: Compiled gitignore-style matcher for lists of ignore patterns
+
+Scope: File and whole-directory verdicts for the repo-level and per-linter `ignore:` lists
+
+Overview: Compiles a list of gitignore-style patterns once into a PatternMatcher, so matching a
+    path no longer re-splits every pattern and retries every "**" split with fnmatch. Each
+    pattern is translated to one regex with the same semantics matches_pattern has always had:
+    "**" spans zero or more whole path segments, "*", "?" and character classes never cross a
+    "/", and a directory pattern (trailing "/") matches any path with that directory as one of
+    its components or as its leading part. A pattern starting with "!" re-includes what earlier
+    patterns excluded (the last matching pattern wins, as in .gitignore); a leading "\\!" stands
+    for a literal "!". Patterns are indexed in a trie keyed by their literal leading segments,
+    so a path is only tested against the patterns whose literal prefix it actually starts with.
+    covers_directory answers whether every path under a directory is excluded, which lets
+    directory traversal prune the directory instead of filtering each file beneath it.
+
+Dependencies: re, functools.lru_cache, dataclasses, collections.abc.Sequence
+
+Exports: PatternMatcher class, compile_patterns function
+
+Interfaces: compile_patterns(patterns) -> PatternMatcher (memoized per pattern tuple),
+    PatternMatcher.matches(path) -> bool, PatternMatcher.covers_directory(dir_path) -> bool
+
+Implementation: One compiled regex per pattern plus a directory regex for patterns that can
+    cover a whole directory; candidates are collected from the prefix trie and tried from the
+    last pattern backwards, so the first hit is the last match. A directory is only covered
+    when no negation that could match beneath it comes after the covering pattern.
+"""
+
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+_GLOB_CHARS = frozenset("*?[")
+
+# Any run of whole path segments, each followed by its "/"
+_ANY_SEGMENTS = "(?:[^/]*/)*"
+
+# Distinct pattern lists kept compiled (one per linter config, plus single patterns)
+_MATCHER_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledPattern:
+    """One pattern's regexes, polarity and literal leading segments."""
+
+    index: int
+    negated: bool
+    prefix: tuple[str, ...]
+    file_regex: re.Pattern[str]
+    # Matches a directory only if every path beneath it matches; None if the pattern never can
+    dir_regex: re.Pattern[str] | None
+
+
+@dataclass(slots=True)
+class _TrieNode:
+    """Prefix trie node listing the patterns whose literal prefix ends here."""
+
+    entries: list[int] = field(default_factory=list)
+    children: dict[str, "_TrieNode"] = field(default_factory=dict)
+
+
+class _PrefixTrie:
+    """Index of pattern positions by literal leading path segments."""
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self._root = _TrieNode()
+
+    def add(self, prefix: tuple[str, ...], index: int) -> None:
+        """Record a pattern position under its literal prefix."""
+        node = self._root
+        for segment in prefix:
+            node = node.children.setdefault(segment, _TrieNode())
+        node.entries.append(index)
+
+    def along(self, segments: Sequence[str]) -> Iterator[int]:
+        """Yield the positions of patterns whose literal prefix the segments start with."""
+        node: _TrieNode | None = self._root
+        for segment in segments:
+            if node is None:
+                return
+            yield from node.entries
+            node = node.children.get(segment)
+        if node is not None:
+            yield from node.entries
+
+    def reachable_under(self, segments: Sequence[str]) -> Iterator[int]:
+        """Yield the positions of patterns that could match a path beneath the segments."""
+        node: _TrieNode | None = self._root
+        for segment in segments:
+            if node is None:
+                return
+            yield from node.entries
+            node = node.children.get(segment)
+        if node is not None:
+            yield from _subtree_entries(node)
+
+
+def _subtree_entries(node: _TrieNode) -> Iterator[int]:
+    """Yield every position recorded at or below a trie node."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield from current.entries
+        stack.extend(current.children.values())
+
+
+class PatternMatcher:
+    """A list of gitignore-style patterns compiled for repeated matching."""
+
+    __slots__ = ("_negations", "_patterns", "_trie")
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        """Compile the patterns in order.
+
+        Args:
+            patterns: Gitignore-style patterns; later patterns take precedence
+        """
+        self._patterns = [_compile(index, pattern) for index, pattern in enumerate(patterns)]
+        self._trie = _PrefixTrie()
+        self._negations = _PrefixTrie()
+        for compiled in self._patterns:
+            self._trie.add(compiled.prefix, compiled.index)
+            if compiled.negated:
+                self._negations.add(compiled.prefix, compiled.index)
+
+    def matches(self, path: str) -> bool:
+        """Check whether the last pattern matching a path excludes it.
+
+        Args:
+            path: "/"-separated path, matched in the form the patterns were written for
+
+        Returns:
+            True if the path is excluded
+        """
+        for index in self._candidates(path):
+            compiled = self._patterns[index]
+            if compiled.file_regex.match(path):
+                return not compiled.negated
+        return False
+
+    def covers_directory(self, dir_path: str) -> bool:
+        """Check whether every path beneath a directory is excluded.
+
+        Args:
+            dir_path: "/"-separated directory path, without a trailing "/"
+
+        Returns:
+            True if the directory can be skipped without visiting anything inside it
+        """
+        latest_negation = max(self._negations.reachable_under(dir_path.split("/")), default=-1)
+        for index in self._candidates(dir_path):
+            if index <= latest_negation:
+                return False
+            dir_regex = self._patterns[index].dir_regex
+            if dir_regex is not None and dir_regex.match(dir_path):
+                return True
+        return False
+
+    def _candidates(self, path: str) -> list[int]:
+        """Get the positions of patterns whose literal prefix fits the path, latest first."""
+        return sorted(self._trie.along(path.split("/")), reverse=True)
+
+
+@lru_cache(maxsize=_MATCHER_CACHE_SIZE)
+def compile_patterns(patterns: tuple[str, ...]) -> PatternMatcher:
+    """Compile a pattern list, reusing the matcher for a list compiled before.
+
+    Args:
+        patterns: Gitignore-style patterns, as a tuple so the list can be cached
+
+    Returns:
+        PatternMatcher for the patterns
+    """
+    return PatternMatcher(patterns)
+
+
+def _compile(index: int, pattern: str) -> _CompiledPattern:
+    """Translate one pattern, noting its polarity."""
+    negated = pattern.startswith("!")
+    if negated or pattern.startswith("\\!"):
+        pattern = pattern[1:]
+    if pattern.endswith("/"):
+        return _compile_directory_pattern(index, negated, pattern.rstrip("/"))
+    return _compile_segment_pattern(index, negated, _collapse_double_stars(pattern.split("/")))
+
+
+def _collapse_double_stars(parts: list[str]) -> list[str]:
+    """Merge runs of "**" segments, which match exactly what a single "**" matches."""
+    return [part for i, part in enumerate(parts) if part != "**" or parts[i - 1 : i] != ["**"]]
+
+
+def _compile_segment_pattern(index: int, negated: bool, parts: list[str]) -> _CompiledPattern:
+    """Compile a pattern matched segment by segment, "**" spanning whole segments."""
+    body = _segments_to_regex(parts)
+    file_regex = re.compile(f"(?s:{body})\\Z")
+    # A trailing "**" keeps matching whatever is appended below a path it matches
+    dir_regex = file_regex if parts[-1] == "**" else None
+    return _CompiledPattern(index, negated, _literal_prefix(parts), file_regex, dir_regex)
+
+
+def _segments_to_regex(parts: list[str]) -> str:
+    """Translate pattern segments, joining them with "/" separators."""
+    pieces: list[str] = []
+    pending_separator = False
+    for position, part in enumerate(parts):
+        is_last = position == len(parts) - 1
+        if part == "**" and is_last:
+            pieces.append("(?:/.*)?" if pending_separator else ".*")
+            return "".join(pieces)
+        if pending_separator:
+            pieces.append("/")
+        if part == "**":
+            pieces.append(_ANY_SEGMENTS)
+            pending_separator = False
+        else:
+            pieces.append(_glob_to_regex(part, crosses_separator=False))
+            pending_separator = True
+    return "".join(pieces)
+
+
+def _compile_directory_pattern(index: int, negated: bool, directory: str) -> _CompiledPattern:
+    """Compile a directory pattern (written with a trailing "/").
+
+    The directory matches as a whole path component anywhere in the path, or as the
+    leading part of the path with "*" free to cross "/" (fnmatch of "<directory>/*").
+    """
+    glob = _glob_to_regex(directory, crosses_separator=True)
+    alternatives = []
+    if directory and "/" not in directory:
+        alternatives.append(f"(?:.*/)?{re.escape(directory)}(?:/.*)?")
+    file_regex = re.compile(f"(?s:{'|'.join([*alternatives, glob + '/.*'])})\\Z")
+    dir_regex = re.compile(f"(?s:{'|'.join([*alternatives, glob + '(?:/.*)?'])})\\Z")
+    prefix = () if alternatives else _literal_prefix(directory.split("/"))
+    return _CompiledPattern(index, negated, prefix, file_regex, dir_regex)
+
+
+def _literal_prefix(parts: list[str]) -> tuple[str, ...]:
+    """Get the leading segments that a matching path must contain verbatim."""
+    prefix: list[str] = []
+    for part in parts:
+        if part == "**" or not _GLOB_CHARS.isdisjoint(part):
+            break
+        prefix.append(part)
+    return tuple(prefix)
+
+
+def _glob_to_regex(glob: str, crosses_separator: bool) -> str:
+    """Translate fnmatch syntax, optionally keeping wildcards within one path segment."""
+    star, any_char, class_guard = (
+        (".*", ".", "") if crosses_separator else ("[^/]*", "[^/]", "(?!/)")
+    )
+    wildcards = {"*": star, "?": any_char}
+    pieces: list[str] = []
+    position = 0
+    while position < len(glob):
+        char = glob[position]
+        position += 1
+        wildcard = wildcards.get(char)
+        if char not in _GLOB_CHARS:
+            pieces.append(re.escape(char))
+        elif wildcard is None:  # "[" opens a character class
+            char_class, position = _translate_class(glob, position)
+            pieces.append(class_guard + char_class if char_class != "\\[" else char_class)
+        elif wildcard != star or not pieces or pieces[-1] != star:
+            pieces.append(wildcard)
+    return "".join(pieces)
+
+
+def _translate_class(glob: str, start: int) -> tuple[str, int]:
+    """Translate a "[...]" class opened just before start, or a literal "[" if unclosed."""
+    end = start
+    if end < len(glob) and glob[end] == "!":
+        end += 1
+    if end < len(glob) and glob[end] == "]":
+        end += 1
+    end = glob.find("]", end)
+    if end == -1:
+        return "\\[", start
+    stuff = glob[start:end].replace("\\", "\\\\")
+    if stuff.startswith("!"):
+        stuff = "^" + stuff[1:]
+    elif stuff.startswith(("^", "[")):
+        stuff = "\\" + stuff
+    return f"[{stuff}]", end + 1
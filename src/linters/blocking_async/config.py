@@ -22,7 +22,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class BlockingAsyncConfig:
     """Configuration for blocking-in-async detection."""
 
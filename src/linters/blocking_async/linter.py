@@ -20,6 +20,7 @@ Implementation: Single-file analysis with config-driven filtering and tree-sitte
 """
 
 from src.core.base import BaseLintContext, BaseLintRule
+from src.core.constants import Language
 from src.core.linter_utils import (
     has_file_content,
     is_ignored_path,
@@ -80,6 +81,11 @@ class BlockingAsyncRule(BaseLintRule):
             "async-compatible alternatives like tokio::fs, tokio::time::sleep, and tokio::net."
         )
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Rust only."""
+        return frozenset({Language.RUST})
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for blocking-in-async violations in a Rust file.
 
@@ -22,7 +22,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class CloneAbuseConfig:
     """Configuration for clone abuse detection."""
 
@@ -17,7 +17,8 @@ Exports: RustCloneAnalyzer, CloneCall
 
 Interfaces: find_clone_calls(code: str) -> list[CloneCall]
 
-Implementation: Recursive AST traversal with pattern classification using parent-chain walking
+Implementation: call_expression lookup via walk_tree with pattern classification using
+    parent-chain walking
 """
 
 from __future__ import annotations
@@ -33,6 +34,7 @@ if TYPE_CHECKING:
 
 _LOOP_NODE_TYPES = frozenset({"for_expression", "while_expression", "loop_expression"})
 _METHOD_NAME_CLONE = "clone"
+_NODE_TYPE_CALL_EXPRESSION = "call_expression"
 
 
 @dataclass
@@ -66,34 +68,34 @@ class RustCloneAnalyzer(RustBaseAnalyzer):
             return []
 
         calls: list[CloneCall] = []
-        self._find_clone_recursive(root, code, calls)
+        for node in self.walk_tree(root, _NODE_TYPE_CALL_EXPRESSION):
+            call = self._check_call(node, code)
+            if call is not None:
+                calls.append(call)
         return calls
 
-    def _find_clone_recursive(self, node: Node, code: str, calls: list[CloneCall]) -> None:
-        """Recursively find abusive clone calls in AST.
+    def _check_call(self, node: Node, code: str) -> CloneCall | None:
+        """Classify one call expression as an abusive clone call, if it is one.
 
         Args:
-            node: Current tree-sitter node to inspect
+            node: A call_expression node
             code: Original source code for context extraction
-            calls: Accumulator list for detected calls
+
+        Returns:
+            CloneCall for an abusive .clone() call, None otherwise
         """
-        if node.type == "call_expression":
-            method_name = self._get_method_name(node)
-            if method_name == _METHOD_NAME_CLONE:
-                pattern = self._classify_clone(node, code)
-                if pattern is not None:
-                    calls.append(
-                        CloneCall(
-                            line=node.start_point[0] + 1,
-                            column=node.start_point[1],
-                            pattern=pattern,
-                            is_in_test=self.is_inside_test(node),
-                            context=get_line_context(code, node.start_point[0]),
-                        )
-                    )
-
-        for child in node.children:
-            self._find_clone_recursive(child, code, calls)
+        if self._get_method_name(node) != _METHOD_NAME_CLONE:
+            return None
+        pattern = self._classify_clone(node, code)
+        if pattern is None:
+            return None
+        return CloneCall(
+            line=node.start_point[0] + 1,
+            column=node.start_point[1],
+            pattern=pattern,
+            is_in_test=self.is_inside_test(node),
+            context=get_line_context(code, node.start_point[0]),
+        )
 
     def _get_method_name(self, call_node: Node) -> str:
         """Extract method name from a call expression.
@@ -179,7 +181,7 @@ class RustCloneAnalyzer(RustBaseAnalyzer):
         if field_expr is None:
             return False
         receiver = _get_receiver_node(field_expr)
-        if receiver is None or receiver.type != "call_expression":
+        if receiver is None or receiver.type != _NODE_TYPE_CALL_EXPRESSION:
             return False
         return self._get_method_name(receiver) == "clone"
 
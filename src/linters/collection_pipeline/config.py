@@ -25,7 +25,7 @@ from typing import Any
 DEFAULT_MIN_CONTINUES = 1
 
 
-@dataclass
+@dataclass(frozen=True)
 class CollectionPipelineConfig:
     """Configuration for collection-pipeline linter."""
 
@@ -8,24 +8,29 @@ Overview: Implements the core detection logic for identifying imperative loop pa
     AST module to analyze code structure and identify refactoring opportunities. Detects
     patterns like 'for x in iter: if not cond: continue; action(x)' and suggests
     refactoring to generator expressions or filter(). Handles edge cases like walrus
-    operators (side effects), else branches, and empty loop bodies.
+    operators (side effects), else branches, and empty loop bodies. Loops are reached through
+    a DispatchVisitor over the module's shared AstIndex, which also supplies the enclosing
+    function body the any/all and filter-map checks need.
 
-Dependencies: ast module, continue_analyzer, suggestion_builder
+Dependencies: ast module, continue_analyzer, suggestion_builder, analyzers.ast_index,
+    analyzers.dispatch_visitor
 
 Exports: PipelinePatternDetector class, PatternMatch dataclass, PatternType enum
 
 Interfaces: PipelinePatternDetector.detect_patterns() -> list[PatternMatch]
 
-Implementation: AST visitor pattern with delegated pattern matching and suggestion generation
-
-Suppressions:
-    - invalid-name: AST NodeVisitor visit_* methods follow convention, not PEP8
+Implementation: Dispatched ast.For handler with delegated pattern matching and suggestion
+    generation
 """
 
 import ast
 from dataclasses import dataclass, field
 from enum import Enum
 
+from src.analyzers.ast_index import AstIndex, get_ast_index
+from src.analyzers.dispatch_visitor import DispatchVisitor, run_detectors
+from src.core.python_source import parse_python_source
+
 from . import any_all_analyzer, continue_analyzer, filter_map_analyzer, suggestion_builder
 
 
@@ -226,7 +231,7 @@ def analyze_for_loop(node: ast.For) -> PatternMatch | None:
     return create_embedded_filter_match(node, continues)
 
 
-class PipelinePatternDetector(ast.NodeVisitor):
+class PipelinePatternDetector:
     """Detects for loops with embedded filtering via if/continue patterns."""
 
     def __init__(self, source_code: str) -> None:
@@ -237,7 +242,7 @@ class PipelinePatternDetector(ast.NodeVisitor):
         """
         self.source_code = source_code
         self.matches: list[PatternMatch] = []
-        self._func_body_stack: list[list[ast.stmt]] = []
+        self._index: AstIndex | None = None
 
     def detect_patterns(self) -> list[PatternMatch]:
         """Analyze source code and return detected patterns.
@@ -246,34 +251,19 @@ class PipelinePatternDetector(ast.NodeVisitor):
             List of PatternMatch objects for each detected anti-pattern
         """
         try:
-            tree = ast.parse(self.source_code)
-            self.visit(tree)
+            tree = parse_python_source(self.source_code)
         except SyntaxError:
-            pass  # Invalid Python, return empty list
+            return self.matches  # Invalid Python, return empty list
+        self._index = get_ast_index(tree)
+        run_detectors(tree, [self], self._index)
         return self.matches
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # pylint: disable=invalid-name
-        """Visit function and track body for any/all pattern detection.
-
-        Args:
-            node: AST FunctionDef node
-        """
-        self._func_body_stack.append(node.body)
-        self.generic_visit(node)
-        self._func_body_stack.pop()
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:  # pylint: disable=invalid-name
-        """Visit async function and track body for any/all pattern detection.
-
-        Args:
-            node: AST AsyncFunctionDef node
-        """
-        self._func_body_stack.append(node.body)
-        self.generic_visit(node)
-        self._func_body_stack.pop()
+    def register(self, visitor: DispatchVisitor) -> None:
+        """Register the for-loop check with a dispatch visitor."""
+        visitor.register(ast.For, self.check_for)
 
-    def visit_For(self, node: ast.For) -> None:  # pylint: disable=invalid-name
-        """Visit for loop and check for filtering patterns.
+    def check_for(self, node: ast.For) -> None:
+        """Check a for loop for filtering patterns.
 
         Args:
             node: AST For node to analyze
@@ -281,7 +271,15 @@ class PipelinePatternDetector(ast.NodeVisitor):
         match = self._find_pattern_match(node)
         if match is not None:
             self.matches.append(match)
-        self.generic_visit(node)
+
+    def _function_body(self, node: ast.For) -> list[ast.stmt] | None:
+        """Get the body of the function enclosing a loop (None at module or class level)."""
+        if self._index is None:
+            return None
+        function = self._index.enclosing_function(node)
+        if isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return function.body
+        return None
 
     def _find_pattern_match(self, node: ast.For) -> PatternMatch | None:
         """Find the first matching anti-pattern for a for loop.
@@ -316,11 +314,10 @@ class PipelinePatternDetector(ast.NodeVisitor):
         Returns:
             PatternMatch if any/all pattern detected, None otherwise
         """
-        if not self._func_body_stack:
+        func_body = self._function_body(node)
+        if func_body is None:
             return None
 
-        func_body = self._func_body_stack[-1]
-
         # Try any() pattern first
         any_match = any_all_analyzer.extract_any_pattern(func_body, node)
         if any_match is not None:
@@ -342,11 +339,10 @@ class PipelinePatternDetector(ast.NodeVisitor):
         Returns:
             PatternMatch if filter-map/takewhile pattern detected, None otherwise
         """
-        if not self._func_body_stack:
+        func_body = self._function_body(node)
+        if func_body is None:
             return None
 
-        func_body = self._func_body_stack[-1]
-
         # Try filter-map pattern first
         fm_match = filter_map_analyzer.extract_filter_map_pattern(func_body, node)
         if fm_match is not None:
@@ -63,6 +63,11 @@ class CollectionPipelineRule(BaseLintRule):  # thailint: ignore[srp,dry]
             "refactored to use collection pipelines (generator expressions, filter())"
         )
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Python only."""
+        return frozenset({Language.PYTHON})
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for collection pipeline anti-patterns.
 
@@ -18,7 +18,7 @@ Interfaces: PythonCQSAnalyzer.analyze(code, file_path, config) -> list[CQSPatter
 Implementation: Coordinates FunctionAnalyzer with error handling for AST parsing failures
 """
 
-import ast
+from src.core.python_source import parse_python_source
 
 from .config import CQSConfig
 from .function_analyzer import FunctionAnalyzer
@@ -46,7 +46,7 @@ class PythonCQSAnalyzer:
             Returns empty list if code cannot be parsed due to SyntaxError.
         """
         try:
-            tree = ast.parse(code, filename=file_path)
+            tree = parse_python_source(code)
         except SyntaxError:
             return []
 
@@ -54,13 +54,12 @@ class BaseTokenAnalyzer:  # thailint: ignore[stateless-class] - Template method
         windows = token_hasher.rolling_hash(lines, config.min_duplicate_lines)
 
         blocks = []
-        for hash_val, start_line, end_line, snippet in windows:
+        for hash_val, start_line, end_line in windows:
             if self._should_include_block(content, start_line, end_line):
                 block = CodeBlock(
                     file_path=file_path,
                     start_line=start_line,
                     end_line=end_line,
-                    snippet=snippet,
                     hash_value=hash_val,
                 )
                 blocks.append(block)
@@ -8,7 +8,7 @@ Overview: Provides an extensible architecture for filtering duplicate code block
     common false positive patterns like keyword-only function arguments, import groups,
     and API call boilerplate. New filters can be added by subclassing BaseBlockFilter.
 
-Dependencies: ast, re, typing
+Dependencies: ast, re, typing, analyzers.ast_index
 
 Exports: BaseBlockFilter, BlockFilterRegistry, FilterCache, KeywordArgumentFilter,
     ImportGroupFilter, LoggerCallFilter, ExceptionReraiseFilter
@@ -28,6 +28,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
+from src.analyzers.ast_index import get_ast_index
+from src.core.python_source import parse_python_source
+
 # Default filter threshold constants
 DEFAULT_KEYWORD_ARG_THRESHOLD = 0.8
 
@@ -38,7 +41,6 @@ class CodeBlock(Protocol):
     file_path: Path
     start_line: int
     end_line: int
-    snippet: str
     hash_value: int
 
 
@@ -162,15 +164,13 @@ class KeywordArgumentFilter(BaseBlockFilter):
         )
 
     def _contains_call_via_walk(self, block: CodeBlock, file_content: str, cache: Cache) -> bool:
-        """Check for a containing Call node by parsing/walking the whole tree."""
+        """Check for a containing Call node among every call in the tree's shared index."""
         tree = self._resolve_tree(file_content, cache)
         if tree is None:
             return False
 
-        return any(
-            isinstance(node, ast.Call) and self._check_multiline_containment(node, block)
-            for node in ast.walk(tree)
-        )
+        calls = get_ast_index(tree).nodes(ast.Call)
+        return any(self._check_multiline_containment(node, block) for node in calls)
 
     @staticmethod
     def _resolve_tree(file_content: str, cache: Cache) -> ast.Module | None:
@@ -178,7 +178,7 @@ class KeywordArgumentFilter(BaseBlockFilter):
         if cache is not None and cache.ast_tree is not None:
             return cache.ast_tree
         try:
-            return ast.parse(file_content)
+            return parse_python_source(file_content)
         except SyntaxError:
             return None
 
@@ -11,22 +11,30 @@ Overview: Implements in-memory, temporary-file, or persistent SQLite storage for
     CASCADE, which requires PRAGMA foreign_keys=ON and was never enabled here (the exact bug,
     #35, that caused stale duplicate-code violations to persist after the underlying duplicate
     was already fixed, in this feature's earlier, removed incarnation). Includes indexes for
-    fast hash lookups enabling efficient cross-file detection. Duplicate-constant detection uses
-    a separate, in-memory, non-SQLite path (DRYRule._constants + find_constant_groups) and has no
-    presence here.
+    fast hash lookups enabling efficient cross-file detection. Windows overlap, so code_blocks
+    holds one row per window and is kept compact: files are referenced by integer id and no
+    snippet text is stored, since violations only need the file path and line range. The
+    per-file state that cross-file finalization needs besides blocks - extracted constants and
+    "# dry:" ignore ranges - shares this database through the file_state store, so under
+    --parallel every worker's results reach the main process through the same shared file as
+    the code blocks.
 
-Dependencies: Python sqlite3 module (stdlib), tempfile module (stdlib), pathlib.Path, dataclasses
+Dependencies: Python sqlite3 module (stdlib), tempfile module (stdlib), pathlib.Path, dataclasses,
+    FileStateStore, create_index_settings_table
 
 Exports: CodeBlock dataclass, DRYCache class
 
 Interfaces: DRYCache.__init__(storage_mode, db_path), upsert_file(file_path, content_hash,
     blocks), needs_rescan(file_path, content_hash), purge_file(file_path),
     find_duplicates_by_hash(hash_value), find_duplicates_by_hashes(hash_values),
-    duplicate_hashes, all_file_paths, close()
+    duplicate_hashes, all_file_paths, file_state (FileStateStore), close()
 
-Implementation: SQLite with three tables (files, code_blocks, schema_meta), indexed for
-    performance, storage_mode determines :memory:/tempfile/persistent location, ACID transactions
-    for reliability, schema_meta enables self-healing rebuild on an incompatible on-disk schema
+Implementation: SQLite with six tables (files, code_blocks, constants, ignore_ranges,
+    index_settings, schema_meta; constants and ignore_ranges are created by FileStateStore), indexed
+    for performance, storage_mode determines :memory:/tempfile/persistent location, ACID
+    transactions for reliability, schema_meta enables self-healing rebuild on an incompatible
+    on-disk schema, index_settings (see index_bookkeeping) discards blocks extracted under different
+    analysis settings
 
 Suppressions:
     - consider-using-with: Tempfile managed by class lifecycle, not context manager
@@ -42,6 +50,8 @@ from pathlib import Path
 from src.core.constants import StorageMode
 
 from .cache_query import CacheQueryService
+from .file_state_store import FileStateStore
+from .index_bookkeeping import create_index_settings_table
 
 
 @dataclass
@@ -51,14 +61,16 @@ class CodeBlock:
     file_path: Path
     start_line: int
     end_line: int
-    snippet: str
     hash_value: int
 
 
 class DRYCache:
     """SQLite-backed storage for duplicate detection."""
 
-    SCHEMA_VERSION = 2
+    # 3: hash_value switched to the polynomial rolling hash over per-line hashes, so
+    # persisted blocks from older versions can never match freshly indexed ones.
+    # 4: code_blocks references files by integer id and no longer stores snippet text.
+    SCHEMA_VERSION = 4
     # Seconds to wait for a lock before raising "database is locked", when connecting
     # to a shared on-disk file that multiple --parallel worker processes write to.
     SHARED_DB_CONNECT_TIMEOUT = 30
@@ -88,6 +100,7 @@ class DRYCache:
             raise ValueError(f"Invalid storage_mode: {storage_mode}")
 
         self._query_service = CacheQueryService()
+        self.file_state = FileStateStore(self.db)
         self._ensure_schema()
 
     def _connect_on_disk(self, storage_mode: str, db_path: Path | None) -> sqlite3.Connection:
@@ -132,27 +145,29 @@ class DRYCache:
 
     def _drop_app_tables(self) -> None:
         """Drop every app table, for a schema-version mismatch rebuild."""
-        for table in ("code_blocks", "files"):
+        for table in ("code_blocks", "files", "constants", "ignore_ranges", "index_settings"):
             self.db.execute(f"DROP TABLE IF EXISTS {table}")  # nosec B608 - fixed table names
 
     def _create_tables(self) -> None:
         """Create the schema if it doesn't already exist."""
         self.db.execute(
             """CREATE TABLE IF NOT EXISTS files (
-                file_path TEXT PRIMARY KEY,
+                id INTEGER PRIMARY KEY,
+                file_path TEXT NOT NULL UNIQUE,
                 content_hash TEXT NOT NULL,
                 last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )"""
         )
 
+        # One row per hash window, so rows are kept minimal: an integer file id instead of
+        # the path, and no snippet text (each source line would otherwise be stored once per
+        # window covering it).
         self.db.execute(
             """CREATE TABLE IF NOT EXISTS code_blocks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                file_path TEXT NOT NULL,
+                file_id INTEGER NOT NULL,
                 hash_value INTEGER NOT NULL,
                 start_line INTEGER NOT NULL,
-                end_line INTEGER NOT NULL,
-                snippet TEXT NOT NULL
+                end_line INTEGER NOT NULL
             )"""
         )
         # Deliberately no FOREIGN KEY ... ON DELETE CASCADE here: SQLite only enforces
@@ -161,7 +176,10 @@ class DRYCache:
         # `files` row being replaced). upsert_file() deletes explicitly instead.
 
         self.db.execute("CREATE INDEX IF NOT EXISTS idx_hash_value ON code_blocks(hash_value)")
-        self.db.execute("CREATE INDEX IF NOT EXISTS idx_file_path ON code_blocks(file_path)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_file_id ON code_blocks(file_id)")
+
+        self.file_state.create_tables()
+        create_index_settings_table(self.db)
 
     def upsert_file(self, file_path: Path, content_hash: str, blocks: list[CodeBlock]) -> None:
         """Replace all stored blocks for a file with fresh ones, atomically.
@@ -177,7 +195,7 @@ class DRYCache:
             content_hash: Hash of the file's current content, for later freshness checks
             blocks: List of CodeBlock instances to store (may be empty)
         """
-        self.db.execute("DELETE FROM code_blocks WHERE file_path = ?", (str(file_path),))
+        self._delete_blocks(file_path)
         self.db.execute(
             """INSERT INTO files (file_path, content_hash, last_scanned)
                VALUES (?, ?, CURRENT_TIMESTAMP)
@@ -187,17 +205,26 @@ class DRYCache:
             (str(file_path), content_hash),
         )
         if blocks:
+            file_id = self._file_id(file_path)
             self.db.executemany(
-                """INSERT INTO code_blocks
-                   (file_path, hash_value, start_line, end_line, snippet)
-                   VALUES (?, ?, ?, ?, ?)""",
-                [
-                    (str(file_path), b.hash_value, b.start_line, b.end_line, b.snippet)
-                    for b in blocks
-                ],
+                """INSERT INTO code_blocks (file_id, hash_value, start_line, end_line)
+                   VALUES (?, ?, ?, ?)""",
+                [(file_id, b.hash_value, b.start_line, b.end_line) for b in blocks],
             )
         self.db.commit()
 
+    def _file_id(self, file_path: Path) -> int:
+        """Look up the integer id of an indexed file."""
+        row = self.db.execute("SELECT id FROM files WHERE file_path = ?", (str(file_path),))
+        return int(row.fetchone()[0])
+
+    def _delete_blocks(self, file_path: Path) -> None:
+        """Delete every stored block of a file (no-op for a file that was never indexed)."""
+        self.db.execute(
+            "DELETE FROM code_blocks WHERE file_id IN (SELECT id FROM files WHERE file_path = ?)",
+            (str(file_path),),
+        )
+
     def needs_rescan(self, file_path: Path, current_content_hash: str) -> bool:
         """Check whether a file's indexed content is stale relative to current_content_hash.
 
@@ -220,8 +247,9 @@ class DRYCache:
         Args:
             file_path: Path to source file
         """
-        self.db.execute("DELETE FROM code_blocks WHERE file_path = ?", (str(file_path),))
+        self._delete_blocks(file_path)
         self.db.execute("DELETE FROM files WHERE file_path = ?", (str(file_path),))
+        self.file_state.delete(file_path)
         self.db.commit()
 
     def find_duplicates_by_hash(self, hash_value: int) -> list[CodeBlock]:
@@ -235,18 +263,7 @@ class DRYCache:
         """
         rows = self._query_service.find_blocks_by_hash(self.db, hash_value)
 
-        blocks = []
-        for file_path_str, start, end, snippet, hash_val in rows:
-            block = CodeBlock(
-                file_path=Path(file_path_str),
-                start_line=start,
-                end_line=end,
-                snippet=snippet,
-                hash_value=hash_val,
-            )
-            blocks.append(block)
-
-        return blocks
+        return [_row_to_block(row) for row in rows]
 
     def find_duplicates_by_hashes(self, hash_values: list[int]) -> dict[int, list[CodeBlock]]:
         """Find all code blocks for a batch of hash values in a single query.
@@ -263,16 +280,9 @@ class DRYCache:
         rows = self._query_service.find_blocks_by_hashes(self.db, hash_values)
 
         result: dict[int, list[CodeBlock]] = {h: [] for h in hash_values}
-        for file_path_str, start, end, snippet, hash_val in rows:
-            result[hash_val].append(
-                CodeBlock(
-                    file_path=Path(file_path_str),
-                    start_line=start,
-                    end_line=end,
-                    snippet=snippet,
-                    hash_value=hash_val,
-                )
-            )
+        for row in rows:
+            block = _row_to_block(row)
+            result[block.hash_value].append(block)
 
         return result
 
@@ -304,3 +314,11 @@ class DRYCache:
         self.db.close()
         if self._tempfile:
             self._tempfile.close()
+
+
+def _row_to_block(row: tuple[str, int, int, int]) -> CodeBlock:
+    """Build a CodeBlock from a (file_path, start_line, end_line, hash_value) query row."""
+    file_path_str, start, end, hash_val = row
+    return CodeBlock(
+        file_path=Path(file_path_str), start_line=start, end_line=end, hash_value=hash_val
+    )
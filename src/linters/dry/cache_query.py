@@ -15,11 +15,15 @@ Exports: CacheQueryService class
 Interfaces: CacheQueryService.get_duplicate_hashes(db), find_blocks_by_hash(db, hash_value),
     find_blocks_by_hashes(db, hash_values)
 
-Implementation: SQL queries for duplicate detection, returns hash values and block data
+Implementation: SQL queries for duplicate detection, returns hash values and block data with
+    each block's file path joined in from the files table
 """
 
 import sqlite3
 
+# Columns a block query returns: code_blocks references its file by id, so the path is joined in
+_BLOCK_COLUMNS = "files.file_path, code_blocks.start_line, code_blocks.end_line, hash_value"
+
 
 class CacheQueryService:
     """Handles cache database queries."""
@@ -54,13 +58,13 @@ class CacheQueryService:
             hash_value: Hash to search for
 
         Returns:
-            List of tuples (file_path, start_line, end_line, snippet, hash_value)
+            List of tuples (file_path, start_line, end_line, hash_value)
         """
         cursor = db.execute(
-            """SELECT file_path, start_line, end_line, snippet, hash_value
-               FROM code_blocks
+            f"""SELECT {_BLOCK_COLUMNS}
+               FROM code_blocks JOIN files ON files.id = code_blocks.file_id
                WHERE hash_value = ?
-               ORDER BY file_path, start_line""",
+               ORDER BY file_path, start_line""",  # nosec B608 - fixed column list
             (hash_value,),
         )
 
@@ -74,15 +78,15 @@ class CacheQueryService:
             hash_values: Hashes to search for
 
         Returns:
-            List of tuples (file_path, start_line, end_line, snippet, hash_value),
+            List of tuples (file_path, start_line, end_line, hash_value),
             for every hash in hash_values, ordered so each hash's rows are contiguous
         """
         if not hash_values:
             return []
         placeholders = ",".join("?" for _ in hash_values)
         cursor = db.execute(
-            f"""SELECT file_path, start_line, end_line, snippet, hash_value
-               FROM code_blocks
+            f"""SELECT {_BLOCK_COLUMNS}
+               FROM code_blocks JOIN files ON files.id = code_blocks.file_id
                WHERE hash_value IN ({placeholders})
                ORDER BY hash_value, file_path, start_line""",  # nosec B608 - placeholders only
             hash_values,
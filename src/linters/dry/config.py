@@ -8,11 +8,12 @@ Overview: Defines configuration structure for the DRY linter including duplicate
     sensible defaults and prevent misconfiguration. Supports loading from YAML configuration files
     through from_dict classmethod. Cache enabled by default for performance on large codebases.
 
-Dependencies: Python dataclasses module
+Dependencies: Python dataclasses module, re, functools.cached_property
 
 Exports: DRYConfig dataclass
 
-Interfaces: DRYConfig.__init__, DRYConfig.from_dict(config: dict) -> DRYConfig
+Interfaces: DRYConfig.__init__, DRYConfig.from_dict(config: dict, language) -> DRYConfig,
+    DRYConfig.analysis_fingerprint -> str, DRYConfig.ignore_constant_regexes
 
 Implementation: Dataclass with field defaults, __post_init__ validation, and dict-based construction
 
@@ -20,7 +21,10 @@ Suppressions:
     - too-many-instance-attributes: Configuration dataclass with related settings
 """
 
+import json
+import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 from src.core.constants import StorageMode
@@ -31,7 +35,7 @@ DEFAULT_MIN_DUPLICATE_TOKENS = 30
 DEFAULT_DETECT_DUPLICATE_CONSTANTS = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class DRYConfig:  # pylint: disable=too-many-instance-attributes
     """Configuration for DRY linter.
 
@@ -143,16 +147,47 @@ class DRYConfig:  # pylint: disable=too-many-instance-attributes
         override = language_overrides.get(language_lower)
         return override if override is not None else self.min_constant_occurrences
 
+    @cached_property
+    def ignore_constant_regexes(self) -> tuple[re.Pattern[str], ...]:
+        """Get ignore_constant_patterns compiled once for this config.
+
+        Returns:
+            Compiled regexes, in configured order
+        """
+        return tuple(re.compile(pattern) for pattern in self.ignore_constant_patterns)
+
+    @property
+    def analysis_fingerprint(self) -> str:
+        """Fingerprint of the settings that shape what is stored for a file.
+
+        Persistent storage reuses a file's stored blocks, constants and ignore ranges only
+        while this is unchanged: the ignore patterns decide which files get blocks, and
+        constants are only extracted while duplicate-constant detection is on.
+
+        Returns:
+            Stable string identifying the extraction settings
+        """
+        settings = {
+            "min_duplicate_lines": self.min_duplicate_lines,
+            "min_duplicate_tokens": self.min_duplicate_tokens,
+            "filters": self.filters,
+            "ignore_patterns": self.ignore_patterns,
+            "detect_duplicate_constants": self.detect_duplicate_constants,
+        }
+        return json.dumps(settings, sort_keys=True)
+
     @classmethod
-    def from_dict(cls, config: dict[str, Any]) -> "DRYConfig":
+    def from_dict(cls, config: dict[str, Any], language: str | None = None) -> "DRYConfig":
         """Load configuration from dictionary.
 
         Args:
             config: Dictionary containing configuration values
+            language: Unused; per-language settings are kept as fields of one config
 
         Returns:
             DRYConfig instance with values from dictionary
         """
+        _ = language
         # Extract language-specific min_occurrences
         python_config = config.get("python", {})
         typescript_config = config.get("typescript", {})
@@ -5,18 +5,21 @@ Scope: Extracts and validates DRY configuration from context
 
 Overview: Handles extraction of DRY configuration from BaseLintContext metadata dictionary.
     Validates configuration structure and converts to DRYConfig instance. Separates config
-    loading logic from main linter rule to maintain SRP compliance.
+    loading logic from main linter rule to maintain SRP compliance. Loads through
+    load_linter_config, so orchestrator contexts reuse the run's resolved DRYConfig.
 
-Dependencies: BaseLintContext, DRYConfig
+Dependencies: BaseLintContext, DRYConfig, load_linter_config
 
 Exports: ConfigLoader class
 
 Interfaces: ConfigLoader.load_config(context) -> DRYConfig
 
-Implementation: Extracts from context metadata, validates dict structure, uses DRYConfig.from_dict()
+Implementation: Delegates to load_linter_config, which falls back to defaults for a missing or
+    non-dict section
 """
 
 from src.core.base import BaseLintContext
+from src.core.linter_utils import load_linter_config
 
 from .config import DRYConfig
 
@@ -33,12 +36,4 @@ class ConfigLoader:
         Returns:
             DRYConfig instance
         """
-        metadata = getattr(context, "metadata", None)
-        if not isinstance(metadata, dict):
-            return DRYConfig()
-
-        config_dict = metadata.get("dry", {})
-        if not isinstance(config_dict, dict):
-            return DRYConfig()
-
-        return DRYConfig.from_dict(config_dict)
+        return load_linter_config(context, "dry", DRYConfig)
@@ -8,13 +8,14 @@ Overview: Provides storage interface for code blocks using SQLite (memory, tempf
     Delegates all storage operations to the DRYCache SQLite layer. Separates storage concerns
     from linting logic to maintain SRP compliance.
 
-Dependencies: DRYCache, CodeBlock, Path
+Dependencies: DRYCache, CodeBlock, FileStateStore, Path
 
 Exports: DuplicateStorage class
 
 Interfaces: DuplicateStorage.upsert_file(file_path, content_hash, blocks), needs_rescan(file_path,
     content_hash), purge_file(file_path), duplicate_hashes property,
-    get_blocks_for_hash(hash_value), get_blocks_for_hashes(hash_values), all_file_paths property
+    get_blocks_for_hash(hash_value), get_blocks_for_hashes(hash_values), all_file_paths property,
+    file_state property
 
 Implementation: Delegates to SQLite cache for all storage operations
 """
@@ -22,6 +23,7 @@ Implementation: Delegates to SQLite cache for all storage operations
 from pathlib import Path
 
 from .cache import CodeBlock, DRYCache
+from .file_state_store import FileStateStore
 
 
 class DuplicateStorage:
@@ -108,3 +110,12 @@ class DuplicateStorage:
             Set of all file_path strings currently in storage
         """
         return self._cache.all_file_paths
+
+    @property
+    def file_state(self) -> FileStateStore:
+        """Stored constants and "# dry:" ignore ranges of each checked file.
+
+        Returns:
+            The FileStateStore sharing the cache's database
+        """
+        return self._cache.file_state
@@ -0,0 +1,151 @@
+"""
+Purpose: SQLite tables for the per-file DRY state other than code blocks
+
+Scope: Extracted constants and "# dry:" ignore ranges of each checked file
+
+Overview: Cross-file finalization needs more than code blocks: the constants extracted for
+    duplicate-constant detection and the line ranges "# dry:" directives exclude. FileStateStore
+    keeps both in the DRY store's database (constants and ignore_ranges tables), keyed by path
+    rather than file id because they are also recorded for files a dry.ignore pattern keeps out of
+    the block index. Each indexed file's rows are rewritten wholesale together with its blocks, so
+    an edited file never keeps stale ones, and an unchanged file reused from a persistent index
+    keeps its rows untouched. Living in the same database as the blocks means that under --parallel
+    every worker's results reach the main process through the one shared file.
+
+Dependencies: sqlite3, pathlib.Path, ConstantInfo
+
+Exports: FileStateStore class
+
+Interfaces: FileStateStore(db).create_tables(), record(file_path, constants, ignore_ranges),
+    delete(file_path), constants_for(file_paths), ignore_ranges_for(file_paths),
+    constant_file_paths property
+
+Implementation: Shares the DRYCache connection; record() and delete() leave the commit to the
+    caller, so a file's state is written in the same transaction as its blocks or purge
+"""
+
+import sqlite3
+from pathlib import Path
+
+from .constant import ConstantInfo
+
+
+class FileStateStore:
+    """Stored constants and ignore ranges of each checked file."""
+
+    def __init__(self, db: sqlite3.Connection) -> None:
+        """Initialize the store on an open DRY database connection.
+
+        Args:
+            db: Connection owned by DRYCache
+        """
+        self._db = db
+
+    def create_tables(self) -> None:
+        """Create the constants and ignore_ranges tables if they don't already exist."""
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS constants (
+                file_path TEXT NOT NULL,
+                name TEXT NOT NULL,
+                line_number INTEGER NOT NULL,
+                value TEXT
+            )"""
+        )
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS ignore_ranges (
+                file_path TEXT NOT NULL,
+                start_line INTEGER NOT NULL,
+                end_line INTEGER NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_constants_path ON constants(file_path)")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ignore_ranges_path ON ignore_ranges(file_path)"
+        )
+
+    def record(
+        self,
+        file_path: Path,
+        constants: list[ConstantInfo],
+        ignore_ranges: list[tuple[int, int]],
+    ) -> None:
+        """Replace a file's stored constants and "# dry:" ignore ranges, without committing.
+
+        Like DRYCache.upsert_file, always deletes first, so a file edited to drop its last
+        constant or directive loses the stale rows. Callers record a file's state just before
+        upserting its blocks, whose commit covers both.
+
+        Args:
+            file_path: Path to source file
+            constants: Constants extracted from the file (may be empty)
+            ignore_ranges: (start_line, end_line) ranges its "# dry:" directives cover
+        """
+        self.delete(file_path)
+        path = str(file_path)
+        if constants:
+            self._db.executemany(
+                "INSERT INTO constants (file_path, name, line_number, value) VALUES (?, ?, ?, ?)",
+                [(path, c.name, c.line_number, c.value) for c in constants],
+            )
+        if ignore_ranges:
+            self._db.executemany(
+                "INSERT INTO ignore_ranges (file_path, start_line, end_line) VALUES (?, ?, ?)",
+                [(path, start, end) for start, end in ignore_ranges],
+            )
+
+    def delete(self, file_path: Path) -> None:
+        """Delete a file's stored constants and ignore ranges, without committing.
+
+        Args:
+            file_path: Path to source file
+        """
+        for table in ("constants", "ignore_ranges"):
+            self._db.execute(
+                f"DELETE FROM {table} WHERE file_path = ?",  # nosec B608 - fixed table names
+                (str(file_path),),
+            )
+
+    def constants_for(self, file_paths: set[str]) -> list[tuple[Path, ConstantInfo]]:
+        """Stored constants of the given files, in file then line order.
+
+        Args:
+            file_paths: Files whose constants take part in this run
+
+        Returns:
+            (file_path, ConstantInfo) pairs, as find_constant_groups expects them
+        """
+        cursor = self._db.execute(
+            "SELECT file_path, name, line_number, value FROM constants "
+            "ORDER BY file_path, line_number"
+        )
+        return [
+            (Path(path), ConstantInfo(name=name, line_number=line, value=value))
+            for path, name, line, value in cursor
+            if path in file_paths
+        ]
+
+    def ignore_ranges_for(self, file_paths: set[str]) -> dict[str, list[tuple[int, int]]]:
+        """Stored "# dry:" ignore ranges of the given files.
+
+        Args:
+            file_paths: Files whose directives apply in this run
+
+        Returns:
+            Mapping of file_path to its (start_line, end_line) ranges
+        """
+        ranges: dict[str, list[tuple[int, int]]] = {}
+        cursor = self._db.execute("SELECT file_path, start_line, end_line FROM ignore_ranges")
+        for path, start, end in cursor:
+            if path in file_paths:
+                ranges.setdefault(path, []).append((start, end))
+        return ranges
+
+    @property
+    def constant_file_paths(self) -> set[str]:
+        """Every file path with stored constants, including files kept out of the index.
+
+        Returns:
+            Set of file_path strings in the constants table
+        """
+        cursor = self._db.execute("SELECT DISTINCT file_path FROM constants")
+        return {row[0] for row in cursor.fetchall()}
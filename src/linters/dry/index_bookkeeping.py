@@ -0,0 +1,132 @@
+"""
+Purpose: Bookkeeping for the persistent DRY index - analysis settings and per-run reuse counts
+
+Scope: index_settings table upkeep and the reused/rescanned file counts of each DRY run
+
+Overview: A file's content_hash only says its text is unchanged; its stored blocks also depend on
+    the analysis settings they were extracted with (DRYConfig.analysis_fingerprint). The
+    index_settings table records that fingerprint, and reset_if_settings_changed discards every
+    indexed file when a run opens the index with different settings, so needs_rescan() can be
+    trusted afterwards. IndexUsage decides per checked file whether its stored blocks can be
+    reused and counts reused versus rescanned files, publishing each finalized run's counts as
+    an IndexStats.
+
+Dependencies: logging, sqlite3, dataclasses, pathlib.Path, DRYConfig, DuplicateStorage
+
+Exports: IndexStats dataclass, IndexUsage class, create_index_settings_table,
+    reset_if_settings_changed
+
+Interfaces: create_index_settings_table(db), reset_if_settings_changed(db, fingerprint) -> bool,
+    IndexUsage.can_reuse(storage, file_path, content_hash, config) -> bool,
+    IndexUsage.finish_run(), IndexUsage.last -> IndexStats
+
+Implementation: Module-level functions over the DRYCache connection for the settings table; a
+    small counter object for the per-run stats
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.core.constants import StorageMode
+
+if TYPE_CHECKING:
+    from .config import DRYConfig
+    from .duplicate_storage import DuplicateStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IndexStats:
+    """How many files a run reused from the index versus analyzed and stored again."""
+
+    reused: int = 0
+    rescanned: int = 0
+
+
+class IndexUsage:
+    """Decides which checked files reuse their indexed blocks, and counts them per run."""
+
+    def __init__(self) -> None:
+        """Start with empty counts for the current and the last finalized run."""
+        self._current = IndexStats()
+        self._last = IndexStats()
+
+    @property
+    def last(self) -> IndexStats:
+        """Reused/rescanned file counts of the last finalized run."""
+        return self._last
+
+    def can_reuse(
+        self, storage: DuplicateStorage, file_path: Path, content_hash: str, config: DRYConfig
+    ) -> bool:
+        """Check whether a prior run already indexed this exact content, and count the file.
+
+        Ephemeral modes start from an empty store, so there is nothing to reuse and the
+        lookup is skipped.
+
+        Args:
+            storage: Storage holding the index
+            file_path: Path to source file
+            content_hash: Hash of the file's current content
+            config: DRY configuration in effect for this run
+
+        Returns:
+            True if the file's stored blocks are current and need no re-analysis
+        """
+        reused = config.storage_mode == StorageMode.PERSISTENT and not storage.needs_rescan(
+            file_path, content_hash
+        )
+        if reused:
+            self._current.reused += 1
+        else:
+            self._current.rescanned += 1
+        return reused
+
+    def finish_run(self) -> None:
+        """Publish this run's counts as the last run's and start counting afresh."""
+        stats = self._current
+        logger.debug("DRY index: %d file(s) reused, %d rescanned", stats.reused, stats.rescanned)
+        self._last = stats
+        self._current = IndexStats()
+
+
+def create_index_settings_table(db: sqlite3.Connection) -> None:
+    """Create the table holding the fingerprint every stored block was extracted with.
+
+    Args:
+        db: Connection to the DRY store
+    """
+    # At most one row: the DRYConfig.analysis_fingerprint of the run that built the index.
+    db.execute("CREATE TABLE IF NOT EXISTS index_settings (fingerprint TEXT NOT NULL)")
+
+
+def reset_if_settings_changed(db: sqlite3.Connection, fingerprint: str) -> bool:
+    """Discard every indexed file if its blocks were extracted with other settings.
+
+    A file's content_hash only says its text is unchanged; its stored blocks also depend
+    on the analysis settings (e.g. min_duplicate_lines, block filters). needs_rescan() can
+    only be trusted once the whole index is known to match the current settings.
+
+    Args:
+        db: Connection to the DRY store
+        fingerprint: Fingerprint of the analysis settings in effect for this run
+
+    Returns:
+        True if the index was cleared
+    """
+    row = db.execute("SELECT fingerprint FROM index_settings").fetchone()
+    if row is not None and row[0] == fingerprint:
+        return False
+    has_files = db.execute("SELECT 1 FROM files LIMIT 1").fetchone() is not None
+    for table in ("code_blocks", "files", "constants", "ignore_ranges"):
+        db.execute(f"DELETE FROM {table}")  # nosec B608 - fixed table names
+    db.execute("DELETE FROM index_settings")
+    db.execute("INSERT INTO index_settings (fingerprint) VALUES (?)", (fingerprint,))
+    db.commit()
+    return has_files
@@ -12,9 +12,11 @@ Dependencies: None (standalone utility)
 
 Exports: InlineIgnoreParser class
 
-Interfaces: InlineIgnoreParser.parse(content) -> dict, should_ignore(file_path, line) -> bool
+Interfaces: InlineIgnoreParser.parse_file(file_path, content) -> list[tuple[int, int]],
+    load_ranges(ranges_by_file), should_ignore(file_path, line) -> bool
 
-Implementation: Regex-based comment parsing, line range tracking
+Implementation: Regex-based comment parsing, line range tracking; files without a "dry:" marker
+    are skipped with one substring check
 """
 
 import re
@@ -28,18 +30,33 @@ class InlineIgnoreParser:
         """Initialize parser with ignore ranges tracking."""
         self._ignore_ranges: dict[str, list[tuple[int, int]]] = {}
 
-    def parse_file(self, file_path: Path, content: str) -> None:
+    def parse_file(self, file_path: Path, content: str) -> list[tuple[int, int]]:
         """Parse file for ignore directives and store ranges.
 
         Args:
             file_path: Path to the file
             content: File content to parse
+
+        Returns:
+            List of (start, end) ignore ranges found in the file
         """
+        if "dry:" not in content:
+            return []  # No DRY directive anywhere; skip the per-line regex scan
         lines = content.split("\n")
         ranges = self._extract_ignore_ranges(lines)
 
         if ranges:
             self._ignore_ranges[str(file_path)] = ranges
+        return ranges
+
+    def load_ranges(self, ranges_by_file: dict[str, list[tuple[int, int]]]) -> None:
+        """Adopt ranges parsed elsewhere (e.g. by --parallel workers), replacing per file.
+
+        Args:
+            ranges_by_file: Mapping of file path to its (start, end) ignore ranges
+        """
+        for file_path, ranges in ranges_by_file.items():
+            self._ignore_ranges[str(Path(file_path))] = ranges
 
     def _extract_ignore_ranges(self, lines: list[str]) -> list[tuple[int, int]]:
         """Extract ignore ranges from lines.
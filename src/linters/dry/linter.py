@@ -5,54 +5,66 @@ Scope: DRYRule class implementing BaseLintRule interface for duplicate code and
 
 Overview: Implements DRY linter rule following BaseLintRule interface with stateful caching design.
     Orchestrates duplicate detection by delegating to specialized classes and functions:
-    ConfigLoader for config, initialize_storage() for storage setup, FileAnalyzer for file
-    analysis, ViolationGenerator for violation creation, and reconcile_stale_matches() for
-    persistent-mode freshness verification. Also supports duplicate constant detection (opt-in)
-    to identify when the same constant is defined in multiple files. Maintains minimal
-    orchestration logic to comply with SRP.
+    ConfigLoader for config, initialize_storage() for storage setup, FileAnalyzer for file analysis,
+    ViolationGenerator for violation creation, and reconcile_stale_matches() for persistent-mode
+    freshness verification. Also supports duplicate constant detection (opt-in) to identify when the
+    same constant is defined in multiple files. Constants and "# dry:" ignore ranges are recorded in
+    the same store and transaction as the blocks, and read back in finalize(): under --parallel,
+    check() runs in worker processes, and the shared store is the only state that reaches the main
+    process. In persistent mode a file whose content hash matches its indexed state is not
+    re-analyzed or written at all: its stored blocks, constants and ignore ranges already take part
+    in finalize(), so a warm run only reads changed files into the store; IndexUsage makes that call
+    and keeps each run's reused/rescanned file counts, published as index_stats. In a changed-files
+    run the same index stands in for the unchanged files, so only files missing from it are checked,
+    and unchecked files sharing a duplicate group with a checked one are re-verified first.
+    Maintains minimal orchestration logic to comply with SRP.
 
 Dependencies: BaseLintRule, BaseLintContext, ConfigLoader, initialize_storage, FileAnalyzer,
-    DuplicateStorage, ViolationGenerator, reconcile_stale_matches, extract_python_constants,
-    TypeScriptConstantExtractor, find_constant_groups, ConstantViolationBuilder
+    IndexUsage, DuplicateStorage, ViolationGenerator, reconcile_stale_matches, reconcile_files,
+    extract_python_constants, TypeScriptConstantExtractor, find_constant_groups,
+    ConstantViolationBuilder
 
-Exports: DRYRule class
+Exports: DRYRule class, IndexStats dataclass (re-exported from index_bookkeeping)
 
-Interfaces: DRYRule.check(context) -> list[Violation], finalize() -> list[Violation]
+Interfaces: DRYRule.check(context) -> list[Violation], finalize() -> list[Violation],
+    DRYRule.index_stats -> IndexStats, DRYRule.select_unchanged_files(candidates) -> list[Path]
 
 Implementation: Delegates all logic to helper classes, maintains only orchestration and state
 
 Suppressions:
     - too-many-instance-attributes: DRYComponents groups helper dependencies; DRYRule has 8
-        attributes due to stateful caching requirements (storage, config, constants, file contents
-        for ignore directive processing)
+        attributes due to stateful caching requirements (storage, config, files with constants,
+        file contents for ignore directive processing)
     - B101: Type narrowing assertions after guards (storage initialized, file_path/content set)
 """
 
 from __future__ import annotations
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from src.core.base import BaseLintContext, BaseLintRule
+from src.core.constants import Language
 from src.core.linter_utils import is_ignored_path, should_process_file
 from src.core.types import Violation
 from src.linter_config.ignore import IgnoreDirectiveParser
 
-from .cache import DRYCache
+from .cache import CodeBlock, DRYCache
 from .config import DRYConfig
 from .config_loader import ConfigLoader
-from .constant import ConstantInfo
+from .constant import ConstantGroup, ConstantInfo
 from .constant_matcher import find_constant_groups
 from .constant_violation_builder import ConstantViolationBuilder
 from .content_hash import compute_content_hash
 from .duplicate_storage import DuplicateStorage
 from .file_analyzer import FileAnalyzer
+from .index_bookkeeping import IndexStats, IndexUsage
 from .inline_ignore import InlineIgnoreParser
 from .python_constant_extractor import extract_python_constants
-from .stale_match_reconciler import reconcile_stale_matches
+from .stale_match_reconciler import StateRecorder, reconcile_files, reconcile_stale_matches
 from .storage_initializer import initialize_storage
 from .typescript_constant_extractor import TypeScriptConstantExtractor
 from .violation_generator import IgnoreContext, ViolationGenerator
@@ -81,16 +93,18 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
         self._file_analyzer: FileAnalyzer | None = None
         self._project_root: Path | None = None
 
-        # Collected constants for cross-file detection: list of (file_path, ConstantInfo)
-        self._constants: list[tuple[Path, ConstantInfo]] = []
+        # Files whose constants this run recorded in storage (dry.ignore'd files included,
+        # unlike _processed_files): finalize() matches constants across exactly these.
+        self._constant_files: set[str] = set()
 
         # Cache file contents for ignore directive checking during finalize
         self._file_contents: dict[str, str] = {}
 
-        # Files actually analyzed and upserted this run (persistent mode only): lets
-        # finalize() tell which matched-against files were freshly scanned versus
-        # indexed by a prior run and needing a freshness check before being trusted.
+        # Files checked this run, whether analyzed or reused unchanged from the index: lets
+        # finalize() tell which matched-against files are known fresh versus indexed by a
+        # prior run and needing a freshness check before being trusted.
         self._processed_files: set[str] = set()
+        self._index_usage = IndexUsage()
 
         # Helper components grouped to reduce instance attributes
         self._helpers = DRYComponents(
@@ -114,6 +128,11 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
         assert self._file_analyzer is not None, "File analyzer not initialized"  # nosec B101
         return self._file_analyzer
 
+    @property
+    def index_stats(self) -> IndexStats:
+        """Reused/rescanned file counts of the last finalized run."""
+        return self._index_usage.last
+
     @property
     def rule_id(self) -> str:
         """Unique identifier for this rule."""
@@ -129,6 +148,11 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
         """Description of what this rule checks."""
         return "Detects duplicate code blocks across the project"
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Languages FileAnalyzer extracts code blocks from."""
+        return frozenset({Language.PYTHON, Language.TYPESCRIPT, Language.JAVASCRIPT})
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Analyze file and store blocks (collection phase)."""
         if not should_process_file(context):
@@ -153,20 +177,17 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
         self._file_contents[str(file_path)] = context.file_content
         # Get project root from context metadata if available
         if self._project_root is None:
-            self._project_root = self._get_project_root(context)
+            self._project_root = _get_project_root(context)
 
-        self._helpers.inline_ignore.parse_file(file_path, context.file_content)
         self._ensure_storage_initialized(config)
-        self._analyze_if_not_ignored(context, config, file_path)
-        if config.detect_duplicate_constants:
-            self._extract_and_store_constants(context)
-
-    def _analyze_if_not_ignored(
-        self, context: BaseLintContext, config: DRYConfig, file_path: Path
-    ) -> None:
-        """Analyze and store blocks, unless the file matches a dry.ignore pattern."""
+        content_hash = compute_content_hash(context.file_content)
+        # An unchanged file's stored blocks, constants and ignore ranges are all current and
+        # still take part in finalize(), so only changed files are analyzed and written again
+        if not self._index_usage.can_reuse(self._active_storage, file_path, content_hash, config):
+            self._index_file(context, config, content_hash)
+        self._constant_files.add(str(file_path))
         if not is_ignored_path(str(file_path), config.ignore_patterns):
-            self._analyze_and_store(context, config)
+            self._processed_files.add(str(file_path))
 
     def _ensure_storage_initialized(self, config: DRYConfig) -> None:
         """Initialize storage and file analyzer on first call."""
@@ -176,66 +197,31 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
             self._file_analyzer = FileAnalyzer(config)
             self._initialized = True
 
-    def _analyze_and_store(self, context: BaseLintContext, config: DRYConfig) -> None:
-        """Analyze file and store blocks."""
-        if not self._can_analyze(context):
-            return
-        # _can_analyze ensures file_path and file_content are set
+    def _index_file(self, context: BaseLintContext, config: DRYConfig, content_hash: str) -> None:
+        """Analyze a file and store its blocks, constants and ignore ranges in one commit."""
         assert context.file_path is not None  # nosec B101
         assert context.file_content is not None  # nosec B101
 
-        blocks = self._active_file_analyzer.analyze(
-            context.file_path,
-            context.file_content,
-            context.language,
-            config,
-        )
+        blocks: list[CodeBlock] = []
+        if not is_ignored_path(str(context.file_path), config.ignore_patterns):
+            blocks = self._active_file_analyzer.analyze(
+                context.file_path, context.file_content, context.language, config
+            )
+        self._record_state(context.file_path, context.file_content, context.language)
         # Always upsert (even with zero blocks) so a file edited to remove its last
         # duplicated block still has its stale blocks deleted - the #35 regression fix.
-        self._active_storage.upsert_file(
-            context.file_path, compute_content_hash(context.file_content), blocks
-        )
-        self._processed_files.add(str(context.file_path))
-
-    def _can_analyze(self, context: BaseLintContext) -> bool:
-        """Check if context is ready for analysis."""
-        return (
-            context.file_path is not None
-            and context.file_content is not None
-            and self._file_analyzer is not None
-            and self._storage is not None
-        )
-
-    def _extract_and_store_constants(self, context: BaseLintContext) -> None:
-        """Extract constants from file and store for cross-file detection."""
-        if context.file_path is None or context.file_content is None:
-            return
-        file_path = Path(context.file_path)
-        extract_fn = _get_extractor_for_language(context.language, self._helpers)
-        if extract_fn:
-            self._constants.extend((file_path, c) for c in extract_fn(context.file_content))
+        # The commit also covers the state rows just recorded.
+        self._active_storage.upsert_file(context.file_path, content_hash, blocks)
 
-    def _get_project_root(self, context: BaseLintContext) -> Path | None:
-        """Get project root from context if available.
-
-        Args:
-            context: Lint context
-
-        Returns:
-            Project root path or None if not available
-        """
-        # Try to get from metadata (orchestrator sets this as "_project_root",
-        # see Orchestrator.lint_file)
-        if hasattr(context, "metadata") and isinstance(context.metadata, dict):
-            project_root = context.metadata.get("_project_root")
-            if project_root:
-                return Path(project_root)
-
-        # Fallback: derive from file path
-        if context.file_path:
-            return Path(context.file_path).parent
-
-        return None
+    def _record_state(self, file_path: Path, content: str, language: str | None) -> None:
+        """Store a file's constants and "# dry:" ignore ranges, left for upsert_file to commit."""
+        assert self._config is not None  # nosec B101
+        constants: list[ConstantInfo] = []
+        if self._config.detect_duplicate_constants:
+            constants = _extract_constants(content, language, self._helpers)
+        ignore_ranges = self._helpers.inline_ignore.parse_file(file_path, content)
+        # Always rewritten (even with nothing) so an edited file's stale rows are dropped
+        self._active_storage.file_state.record(file_path, constants, ignore_ranges)
 
     def finalize(self) -> list[Violation]:
         """Generate violations after all files processed."""
@@ -243,6 +229,9 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
             return []
 
         self._reconcile_stale_matches_if_persistent()
+        self._helpers.inline_ignore.load_ranges(
+            self._active_storage.file_state.ignore_ranges_for(self._processed_files)
+        )
 
         # Create ignore context for violation filtering
         ignore_parser = IgnoreDirectiveParser(self._project_root)
@@ -255,18 +244,17 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
         violations = self._helpers.violation_generator.generate_violations(
             self._storage, self.rule_id, self._config, ignore_ctx, self._processed_files
         )
-        if self._config.detect_duplicate_constants and self._constants:
-            constant_violations = _generate_constant_violations(
-                self._constants, self._config, self._helpers, self.rule_id
-            )
+        if self._config.detect_duplicate_constants:
+            constant_violations = self._duplicate_constant_violations()
             # Filter constant violations through shared ignore parser
             constant_violations = _filter_ignored_violations(
                 constant_violations, ignore_parser, self._file_contents
             )
             violations.extend(constant_violations)
 
+        self._index_usage.finish_run()
         self._helpers.inline_ignore.clear()
-        self._constants = []
+        self._constant_files = set()
         self._file_contents = {}
         self._processed_files = set()
         return violations
@@ -283,9 +271,48 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
         if self._config.storage_mode != "persistent":
             return
         reconcile_stale_matches(
-            self._active_storage, self._active_file_analyzer, self._config, self._processed_files
+            self._active_storage,
+            self._active_file_analyzer,
+            self._config,
+            self._processed_files,
+            self._record_state,
         )
 
+    def _duplicate_constant_violations(self) -> list[Violation]:
+        """Report the duplicate constants defined in files checked this run."""
+        assert self._config is not None  # nosec B101
+        groups = _reconciled_constant_groups(
+            self._active_storage,
+            self._active_file_analyzer,
+            self._config,
+            self._constant_files,
+            self._record_state,
+        )
+        builder = self._helpers.constant_violation_builder
+        builder.min_occurrences = self._config.min_constant_occurrences
+        violations = builder.build_violations(groups, self.rule_id)
+        return [v for v in violations if v.file_path in self._constant_files]
+
+    def select_unchanged_files(self, candidates: Sequence[Path]) -> list[Path]:
+        """Pick the unchanged files a changed-files run must check for duplicates.
+
+        A persistent index already holds the blocks and constants of every file it has
+        seen, and finalize() re-verifies the matched ones, so only files missing from it
+        are needed. Ephemeral storage keeps nothing between runs, so it needs every
+        candidate.
+        """
+        if self._config is None or self._storage is None:
+            return []  # No changed file reached the rule, so there is nothing to compare
+        if self._config.storage_mode != "persistent":
+            return list(candidates)
+        indexed = self._active_storage.all_file_paths
+        ignore_patterns = self._config.ignore_patterns
+        return [
+            path
+            for path in candidates
+            if str(path) not in indexed and not is_ignored_path(str(path), ignore_patterns)
+        ]
+
     def get_parallel_shared_config(self, shared_dir: Path) -> dict[str, Any] | None:
         """Force a shared, on-disk store for the duration of one --parallel run.
 
@@ -316,11 +343,37 @@ class DRYRule(BaseLintRule):  # pylint: disable=too-many-instance-attributes
         # here). The shared store is a fresh, per-run file (see
         # get_parallel_shared_config), so every file in it belongs to this run - treat
         # all of it as in scope for report filtering, rather than filtering everything
-        # out.
+        # out. The same holds for the constants and ignore ranges workers recorded there.
+        # Their file contents stay in the workers; the orchestrator's suppression stage
+        # applies thailint directives to the finalize() output from the files themselves.
         self._processed_files = self._active_storage.all_file_paths
+        self._constant_files = self._active_storage.file_state.constant_file_paths
         return self.finalize()
 
 
+def _get_project_root(context: BaseLintContext) -> Path | None:
+    """Get project root from context if available.
+
+    Args:
+        context: Lint context
+
+    Returns:
+        Project root path or None if not available
+    """
+    # Try to get from metadata (orchestrator sets this as "_project_root",
+    # see Orchestrator.lint_file)
+    if hasattr(context, "metadata") and isinstance(context.metadata, dict):
+        project_root = context.metadata.get("_project_root")
+        if project_root:
+            return Path(project_root)
+
+    # Fallback: derive from file path
+    if context.file_path:
+        return Path(context.file_path).parent
+
+    return None
+
+
 ConstantExtractorFn = Callable[[str], list[ConstantInfo]]
 
 
@@ -336,30 +389,74 @@ def _get_extractor_for_language(
     return extractors.get(language or "")
 
 
-def _generate_constant_violations(
-    constants: list[tuple[Path, ConstantInfo]],
+def _reconciled_constant_groups(
+    storage: DuplicateStorage,
+    file_analyzer: FileAnalyzer,
     config: DRYConfig,
-    helpers: DRYComponents,
-    rule_id: str,
-) -> list[Violation]:
-    """Generate violations for duplicate constants."""
-    eligible = _filter_ignored_constant_names(constants, config.ignore_constant_patterns)
+    checked_files: set[str],
+    record_state: StateRecorder,
+) -> list[ConstantGroup]:
+    """Group duplicate constants once the unchecked files they involve are verified fresh.
+
+    A persistent index also holds the constants of files this run did not check, so a
+    changed-files run still finds duplicates in unchanged files. Those rows were recorded by
+    a prior run, so the files sharing a group with a checked file are re-verified first, as
+    reconcile_stale_matches() does for blocks.
+    """
+    groups = _duplicate_constant_groups(storage, config, checked_files)
+    # Empty outside persistent mode, whose store only ever holds this run's files
+    external = _external_group_members(groups, checked_files)
+    if reconcile_files(external, storage, file_analyzer, config, record_state):
+        groups = _duplicate_constant_groups(storage, config, checked_files)
+    return groups
+
+
+def _extract_constants(
+    content: str, language: str | None, helpers: DRYComponents
+) -> list[ConstantInfo]:
+    """Extract constants from file for cross-file detection."""
+    extract_fn = _get_extractor_for_language(language, helpers)
+    return extract_fn(content) if extract_fn else []
+
+
+def _duplicate_constant_groups(
+    storage: DuplicateStorage, config: DRYConfig, checked_files: set[str]
+) -> list[ConstantGroup]:
+    """Group the stored constants a run compares, keeping groups big enough to report.
+
+    A persistent index compares against every stored file's constants, including files
+    this run did not check.
+    """
+    file_state = storage.file_state
+    persistent = config.storage_mode == "persistent"
+    sources = file_state.constant_file_paths if persistent else checked_files
+    eligible = _filter_ignored_constant_names(
+        file_state.constants_for(sources), config.ignore_constant_regexes
+    )
     groups = find_constant_groups(eligible)
-    helpers.constant_violation_builder.min_occurrences = config.min_constant_occurrences
-    return helpers.constant_violation_builder.build_violations(groups, rule_id)
+    return [group for group in groups if group.file_count >= config.min_constant_occurrences]
+
+
+def _external_group_members(groups: list[ConstantGroup], checked_files: set[str]) -> set[Path]:
+    """Files not checked this run that share a constant group with a checked file."""
+    external: set[Path] = set()
+    for group in groups:
+        paths = {str(loc.file_path) for loc in group.locations}
+        if paths & checked_files:
+            external.update(Path(path) for path in paths - checked_files)
+    return external
 
 
 def _filter_ignored_constant_names(
-    constants: list[tuple[Path, ConstantInfo]], patterns: list[str]
+    constants: list[tuple[Path, ConstantInfo]], compiled: tuple[re.Pattern[str], ...]
 ) -> list[tuple[Path, ConstantInfo]]:
     """Drop constants whose name matches a configured ignore_constant_patterns regex."""
-    if not patterns:
+    if not compiled:
         return constants
-    compiled = [re.compile(p) for p in patterns]
     return [(path, info) for path, info in constants if not _name_matches_any(info.name, compiled)]
 
 
-def _name_matches_any(name: str, compiled: list[re.Pattern[str]]) -> bool:
+def _name_matches_any(name: str, compiled: tuple[re.Pattern[str], ...]) -> bool:
     """Check whether a constant name matches any compiled ignore pattern (full match)."""
     return any(pattern.fullmatch(name) for pattern in compiled)
 
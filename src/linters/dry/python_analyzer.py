@@ -8,7 +8,8 @@ Overview: Analyzes Python source files to extract code blocks for duplicate dete
     Filters out docstrings at the tokenization level to prevent false positive duplication
     detection on documentation strings.
 
-Dependencies: BaseTokenAnalyzer, CodeBlock, DRYConfig, pathlib.Path, ast, token_hasher module
+Dependencies: BaseTokenAnalyzer, CodeBlock, DRYConfig, pathlib.Path, ast, token_hasher module,
+    analyzers.ast_index
 
 Exports: PythonDuplicateAnalyzer class
 
@@ -18,7 +19,6 @@ Interfaces: PythonDuplicateAnalyzer.analyze(file_path: Path, content: str, confi
 Implementation: Uses custom tokenizer that filters docstrings before hashing
 
 Suppressions:
-    - too-many-arguments,too-many-positional-arguments: Line processing with related params
     - type:ignore[arg-type]: ast.get_docstring returns str|None, typing limitation
     - srp.violation: Complex AST analysis algorithm for duplicate detection. See SRP Exception below.
     - nesting.excessive-depth: analyze method uses nested loops for docstring extraction.
@@ -37,6 +37,9 @@ SRP Exception: PythonDuplicateAnalyzer has 32 methods and 358 lines (exceeds max
 import ast
 from pathlib import Path
 
+from src.analyzers.ast_index import get_ast_index
+from src.core.python_source import parse_python_source
+
 from . import token_hasher
 from .base_token_analyzer import BaseTokenAnalyzer
 from .block_filter import BlockFilterRegistry, FilterCache, create_default_registry
@@ -44,6 +47,9 @@ from .cache import CodeBlock
 from .config import DRYConfig
 from .single_statement_detector import SingleStatementDetector
 
+# Node types ast.get_docstring accepts
+_DOCSTRING_OWNER_TYPES = (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
 
 class PythonDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.violation]
     """Analyzes Python code for duplicate blocks, excluding docstrings.
@@ -97,8 +103,9 @@ class PythonDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.violat
             lines_with_numbers = self._tokenize_with_line_numbers(content, docstring_ranges)
 
             # Generate rolling hash windows
-            windows = self._rolling_hash_with_tracking(
-                lines_with_numbers, config.min_duplicate_lines
+            code_lines, line_numbers = token_hasher.split_numbered_lines(lines_with_numbers)
+            windows = token_hasher.rolling_hash(
+                code_lines, config.min_duplicate_lines, line_numbers
             )
 
             return self._filter_valid_blocks(windows, file_path, content)
@@ -109,48 +116,32 @@ class PythonDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.violat
 
     def _filter_valid_blocks(
         self,
-        windows: list[tuple[int, int, int, str]],
+        windows: list[tuple[int, int, int]],
         file_path: Path,
         content: str,
     ) -> list[CodeBlock]:
         """Filter hash windows and create valid CodeBlock instances."""
-        return [
-            block
-            for hash_val, start_line, end_line, snippet in windows
-            if (
-                block := self._create_block_if_valid(
-                    file_path, content, hash_val, start_line, end_line, snippet
-                )
-            )
-        ]
-
-    def _create_block_if_valid(  # pylint: disable=too-many-arguments,too-many-positional-arguments
-        self,
-        file_path: Path,
-        content: str,
-        hash_val: int,
-        start_line: int,
-        end_line: int,
-        snippet: str,
-    ) -> CodeBlock | None:
-        """Create CodeBlock if it passes all validation checks."""
-        if self._statement_detector and self._statement_detector.is_single_statement(
-            content, start_line, end_line
-        ):
-            return None
-
-        block = CodeBlock(
-            file_path=file_path,
-            start_line=start_line,
-            end_line=end_line,
-            snippet=snippet,
-            hash_value=hash_val,
+        candidates = (
+            window
+            for window in windows
+            if not self._is_single_statement_window(content, window[1], window[2])
         )
+        blocks = []
+        for hash_val, start_line, end_line in candidates:
+            block = CodeBlock(
+                file_path=file_path,
+                start_line=start_line,
+                end_line=end_line,
+                hash_value=hash_val,
+            )
+            if not self._filter_registry.should_filter_block(block, content, self._filter_cache):
+                blocks.append(block)
+        return blocks
 
-        if self._filter_registry.should_filter_block(block, content, self._filter_cache):
-            return None
-
-        return block
+    def _is_single_statement_window(self, content: str, start_line: int, end_line: int) -> bool:
+        """Check whether a window covers a single statement (not a real duplicate)."""
+        detector = self._statement_detector
+        return detector is not None and detector.is_single_statement(content, start_line, end_line)
 
     def _get_docstring_ranges_from_content(self, content: str) -> set[int]:
         """Extract line numbers that are part of docstrings.
@@ -162,12 +153,12 @@ class PythonDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.violat
             Set of line numbers (1-indexed) that are part of docstrings
         """
         try:
-            tree = ast.parse(content)
+            tree = parse_python_source(content)
         except SyntaxError:
             return set()
 
         docstring_lines: set[int] = set()
-        for node in ast.walk(tree):
+        for node in get_ast_index(tree).nodes(_DOCSTRING_OWNER_TYPES):
             self._extract_docstring_lines(node, docstring_lines)
 
         return docstring_lines
@@ -257,42 +248,10 @@ class PythonDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.violat
             return new_state, None
         return new_state, normalized
 
-    def _rolling_hash_with_tracking(
-        self, lines_with_numbers: list[tuple[int, str]], window_size: int
-    ) -> list[tuple[int, int, int, str]]:
-        """Create rolling hash windows while preserving original line numbers.
-
-        Args:
-            lines_with_numbers: List of (line_number, code) tuples
-            window_size: Number of lines per window
-
-        Returns:
-            List of (hash_value, start_line, end_line, snippet) tuples
-        """
-        if len(lines_with_numbers) < window_size:
-            return []
-
-        hashes = []
-        for i in range(len(lines_with_numbers) - window_size + 1):
-            window = lines_with_numbers[i : i + window_size]
-
-            # Extract just the code for hashing
-            code_lines = [code for _, code in window]
-            snippet = "\n".join(code_lines)
-            hash_val = token_hasher.stable_hash(snippet)
-
-            # Get original line numbers
-            start_line = window[0][0]
-            end_line = window[-1][0]
-
-            hashes.append((hash_val, start_line, end_line, snippet))
-
-        return hashes
-
     @staticmethod
     def _parse_content_safe(content: str) -> ast.Module | None:
         """Parse content, returning None on syntax error."""
         try:
-            return ast.parse(content)
+            return parse_python_source(content)
         except SyntaxError:
             return None
@@ -20,6 +20,8 @@ Implementation: AST-based parsing with module-level filtering and ALL_CAPS regex
 
 import ast
 
+from src.core.python_source import parse_python_source
+
 from .constant import CONSTANT_NAME_PATTERN, ConstantInfo
 
 # Container types with fixed representations
@@ -36,7 +38,7 @@ def extract_python_constants(content: str) -> list[ConstantInfo]:
         List of ConstantInfo for module-level constants
     """
     try:
-        tree = ast.parse(content)
+        tree = parse_python_source(content)
     except SyntaxError:
         return []
     constants: list[ConstantInfo] = []
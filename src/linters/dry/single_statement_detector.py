@@ -10,7 +10,7 @@ Overview: Provides sophisticated single-statement pattern detection to filter fa
     supports various Python language constructs including classes, functions, decorators, and
     nested structures.
 
-Dependencies: ast module for Python AST parsing
+Dependencies: ast module for Python AST parsing, analyzers.ast_index for the shared node index
 
 Exports: SingleStatementDetector class
 
@@ -38,6 +38,9 @@ import ast
 from collections.abc import Callable
 from typing import cast
 
+from src.analyzers.ast_index import get_ast_index
+from src.core.python_source import parse_python_source
+
 # AST context checking constants
 AST_LOOKBACK_LINES = 10
 AST_LOOKFORWARD_LINES = 5
@@ -99,7 +102,7 @@ class SingleStatementDetector:  # thailint: ignore[srp.violation]
     def _parse_content_safe(content: str) -> ast.Module | None:
         """Parse content, returning None on syntax error."""
         try:
-            return ast.parse(content)
+            return parse_python_source(content)
         except SyntaxError:
             return None
 
@@ -107,7 +110,7 @@ class SingleStatementDetector:  # thailint: ignore[srp.violation]
     def build_line_to_node_index(tree: ast.Module | None) -> dict[int, list[ast.AST]] | None:
         """Build an index mapping each line number to overlapping AST nodes.
 
-        Performance optimization: Allows O(1) lookups instead of O(n) ast.walk() calls.
+        Performance optimization: Allows O(1) lookups instead of a scan of every node per window.
 
         Args:
             tree: Parsed AST tree (None if parsing failed)
@@ -119,7 +122,7 @@ class SingleStatementDetector:  # thailint: ignore[srp.violation]
             return None
 
         line_to_nodes: dict[int, list[ast.AST]] = {}
-        for node in ast.walk(tree):
+        for node in get_ast_index(tree).walk():
             if SingleStatementDetector._node_has_line_info(node):
                 SingleStatementDetector._add_node_to_index(node, line_to_nodes)
 
@@ -166,9 +169,10 @@ class SingleStatementDetector:  # thailint: ignore[srp.violation]
         return any(self._is_single_statement_pattern(node, start_line, end_line) for node in nodes)
 
     def _check_nodes_via_walk(self, tree: ast.Module, start_line: int, end_line: int) -> bool:
-        """Check nodes using ast.walk() fallback."""
+        """Check every node of the tree's shared index (fallback without a line index)."""
         return any(
-            self._node_matches_via_walk(node, start_line, end_line) for node in ast.walk(tree)
+            self._node_matches_via_walk(node, start_line, end_line)
+            for node in get_ast_index(tree).walk()
         )
 
     def _node_matches_via_walk(self, node: ast.AST, start_line: int, end_line: int) -> bool:
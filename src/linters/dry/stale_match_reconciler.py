@@ -9,35 +9,47 @@ Overview: A persistent, cross-run duplicate index can report a match against a f
     trusting such a match, this reconciles each externally-matched file's current state: if it
     no longer exists, its stale entries are purged so it can't produce phantom violations; if its
     content hash no longer matches what's indexed, it's transparently rescanned and re-upserted
-    so the match reflects current content, not stale content. Files this run already processed
-    directly (via DRYRule.check()) are skipped entirely - they're already known-fresh.
+    so the match reflects current content, not stale content. A rescan also refreshes the file's
+    stored constants and ignore ranges through record_state, so a later run that reuses the file
+    finds them current. reconcile_files does the same for any given set of indexed files, such as
+    the other members of a duplicate-constant group. Files this run already processed directly
+    (via DRYRule.check()) are skipped entirely - they're already known-fresh.
 
-Dependencies: DuplicateStorage, FileAnalyzer, DRYConfig, detect_language, compute_content_hash
+Dependencies: DuplicateStorage, FileAnalyzer, DRYConfig, detect_language, compute_content_hash,
+    is_ignored_path
 
-Exports: reconcile_stale_matches function
+Exports: reconcile_stale_matches and reconcile_files functions, StateRecorder type
 
-Interfaces: reconcile_stale_matches(storage, file_analyzer, config, processed_files)
+Interfaces: reconcile_stale_matches(storage, file_analyzer, config, processed_files, record_state),
+    reconcile_files(file_paths, storage, file_analyzer, config, record_state) -> bool
 
 Implementation: Module-level functions (no state to justify a class). Queries duplicate hashes
     once, collects the file paths involved that aren't in processed_files, and rescans/purges
     each as needed before returning
 """
 
+from collections.abc import Callable, Iterable
 from pathlib import Path
 
+from src.core.linter_utils import is_ignored_path
 from src.orchestrator.language_detector import detect_language
 
+from .cache import CodeBlock
 from .config import DRYConfig
 from .content_hash import compute_content_hash
 from .duplicate_storage import DuplicateStorage
 from .file_analyzer import FileAnalyzer
 
+# Stores a rescanned file's constants and ignore ranges: (file_path, content, language)
+StateRecorder = Callable[[Path, str, str | None], None]
+
 
 def reconcile_stale_matches(
     storage: DuplicateStorage,
     file_analyzer: FileAnalyzer,
     config: DRYConfig,
     processed_files: set[str],
+    record_state: StateRecorder | None = None,
 ) -> None:
     """Rescan or purge stale matched-against files before violations are generated.
 
@@ -47,9 +59,37 @@ def reconcile_stale_matches(
         config: DRY configuration, used to rescan with the same settings
         processed_files: Absolute-path strings of files this run already scanned
             directly via check() - never reconciled, since they're already fresh
+        record_state: Refreshes a rescanned file's stored constants and ignore ranges
+    """
+    external = _external_file_paths(storage, processed_files)
+    reconcile_files(external, storage, file_analyzer, config, record_state)
+
+
+def reconcile_files(
+    file_paths: Iterable[Path],
+    storage: DuplicateStorage,
+    file_analyzer: FileAnalyzer,
+    config: DRYConfig,
+    record_state: StateRecorder | None = None,
+) -> bool:
+    """Purge deleted files and rescan drifted ones among indexed files this run did not check.
+
+    Args:
+        file_paths: Indexed files to verify
+        storage: Duplicate storage backed by the persistent index
+        file_analyzer: Analyzer used to rescan a stale file's blocks
+        config: DRY configuration, used to rescan with the same settings
+        record_state: Refreshes a rescanned file's stored constants and ignore ranges
+
+    Returns:
+        True if any file was purged or rescanned
     """
-    for file_path in _external_file_paths(storage, processed_files):
-        _reconcile_file(file_path, storage, file_analyzer, config)
+    changed = False
+    for file_path in sorted(file_paths):
+        changed = (
+            _reconcile_file(file_path, storage, file_analyzer, config, record_state) or changed
+        )
+    return changed
 
 
 def _external_file_paths(storage: DuplicateStorage, processed_files: set[str]) -> set[Path]:
@@ -68,20 +108,27 @@ def _reconcile_file(
     storage: DuplicateStorage,
     file_analyzer: FileAnalyzer,
     config: DRYConfig,
-) -> None:
+    record_state: StateRecorder | None,
+) -> bool:
     """Purge a deleted file, or rescan one whose content hash has drifted."""
     content = _read_file(file_path)
     if content is None:
         storage.purge_file(file_path)
-        return
+        return True
 
     content_hash = compute_content_hash(content)
     if not storage.needs_rescan(file_path, content_hash):
-        return
+        return False
 
     language = detect_language(file_path)
-    blocks = file_analyzer.analyze(file_path, content, language, config)
+    blocks: list[CodeBlock] = []
+    if not is_ignored_path(str(file_path), config.ignore_patterns):
+        blocks = file_analyzer.analyze(file_path, content, language, config)
+    if record_state is not None:
+        record_state(file_path, content, language)
+    # Commits the refreshed state rows together with the blocks
     storage.upsert_file(file_path, content_hash, blocks)
+    return True
 
 
 def _read_file(file_path: Path) -> str | None:
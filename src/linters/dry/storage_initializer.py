@@ -6,11 +6,13 @@ Scope: Initializes DuplicateStorage with SQLite storage
 Overview: Handles storage initialization based on DRY configuration. Creates SQLite storage in
     memory, tempfile, or persistent mode based on config.storage_mode. Resolves the on-disk path
     for persistent mode to a stable, project-relative location so it survives between separate
-    CLI invocations. Separated from the main linter rule to maintain SRP compliance.
+    CLI invocations, and discards a persistent index built with different analysis settings so
+    its stored blocks can be reused for unchanged files. Separated from the main linter rule to
+    maintain SRP compliance.
 
-Dependencies: DRYConfig, DRYCache, DuplicateStorage, pathlib.Path
+Dependencies: DEFAULT_CACHE_DIR_NAME, DRYConfig, DRYCache, DuplicateStorage, reset_if_settings_changed, pathlib.Path
 
-Exports: initialize_storage function, DEFAULT_CACHE_DIR_NAME, DEFAULT_CACHE_FILE_NAME constants
+Exports: initialize_storage function, DEFAULT_CACHE_FILE_NAME constant
 
 Interfaces: initialize_storage(config, project_root) -> DuplicateStorage
 
@@ -20,12 +22,14 @@ Implementation: Module-level functions (no state to justify a class) creating DR
 
 from pathlib import Path
 
+from src.core.constants import DEFAULT_CACHE_DIR_NAME
+
 from .cache import DRYCache
 from .config import DRYConfig
 from .duplicate_storage import DuplicateStorage
+from .index_bookkeeping import reset_if_settings_changed
 
-# Default location for the persistent cross-run duplicate index, relative to project root.
-DEFAULT_CACHE_DIR_NAME = ".thailint-cache"
+# File name of the persistent cross-run duplicate index, inside DEFAULT_CACHE_DIR_NAME.
 DEFAULT_CACHE_FILE_NAME = "dry.db"
 
 
@@ -43,6 +47,8 @@ def initialize_storage(config: DRYConfig, project_root: Path | None = None) -> D
     """
     db_path = _resolve_db_path(config, project_root)
     cache = DRYCache(storage_mode=config.storage_mode, db_path=db_path)
+    if config.storage_mode == "persistent":
+        reset_if_settings_changed(cache.db, config.analysis_fingerprint)
 
     return DuplicateStorage(cache)
 
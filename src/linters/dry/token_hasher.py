@@ -6,25 +6,34 @@ Scope: Code normalization, comment stripping, and hash window generation
 Overview: Implements token-based hashing algorithm (Rabin-Karp) for detecting code duplicates.
     Normalizes source code by stripping comments and whitespace, then generates rolling hash
     windows over consecutive lines. Each window represents a potential duplicate code block.
-    Uses a stable content hash (blake2b) rather than Python's built-in hash(), whose per-process
-    random seed (PYTHONHASHSEED) would otherwise make the same block hash differently in every
-    new process - fine for a single run, but fatal for any cache read back across process
-    invocations. Supports both Python and JavaScript/TypeScript comment styles.
+    Every line is fingerprinted once (its bytes as a number modulo a 62-bit prime) and each
+    window's hash is a polynomial over its line fingerprints, slid forward in constant time,
+    so hashing a file is linear in its line count rather than in lines times window size and
+    no window text is ever built. Both steps are plain integer
+    arithmetic, and stable_hash uses blake2b, rather than Python's built-in hash(), whose
+    per-process random seed (PYTHONHASHSEED) would otherwise make the same block hash
+    differently in every new process - fine for a single run, but fatal for any cache read
+    back across process invocations. Supports both Python and JavaScript/TypeScript comment
+    styles.
 
-Dependencies: hashlib (stdlib)
+Dependencies: hashlib (stdlib), collections.abc.Sequence
 
-Exports: tokenize, rolling_hash, stable_hash, normalize_line, should_skip_import_line functions
+Exports: tokenize, rolling_hash, split_numbered_lines, stable_hash,
+    normalize_line, should_skip_import_line functions
 
 Interfaces: tokenize(code: str) -> list[str],
-    rolling_hash(lines: list[str], window_size: int) -> list[tuple],
+    rolling_hash(lines, window_size, line_numbers=None) -> list[tuple],
+    split_numbered_lines(lines_with_numbers) -> tuple[list[str], list[int]],
     stable_hash(snippet: str) -> int,
     normalize_line(line: str) -> str,
     should_skip_import_line(line: str, in_multiline_import: bool) -> tuple
 
-Implementation: Token-based normalization with rolling window algorithm, language-agnostic approach
+Implementation: Token-based normalization with a two-level Rabin-Karp fingerprint (bytes within
+    a line, then lines within a window) modulo the prime 2**62 - 57, language-agnostic approach
 """
 
 import hashlib
+from collections.abc import Sequence
 
 # Pre-compiled import token set for O(1) membership test
 _IMPORT_TOKENS: frozenset[str] = frozenset(("{", "}", "} from"))
@@ -34,6 +43,12 @@ _IMPORT_PREFIXES: tuple[str, ...] = ("import ", "from ", "export ")
 # hash() previously produced.
 _STABLE_HASH_DIGEST_SIZE = 8
 
+# Rolling window hash: a polynomial over per-line fingerprints modulo the prime 2**62 - 57,
+# so window hashes are non-negative and fit a signed 64-bit SQLite INTEGER. 256 has a huge
+# multiplicative order modulo this prime, so byte positions within a line never alias.
+_ROLLING_MODULUS = 4_611_686_018_427_387_847  # 2**62 - 57
+_ROLLING_BASE = 1_000_003
+
 
 def stable_hash(snippet: str) -> int:
     """Compute a hash for a code snippet that is stable across process boundaries.
@@ -173,29 +188,61 @@ def _is_import_statement(line: str) -> bool:
     return line.startswith(_IMPORT_PREFIXES) or line in _IMPORT_TOKENS
 
 
-def rolling_hash(lines: list[str], window_size: int) -> list[tuple[int, int, int, str]]:
+def rolling_hash(
+    lines: Sequence[str], window_size: int, line_numbers: Sequence[int] | None = None
+) -> list[tuple[int, int, int]]:
     """Create rolling hash windows over code lines.
 
+    Each line is fingerprinted once; a window's hash is a polynomial over the fingerprints
+    of its lines, updated in O(1) per step by dropping the outgoing line and adding
+    the incoming one. No window text is joined or hashed.
+
     Args:
         lines: List of normalized code lines
         window_size: Number of lines per window (min_duplicate_lines)
+        line_numbers: Original (1-indexed) line number of each entry in lines; defaults to
+            the position in lines
 
     Returns:
-        List of tuples: (hash_value, start_line, end_line, code_snippet)
+        List of tuples: (hash_value, start_line, end_line)
     """
-    if len(lines) < window_size:
+    if window_size < 1 or len(lines) < window_size:
         return []
+    numbers = line_numbers if line_numbers is not None else range(1, len(lines) + 1)
+    window_hashes = _window_hashes(list(map(_line_hash, lines)), window_size)
+    return list(zip(window_hashes, numbers, numbers[window_size - 1 :], strict=False))
 
-    hashes = []
-    for i in range(len(lines) - window_size + 1):
-        window = lines[i : i + window_size]
-        snippet = "\n".join(window)
-        hash_val = stable_hash(snippet)
 
-        # Line numbers are 1-indexed
-        start_line = i + 1
-        end_line = i + window_size
+def split_numbered_lines(
+    lines_with_numbers: Sequence[tuple[int, str]],
+) -> tuple[list[str], list[int]]:
+    """Split (line_number, code) pairs into the lines and line_numbers rolling_hash takes.
 
-        hashes.append((hash_val, start_line, end_line, snippet))
+    Args:
+        lines_with_numbers: List of (line_number, code) tuples
 
+    Returns:
+        Tuple of (code lines, original line numbers)
+    """
+    return [code for _, code in lines_with_numbers], [num for num, _ in lines_with_numbers]
+
+
+def _line_hash(line: str) -> int:
+    """Fingerprint one normalized line: its UTF-8 bytes as a base-256 number mod the prime."""
+    # The leading \x01 keeps lines that differ only by leading NUL bytes apart
+    return int.from_bytes(("\x01" + line).encode("utf-8"), "big") % _ROLLING_MODULUS
+
+
+def _window_hashes(line_hashes: list[int], window_size: int) -> list[int]:
+    """Polynomial rolling hash of every window_size-long run of line hashes."""
+    base, modulus = _ROLLING_BASE, _ROLLING_MODULUS  # locals: this loop runs once per line
+    # Weight a line has just after the window slides past it, subtracted to drop it
+    outgoing_weight = pow(base, window_size, modulus)
+    value = 0
+    for line_hash in line_hashes[:window_size]:
+        value = (value * base + line_hash) % modulus
+    hashes = [value]
+    for outgoing, incoming in zip(line_hashes, line_hashes[window_size:], strict=False):
+        value = (value * base + incoming - outgoing * outgoing_weight) % modulus
+        hashes.append(value)
     return hashes
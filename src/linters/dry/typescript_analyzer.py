@@ -106,15 +106,16 @@ class TypeScriptDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.vi
         lines_with_numbers = self._tokenize_with_line_numbers(content, jsdoc_ranges)
 
         # Generate rolling hash windows
-        windows = self._rolling_hash_with_tracking(lines_with_numbers, config.min_duplicate_lines)
+        code_lines, line_numbers = token_hasher.split_numbered_lines(lines_with_numbers)
+        windows = token_hasher.rolling_hash(code_lines, config.min_duplicate_lines, line_numbers)
 
         # Compute interface/type definition ranges once, then reuse across all windows
         interface_ranges = find_interface_ranges(content)
 
         # Filter out interface/type definitions and single statement patterns
         valid_windows = (
-            (hash_val, start_line, end_line, snippet)
-            for hash_val, start_line, end_line, snippet in windows
+            (hash_val, start_line, end_line)
+            for hash_val, start_line, end_line in windows
             if not block_overlaps_interface(start_line, end_line, interface_ranges)
             and not is_single_statement_for_root(root, start_line, end_line, line_to_node_index)
         )
@@ -122,14 +123,14 @@ class TypeScriptDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.vi
 
     def _build_blocks(
         self,
-        windows: Iterable[tuple[int, int, int, str]],
+        windows: Iterable[tuple[int, int, int]],
         file_path: Path,
         content: str,
     ) -> list[CodeBlock]:
         """Build CodeBlock objects from valid windows, applying filters.
 
         Args:
-            windows: Iterable of (hash_val, start_line, end_line, snippet) tuples
+            windows: Iterable of (hash_val, start_line, end_line) tuples
             file_path: Path to source file
             content: File content
 
@@ -137,12 +138,11 @@ class TypeScriptDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.vi
             List of CodeBlock instances that pass all filters
         """
         blocks = []
-        for hash_val, start_line, end_line, snippet in windows:
+        for hash_val, start_line, end_line in windows:
             block = CodeBlock(
                 file_path=file_path,
                 start_line=start_line,
                 end_line=end_line,
-                snippet=snippet,
                 hash_value=hash_val,
             )
             if not self._filter_registry.should_filter_block(block, content):
@@ -257,35 +257,3 @@ class TypeScriptDuplicateAnalyzer(BaseTokenAnalyzer):  # thailint: ignore[srp.vi
         if should_skip:
             return new_state, None
         return new_state, normalized
-
-    def _rolling_hash_with_tracking(
-        self, lines_with_numbers: list[tuple[int, str]], window_size: int
-    ) -> list[tuple[int, int, int, str]]:
-        """Create rolling hash windows while preserving original line numbers.
-
-        Args:
-            lines_with_numbers: List of (line_number, code) tuples
-            window_size: Number of lines per window
-
-        Returns:
-            List of (hash_value, start_line, end_line, snippet) tuples
-        """
-        if len(lines_with_numbers) < window_size:
-            return []
-
-        hashes = []
-        for i in range(len(lines_with_numbers) - window_size + 1):
-            window = lines_with_numbers[i : i + window_size]
-
-            # Extract just the code for hashing
-            code_lines = [code for _, code in window]
-            snippet = "\n".join(code_lines)
-            hash_val = token_hasher.stable_hash(snippet)
-
-            # Get original line numbers
-            start_line = window[0][0]
-            end_line = window[-1][0]
-
-            hashes.append((hash_val, start_line, end_line, snippet))
-
-        return hashes
@@ -25,7 +25,7 @@ Suppressions:
 
 from typing import Any
 
-from src.analyzers.typescript_base import TREE_SITTER_AVAILABLE, TS_PARSER
+from src.analyzers.typescript_base import TREE_SITTER_AVAILABLE, get_typescript_source
 
 from .constant import CONSTANT_NAME_PATTERN, ConstantInfo
 from .typescript_value_extractor import TypeScriptValueExtractor
@@ -105,10 +105,11 @@ class TypeScriptConstantExtractor:
 
 def _parse_content(content: str) -> Node | None:
     """Parse content and return root node, or None on failure."""
-    if not TREE_SITTER_AVAILABLE or TS_PARSER is None:
+    source = get_typescript_source(content)
+    if source is None:
         return None
     try:
-        return TS_PARSER.parse(bytes(content, "utf8")).root_node
+        return source.root_node
     except Exception:  # pylint: disable=broad-exception-caught
         return None
 
@@ -50,7 +50,7 @@ DEFAULT_REQUIRED_FIELDS: dict[str, list[str]] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class FileHeaderConfig:
     """Configuration for file header linting."""
 
@@ -35,8 +35,9 @@ from src.core.base import BaseLintContext, BaseLintRule
 from src.core.constants import HEADER_SCAN_LINES, Language
 from src.core.linter_utils import is_ignored_path, load_linter_config
 from src.core.types import Violation
-from src.linter_config.directive_markers import check_general_ignore, has_ignore_directive_marker
-from src.linter_config.ignore import _check_specific_rule_ignore, get_ignore_parser
+from src.linter_config.directive_index import _check_specific_rule_ignore, index_for_content
+from src.linter_config.directive_markers import check_general_ignore
+from src.linter_config.ignore import get_ignore_parser
 
 from .atemporal_detector import AtemporalDetector
 from .bash_parser import BashHeaderParser
@@ -100,6 +101,11 @@ class FileHeaderRule(BaseLintRule):  # thailint: ignore[srp]
         """Description of what this rule checks."""
         return "Validates file headers for mandatory fields and atemporal language"
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Languages with a header parser."""
+        return frozenset(self._parsers)
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check file header for violations."""
         if self._has_file_ignore(context):
@@ -169,19 +175,17 @@ class FileHeaderRule(BaseLintRule):  # thailint: ignore[srp]
         return self._has_custom_ignore_syntax(file_content)
 
     def _has_standard_ignore(self, file_content: str) -> bool:
-        """Check standard ignore parser for file-level ignores."""
-        first_lines = file_content.splitlines()[:HEADER_SCAN_LINES]
-        return any(self._line_has_matching_ignore(line) for line in first_lines)
+        """Check the file's indexed ignore-file directives for file-level ignores."""
+        directives = index_for_content(file_content).file_directives
+        return any(self._line_has_matching_ignore(line) for line in directives)
 
     def _line_has_matching_ignore(self, line: str) -> bool:
-        """Check if line has matching ignore directive for this rule."""
-        if not has_ignore_directive_marker(line):
-            return False
+        """Check if an ignore-file directive line matches this rule."""
         return _check_specific_rule_ignore(line, self.rule_id) or check_general_ignore(line)
 
     def _has_custom_ignore_syntax(self, file_content: str) -> bool:
         """Check custom file-level ignore syntax."""
-        first_lines = file_content.splitlines()[:HEADER_SCAN_LINES]
+        first_lines = index_for_content(file_content).lines[:HEADER_SCAN_LINES]
         return any(self._is_ignore_line(line) for line in first_lines)
 
     def _is_ignore_line(self, line: str) -> bool:
@@ -256,23 +260,19 @@ class FileHeaderRule(BaseLintRule):  # thailint: ignore[srp]
     ) -> list[Violation]:
         """Filter out violations that should be ignored."""
         file_content = context.file_content or ""
-        lines = file_content.splitlines()
 
         non_ignored = (
             v
             for v in violations
             if not self._ignore_parser.should_ignore_violation(v, file_content)
-            and not self._has_line_level_ignore(lines, v)
+            and not self._has_line_level_ignore(file_content, v)
         )
         return list(non_ignored)
 
-    def _has_line_level_ignore(self, lines: list[str], violation: Violation) -> bool:
+    def _has_line_level_ignore(self, file_content: str, violation: Violation) -> bool:
         """Check for thailint-ignore-line directive."""
-        if violation.line <= 0 or violation.line > len(lines):
-            return False
-
-        line_content = lines[violation.line - 1]
-        return "# thailint-ignore-line:" in line_content.lower()
+        line_content = index_for_content(file_content).line_text(violation.line)
+        return line_content is not None and "# thailint-ignore-line:" in line_content.lower()
 
     def _extract_markdown_prose_fields(self, fields: dict[str, str]) -> str:
         """Extract prose fields from Markdown frontmatter for atemporal checking."""
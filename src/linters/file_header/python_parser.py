@@ -20,6 +20,7 @@ Implementation: AST-based docstring extraction with syntax error handling
 
 import ast
 
+from src.core.python_source import parse_python_source
 from src.linters.file_header.base_parser import BaseHeaderParser
 
 
@@ -36,7 +37,7 @@ class PythonHeaderParser(BaseHeaderParser):
             Module docstring or None if not found or parse error
         """
         try:
-            tree = ast.parse(code)
+            tree = parse_python_source(code)
             return ast.get_docstring(tree)
         except SyntaxError:
             return None
@@ -55,7 +55,7 @@ def _default_fluent_methods() -> list[str]:
     ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class LawOfDemeterConfig:
     """Configuration for Law of Demeter linter."""
 
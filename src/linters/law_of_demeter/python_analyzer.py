@@ -3,23 +3,26 @@ Purpose: Python AST analyzer for Law of Demeter chain detection
 
 Scope: Extract attribute/method chains and import information from Python AST
 
-Overview: Provides functions that walk Python AST trees to find attribute/method chains
+Overview: Provides functions that query the shared AST index of a Python tree to find attribute/method chains
     meeting a minimum depth threshold and extract import information for the module-access
     filter. Also provides the FileImports dataclass for tracking module names and from-imports
     per file.
 
-Dependencies: ast, dataclasses, chain_extractor
+Dependencies: ast, dataclasses, chain_extractor, analyzers.ast_index
 
 Exports: FileImports, extract_chains, extract_imports
 
 Interfaces: extract_chains(tree, min_depth), extract_imports(tree)
 
-Implementation: Uses ast.walk() for chain extraction with per-line deduplication
+Implementation: Node-type queries on the shared AstIndex for chain extraction with per-line
+    deduplication
 """
 
 import ast
 from dataclasses import dataclass, field
 
+from src.analyzers.ast_index import get_ast_index
+
 from .chain_extractor import chain_to_parts
 
 
@@ -55,7 +58,7 @@ def extract_imports(tree: ast.AST) -> FileImports:
         FileImports with module names and from-import mappings
     """
     imports = FileImports()
-    for node in ast.walk(tree):
+    for node in get_ast_index(tree).nodes((ast.Import, ast.ImportFrom)):
         if isinstance(node, ast.Import):
             _process_import(node, imports)
         elif isinstance(node, ast.ImportFrom):
@@ -64,14 +67,12 @@ def extract_imports(tree: ast.AST) -> FileImports:
 
 
 def _collect_raw_chains(tree: ast.AST, min_depth: int) -> list[tuple[list[str], ast.AST]]:
-    """Walk AST and collect all chains meeting minimum depth."""
+    """Collect all chains meeting minimum depth."""
     chains: list[tuple[list[str], ast.AST]] = []
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.Attribute, ast.Call)):
-            parts = chain_to_parts(node)
-            depth = len(parts) - 1
-            if depth >= min_depth:
-                chains.append((parts, node))
+    for node in get_ast_index(tree).nodes((ast.Attribute, ast.Call)):
+        parts = chain_to_parts(node)
+        if len(parts) - 1 >= min_depth:
+            chains.append((parts, node))
     return chains
 
 
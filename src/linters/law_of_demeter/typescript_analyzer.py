@@ -95,10 +95,11 @@ def _collect_raw_chains(
     chains: list[tuple[list[str], TSNodeAdapter]] = []
     seen_nodes: set[int] = set()
 
-    for node in analyzer.walk_tree(root, "member_expression"):
+    found = analyzer.walk_tree_by_types(root, ("member_expression", "call_expression"))
+    for node in found["member_expression"]:
         _try_extract_chain(node, min_depth, chains, seen_nodes)
 
-    for node in analyzer.walk_tree(root, "call_expression"):
+    for node in found["call_expression"]:
         _try_extract_from_call(node, min_depth, chains, seen_nodes)
 
     return chains
@@ -24,7 +24,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class LazyIgnoresConfig:  # pylint: disable=too-many-instance-attributes
     """Configuration for the lazy-ignores linter."""
 
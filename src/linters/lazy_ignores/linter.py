@@ -71,6 +71,16 @@ class LazyIgnoresRule(BaseLintRule):
             "Suppressions section."
         )
 
+    @property
+    def honors_ignore_directives(self) -> bool:
+        """Report ignore directives even on lines an inline ignore covers."""
+        return False
+
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Python only (suppression comments are parsed as Python)."""
+        return frozenset({Language.PYTHON})
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for violations in the given context.
 
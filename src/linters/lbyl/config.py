@@ -25,7 +25,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class LBYLConfig:  # pylint: disable=too-many-instance-attributes
     """Configuration for LBYL linter."""
 
@@ -4,25 +4,36 @@ Purpose: Base class for LBYL pattern detectors
 Scope: Abstract base providing common detector interface
 
 Overview: Defines BaseLBYLDetector abstract class that all pattern detectors extend.
-    Inherits from ast.NodeVisitor for AST traversal. Defines LBYLPattern base dataclass
-    for representing detected patterns with line number and column information. Each
-    concrete detector implements find_patterns() to identify specific LBYL anti-patterns.
-    Uses Generic TypeVar for type-safe subclass pattern storage.
+    Defines LBYLPattern base dataclass for representing detected patterns with line number and
+    column information. Each concrete detector implements check_if() for one if statement;
+    register() hooks it into a DispatchVisitor so the analyzer runs every enabled detector in a
+    single pass over the module, while find_patterns() runs one detector on its own. Uses
+    Generic TypeVar for type-safe subclass pattern storage. Detectors inspect the bodies of the
+    statements they match through the module's shared AstIndex rather than re-walking each body.
 
-Dependencies: abc, ast, dataclasses, typing
+Dependencies: abc, ast, dataclasses, typing, analyzers.ast_index, analyzers.dispatch_visitor
 
 Exports: BaseLBYLDetector, LBYLPattern
 
-Interfaces: find_patterns(tree: ast.AST) -> list[LBYLPattern]
+Interfaces: find_patterns(tree: ast.AST) -> list[LBYLPattern], begin(tree), register(visitor),
+    patterns
 
-Implementation: Abstract base with NodeVisitor pattern for extensibility, Generic for type safety
+Implementation: Abstract base registering an ast.If handler with the shared dispatch visitor,
+    Generic for type safety
 """
 
 import ast
-from abc import ABC
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Generic, TypeVar
 
+from src.analyzers.ast_index import AstIndex, NodeT, build_ast_index, get_ast_index
+from src.analyzers.dispatch_visitor import DispatchVisitor
+
+# Index of an empty module: body queries against it index the statements on their own, so
+# detectors whose check_if is called directly (without find_patterns) still work
+_DETACHED_INDEX = build_ast_index(ast.Module(body=[], type_ignores=[]))
+
 
 @dataclass
 class LBYLPattern:
@@ -35,11 +46,11 @@ class LBYLPattern:
 PatternT = TypeVar("PatternT", bound=LBYLPattern)
 
 
-class BaseLBYLDetector(ast.NodeVisitor, ABC, Generic[PatternT]):
+class BaseLBYLDetector(ABC, Generic[PatternT]):
     """Base class for LBYL pattern detectors.
 
     Subclasses must initialize self._patterns as an empty list in __init__
-    and populate it in visit methods. The _patterns attribute stores subclass-
+    and populate it in check_if. The _patterns attribute stores subclass-
     specific pattern types (DictKeyPattern, HasattrPattern, etc.) which all
     inherit from LBYLPattern.
 
@@ -48,6 +59,7 @@ class BaseLBYLDetector(ast.NodeVisitor, ABC, Generic[PatternT]):
     """
 
     _patterns: list[PatternT]
+    _index: AstIndex = _DETACHED_INDEX
 
     def find_patterns(self, tree: ast.AST) -> list[LBYLPattern]:
         """Find LBYL patterns in AST.
@@ -58,6 +70,52 @@ class BaseLBYLDetector(ast.NodeVisitor, ABC, Generic[PatternT]):
         Returns:
             List of detected LBYL patterns
         """
+        self.begin(tree)
+        visitor = DispatchVisitor()
+        self.register(visitor)
+        visitor.visit(tree, self._index)
+        return self.patterns
+
+    def begin(self, tree: ast.AST) -> None:
+        """Reset recorded patterns before a pass over a new tree.
+
+        Args:
+            tree: Tree the next pass visits
+        """
         self._patterns = []
-        self.visit(tree)
+        self._index = get_ast_index(tree)
+
+    def register(self, visitor: DispatchVisitor) -> None:
+        """Register this detector's if-statement check with a dispatch visitor."""
+        visitor.register(ast.If, self.check_if)
+
+    @property
+    def patterns(self) -> list[LBYLPattern]:
+        """Patterns recorded since the last begin()."""
         return list(self._patterns)
+
+    @abstractmethod
+    def check_if(self, node: ast.If) -> None:
+        """Check one if statement and record a pattern if it matches.
+
+        Args:
+            node: AST If node to analyze
+        """
+
+    def _body_nodes(
+        self, body: list[ast.stmt], node_type: type[NodeT] | tuple[type[NodeT], ...]
+    ) -> list[NodeT]:
+        """Get the nodes of a type inside a statement body, in source order.
+
+        Args:
+            body: Statement body of a matched node
+            node_type: Node class or tuple of classes to select
+
+        Returns:
+            Matching nodes from the shared index
+        """
+        return self._index.nodes(node_type, within=body)
+
+    def _body_walk(self, body: list[ast.stmt]) -> list[ast.AST]:
+        """Get every node inside a statement body, in source order."""
+        return self._index.walk(within=body)
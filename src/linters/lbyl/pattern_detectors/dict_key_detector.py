@@ -15,11 +15,7 @@ Exports: DictKeyPattern, DictKeyDetector
 
 Interfaces: DictKeyDetector.find_patterns(tree: ast.AST) -> list[DictKeyPattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect in-check followed by subscript
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
+Implementation: Dispatched check_if handler to detect in-check followed by subscript
 """
 
 import ast
@@ -69,8 +65,8 @@ class DictKeyDetector(BaseLBYLDetector[DictKeyPattern]):
         """Initialize the detector."""
         self._patterns: list[DictKeyPattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for dict key LBYL pattern.
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for dict key LBYL pattern.
 
         Args:
             node: AST If node to analyze
@@ -81,8 +77,6 @@ class DictKeyDetector(BaseLBYLDetector[DictKeyPattern]):
             if self._body_has_subscript_match(node.body, dict_expr, key_expr):
                 self._patterns.append(self._create_pattern(node, dict_expr, key_expr))
 
-        self.generic_visit(node)
-
     def _body_has_subscript_match(
         self, body: list[ast.stmt], dict_expr: ast.expr, key_expr: ast.expr
     ) -> bool:
@@ -90,9 +84,7 @@ class DictKeyDetector(BaseLBYLDetector[DictKeyPattern]):
         expected = (ast.dump(dict_expr), ast.dump(key_expr))
         return any(
             (ast.dump(node.value), ast.dump(node.slice)) == expected
-            for stmt in body
-            for node in ast.walk(stmt)
-            if isinstance(node, ast.Subscript)
+            for node in self._body_nodes(body, ast.Subscript)
         )
 
     def _create_pattern(
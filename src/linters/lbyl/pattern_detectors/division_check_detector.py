@@ -15,16 +15,12 @@ Exports: DivisionCheckPattern, DivisionCheckDetector
 
 Interfaces: DivisionCheckDetector.find_patterns(tree: ast.AST) -> list[DivisionCheckPattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect zero comparison followed
+Implementation: Dispatched check_if handler to detect zero comparison followed
     by division using the checked variable
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
 """
 
 import ast
-from collections.abc import Iterator
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from .base import BaseLBYLDetector, LBYLPattern
@@ -164,12 +160,6 @@ def _check_augassign(node: ast.AugAssign, expected_key: str) -> str | None:
     return None
 
 
-def _iter_ast_nodes(body: list[ast.stmt]) -> Iterator[ast.AST]:
-    """Iterate over all AST nodes in a list of statements."""
-    for stmt in body:
-        yield from ast.walk(stmt)
-
-
 def _check_division_node(node: ast.AST, expected_key: str) -> str | None:
     """Check if AST node is a division using expected divisor."""
     if isinstance(node, ast.BinOp):
@@ -179,9 +169,9 @@ def _check_division_node(node: ast.AST, expected_key: str) -> str | None:
     return None
 
 
-def _find_division(body: list[ast.stmt], expected_key: str) -> str | None:
-    """Find first division operation using expected divisor in body."""
-    for node in _iter_ast_nodes(body):
+def _find_division(nodes: Iterable[ast.AST], expected_key: str) -> str | None:
+    """Find first division operation using expected divisor among a body's nodes."""
+    for node in nodes:
         result = _check_division_node(node, expected_key)
         if result:
             return result
@@ -195,14 +185,13 @@ class DivisionCheckDetector(BaseLBYLDetector[DivisionCheckPattern]):
         """Initialize the detector."""
         self._patterns: list[DivisionCheckPattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for division zero-check LBYL pattern.
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for division zero-check LBYL pattern.
 
         Args:
             node: AST If node to analyze
         """
         self._check_division_pattern(node)
-        self.generic_visit(node)
 
     def _check_division_pattern(self, node: ast.If) -> None:
         """Check if node is a division zero-check LBYL pattern and record it."""
@@ -216,7 +205,9 @@ class DivisionCheckDetector(BaseLBYLDetector[DivisionCheckPattern]):
             return
 
         expected_key = _get_expression_key(var_expr)
-        operation = _find_division(body_to_check, expected_key)
+        operation = _find_division(
+            self._body_nodes(body_to_check, (ast.BinOp, ast.AugAssign)), expected_key
+        )
         if operation:
             self._patterns.append(self._create_pattern(node, var_expr, operation))
 
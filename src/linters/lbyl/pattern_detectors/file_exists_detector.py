@@ -15,12 +15,8 @@ Exports: FileExistsPattern, FileExistsDetector
 
 Interfaces: FileExistsDetector.find_patterns(tree: ast.AST) -> list[FileExistsPattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect exists check followed by
+Implementation: Dispatched check_if handler to detect exists check followed by
     file operation (open, read_text, write_text)
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
 """
 
 import ast
@@ -184,10 +180,9 @@ class FileExistsDetector(BaseLBYLDetector[FileExistsPattern]):
         """Initialize the detector."""
         self._patterns: list[FileExistsPattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for file exists LBYL pattern."""
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for file exists LBYL pattern."""
         self._check_file_exists_pattern(node)
-        self.generic_visit(node)
 
     def _check_file_exists_pattern(self, node: ast.If) -> None:
         """Check if node matches file exists LBYL pattern."""
@@ -205,7 +200,7 @@ class FileExistsDetector(BaseLBYLDetector[FileExistsPattern]):
         """Check if body contains file operation on the same path."""
         expected_path = ast.dump(path_expr)
         return any(
-            _is_file_operation(node, expected_path) for stmt in body for node in ast.walk(stmt)
+            _is_file_operation(node, expected_path) for node in self._body_nodes(body, ast.Call)
         )
 
     def _create_pattern(
@@ -16,12 +16,8 @@ Exports: HasattrPattern, HasattrDetector
 
 Interfaces: HasattrDetector.find_patterns(tree: ast.AST) -> list[HasattrPattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect hasattr check followed by
+Implementation: Dispatched check_if handler to detect hasattr check followed by
     attribute access
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
 """
 
 import ast
@@ -74,14 +70,13 @@ class HasattrDetector(BaseLBYLDetector[HasattrPattern]):
         """Initialize the detector."""
         self._patterns: list[HasattrPattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for hasattr LBYL pattern.
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for hasattr LBYL pattern.
 
         Args:
             node: AST If node to analyze
         """
         self._check_hasattr_pattern(node)
-        self.generic_visit(node)
 
     def _check_hasattr_pattern(self, node: ast.If) -> None:
         """Check if node is a hasattr LBYL pattern and record it."""
@@ -99,8 +94,7 @@ class HasattrDetector(BaseLBYLDetector[HasattrPattern]):
         expected_obj = ast.dump(obj_expr)
         return any(
             self._is_matching_attribute(node, expected_obj, attr_name)
-            for stmt in body
-            for node in ast.walk(stmt)
+            for node in self._body_nodes(body, ast.Attribute)
         )
 
     def _is_matching_attribute(self, node: ast.AST, expected_obj: str, attr_name: str) -> bool:
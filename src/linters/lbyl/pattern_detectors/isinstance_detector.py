@@ -15,12 +15,8 @@ Exports: IsinstancePattern, IsinstanceDetector
 
 Interfaces: IsinstanceDetector.find_patterns(tree: ast.AST) -> list[IsinstancePattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect isinstance check followed by
+Implementation: Dispatched check_if handler to detect isinstance check followed by
     operations on the checked object
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
 """
 
 import ast
@@ -68,14 +64,13 @@ class IsinstanceDetector(BaseLBYLDetector[IsinstancePattern]):
         """Initialize the detector."""
         self._patterns: list[IsinstancePattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for isinstance LBYL pattern.
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for isinstance LBYL pattern.
 
         Args:
             node: AST If node to analyze
         """
         self._check_isinstance_pattern(node)
-        self.generic_visit(node)
 
     def _check_isinstance_pattern(self, node: ast.If) -> None:
         """Check if node is an isinstance LBYL pattern and record it."""
@@ -89,9 +84,7 @@ class IsinstanceDetector(BaseLBYLDetector[IsinstancePattern]):
     def _body_has_object_operation(self, body: list[ast.stmt], obj_expr: ast.expr) -> bool:
         """Check if body contains operations on the isinstance-checked object."""
         expected_obj = ast.dump(obj_expr)
-        return any(
-            self._node_uses_object(node, expected_obj) for stmt in body for node in ast.walk(stmt)
-        )
+        return any(self._node_uses_object(node, expected_obj) for node in self._body_walk(body))
 
     def _node_uses_object(self, node: ast.AST, expected_obj: str) -> bool:
         """Check if AST node uses the expected object."""
@@ -16,12 +16,8 @@ Exports: LenCheckPattern, LenCheckDetector
 
 Interfaces: LenCheckDetector.find_patterns(tree: ast.AST) -> list[LenCheckPattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect len check followed by
+Implementation: Dispatched check_if handler to detect len check followed by
     subscript access
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
 """
 
 import ast
@@ -134,10 +130,9 @@ class LenCheckDetector(BaseLBYLDetector[LenCheckPattern]):
         """Initialize the detector."""
         self._patterns: list[LenCheckPattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for len check LBYL pattern."""
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for len check LBYL pattern."""
         self._check_len_pattern(node)
-        self.generic_visit(node)
 
     def _check_len_pattern(self, node: ast.If) -> None:
         """Check if node matches len check LBYL pattern."""
@@ -156,9 +151,8 @@ class LenCheckDetector(BaseLBYLDetector[LenCheckPattern]):
         """Check if body contains collection[index] access matching the len check."""
         expected_collection = ast.dump(collection_expr)
         return any(
-            isinstance(node, ast.Subscript) and ast.dump(node.value) == expected_collection
-            for stmt in body
-            for node in ast.walk(stmt)
+            ast.dump(node.value) == expected_collection
+            for node in self._body_nodes(body, ast.Subscript)
         )
 
     def _create_pattern(
@@ -15,12 +15,8 @@ Exports: NoneCheckPattern, NoneCheckDetector
 
 Interfaces: NoneCheckDetector.find_patterns(tree: ast.AST) -> list[NoneCheckPattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect None comparison followed by
+Implementation: Dispatched check_if handler to detect None comparison followed by
     variable usage
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
 """
 
 import ast
@@ -96,14 +92,13 @@ class NoneCheckDetector(BaseLBYLDetector[NoneCheckPattern]):
         """Initialize the detector."""
         self._patterns: list[NoneCheckPattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for None check LBYL pattern.
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for None check LBYL pattern.
 
         Args:
             node: AST If node to analyze
         """
         self._check_none_pattern(node)
-        self.generic_visit(node)
 
     def _check_none_pattern(self, node: ast.If) -> None:
         """Check if node is a None check LBYL pattern and record it."""
@@ -123,9 +118,7 @@ class NoneCheckDetector(BaseLBYLDetector[NoneCheckPattern]):
     def _body_has_variable_usage(self, body: list[ast.stmt], var_expr: ast.expr) -> bool:
         """Check if body contains usage of the None-checked variable."""
         expected_var = ast.dump(var_expr)
-        return any(
-            self._is_variable_usage(node, expected_var) for stmt in body for node in ast.walk(stmt)
-        )
+        return any(self._is_variable_usage(node, expected_var) for node in self._body_walk(body))
 
     def _is_variable_usage(self, node: ast.AST, expected_var: str) -> bool:
         """Check if node represents usage of the expected variable."""
@@ -15,16 +15,12 @@ Exports: StringValidatorPattern, StringValidatorDetector
 
 Interfaces: StringValidatorDetector.find_patterns(tree: ast.AST) -> list[StringValidatorPattern]
 
-Implementation: AST NodeVisitor pattern with visit_If to detect string validation followed
+Implementation: Dispatched check_if handler to detect string validation followed
     by conversion call
-
-Suppressions:
-    - N802: visit_If follows Python AST visitor naming convention (camelCase required)
-    - invalid-name: visit_If follows Python AST visitor naming convention (camelCase required)
 """
 
 import ast
-from collections.abc import Iterator
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from .base import BaseLBYLDetector, LBYLPattern
@@ -76,12 +72,6 @@ def _get_conversion_func_name(node: ast.AST) -> str | None:
     return node.func.id
 
 
-def _iter_ast_nodes(body: list[ast.stmt]) -> Iterator[ast.AST]:
-    """Iterate over all AST nodes in a list of statements."""
-    for stmt in body:
-        yield from ast.walk(stmt)
-
-
 def _is_matching_call(node: ast.AST, expected_key: str) -> str | None:
     """Check if node is a matching conversion call."""
     if not isinstance(node, ast.Call):
@@ -92,9 +82,9 @@ def _is_matching_call(node: ast.AST, expected_key: str) -> str | None:
     return None
 
 
-def _find_conversion(body: list[ast.stmt], expected_key: str) -> str | None:
-    """Find first matching conversion in body."""
-    for node in _iter_ast_nodes(body):
+def _find_conversion(calls: Iterable[ast.Call], expected_key: str) -> str | None:
+    """Find first matching conversion among a body's calls."""
+    for node in calls:
         result = _is_matching_call(node, expected_key)
         if result:
             return result
@@ -108,14 +98,13 @@ class StringValidatorDetector(BaseLBYLDetector[StringValidatorPattern]):
         """Initialize the detector."""
         self._patterns: list[StringValidatorPattern] = []
 
-    def visit_If(self, node: ast.If) -> None:  # noqa: N802  # pylint: disable=invalid-name
-        """Visit if statement to check for string validator LBYL pattern.
+    def check_if(self, node: ast.If) -> None:
+        """Check an if statement for string validator LBYL pattern.
 
         Args:
             node: AST If node to analyze
         """
         self._check_validator_pattern(node)
-        self.generic_visit(node)
 
     def _check_validator_pattern(self, node: ast.If) -> None:
         """Check if node is a string validator LBYL pattern and record it."""
@@ -124,7 +113,7 @@ class StringValidatorDetector(BaseLBYLDetector[StringValidatorPattern]):
             return
 
         expected_key = _get_string_expression_key(string_expr)
-        conversion = _find_conversion(node.body, expected_key)
+        conversion = _find_conversion(self._body_nodes(node.body, ast.Call), expected_key)
         if conversion:
             self._patterns.append(self._create_pattern(node, string_expr, validator, conversion))
 
@@ -6,23 +6,27 @@ Scope: Orchestrates multiple pattern detectors and converts results to violation
 Overview: Provides PythonLBYLAnalyzer class that coordinates all LBYL pattern detectors
     and converts detected patterns into Violation objects. Handles AST parsing with
     graceful syntax error handling, runs enabled detectors based on configuration toggles,
-    and aggregates violations from all detectors. Serves as the main analysis engine
-    called by LBYLRule.
+    and aggregates violations from all detectors. The enabled detectors share one
+    DispatchVisitor, so the module is traversed once however many are enabled. Serves as the
+    main analysis engine called by LBYLRule.
 
-Dependencies: ast module, LBYLConfig, pattern detectors, violation_builder functions
+Dependencies: ast module, LBYLConfig, pattern detectors, violation_builder functions,
+    analyzers.dispatch_visitor
 
 Exports: PythonLBYLAnalyzer
 
 Interfaces: analyze(code: str, file_path: str, config: LBYLConfig) -> list[Violation]
 
-Implementation: Detector coordination with config-driven pattern selection using
-    generic detector runner for code reuse
+Implementation: Detector coordination with config-driven pattern selection and a single
+    fused dispatch pass over the shared AST index
 """
 
 import ast
 from collections.abc import Callable
 from typing import Any, TypeVar
 
+from src.analyzers.dispatch_visitor import run_detectors
+from src.core.python_source import parse_python_source
 from src.core.types import Violation
 
 from .config import LBYLConfig
@@ -60,22 +64,23 @@ def _parse_python_code(code: str) -> ast.Module | None:
     if not code or not code.strip():
         return None
     try:
-        return ast.parse(code)
+        return parse_python_source(code)
     except SyntaxError:
         return None
 
 
-def _run_detector(
+# Each tuple: (detector, converter, pattern_type)
+DetectorConfig = tuple[BaseLBYLDetector[Any], Callable[..., Violation], type]
+
+
+def _convert_patterns(
     detector: BaseLBYLDetector[PatternT],
-    tree: ast.Module,
     file_path: str,
     converter: Callable[[PatternT, str], Violation],
     pattern_type: type[PatternT],
 ) -> list[Violation]:
-    """Run a detector and convert patterns to violations."""
-    return [
-        converter(p, file_path) for p in detector.find_patterns(tree) if isinstance(p, pattern_type)
-    ]
+    """Convert the patterns a detector recorded during the last pass to violations."""
+    return [converter(p, file_path) for p in detector.patterns if isinstance(p, pattern_type)]
 
 
 def _build_dict_key(pattern: DictKeyPattern, file_path: str) -> Violation:
@@ -171,10 +176,7 @@ class PythonLBYLAnalyzer:
 
     def __init__(self) -> None:
         """Initialize the analyzer with pattern detectors."""
-        # Each tuple: (detector, converter, pattern_type)
-        self._detector_configs: list[
-            tuple[BaseLBYLDetector[Any], Callable[..., Violation], type]
-        ] = [
+        self._detector_configs: list[DetectorConfig] = [
             (DictKeyDetector(), _build_dict_key, DictKeyPattern),
             (DivisionCheckDetector(), _build_division_check, DivisionCheckPattern),
             (FileExistsDetector(), _build_file_exists, FileExistsPattern),
@@ -195,7 +197,19 @@ class PythonLBYLAnalyzer:
     def _run_enabled_detectors(
         self, tree: ast.Module, file_path: str, config: LBYLConfig
     ) -> list[Violation]:
-        """Run all enabled pattern detectors and collect violations."""
+        """Run all enabled pattern detectors in one pass and collect violations."""
+        enabled = self._enabled_detectors(config)
+        for detector, _, _ in enabled:
+            detector.begin(tree)
+        run_detectors(tree, [detector for detector, _, _ in enabled])
+
+        violations: list[Violation] = []
+        for detector, converter, pattern_type in enabled:
+            violations.extend(_convert_patterns(detector, file_path, converter, pattern_type))
+        return violations
+
+    def _enabled_detectors(self, config: LBYLConfig) -> list[DetectorConfig]:
+        """Get the detector configs whose toggle is on, in detector order."""
         # Map detector types to their config flags
         enabled_flags = {
             DictKeyDetector: config.detect_dict_key,
@@ -208,8 +222,4 @@ class PythonLBYLAnalyzer:
             StringValidatorDetector: config.detect_string_validation,
         }
 
-        violations: list[Violation] = []
-        for detector, converter, pattern_type in self._detector_configs:
-            if enabled_flags.get(type(detector), False):
-                violations.extend(_run_detector(detector, tree, file_path, converter, pattern_type))
-        return violations
+        return [cfg for cfg in self._detector_configs if enabled_flags.get(type(cfg[0]), False)]
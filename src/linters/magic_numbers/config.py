@@ -55,7 +55,7 @@ DEFAULT_ALLOWED_NUMBERS: set[int | float] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class MagicNumberConfig:
     """Configuration for magic numbers linter."""
 
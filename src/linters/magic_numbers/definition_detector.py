@@ -10,7 +10,8 @@ Overview: Provides functions to detect if a file is a constant definition file t
     2. Content patterns (dicts with 5+ int keys, 10+ UPPERCASE constant assignments)
     Files matching these patterns contain legitimate constant definitions.
 
-Dependencies: ast module for parsing, pathlib for Path handling, re for pattern matching
+Dependencies: ast module for parsing, pathlib for Path handling, re for pattern matching,
+    analyzers.ast_index for the shared node index
 
 Exports: is_definition_file function
 
@@ -23,6 +24,9 @@ import ast
 import re
 from pathlib import Path
 
+from src.analyzers.ast_index import get_ast_index
+from src.core.python_source import parse_python_source
+
 # Threshold for number of UPPERCASE constants to consider a file as definition file
 MIN_UPPERCASE_CONSTANTS = 10
 
@@ -93,7 +97,7 @@ def _has_definition_content_patterns(content: str) -> bool:
         True if content matches definition patterns
     """
     try:
-        tree = ast.parse(content)
+        tree = parse_python_source(content)
     except SyntaxError:
         return False
 
@@ -187,7 +191,7 @@ def _has_dict_with_int_keys(tree: ast.Module) -> bool:
     Returns:
         True if there's a dict with MIN_DICT_INT_KEYS+ int keys
     """
-    return any(_has_enough_int_keys(node) for node in ast.walk(tree) if isinstance(node, ast.Dict))
+    return any(_has_enough_int_keys(node) for node in get_ast_index(tree).nodes(ast.Dict))
 
 
 def _has_enough_int_keys(dict_node: ast.Dict) -> bool:
@@ -33,7 +33,7 @@ from typing import Any
 
 from src.analyzers.rust_base import TREE_SITTER_RUST_AVAILABLE
 from src.core.base import BaseLintContext, MultiLanguageLintRule
-from src.core.linter_utils import load_linter_config
+from src.core.linter_utils import get_python_ast, get_python_parent_map, load_linter_config
 from src.core.types import Violation
 from src.core.violation_utils import get_violation_line, has_python_noqa
 from src.linter_config.ignore import get_ignore_parser
@@ -140,24 +140,17 @@ class MagicNumberRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         ):
             return []
 
-        tree = self._parse_python_code(context.file_content)
+        tree = get_python_ast(context)
         if tree is None:
             return []
 
-        numeric_literals = self._find_numeric_literals(tree)
+        numeric_literals = self._find_numeric_literals(tree, get_python_parent_map(context))
         return self._collect_violations(numeric_literals, context, config)
 
-    def _parse_python_code(self, code: str | None) -> ast.AST | None:
-        """Parse Python code into AST."""
-        try:
-            return ast.parse(code or "")
-        except SyntaxError:
-            return None
-
-    def _find_numeric_literals(self, tree: ast.AST) -> list:
+    def _find_numeric_literals(self, tree: ast.AST, parent_map: dict[ast.AST, ast.AST]) -> list:
         """Find all numeric literals in AST."""
         analyzer = PythonMagicNumberAnalyzer()
-        return analyzer.find_numeric_literals(tree)
+        return analyzer.find_numeric_literals(tree, parent_map)
 
     def _collect_violations(
         self, numeric_literals: list, context: BaseLintContext, config: MagicNumberConfig
@@ -238,37 +231,20 @@ class MagicNumberRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         if self._ignore_parser.should_ignore_violation(violation, context.file_content or ""):
             return True
 
-        # Workaround for generic ignore directives
-        return self._check_generic_ignore(violation, context)
+        return self._has_noqa(violation, context)
 
-    def _check_generic_ignore(self, violation: Violation, context: BaseLintContext) -> bool:
-        """Check for generic ignore directives (workaround for parser limitation).
+    def _has_noqa(self, violation: Violation, context: BaseLintContext) -> bool:
+        """Check for a "# noqa" comment, honored by this rule on top of thailint directives.
 
         Args:
             violation: Violation to check
             context: Lint context
 
         Returns:
-            True if line has generic ignore directive
+            True if the violation's line has a noqa comment
         """
         line_text = get_violation_line(violation, context)
-        if line_text is None:
-            return False
-
-        return self._has_generic_ignore_directive(line_text)
-
-    def _has_generic_ignore_directive(self, line_text: str) -> bool:
-        """Check if line has generic ignore directive."""
-        if self._has_generic_thailint_ignore(line_text):
-            return True
-        return has_python_noqa(line_text)
-
-    def _has_generic_thailint_ignore(self, line_text: str) -> bool:
-        """Check for generic thailint: ignore (no brackets)."""
-        if "# thailint: ignore" not in line_text:
-            return False
-        after_ignore = line_text.split("# thailint: ignore")[1].split("#")[0]
-        return "[" not in after_ignore
+        return line_text is not None and has_python_noqa(line_text)
 
     def _check_typescript(
         self, context: BaseLintContext, config: MagicNumberConfig
@@ -14,7 +14,7 @@ Dependencies: ast module for AST parsing and node types, analyzers.ast_utils
 
 Exports: PythonMagicNumberAnalyzer class
 
-Interfaces: PythonMagicNumberAnalyzer.find_numeric_literals(tree) -> list[tuple],
+Interfaces: PythonMagicNumberAnalyzer.find_numeric_literals(tree, parent_map) -> list[tuple],
     returns list of (node, parent, value, line_number) tuples
 
 Implementation: AST NodeVisitor pattern with parent tracking, filters for numeric Constant nodes
@@ -35,18 +35,19 @@ class PythonMagicNumberAnalyzer(ast.NodeVisitor):
         self.parent_map: dict[ast.AST, ast.AST] = {}
 
     def find_numeric_literals(
-        self, tree: ast.AST
+        self, tree: ast.AST, parent_map: dict[ast.AST, ast.AST] | None = None
     ) -> list[tuple[ast.Constant, ast.AST | None, Any, int]]:
         """Find all numeric literals in the AST.
 
         Args:
             tree: The AST to analyze
+            parent_map: Precomputed node-to-parent map for tree (built if omitted)
 
         Returns:
             List of tuples (node, parent, value, line_number)
         """
         self.numeric_literals = []
-        self.parent_map = build_parent_map(tree)
+        self.parent_map = parent_map if parent_map is not None else build_parent_map(tree)
         self.visit(tree)
         return self.numeric_literals
 
@@ -16,7 +16,7 @@ Exports: RustMagicNumberAnalyzer class with find_numeric_literals and context de
 
 Interfaces: find_numeric_literals(root_node) -> list[tuple], is_constant_definition(node)
 
-Implementation: Tree-sitter node traversal with visitor pattern, context-aware filtering
+Implementation: Literal lookup via walk_tree, context-aware filtering
 """
 
 from typing import Any
@@ -28,7 +28,7 @@ class RustMagicNumberAnalyzer(RustBaseAnalyzer):
     """Analyzes Rust code for magic numbers using tree-sitter."""
 
     # Node types that represent numeric literals in Rust
-    NUMERIC_LITERAL_TYPES = {"integer_literal", "float_literal"}
+    NUMERIC_LITERAL_TYPES = ("integer_literal", "float_literal")
 
     def find_numeric_literals(self, root_node: Any) -> list[tuple[Any, float | int, int]]:
         """Find all numeric literal nodes in Rust AST.
@@ -43,26 +43,11 @@ class RustMagicNumberAnalyzer(RustBaseAnalyzer):
             return []
 
         literals: list[tuple[Any, float | int, int]] = []
-        self._collect_numeric_literals(root_node, literals)
-        return literals
-
-    def _collect_numeric_literals(
-        self, node: Any, literals: list[tuple[Any, float | int, int]]
-    ) -> None:
-        """Recursively collect numeric literals from AST.
-
-        Args:
-            node: Current tree-sitter node
-            literals: List to accumulate found literals
-        """
-        if node.type in self.NUMERIC_LITERAL_TYPES:
+        for node in self.walk_tree(root_node, self.NUMERIC_LITERAL_TYPES):
             value = self._extract_numeric_value(node)
             if value is not None:
-                line_number = node.start_point[0] + 1
-                literals.append((node, value, line_number))
-
-        for child in node.children:
-            self._collect_numeric_literals(child, literals)
+                literals.append((node, value, node.start_point[0] + 1))
+        return literals
 
     def _extract_numeric_value(self, node: Any) -> float | int | None:
         """Extract numeric value from a literal node.
@@ -18,7 +18,7 @@ Exports: TypeScriptMagicNumberAnalyzer class with find_numeric_literals and cont
 Interfaces: find_numeric_literals(root_node) -> list[tuple], is_enum_context(node),
     is_constant_definition(node)
 
-Implementation: Tree-sitter node traversal with visitor pattern, context-aware filtering
+Implementation: Literal lookup via walk_tree, context-aware filtering
     for acceptable numeric literal locations
 
 Suppressions:
@@ -32,6 +32,8 @@ from src.analyzers.typescript_base import (
     TypeScriptBaseAnalyzer,
 )
 
+_NODE_TYPE_NUMBER = "number"
+
 
 class TypeScriptMagicNumberAnalyzer(TypeScriptBaseAnalyzer):  # thailint: ignore[srp]
     """Analyzes TypeScript/JavaScript code for magic numbers using Tree-sitter.
@@ -54,26 +56,11 @@ class TypeScriptMagicNumberAnalyzer(TypeScriptBaseAnalyzer):  # thailint: ignore
             return []
 
         literals: list[tuple[Node, float | int, int]] = []
-        self._collect_numeric_literals(root_node, literals)
-        return literals
-
-    def _collect_numeric_literals(
-        self, node: Node, literals: list[tuple[Node, float | int, int]]
-    ) -> None:
-        """Recursively collect numeric literals from AST.
-
-        Args:
-            node: Current tree-sitter node
-            literals: List to accumulate found literals
-        """
-        if node.type == "number":
+        for node in self.walk_tree(root_node, _NODE_TYPE_NUMBER):
             value = self._extract_numeric_value(node)
             if value is not None:
-                line_number = node.start_point[0] + 1
-                literals.append((node, value, line_number))
-
-        for child in node.children:
-            self._collect_numeric_literals(child, literals)
+                literals.append((node, value, node.start_point[0] + 1))
+        return literals
 
     def _extract_numeric_value(self, node: Node) -> float | int | None:
         """Extract numeric value from number node.
@@ -4,9 +4,9 @@ Purpose: TypeScript-specific ignore directive checking for magic numbers linter
 Scope: Ignore directive detection for TypeScript/JavaScript files
 
 Overview: Provides ignore directive checking functionality specifically for TypeScript and JavaScript
-    files in the magic numbers linter. Handles both thailint-style and noqa-style ignore comments
-    using TypeScript comment syntax (// instead of #). Extracted from linter.py to reduce file
-    size and improve modularity.
+    files in the magic numbers linter. thailint directives are answered by the shared ignore
+    parser; "// noqa" comments, which this rule also honors, are checked on the violation's line.
+    Extracted from linter.py to reduce file size and improve modularity.
 
 Dependencies: IgnoreDirectiveParser from src.linter_config.ignore, Violation type, violation_utils
 
@@ -46,36 +46,14 @@ class TypeScriptIgnoreChecker:
         return self._check_typescript_ignore(violation, context)
 
     def _check_typescript_ignore(self, violation: Violation, context: BaseLintContext) -> bool:
-        """Check for TypeScript-style ignore directives.
+        """Check for a "// noqa" comment, honored on top of thailint directives.
 
         Args:
             violation: Violation to check
             context: Lint context
 
         Returns:
-            True if line has ignore directive
+            True if the violation's line has a noqa comment
         """
         line_text = get_violation_line(violation, context)
-        if line_text is None:
-            return False
-
-        return self._has_typescript_ignore_directive(line_text)
-
-    def _has_typescript_ignore_directive(self, line_text: str) -> bool:
-        """Check if line has TypeScript-style ignore directive.
-
-        Args:
-            line_text: Line text to check
-
-        Returns:
-            True if has ignore directive
-        """
-        if "// thailint: ignore[magic-numbers]" in line_text:
-            return True
-
-        if "// thailint: ignore" in line_text:
-            after_ignore = line_text.split("// thailint: ignore")[1].split("//")[0]
-            if "[" not in after_ignore:
-                return True
-
-        return has_typescript_noqa(line_text)
+        return line_text is not None and has_typescript_noqa(line_text)
@@ -87,7 +87,7 @@ def _load_set_config(
     return default
 
 
-@dataclass
+@dataclass(frozen=True)
 class MethodPropertyConfig:  # thailint: ignore[dry]
     """Configuration for method-should-be-property linter."""
 
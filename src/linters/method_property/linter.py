@@ -12,7 +12,7 @@ Overview: Implements method-should-be-property linter rule following MultiLangua
     detection and non-Python languages gracefully.
 
 Dependencies: BaseLintContext and MultiLanguageLintRule from core, ast module, pathlib,
-    analyzer classes, config classes
+    analyzer classes, config classes, analyzers.ast_index
 
 Exports: MethodPropertyRule class implementing MultiLanguageLintRule interface
 
@@ -30,8 +30,9 @@ Suppressions:
 import ast
 from pathlib import Path
 
+from src.analyzers.ast_index import get_ast_index
 from src.core.base import BaseLintContext, MultiLanguageLintRule
-from src.core.linter_utils import load_linter_config
+from src.core.linter_utils import get_python_ast, load_linter_config
 from src.core.types import Violation
 
 from .config import MethodPropertyConfig
@@ -163,7 +164,7 @@ class MethodPropertyRule(MultiLanguageLintRule):  # thailint: ignore[srp,dry]
         if self._is_test_file(context.file_path):
             return []
 
-        tree = self._parse_python_code(context.file_content)
+        tree = get_python_ast(context)
         if tree is None:
             return []
 
@@ -194,20 +195,6 @@ class MethodPropertyRule(MultiLanguageLintRule):  # thailint: ignore[srp,dry]
             return candidates
         return [c for c in candidates if c.method_name not in config.ignore_methods]
 
-    def _parse_python_code(self, code: str | None) -> ast.AST | None:
-        """Parse Python code into AST.
-
-        Args:
-            code: Python source code
-
-        Returns:
-            AST or None if parse fails
-        """
-        try:
-            return ast.parse(code or "")
-        except SyntaxError:
-            return None
-
     def _collect_violations(
         self,
         candidates: list[PropertyCandidate],
@@ -314,7 +301,7 @@ class MethodPropertyRule(MultiLanguageLintRule):  # thailint: ignore[srp,dry]
         Returns:
             True if docstring has ignore directive
         """
-        tree = self._parse_python_code(context.file_content)
+        tree = get_python_ast(context)
         if tree is None:
             return False
 
@@ -354,10 +341,8 @@ class MethodPropertyRule(MultiLanguageLintRule):  # thailint: ignore[srp,dry]
         Returns:
             ClassDef node or None
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                return node
-        return None
+        classes = get_ast_index(tree).nodes(ast.ClassDef)
+        return next((node for node in classes if node.name == class_name), None)
 
     def _find_method_in_class(self, class_node: ast.ClassDef, method_name: str) -> str | None:
         """Find method docstring within a class.
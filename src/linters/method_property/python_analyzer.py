@@ -11,13 +11,15 @@ Overview: Provides PythonMethodAnalyzer class that traverses Python AST to find
     dunder methods, and async definitions. Returns structured data about each candidate including
     method name, class name, line number, and column for violation reporting.
 
-Dependencies: ast module for AST parsing and node types, config module for exclusion defaults
+Dependencies: ast module for AST parsing and node types, config module for exclusion defaults,
+    analyzers.ast_index for the shared node index
 
 Exports: PythonMethodAnalyzer class, PropertyCandidate dataclass
 
 Interfaces: find_property_candidates(tree) -> list[PropertyCandidate]
 
-Implementation: AST walk pattern with comprehensive method body analysis and exclusion checks
+Implementation: Class traversal with comprehensive method body analysis and exclusion checks;
+    method bodies are queried through the module's shared AST index instead of re-walked
 
 Suppressions:
     - srp: Analyzer class implements comprehensive exclusion rules requiring many helper methods.
@@ -27,6 +29,8 @@ Suppressions:
 import ast
 from dataclasses import dataclass
 
+from src.analyzers.ast_index import AstIndex, NodeT, get_ast_index
+
 from .config import DEFAULT_EXCLUDE_NAMES, DEFAULT_EXCLUDE_PREFIXES
 
 
@@ -62,6 +66,7 @@ class PythonMethodAnalyzer:  # thailint: ignore[srp]
         self.exclude_names = exclude_names or DEFAULT_EXCLUDE_NAMES
         self.candidates: list[PropertyCandidate] = []
         self._visited_classes: set[int] = set()
+        self._index: AstIndex | None = None
 
     def find_property_candidates(self, tree: ast.AST) -> list[PropertyCandidate]:
         """Find all methods that should be properties.
@@ -73,9 +78,17 @@ class PythonMethodAnalyzer:  # thailint: ignore[srp]
             List of PropertyCandidate objects
         """
         self.candidates = []
+        self._index = get_ast_index(tree)
         self._visit_classes(tree)
         return self.candidates
 
+    def _method_nodes(
+        self, method: ast.FunctionDef, node_type: type[NodeT] | tuple[type[NodeT], ...]
+    ) -> list[NodeT]:
+        """Get nodes of a type inside a method from the module's shared index."""
+        index = self._index or get_ast_index(method)
+        return index.nodes(node_type, within=method)
+
     def _visit_classes(self, tree: ast.AST) -> None:
         """Visit all top-level and nested classes in the AST.
 
@@ -350,7 +363,16 @@ class PythonMethodAnalyzer:  # thailint: ignore[srp]
         Returns:
             True if has side effects
         """
-        return any(self._is_side_effect_node(node) for node in ast.walk(method))
+        statements = self._method_nodes(method, self._SIDE_EFFECT_TYPES)
+        return any(self._is_side_effect_node(node) for node in statements)
+
+    # Statement types that can assign to or delete self attributes
+    _SIDE_EFFECT_TYPES: tuple[type[ast.stmt], ...] = (
+        ast.Assign,
+        ast.AugAssign,
+        ast.AnnAssign,
+        ast.Delete,
+    )
 
     def _is_side_effect_node(self, node: ast.AST) -> bool:
         """Check if a node represents a side effect.
@@ -434,7 +456,7 @@ class PythonMethodAnalyzer:  # thailint: ignore[srp]
         Returns:
             True if has complex control flow
         """
-        return any(isinstance(node, self._CONTROL_FLOW_TYPES) for node in ast.walk(method))
+        return bool(self._method_nodes(method, self._CONTROL_FLOW_TYPES))
 
     def _has_external_calls(self, method: ast.FunctionDef) -> bool:
         """Check if method has external function calls.
@@ -448,7 +470,7 @@ class PythonMethodAnalyzer:  # thailint: ignore[srp]
         Returns:
             True if has external calls
         """
-        call_nodes = (node for node in ast.walk(method) if isinstance(node, ast.Call))
+        call_nodes = self._method_nodes(method, ast.Call)
         return any(self._is_external_function_call(node) for node in call_nodes)
 
     def _is_external_function_call(self, call: ast.Call) -> bool:
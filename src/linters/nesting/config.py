@@ -26,7 +26,7 @@ from typing import Any
 DEFAULT_MAX_NESTING_DEPTH = 4
 
 
-@dataclass
+@dataclass(frozen=True)
 class NestingConfig:
     """Configuration for nesting depth linter."""
 
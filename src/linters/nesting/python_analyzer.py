@@ -12,7 +12,7 @@ Overview: Analyzes Python code to calculate maximum nesting depth using AST trav
     violation reporting. Provides helper method to find all function definitions in an AST tree
     for batch processing.
 
-Dependencies: ast module for Python parsing
+Dependencies: ast module for Python parsing, analyzers.ast_index for the shared node index
 
 Exports: PythonNestingAnalyzer class with calculate_max_depth method
 
@@ -23,6 +23,8 @@ Implementation: AST visitor pattern with depth tracking, elif detection via pare
 
 import ast
 
+from src.analyzers.ast_index import get_ast_index
+
 # Control structure types that increase nesting depth
 _CONTROL_STRUCTURES = (
     ast.For,
@@ -84,11 +86,7 @@ class PythonNestingAnalyzer:
         Returns:
             List of all FunctionDef and AsyncFunctionDef nodes found
         """
-        functions = []
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                functions.append(node)
-        return functions
+        return get_ast_index(tree).nodes((ast.FunctionDef, ast.AsyncFunctionDef))
 
 
 def _visit_node(
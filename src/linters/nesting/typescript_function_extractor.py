@@ -6,8 +6,9 @@ Scope: Identifies and extracts function metadata from tree-sitter nodes
 Overview: Provides function extraction functionality for TypeScript AST analysis. Extends
     TypeScriptBaseAnalyzer to reuse tree-sitter utilities. Handles multiple TypeScript
     function forms including function declarations, arrow functions, method definitions,
-    and function expressions. Extracts function name and node for each form. Recursively
-    collects all functions in an AST tree. Isolates function identification logic from
+    and function expressions. Extracts function name and node for each form. Collects all
+    functions in an AST tree with one walk_tree lookup over the function node types.
+    Isolates function identification logic from
     nesting depth calculation.
 
 Dependencies: TypeScriptBaseAnalyzer, tree-sitter
@@ -23,6 +24,9 @@ from typing import Any
 
 from src.analyzers.typescript_base import TypeScriptBaseAnalyzer
 
+# Node types extract_function_info recognizes
+_FUNCTION_NODE_TYPES = ("function_declaration", "arrow_function", "method_definition", "function")
+
 
 class TypeScriptFunctionExtractor(TypeScriptBaseAnalyzer):
     """Extracts function information from TypeScript AST nodes."""
@@ -36,23 +40,9 @@ class TypeScriptFunctionExtractor(TypeScriptBaseAnalyzer):
         Returns:
             List of (function_node, function_name) tuples
         """
-        functions: list[tuple[Any, str]] = []
-        self._collect_functions_recursive(root_node, functions)
-        return functions
-
-    def _collect_functions_recursive(self, node: Any, functions: list[tuple[Any, str]]) -> None:
-        """Recursively collect function nodes.
-
-        Args:
-            node: Current node to examine
-            functions: List to append found functions to
-        """
-        func_info = self.extract_function_info(node)
-        if func_info:
-            functions.append(func_info)
-
-        for child in node.children:
-            self._collect_functions_recursive(child, functions)
+        nodes = self.walk_tree(root_node, _FUNCTION_NODE_TYPES)
+        infos = (self.extract_function_info(node) for node in nodes)
+        return [info for info in infos if info]
 
     def extract_function_info(self, node: Any) -> tuple[Any, str] | None:
         """Extract function information if node is a function.
@@ -8,13 +8,15 @@ Overview: Analyzes Python code to detect string concatenation inside loops using
     Detects `result += str(item)` patterns inside for/while loops that indicate O(n²) complexity.
     Provides suggestions for using join() or list comprehension instead.
 
-Dependencies: ast module for Python parsing, constants module for shared patterns
+Dependencies: ast module for Python parsing, constants module for shared patterns,
+    analyzers.ast_index for the shared node index
 
 Exports: PythonStringConcatAnalyzer class with find_violations method
 
 Interfaces: find_violations(tree: ast.AST) -> list[dict] with violation info
 
-Implementation: AST visitor pattern detecting augmented assignments in loop contexts
+Implementation: Shared AST index queries for assignments and augmented assignments; each +='s
+    nearest enclosing for/while loop is found through the index's parent links
 
 Suppressions:
     - srp.violation: Class uses many small methods to achieve A-grade cyclomatic complexity.
@@ -24,6 +26,8 @@ Suppressions:
 import ast
 from dataclasses import dataclass
 
+from src.analyzers.ast_index import AstIndex, get_ast_index
+
 from .constants import STRING_VARIABLE_PATTERNS
 
 
@@ -59,21 +63,23 @@ class PythonStringConcatAnalyzer:
         self._string_variables = set()
         self._non_string_variables = set()
 
+        index = get_ast_index(tree)
+
         # First pass: identify variables initialized as strings or non-strings
-        self._identify_string_variables(tree)
+        self._identify_string_variables(index)
 
         # Second pass: find += in loops
-        self._find_concat_in_loops(tree, violations)
+        self._find_concat_in_loops(index, violations)
 
         return violations
 
-    def _identify_string_variables(self, tree: ast.AST) -> None:
+    def _identify_string_variables(self, index: AstIndex) -> None:
         """Identify variables that are initialized as strings or non-strings.
 
         Args:
-            tree: AST to analyze
+            index: Index of the AST to analyze
         """
-        for node in ast.walk(tree):
+        for node in index.nodes((ast.Assign, ast.AnnAssign)):
             self._process_assignment_node(node)
 
     def _process_assignment_node(self, node: ast.AST) -> None:
@@ -136,42 +142,24 @@ class PythonStringConcatAnalyzer:
         return isinstance(node, ast.Constant) and isinstance(node.value, (int, float))
 
     def _find_concat_in_loops(
-        self,
-        node: ast.AST,
-        violations: list[StringConcatViolation],
-        in_loop: str | None = None,
-        reset_vars: set[str] | None = None,
+        self, index: AstIndex, violations: list[StringConcatViolation]
     ) -> None:
-        """Recursively find string concatenation in loops.
+        """Find string concatenation whose nearest enclosing loop is a for or while loop.
 
         Args:
-            node: Current AST node
+            index: Index of the AST to analyze
             violations: List to append violations to
-            in_loop: Type of enclosing loop ('for' or 'while'), None if not in loop
-            reset_vars: Variables reset to string values in current loop body
         """
-        if reset_vars is None:
-            reset_vars = set()
-
-        # When entering a new loop, find variables reset in its body
-        loop_type = self._get_loop_type(node)
-        current_loop: str | None
-        current_reset_vars: set[str]
-        if loop_type:
-            # Find variables assigned to strings in this loop's body
-            loop_reset_vars = self._find_vars_reset_in_loop(node)
-            current_loop = loop_type
-            current_reset_vars = loop_reset_vars
-        else:
-            current_loop = in_loop
-            current_reset_vars = reset_vars
-
-        self._check_for_string_concat(node, violations, current_loop, current_reset_vars)
-
-        for child in ast.iter_child_nodes(node):
-            self._find_concat_in_loops(child, violations, current_loop, current_reset_vars)
-
-    def _get_loop_type(self, node: ast.AST) -> str | None:
+        # Variables reset to string values in each loop's body, computed once per loop
+        reset_vars_by_loop: dict[ast.AST | None, set[str]] = {}
+        for node in index.nodes(ast.AugAssign):
+            loop = index.ancestor(node, (ast.For, ast.While))
+            reset_vars = reset_vars_by_loop.get(loop)
+            if reset_vars is None:
+                reset_vars = reset_vars_by_loop[loop] = self._find_vars_reset_in_loop(loop)
+            self._check_for_string_concat(node, violations, self._get_loop_type(loop), reset_vars)
+
+    def _get_loop_type(self, node: ast.AST | None) -> str | None:
         """Get the loop type if node is a loop, else None."""
         if isinstance(node, ast.For):
             return "for"
@@ -179,14 +167,14 @@ class PythonStringConcatAnalyzer:
             return "while"
         return None
 
-    def _find_vars_reset_in_loop(self, loop_node: ast.AST) -> set[str]:
+    def _find_vars_reset_in_loop(self, loop_node: ast.AST | None) -> set[str]:
         """Find variables that are assigned to string values in a loop body.
 
         These variables are "reset" each iteration and should not be flagged
         for O(n²) string concatenation since they don't accumulate across iterations.
 
         Args:
-            loop_node: A For or While loop AST node
+            loop_node: A For or While loop AST node (None outside any loop)
 
         Returns:
             Set of variable names that are reset to strings in the loop body
@@ -9,14 +9,14 @@ Overview: Analyzes Python code to detect regex function calls inside loops using
     avoid false positives when compiled patterns are correctly used. Supports import
     variations including 'import re', 'from re import match', and 'import re as alias'.
 
-Dependencies: ast module for Python parsing
+Dependencies: ast module for Python parsing, analyzers.ast_index for the shared node index
 
 Exports: PythonRegexInLoopAnalyzer class with find_violations method
 
 Interfaces: find_violations(tree: ast.AST) -> list[RegexInLoopViolation]
 
-Implementation: AST visitor pattern detecting regex calls in loop contexts with compiled
-    pattern tracking
+Implementation: Shared AST index queries for imports, compiled patterns and calls; each call's
+    nearest enclosing for/while loop is found through the index's parent links
 
 Suppressions:
     - srp.violation: Class uses many small methods to achieve A-grade cyclomatic complexity.
@@ -26,6 +26,8 @@ Suppressions:
 import ast
 from dataclasses import dataclass
 
+from src.analyzers.ast_index import AstIndex, get_ast_index
+
 # Regex module functions that compile patterns on each call
 RE_FUNCTIONS = frozenset(
     {
@@ -75,22 +77,24 @@ class PythonRegexInLoopAnalyzer:
         self._re_aliases = {"re"}  # Default 're' is always valid
         self._direct_imports = set()
 
+        index = get_ast_index(tree)
+
         # First pass: identify imports and compiled patterns
-        self._identify_imports(tree)
-        self._identify_compiled_patterns(tree)
+        self._identify_imports(index)
+        self._identify_compiled_patterns(index)
 
         # Second pass: find regex calls in loops
-        self._find_regex_in_loops(tree, violations)
+        self._find_regex_in_loops(index, violations)
 
         return violations
 
-    def _identify_imports(self, tree: ast.AST) -> None:
+    def _identify_imports(self, index: AstIndex) -> None:
         """Identify re module imports and aliases.
 
         Args:
-            tree: AST to analyze
+            index: Index of the AST to analyze
         """
-        for node in ast.walk(tree):
+        for node in index.nodes((ast.Import, ast.ImportFrom)):
             self._process_import_node(node)
 
     def _process_import_node(self, node: ast.AST) -> None:
@@ -121,13 +125,13 @@ class PythonRegexInLoopAnalyzer:
         imported_name = alias.asname or alias.name
         self._direct_imports.add(imported_name)
 
-    def _identify_compiled_patterns(self, tree: ast.AST) -> None:
+    def _identify_compiled_patterns(self, index: AstIndex) -> None:
         """Identify variables assigned from re.compile().
 
         Args:
-            tree: AST to analyze
+            index: Index of the AST to analyze
         """
-        for node in ast.walk(tree):
+        for node in index.nodes((ast.Assign, ast.AnnAssign)):
             self._check_for_compile_assignment(node)
 
     def _check_for_compile_assignment(self, node: ast.AST) -> None:
@@ -183,26 +187,20 @@ class PythonRegexInLoopAnalyzer:
             return func.value.id in self._re_aliases
         return False
 
-    def _find_regex_in_loops(
-        self,
-        node: ast.AST,
-        violations: list[RegexInLoopViolation],
-        in_loop: str | None = None,
-    ) -> None:
-        """Recursively find regex calls in loops.
+    def _find_regex_in_loops(self, index: AstIndex, violations: list[RegexInLoopViolation]) -> None:
+        """Find regex calls whose nearest enclosing loop is a for or while loop.
 
         Args:
-            node: Current AST node
+            index: Index of the AST to analyze
             violations: List to append violations to
-            in_loop: Type of enclosing loop ('for' or 'while'), None if not in loop
         """
-        current_loop = self._get_loop_type(node) or in_loop
-        self._check_for_regex_call(node, violations, current_loop)
-
-        for child in ast.iter_child_nodes(node):
-            self._find_regex_in_loops(child, violations, current_loop)
+        if not index.nodes((ast.For, ast.While)):
+            return
+        for call in index.nodes(ast.Call):
+            loop = index.ancestor(call, (ast.For, ast.While))
+            self._check_for_regex_call(call, violations, self._get_loop_type(loop))
 
-    def _get_loop_type(self, node: ast.AST) -> str | None:
+    def _get_loop_type(self, node: ast.AST | None) -> str | None:
         """Get the loop type if node is a loop, else None."""
         if isinstance(node, ast.For):
             return "for"
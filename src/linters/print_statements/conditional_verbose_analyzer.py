@@ -10,17 +10,20 @@ Overview: Provides ConditionalVerboseAnalyzer class that traverses Python AST to
     various verbose condition patterns including simple names, attribute access, dict access, and
     method calls on context objects.
 
-Dependencies: ast module for AST parsing and node types
+Dependencies: ast module for AST parsing and node types, analyzers.ast_index for the shared
+    node index
 
 Exports: ConditionalVerboseAnalyzer class, is_verbose_condition function, is_logger_call function
 
 Interfaces: find_conditional_verbose_calls(tree) -> list[tuple[If, Call, int]]
 
-Implementation: AST walk pattern with condition matching for verbose patterns and logger call detection
+Implementation: Shared AST index queries with condition matching for verbose patterns and logger call detection
 """
 
 import ast
 
+from src.analyzers.ast_index import AstIndex, get_ast_index
+
 # Logger methods that indicate a logging call
 LOGGER_METHODS = frozenset({"debug", "info", "warning", "error", "critical", "log", "exception"})
 
@@ -156,23 +159,20 @@ class ConditionalVerboseAnalyzer:
         Returns:
             List of tuples (if_node, call_node, logger_method, line_number)
         """
-        verbose_if_nodes = (
-            node
-            for node in ast.walk(tree)
-            if isinstance(node, ast.If) and is_verbose_condition(node.test)
-        )
+        index = get_ast_index(tree)
+        verbose_if_nodes = (node for node in index.nodes(ast.If) if is_verbose_condition(node.test))
 
         results: list[tuple[ast.If, ast.Call, str, int]] = []
         for if_node in verbose_if_nodes:
-            results.extend(self._extract_logger_call_results(if_node))
+            results.extend(self._extract_logger_call_results(index, if_node))
 
         return results
 
     def _extract_logger_call_results(
-        self, if_node: ast.If
+        self, index: AstIndex, if_node: ast.If
     ) -> list[tuple[ast.If, ast.Call, str, int]]:
         """Extract logger call results from a verbose if node."""
-        logger_calls = self._find_logger_calls_in_body(if_node.body)
+        logger_calls = self._find_logger_calls_in_body(index, if_node.body)
         return [
             (
                 if_node,
@@ -183,18 +183,14 @@ class ConditionalVerboseAnalyzer:
             for call_node in logger_calls
         ]
 
-    def _find_logger_calls_in_body(self, body: list[ast.stmt]) -> list[ast.Call]:
+    def _find_logger_calls_in_body(self, index: AstIndex, body: list[ast.stmt]) -> list[ast.Call]:
         """Find all logger calls in a list of statements.
 
         Args:
+            index: Index of the tree containing the statements
             body: List of AST statements
 
         Returns:
             List of Call nodes that are logger calls
         """
-        logger_calls: list[ast.Call] = []
-        for stmt in body:
-            for node in ast.walk(stmt):
-                if isinstance(node, ast.Call) and is_logger_call(node):
-                    logger_calls.append(node)
-        return logger_calls
+        return [node for node in index.nodes(ast.Call, within=body) if is_logger_call(node)]
@@ -24,7 +24,12 @@ import ast
 
 from src.core.base import BaseLintContext, BaseLintRule
 from src.core.constants import Language
-from src.core.linter_utils import has_file_content, is_ignored_path, load_linter_config
+from src.core.linter_utils import (
+    get_python_ast,
+    has_file_content,
+    is_ignored_path,
+    load_linter_config,
+)
 from src.core.types import Violation
 from src.core.violation_utils import get_violation_line, has_python_noqa
 from src.linter_config.ignore import get_ignore_parser
@@ -55,6 +60,11 @@ class ConditionalVerboseRule(BaseLintRule):
         """Description of what this rule checks."""
         return "Conditional verbose logging should use log level configuration instead"
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Python only."""
+        return frozenset({Language.PYTHON})
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for conditional verbose logging violations.
 
@@ -69,7 +79,7 @@ class ConditionalVerboseRule(BaseLintRule):
         if not self._should_analyze(context):
             return []
 
-        tree = self._parse_python_code(context.file_content)
+        tree = get_python_ast(context)
         if tree is None:
             return []
 
@@ -139,13 +149,6 @@ class ConditionalVerboseRule(BaseLintRule):
             return False
         return is_ignored_path(str(context.file_path), config.ignore)
 
-    def _parse_python_code(self, code: str | None) -> ast.AST | None:
-        """Parse Python code into AST."""
-        try:
-            return ast.parse(code or "")
-        except SyntaxError:
-            return None
-
     def _collect_violations(
         self,
         conditional_calls: list[tuple[ast.If, ast.Call, str, int]],
@@ -210,32 +213,17 @@ class ConditionalVerboseRule(BaseLintRule):
         """
         if self._ignore_parser.should_ignore_violation(violation, context.file_content or ""):
             return True
-        return self._check_generic_ignore(violation, context)
+        return self._has_noqa(violation, context)
 
-    def _check_generic_ignore(self, violation: Violation, context: BaseLintContext) -> bool:
-        """Check for generic ignore directives.
+    def _has_noqa(self, violation: Violation, context: BaseLintContext) -> bool:
+        """Check for a "# noqa" comment, honored by this rule on top of thailint directives.
 
         Args:
             violation: Violation to check
             context: Lint context
 
         Returns:
-            True if line has generic ignore directive
+            True if the violation's line has a noqa comment
         """
         line_text = get_violation_line(violation, context)
-        if line_text is None:
-            return False
-        return self._has_generic_ignore_directive(line_text)
-
-    def _has_generic_ignore_directive(self, line_text: str) -> bool:
-        """Check if line has generic ignore directive."""
-        if self._has_generic_thailint_ignore(line_text):
-            return True
-        return has_python_noqa(line_text)
-
-    def _has_generic_thailint_ignore(self, line_text: str) -> bool:
-        """Check for generic thailint: ignore (no brackets)."""
-        if "# thailint: ignore" not in line_text:
-            return False
-        after_ignore = line_text.split("# thailint: ignore")[1].split("#")[0]
-        return "[" not in after_ignore
+        return line_text is not None and has_python_noqa(line_text)
@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class PrintStatementConfig:
     """Configuration for print statements linter."""
 
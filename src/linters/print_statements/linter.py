@@ -31,7 +31,7 @@ Suppressions:
 import ast
 
 from src.core.base import BaseLintContext, MultiLanguageLintRule
-from src.core.linter_utils import load_linter_config
+from src.core.linter_utils import get_python_ast, get_python_parent_map, load_linter_config
 from src.core.types import Violation
 from src.core.violation_utils import get_violation_line, has_python_noqa, has_typescript_noqa
 from src.linter_config.ignore import get_ignore_parser
@@ -120,21 +120,14 @@ class PrintStatementRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         Returns:
             List of violations found in Python code
         """
-        tree = self._parse_python_code(context.file_content)
+        tree = get_python_ast(context)
         if tree is None:
             return []
 
         analyzer = PythonPrintStatementAnalyzer()
-        print_calls = analyzer.find_print_calls(tree)
+        print_calls = analyzer.find_print_calls(tree, get_python_parent_map(context))
         return self._collect_python_violations(print_calls, context, config, analyzer)
 
-    def _parse_python_code(self, code: str | None) -> ast.AST | None:
-        """Parse Python code into AST."""
-        try:
-            return ast.parse(code or "")
-        except SyntaxError:
-            return None
-
     def _collect_python_violations(
         self,
         print_calls: list,
@@ -207,35 +200,20 @@ class PrintStatementRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         """
         if self._ignore_parser.should_ignore_violation(violation, context.file_content or ""):
             return True
-        return self._check_generic_ignore(violation, context)
+        return self._has_noqa(violation, context)
 
-    def _check_generic_ignore(self, violation: Violation, context: BaseLintContext) -> bool:
-        """Check for generic ignore directives.
+    def _has_noqa(self, violation: Violation, context: BaseLintContext) -> bool:
+        """Check for a "# noqa" comment, honored by this rule on top of thailint directives.
 
         Args:
             violation: Violation to check
             context: Lint context
 
         Returns:
-            True if line has generic ignore directive
+            True if the violation's line has a noqa comment
         """
         line_text = get_violation_line(violation, context)
-        if line_text is None:
-            return False
-        return self._has_generic_ignore_directive(line_text)
-
-    def _has_generic_ignore_directive(self, line_text: str) -> bool:
-        """Check if line has generic ignore directive."""
-        if self._has_generic_thailint_ignore(line_text):
-            return True
-        return has_python_noqa(line_text)
-
-    def _has_generic_thailint_ignore(self, line_text: str) -> bool:
-        """Check for generic thailint: ignore (no brackets)."""
-        if "# thailint: ignore" not in line_text:
-            return False
-        after_ignore = line_text.split("# thailint: ignore")[1].split("#")[0]
-        return "[" not in after_ignore
+        return line_text is not None and has_python_noqa(line_text)
 
     def _check_typescript(
         self, context: BaseLintContext, config: PrintStatementConfig
@@ -337,35 +315,14 @@ class PrintStatementRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         return self._check_typescript_ignore(violation, context)
 
     def _check_typescript_ignore(self, violation: Violation, context: BaseLintContext) -> bool:
-        """Check for TypeScript-style ignore directives.
+        """Check for a "// noqa" comment, honored on top of thailint directives.
 
         Args:
             violation: Violation to check
             context: Lint context
 
         Returns:
-            True if line has ignore directive
+            True if the violation's line has a noqa comment
         """
         line_text = get_violation_line(violation, context)
-        if line_text is None:
-            return False
-        return self._has_typescript_ignore_directive(line_text)
-
-    def _has_typescript_ignore_directive(self, line_text: str) -> bool:
-        """Check if line has TypeScript-style ignore directive.
-
-        Args:
-            line_text: Line text to check
-
-        Returns:
-            True if has ignore directive
-        """
-        if "// thailint: ignore[print-statements]" in line_text:
-            return True
-
-        if "// thailint: ignore" in line_text:
-            after_ignore = line_text.split("// thailint: ignore")[1].split("//")[0]
-            if "[" not in after_ignore:
-                return True
-
-        return has_typescript_noqa(line_text)
+        return line_text is not None and has_typescript_noqa(line_text)
@@ -4,23 +4,25 @@ Purpose: Python AST analysis for finding print() call nodes
 Scope: Python print() statement detection and __main__ block context analysis
 
 Overview: Provides PythonPrintStatementAnalyzer class that traverses Python AST to find all
-    print() function calls. Uses ast.walk() to traverse the syntax tree and collect
-    Call nodes where the function is 'print'. Tracks parent nodes to detect if print calls
+    print() function calls. Queries the module's shared AST index for Call nodes and keeps
+    those where the function is 'print'. Tracks parent nodes to detect if print calls
     are within __main__ blocks (if __name__ == "__main__":) for allow_in_scripts filtering.
     Returns structured data about each print call including the AST node, parent context,
     and line number for violation reporting. Handles both simple print() and builtins.print() calls.
 
-Dependencies: ast module for AST parsing and node types, analyzers.ast_utils
+Dependencies: ast module for AST parsing and node types, analyzers.ast_utils,
+    analyzers.ast_index
 
 Exports: PythonPrintStatementAnalyzer class, is_print_call function, is_main_if_block function
 
 Interfaces: find_print_calls(tree) -> list[tuple[Call, AST | None, int]], is_in_main_block(node) -> bool
 
-Implementation: AST walk pattern with parent map for context detection and __main__ block identification
+Implementation: Shared AST index lookup with parent map for context detection and __main__ block identification
 """
 
 import ast
 
+from src.analyzers.ast_index import get_ast_index
 from src.analyzers.ast_utils import build_parent_map
 
 # --- Pure helper functions for print call detection ---
@@ -109,28 +111,31 @@ class PythonPrintStatementAnalyzer:
         self.print_calls: list[tuple[ast.Call, ast.AST | None, int]] = []
         self.parent_map: dict[ast.AST, ast.AST] = {}
 
-    def find_print_calls(self, tree: ast.AST) -> list[tuple[ast.Call, ast.AST | None, int]]:
+    def find_print_calls(
+        self, tree: ast.AST, parent_map: dict[ast.AST, ast.AST] | None = None
+    ) -> list[tuple[ast.Call, ast.AST | None, int]]:
         """Find all print() calls in the AST.
 
         Args:
             tree: The AST to analyze
+            parent_map: Precomputed node-to-parent map for tree (built if omitted)
 
         Returns:
             List of tuples (node, parent, line_number)
         """
         self.print_calls = []
-        self.parent_map = build_parent_map(tree)
+        self.parent_map = parent_map if parent_map is not None else build_parent_map(tree)
         self._collect_print_calls(tree)
         return self.print_calls
 
     def _collect_print_calls(self, tree: ast.AST) -> None:
-        """Walk tree and collect all print() calls.
+        """Collect all print() calls in the tree.
 
         Args:
-            tree: AST to traverse
+            tree: AST to search
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call) and is_print_call(node):
+        for node in get_ast_index(tree).nodes(ast.Call):
+            if is_print_call(node):
                 parent = self.parent_map.get(node)
                 line_number = node.lineno if hasattr(node, "lineno") else 0
                 self.print_calls.append((node, parent, line_number))
@@ -55,28 +55,12 @@ class TypeScriptPrintStatementAnalyzer(TypeScriptBaseAnalyzer):
             return []
 
         calls: list[tuple[Node, str, int]] = []
-        self._collect_console_calls(root_node, methods, calls)
-        logger.debug("find_console_calls: found %d calls", len(calls))
-        return calls
-
-    def _collect_console_calls(
-        self, node: Node, methods: set[str], calls: list[tuple[Node, str, int]]
-    ) -> None:
-        """Recursively collect console.* calls from AST.
-
-        Args:
-            node: Current tree-sitter node
-            methods: Set of console method names to detect
-            calls: List to accumulate found calls
-        """
-        if node.type == "call_expression":
+        for node in self.walk_tree(root_node, "call_expression"):
             method_name = self._extract_console_method(node, methods)
             if method_name is not None:
-                line_number = node.start_point[0] + 1
-                calls.append((node, method_name, line_number))
-
-        for child in node.children:
-            self._collect_console_calls(child, methods, calls)
+                calls.append((node, method_name, node.start_point[0] + 1))
+        logger.debug("find_console_calls: found %d calls", len(calls))
+        return calls
 
     def _extract_console_method(self, node: Node, methods: set[str]) -> str | None:
         """Extract console method name if this is a console.* call.
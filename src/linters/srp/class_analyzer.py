@@ -21,6 +21,7 @@ import ast
 from typing import Any
 
 from src.core.base import BaseLintContext
+from src.core.linter_utils import get_context_python_source
 from src.core.types import Severity, Violation
 
 from .config import SRPConfig
@@ -139,10 +140,10 @@ class ClassAnalyzer:
         Returns:
             AST if successful, list of syntax error violations otherwise
         """
-        try:
-            return ast.parse(context.file_content or "")
-        except SyntaxError as exc:
-            return [self._create_syntax_error_violation(exc, context)]
+        source = get_context_python_source(context)
+        if source.syntax_error is not None:
+            return [self._create_syntax_error_violation(source.syntax_error, context)]
+        return source.require_tree()
 
     def _create_syntax_error_violation(
         self, exc: SyntaxError, context: BaseLintContext
@@ -28,7 +28,7 @@ DEFAULT_MAX_METHODS_PER_CLASS = 9
 DEFAULT_MAX_LOC_PER_CLASS = 200
 
 
-@dataclass
+@dataclass(frozen=True)
 class SRPConfig:
     """Configuration for SRP linter."""
 
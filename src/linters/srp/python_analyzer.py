@@ -11,18 +11,21 @@ Overview: Implements Python-specific SRP analysis using the ast module to parse
     calculation. Returns structured metric dictionaries that the main linter uses to create
     violations. Handles nested classes by analyzing all classes in the tree.
 
-Dependencies: ast module for Python AST parsing, typing for type hints, heuristics module
+Dependencies: ast module for Python AST parsing, typing for type hints, heuristics module,
+    analyzers.ast_index for the shared node index
 
 Exports: find_all_classes function, analyze_class function, PythonSRPAnalyzer class (compat)
 
 Interfaces: find_all_classes(tree), analyze_class(class_node, source, config)
 
-Implementation: AST walking pattern, metric collection, integration with heuristics module
+Implementation: Shared AST index lookup, metric collection, integration with heuristics module
 """
 
 import ast
 from typing import Any
 
+from src.analyzers.ast_index import get_ast_index
+
 from .config import SRPConfig
 from .heuristics import count_loc, count_methods, has_responsibility_keyword
 
@@ -36,11 +39,7 @@ def find_all_classes(tree: ast.AST) -> list[ast.ClassDef]:
     Returns:
         List of all class definition nodes
     """
-    classes = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            classes.append(node)
-    return classes
+    return get_ast_index(tree).nodes(ast.ClassDef)
 
 
 def analyze_class(class_node: ast.ClassDef, source: str, config: SRPConfig) -> dict[str, Any]:
@@ -23,7 +23,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class StatelessClassConfig:
     """Configuration for stateless-class linter."""
 
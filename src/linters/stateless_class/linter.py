@@ -32,7 +32,7 @@ from collections.abc import Callable
 
 from src.core.base import BaseLintContext, BaseLintRule
 from src.core.constants import HEADER_SCAN_LINES, IgnoreDirective, Language
-from src.core.linter_utils import is_ignored_path
+from src.core.linter_utils import get_python_index, is_ignored_path
 from src.core.types import Severity, Violation
 from src.linter_config.ignore import get_ignore_parser
 from src.linter_config.rule_matcher import rule_matches
@@ -69,6 +69,11 @@ class StatelessClassRule(BaseLintRule):  # thailint: ignore[srp,dry]
         """Description of what this rule checks."""
         return "Classes without state should be refactored to module-level functions"
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Python only."""
+        return frozenset({Language.PYTHON})
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for stateless class violations.
 
@@ -253,11 +258,10 @@ class StatelessClassRule(BaseLintRule):  # thailint: ignore[srp,dry]
         """
         if not context.file_content:
             return None
-        try:
-            tree = ast.parse(context.file_content)
-        except SyntaxError:
+        index = get_python_index(context)
+        if index is None:
             return None
-        return {node.name: node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)}
+        return {node.name: node for node in index.nodes(ast.ClassDef)}
 
     def _filter_test_classes(
         self, classes: list[ClassInfo], context: BaseLintContext
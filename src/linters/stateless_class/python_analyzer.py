@@ -10,19 +10,22 @@ Overview: Analyzes Python source code using AST to detect classes that have no
     with class-level attributes, test classes (Test* prefix or TestCase inheritance),
     and mixin classes (name contains "Mixin").
 
-Dependencies: Python AST module
+Dependencies: Python AST module, analyzers.ast_index for the shared node index
 
 Exports: analyze_code function, ClassInfo dataclass, is_test_class function
 
 Interfaces: analyze_code(code) -> list[ClassInfo] returning detected stateless classes,
     is_test_class(class_node) -> bool for test class detection
 
-Implementation: AST visitor pattern with focused helper functions for different checks
+Implementation: Shared AST index queries with focused helper functions for different checks
 """
 
 import ast
 from dataclasses import dataclass
 
+from src.analyzers.ast_index import AstIndex, get_ast_index
+from src.core.python_source import parse_python_source
+
 
 @dataclass
 class ClassInfo:
@@ -44,7 +47,7 @@ def analyze_code(code: str, min_methods: int = 2) -> list[ClassInfo]:
         List of detected stateless class info
     """
     try:
-        tree = ast.parse(code)
+        tree = parse_python_source(code)
     except SyntaxError:
         return []
 
@@ -61,33 +64,36 @@ def _find_stateless_classes(tree: ast.Module, min_methods: int = 2) -> list[Clas
     Returns:
         List of stateless class info
     """
-    results = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef) and _is_stateless(node, min_methods):
-            results.append(ClassInfo(node.name, node.lineno, node.col_offset))
-    return results
+    index = get_ast_index(tree)
+    return [
+        ClassInfo(node.name, node.lineno, node.col_offset)
+        for node in index.nodes(ast.ClassDef)
+        if _is_stateless(node, index, min_methods)
+    ]
 
 
-def _is_stateless(class_node: ast.ClassDef, min_methods: int = 2) -> bool:
+def _is_stateless(class_node: ast.ClassDef, index: AstIndex, min_methods: int = 2) -> bool:
     """Check if class is stateless and should be functions.
 
     Args:
         class_node: AST ClassDef node
+        index: Index of the tree containing the class
         min_methods: Minimum methods required to flag class
 
     Returns:
         True if class is stateless violation
     """
-    if _should_skip_class(class_node):
+    if _should_skip_class(class_node, index):
         return False
     return _count_methods(class_node) >= min_methods
 
 
-def _should_skip_class(class_node: ast.ClassDef) -> bool:
+def _should_skip_class(class_node: ast.ClassDef, index: AstIndex) -> bool:
     """Check if class should be skipped from analysis.
 
     Args:
         class_node: AST ClassDef node
+        index: Index of the tree containing the class
 
     Returns:
         True if class should be skipped
@@ -96,7 +102,7 @@ def _should_skip_class(class_node: ast.ClassDef) -> bool:
         _has_constructor(class_node)
         or _is_exception_case(class_node)
         or _has_class_attributes(class_node)
-        or _has_instance_attributes(class_node)
+        or _has_instance_attributes(class_node, index)
         or _has_base_classes(class_node)
     )
 
@@ -207,44 +213,45 @@ def _has_class_attributes(class_node: ast.ClassDef) -> bool:
     return any(isinstance(item, (ast.Assign, ast.AnnAssign)) for item in class_node.body)
 
 
-def _has_instance_attributes(class_node: ast.ClassDef) -> bool:
+def _has_instance_attributes(class_node: ast.ClassDef, index: AstIndex) -> bool:
     """Check if methods assign to self.attr.
 
     Args:
         class_node: AST ClassDef node
+        index: Index of the tree containing the class
 
     Returns:
         True if any method assigns to self
     """
     return any(
-        isinstance(item, ast.FunctionDef) and _method_has_self_assignment(item)
+        isinstance(item, ast.FunctionDef) and _method_has_self_assignment(item, index)
         for item in class_node.body
     )
 
 
-def _method_has_self_assignment(method: ast.FunctionDef) -> bool:
+def _method_has_self_assignment(method: ast.FunctionDef, index: AstIndex) -> bool:
     """Check if method assigns to self.attr.
 
     Args:
         method: AST FunctionDef node
+        index: Index of the tree containing the method
 
     Returns:
         True if method assigns to self
     """
-    return any(_is_self_attribute_assignment(node) for node in ast.walk(method))
+    assignments = index.nodes(ast.Assign, within=method)
+    return any(_is_self_attribute_assignment(node) for node in assignments)
 
 
-def _is_self_attribute_assignment(node: ast.AST) -> bool:
-    """Check if node is a self.attr assignment.
+def _is_self_attribute_assignment(node: ast.Assign) -> bool:
+    """Check if an assignment targets a self.attr.
 
     Args:
-        node: AST node to check
+        node: Assignment node to check
 
     Returns:
         True if node is self attribute assignment
     """
-    if not isinstance(node, ast.Assign):
-        return False
     return any(_is_self_attribute(t) for t in node.targets)
 
 
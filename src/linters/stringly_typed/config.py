@@ -9,13 +9,14 @@ Overview: Provides StringlyTypedConfig for customizing linter behavior including
     plain strings are used instead of proper enums or typed alternatives. Integrates with
     the orchestrator's configuration system to allow users to customize detection via
     .thailint.yaml configuration files. Follows the same configuration pattern as other
-    thai-lint linters.
+    thai-lint linters. index_fingerprint identifies the settings a persistent index depends on.
 
-Dependencies: dataclasses, typing
+Dependencies: dataclasses, json, typing
 
 Exports: StringlyTypedConfig dataclass, default constants
 
-Interfaces: StringlyTypedConfig.from_dict() class method for configuration loading
+Interfaces: StringlyTypedConfig.from_dict() class method for configuration loading,
+    StringlyTypedConfig.index_fingerprint() -> str
 
 Implementation: Dataclass with sensible defaults, validation in __post_init__, and config
     loading from dictionary with language-specific override support
@@ -24,6 +25,7 @@ Suppressions:
     - too-many-instance-attributes: Configuration dataclass with cohesive detection settings
 """
 
+import json
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -50,7 +52,7 @@ DEFAULT_IGNORE_PATTERNS: list[str] = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class StringlyTypedConfig:  # pylint: disable=too-many-instance-attributes
     """Configuration for stringly-typed linter.
 
@@ -87,7 +89,7 @@ class StringlyTypedConfig:  # pylint: disable=too-many-instance-attributes
     """Variable names to exclude from detection."""
 
     storage_mode: str = "memory"
-    """Storage mode - "memory" (default) or "tempfile"."""
+    """Storage mode - "memory" (default), "tempfile", or "persistent" (cross-run index)."""
 
     shared_db_path: str | None = None
     """Set by the orchestrator (not user-facing) when running under --parallel: an
@@ -108,6 +110,17 @@ class StringlyTypedConfig:  # pylint: disable=too-many-instance-attributes
                 f"min_values_for_enum ({self.min_values_for_enum})"
             )
 
+    def index_fingerprint(self) -> str:
+        """Fingerprint of the settings that decide which files a persistent index holds.
+
+        Extraction itself is not configurable, but the ignore patterns keep files out of
+        the index; stored rows are reused only while this is unchanged.
+
+        Returns:
+            Stable string identifying the index settings
+        """
+        return json.dumps({"ignore": sorted(self.ignore)})
+
     @classmethod
     def from_dict(
         cls, config: dict[str, Any], language: str | None = None
@@ -0,0 +1,55 @@
+"""
+Purpose: Process-independent hashes for stringly-typed storage
+
+Scope: String-set hashing for cross-file matching and whole-file content hashing for freshness
+
+Overview: Both hashes end up in SQLite storage that other processes read: --parallel workers
+    write to a shared store, and a persistent index is read by later CLI invocations. Python's
+    built-in hash() salts str hashing per process (PYTHONHASHSEED), so the same string set would
+    hash differently in each of them and never match. blake2b has no salt, so a string set
+    always gets the same string_set_hash, and a file's content_hash tells whether it changed
+    since it was indexed (StringlyTypedStorage.needs_rescan).
+
+Dependencies: hashlib, json
+
+Exports: compute_string_set_hash, compute_content_hash
+
+Interfaces: compute_string_set_hash(values) -> int, compute_content_hash(content) -> str
+
+Implementation: blake2b digests; the string-set digest is truncated to 8 bytes so it fits a
+    signed 64-bit SQLite INTEGER
+"""
+
+import hashlib
+import json
+
+# 8 bytes -> fits a signed 64-bit SQLite INTEGER
+_STRING_SET_DIGEST_SIZE = 8
+
+
+def compute_string_set_hash(values: set[str]) -> int:
+    """Compute consistent hash for a set of strings.
+
+    Args:
+        values: Set of string values to hash
+
+    Returns:
+        Hash value based on sorted, lowercased strings, identical in every process
+    """
+    normalized = json.dumps(sorted(s.lower() for s in values))
+    digest = hashlib.blake2b(
+        normalized.encode("utf-8"), digest_size=_STRING_SET_DIGEST_SIZE
+    ).digest()
+    return int.from_bytes(digest, byteorder="big", signed=True)
+
+
+def compute_content_hash(content: str) -> str:
+    """Compute a stable hash of a file's full content.
+
+    Args:
+        content: File content to hash
+
+    Returns:
+        Hex-encoded blake2b digest of the content
+    """
+    return hashlib.blake2b(content.encode("utf-8")).hexdigest()
@@ -6,17 +6,25 @@ Scope: StringlyTypedRule implementing MultiLanguageLintRule for cross-file patte
 Overview: Implements stringly-typed linter rule following MultiLanguageLintRule interface with
     cross-file detection using SQLite storage. Orchestrates pattern detection by delegating to
     language-specific analyzers (Python, TypeScript). During check() phase, patterns are collected
-    into storage. During finalize() phase, storage is queried for patterns appearing across
-    multiple files and violations are generated. Maintains minimal orchestration logic to comply
-    with SRP.
+    into storage; a Python file is parsed and traversed once for all pattern kinds
+    (PythonStringlyTypedAnalyzer.analyze_all), and each file's rows are stored in one transaction
+    that first deletes the rows it had before. During finalize() phase, storage is queried for
+    patterns appearing across multiple files and violations are generated. In persistent mode a file
+    whose content hash matches its indexed state is not re-analyzed: its stored rows already take
+    part in cross-file matching. Indexed files this run did not check only serve as the comparison
+    set: those a violation points at are verified first (reconcile_stale_files), and only violations
+    in checked files are reported. A changed-files run only needs to check the unchanged files
+    missing from the index. Maintains minimal orchestration logic to comply with SRP.
 
 Dependencies: MultiLanguageLintRule, BaseLintContext, PythonStringlyTypedAnalyzer,
-    StringlyTypedStorage, StorageInitializer, ViolationGenerator, StringlyTypedConfig
+    TypeScriptStringlyTypedAnalyzer, StringlyTypedStorage, StorageInitializer,
+    ViolationGenerator, StringlyTypedConfig, reconcile_stale_files, detect_language
 
 Exports: StringlyTypedRule class
 
 Interfaces: StringlyTypedRule.check(context) -> list[Violation],
-    StringlyTypedRule.finalize() -> list[Violation]
+    StringlyTypedRule.finalize() -> list[Violation],
+    StringlyTypedRule.select_unchanged_files(candidates) -> list[Path]
 
 Implementation: Two-phase pattern: check() stores data, finalize() generates violations.
     Delegates all logic to helper classes, maintains only orchestration and state.
@@ -29,39 +37,32 @@ Suppressions:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from src.core.base import BaseLintContext, MultiLanguageLintRule
-from src.core.linter_utils import load_linter_config
+from src.core.constants import Language, StorageMode
+from src.core.linter_utils import is_ignored_path, load_linter_config
 from src.core.types import Violation
+from src.orchestrator.language_detector import detect_language
 
 from .config import StringlyTypedConfig
+from .hashing import compute_content_hash, compute_string_set_hash
 from .python.analyzer import (
     AnalysisResult,
     ComparisonResult,
     FunctionCallResult,
     PythonStringlyTypedAnalyzer,
 )
+from .stale_file_reconciler import FileRows, reconcile_stale_files
 from .storage import StoredComparison, StoredFunctionCall, StoredPattern, StringlyTypedStorage
 from .storage_initializer import StorageInitializer
 from .typescript.analyzer import TypeScriptStringlyTypedAnalyzer
 from .violation_generator import ViolationGenerator
 
 
-def compute_string_set_hash(values: set[str]) -> int:
-    """Compute consistent hash for a set of strings.
-
-    Args:
-        values: Set of string values to hash
-
-    Returns:
-        Hash value based on sorted, lowercased strings
-    """
-    return hash(tuple(sorted(s.lower() for s in values)))
-
-
 def _is_ready_for_analysis(context: BaseLintContext, storage: StringlyTypedStorage | None) -> bool:
     """Check if context and storage are ready for analysis."""
     return bool(context.file_path and context.file_content and storage)
@@ -126,6 +127,27 @@ def _convert_to_stored_comparison(result: ComparisonResult) -> StoredComparison:
     )
 
 
+def _to_rows(
+    validations: list[AnalysisResult],
+    calls: list[FunctionCallResult],
+    comparisons: list[ComparisonResult],
+) -> FileRows:
+    """Convert a file's analysis results to the rows stored for it."""
+    return (
+        [_convert_to_stored_pattern(r) for r in validations],
+        [_convert_to_stored_function_call(r) for r in calls],
+        [_convert_to_stored_comparison(r) for r in comparisons],
+    )
+
+
+def _project_root_of(context: BaseLintContext) -> Path | None:
+    """Project root the orchestrator recorded in the context metadata, if any."""
+    metadata = getattr(context, "metadata", None)
+    if isinstance(metadata, dict) and metadata.get("_project_root"):
+        return Path(metadata["_project_root"])
+    return None
+
+
 @dataclass
 class StringlyTypedComponents:
     """Component dependencies for stringly-typed linter."""
@@ -150,6 +172,11 @@ class StringlyTypedRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         self._initialized = False
         self._config: StringlyTypedConfig | None = None
 
+        # Files checked this run, whether analyzed or reused unchanged from a persistent
+        # index: reported files outside this set are verified fresh before finalize() trusts
+        # their stored rows.
+        self._processed_files: set[str] = set()
+
         # Helper components grouped to reduce instance attributes
         self._helpers = StringlyTypedComponents(
             storage_initializer=StorageInitializer(),
@@ -209,8 +236,8 @@ class StringlyTypedRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         Returns:
             Empty list (violations generated in finalize)
         """
-        self._ensure_storage_initialized(config)
-        self._analyze_python_file(context, config)
+        self._ensure_storage_initialized(config, _project_root_of(context))
+        self._index_file(context, config)
         return []
 
     def _check_typescript(
@@ -225,62 +252,26 @@ class StringlyTypedRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         Returns:
             Empty list (violations generated in finalize)
         """
-        self._ensure_storage_initialized(config)
-        self._analyze_typescript_file(context, config)
+        self._ensure_storage_initialized(config, _project_root_of(context))
+        self._index_file(context, config)
         return []
 
-    def _analyze_typescript_file(
-        self, context: BaseLintContext, config: StringlyTypedConfig
-    ) -> None:
-        """Analyze TypeScript file and store patterns.
-
-        Uses single-parse optimization to avoid duplicate parsing overhead.
-
-        Args:
-            context: Lint context with file content
-            config: Stringly-typed configuration
-        """
-        if not self._should_analyze(context):
-            return
-        # _should_analyze ensures file_path and file_content are set
-        assert context.file_path is not None  # nosec B101
-        assert context.file_content is not None  # nosec B101
-
-        self._helpers.typescript_analyzer.config = config
-        call_results, comparison_results = self._helpers.typescript_analyzer.analyze_all(
-            context.file_content, context.file_path
-        )
-        self._store_typescript_results(call_results, comparison_results)
-
-    def _store_typescript_results(
-        self,
-        call_results: list[FunctionCallResult],
-        comparison_results: list[ComparisonResult],
+    def _ensure_storage_initialized(
+        self, config: StringlyTypedConfig, project_root: Path | None = None
     ) -> None:
-        """Store TypeScript analysis results.
-
-        Args:
-            call_results: Function call patterns found
-            comparison_results: Comparison patterns found
-        """
-        stored_calls = [_convert_to_stored_function_call(r) for r in call_results]
-        self._active_storage.add_function_calls(stored_calls)
-        stored_comparisons = [_convert_to_stored_comparison(r) for r in comparison_results]
-        self._active_storage.add_comparisons(stored_comparisons)
-
-    def _ensure_storage_initialized(self, config: StringlyTypedConfig) -> None:
         """Initialize storage and analyzers on first call.
 
         Args:
             config: Stringly-typed configuration
+            project_root: Project root, locating the persistent index
         """
         if not self._initialized:
-            self._storage = self._helpers.storage_initializer.initialize(config)
+            self._storage = self._helpers.storage_initializer.initialize(config, project_root)
             self._config = config
             self._initialized = True
 
-    def _analyze_python_file(self, context: BaseLintContext, config: StringlyTypedConfig) -> None:
-        """Analyze Python file and store patterns.
+    def _index_file(self, context: BaseLintContext, config: StringlyTypedConfig) -> None:
+        """Analyze a file and replace its stored rows, unless the index already holds them.
 
         Args:
             context: Lint context with file content
@@ -292,58 +283,62 @@ class StringlyTypedRule(MultiLanguageLintRule):  # thailint: ignore[srp]
         assert context.file_path is not None  # nosec B101
         assert context.file_content is not None  # nosec B101
 
-        file_path = context.file_path
-        file_content = context.file_content
-        self._helpers.python_analyzer.config = config
+        content_hash = compute_content_hash(context.file_content)
+        if not self._is_indexed_unchanged(context.file_path, content_hash, config):
+            self._helpers.python_analyzer.config = config
+            self._helpers.typescript_analyzer.config = config
+            rows = self._extract_rows(context.file_path, context.file_content, context.language)
+            if rows is not None:
+                self._active_storage.replace_file(context.file_path, content_hash, *rows)
+        self._processed_files.add(str(context.file_path))
+
+    def _is_indexed_unchanged(
+        self, file_path: Path, content_hash: str, config: StringlyTypedConfig
+    ) -> bool:
+        """Check whether a prior run already indexed this exact content (persistent mode).
+
+        Ephemeral modes start from an empty store, so the lookup is skipped.
+        """
+        if config.storage_mode != StorageMode.PERSISTENT:
+            return False
+        return not self._active_storage.needs_rescan(file_path, content_hash)
 
-        self._store_validation_patterns(file_content, file_path)
-        self._store_function_calls(file_content, file_path)
-        self._store_comparisons(file_content, file_path)
+    def _extract_rows(self, file_path: Path, content: str, language: str | None) -> FileRows | None:
+        """Analyze a file with its language's analyzer.
 
-    def _should_analyze(self, context: BaseLintContext) -> bool:
-        """Check if file should be analyzed.
+        A Python file is parsed and traversed once for all pattern kinds; the TypeScript
+        analyzer parses once for calls and comparisons.
 
         Args:
-            context: Lint context
+            file_path: Path to the file
+            content: File content
+            language: Language of the file
 
         Returns:
-            True if file should be analyzed
+            The file's patterns, function calls and comparisons, or None for a language
+            no analyzer handles
         """
-        return _is_ready_for_analysis(context, self._storage)
+        if language == Language.PYTHON:
+            return _to_rows(*self._helpers.python_analyzer.analyze_all(content, file_path))
+        if language in (Language.TYPESCRIPT, Language.JAVASCRIPT):
+            calls, comparisons = self._helpers.typescript_analyzer.analyze_all(content, file_path)
+            return _to_rows([], calls, comparisons)
+        return None
 
-    def _store_validation_patterns(self, file_content: str, file_path: Path) -> None:
-        """Analyze and store validation patterns.
+    def _extract_rows_for_path(self, file_path: Path, content: str) -> FileRows | None:
+        """Analyze a file this run did not check, detecting its language from the path."""
+        return self._extract_rows(file_path, content, detect_language(file_path))
 
-        Args:
-            file_content: Python source code
-            file_path: Path to file
-        """
-        results = self._helpers.python_analyzer.analyze(file_content, file_path)
-        self._active_storage.add_patterns([_convert_to_stored_pattern(r) for r in results])
-
-    def _store_function_calls(self, file_content: str, file_path: Path) -> None:
-        """Analyze and store function call patterns.
+    def _should_analyze(self, context: BaseLintContext) -> bool:
+        """Check if file should be analyzed.
 
         Args:
-            file_content: Python source code
-            file_path: Path to file
-        """
-        call_results = self._helpers.python_analyzer.analyze_function_calls(file_content, file_path)
-        stored_calls = [_convert_to_stored_function_call(r) for r in call_results]
-        self._active_storage.add_function_calls(stored_calls)
-
-    def _store_comparisons(self, file_content: str, file_path: Path) -> None:
-        """Analyze and store Python comparison patterns.
+            context: Lint context
 
-        Args:
-            file_content: Python source code
-            file_path: Path to file
+        Returns:
+            True if file should be analyzed
         """
-        comparison_results = self._helpers.python_analyzer.analyze_comparisons(
-            file_content, file_path
-        )
-        stored_comparisons = [_convert_to_stored_comparison(r) for r in comparison_results]
-        self._active_storage.add_comparisons(stored_comparisons)
+        return _is_ready_for_analysis(context, self._storage)
 
     def finalize(self) -> list[Violation]:
         """Generate violations after all files processed.
@@ -355,18 +350,78 @@ class StringlyTypedRule(MultiLanguageLintRule):  # thailint: ignore[srp]
             return []
 
         # Generate violations from cross-file patterns
-        violations = self._helpers.violation_generator.generate_violations(
-            self._storage, self.rule_id, self._config
-        )
+        violations = self._generate_violations()
+        if self._reconcile_reported_files(violations):
+            violations = self._generate_violations()
+        violations = self._filter_to_checked_files(violations)
 
         # Cleanup and reset state for next run
         self._storage.close()
         self._storage = None
         self._config = None
         self._initialized = False
+        self._processed_files = set()
 
         return violations
 
+    def _generate_violations(self) -> list[Violation]:
+        """Generate violations from the patterns currently in storage."""
+        assert self._config is not None  # nosec B101
+        return self._helpers.violation_generator.generate_violations(
+            self._active_storage, self.rule_id, self._config
+        )
+
+    def _reconcile_reported_files(self, violations: list[Violation]) -> bool:
+        """Verify freshness of reported files that were indexed by a prior run.
+
+        Only relevant in persistent mode: a file this run did not check may have changed
+        or been deleted since it was indexed. Ephemeral modes never need this - every row
+        in their store was written by this same run.
+
+        Returns:
+            True if a stale file was purged or re-extracted, so violations must be regenerated
+        """
+        assert self._config is not None  # nosec B101
+        if self._config.storage_mode != StorageMode.PERSISTENT:
+            return False
+        external = {
+            Path(v.file_path) for v in violations if v.file_path not in self._processed_files
+        }
+        return reconcile_stale_files(
+            self._active_storage, sorted(external), self._extract_rows_for_path
+        )
+
+    def _filter_to_checked_files(self, violations: list[Violation]) -> list[Violation]:
+        """Keep only violations in files this run checked (persistent mode).
+
+        A persistent index also holds files outside the requested paths; they take part in
+        matching as the comparison set but are not reported on, like DRYRule's finalize().
+        Ephemeral stores only hold this run's files, so there is nothing to drop.
+        """
+        assert self._config is not None  # nosec B101
+        if self._config.storage_mode != StorageMode.PERSISTENT:
+            return violations
+        return [v for v in violations if v.file_path in self._processed_files]
+
+    def select_unchanged_files(self, candidates: Sequence[Path]) -> list[Path]:
+        """Pick the unchanged files a changed-files run must check for cross-file patterns.
+
+        A persistent index already holds the rows of every file it has seen, and finalize()
+        re-verifies the reported ones, so only files missing from it are needed. Ephemeral
+        storage keeps nothing between runs, so it needs every candidate.
+        """
+        if self._config is None or self._storage is None:
+            return []  # No changed file reached the rule, so there is nothing to compare
+        if self._config.storage_mode != StorageMode.PERSISTENT:
+            return list(candidates)
+        indexed = self._active_storage.all_file_paths
+        ignore_patterns = self._config.ignore
+        return [
+            path
+            for path in candidates
+            if str(path) not in indexed and not is_ignored_path(str(path), ignore_patterns)
+        ]
+
     def get_parallel_shared_config(self, shared_dir: Path) -> dict[str, Any] | None:
         """Force a shared, on-disk store for the duration of one --parallel run.
 
@@ -10,16 +10,18 @@ Overview: Provides PythonStringlyTypedAnalyzer class that coordinates detection
     arguments. Returns unified AnalysisResult objects for validation patterns and
     FunctionCallResult objects for function calls. Handles AST parsing errors gracefully
     and provides a single entry point for Python analysis. Supports configuration options
-    for filtering and thresholds.
+    for filtering and thresholds. analyze_all returns all three result kinds from one parse
+    and one combined traversal (collect_patterns), for callers that need every kind.
 
 Dependencies: ast module, MembershipValidationDetector, ConditionalPatternDetector,
-    FunctionCallTracker, StringlyTypedConfig
+    FunctionCallTracker, ComparisonTracker, collect_patterns, StringlyTypedConfig
 
 Exports: PythonStringlyTypedAnalyzer class, AnalysisResult dataclass, FunctionCallResult dataclass,
     ComparisonResult dataclass
 
 Interfaces: PythonStringlyTypedAnalyzer.analyze(code, file_path) -> list[AnalysisResult],
-    PythonStringlyTypedAnalyzer.analyze_function_calls(code, file_path) -> list[FunctionCallResult]
+    PythonStringlyTypedAnalyzer.analyze_function_calls(code, file_path) -> list[FunctionCallResult],
+    PythonStringlyTypedAnalyzer.analyze_all(code, file_path) -> tuple of all three result lists
 
 Implementation: Facade pattern coordinating multiple detectors with unified result format
 
@@ -32,10 +34,13 @@ import ast
 from dataclasses import dataclass
 from pathlib import Path
 
+from src.core.python_source import parse_python_source
+
 from ..config import StringlyTypedConfig
 from .call_tracker import FunctionCallPattern, FunctionCallTracker
 from .comparison_tracker import ComparisonPattern, ComparisonTracker
 from .conditional_detector import ConditionalPatternDetector, EqualityChainPattern
+from .pattern_collector import collect_patterns
 from .validation_detector import MembershipPattern, MembershipValidationDetector
 
 
@@ -180,6 +185,34 @@ class PythonStringlyTypedAnalyzer:  # thailint: ignore[srp]
 
         return results
 
+    def analyze_all(
+        self, code: str, file_path: Path
+    ) -> tuple[list[AnalysisResult], list[FunctionCallResult], list[ComparisonResult]]:
+        """Analyze Python code for every stringly-typed pattern kind in a single pass.
+
+        Parses once and collects membership, conditional, call and comparison patterns in
+        one traversal; results match analyze, analyze_function_calls and
+        analyze_comparisons.
+
+        Args:
+            code: Python source code to analyze
+            file_path: Path to the file being analyzed
+
+        Returns:
+            Tuple of (validation_results, function_call_results, comparison_results)
+        """
+        tree = self._parse_code(code)
+        if tree is None:
+            return [], [], []
+        found = collect_patterns(tree)
+        validations = [self._convert_membership_pattern(p, file_path) for p in found.membership]
+        validations.extend(
+            self._convert_conditional_pattern(p, file_path) for p in found.conditional
+        )
+        calls = [self._convert_call_pattern(p, file_path) for p in found.calls]
+        comparisons = [self._convert_comparison_pattern(p, file_path) for p in found.comparisons]
+        return validations, calls, comparisons
+
     def _parse_code(self, code: str) -> ast.AST | None:
         """Parse Python source code into an AST.
 
@@ -190,7 +223,7 @@ class PythonStringlyTypedAnalyzer:  # thailint: ignore[srp]
             AST if parsing succeeds, None if parsing fails
         """
         try:
-            return ast.parse(code)
+            return parse_python_source(code)
         except SyntaxError:
             return None
 
@@ -15,7 +15,8 @@ Dependencies: ast module for AST parsing, dataclasses for pattern structure,
 
 Exports: FunctionCallTracker class, FunctionCallPattern dataclass
 
-Interfaces: FunctionCallTracker.find_patterns(tree) -> list[FunctionCallPattern]
+Interfaces: FunctionCallTracker.find_patterns(tree) -> list[FunctionCallPattern],
+    check_call(node) for callers that traverse the tree themselves
 
 Implementation: AST NodeVisitor pattern with Call node handling for string arguments
 
@@ -87,14 +88,19 @@ class FunctionCallTracker(ast.NodeVisitor):
         Args:
             node: The Call node to analyze
         """
-        function_name = self._extract_function_name(node.func)
-        if function_name is None:
-            self.generic_visit(node)
-            return
-
-        self._check_positional_args(node, function_name)
+        self.check_call(node)
         self.generic_visit(node)
 
+    def check_call(self, node: ast.Call) -> None:
+        """Record the string arguments of one Call node, without visiting its children.
+
+        Args:
+            node: The Call node to analyze
+        """
+        function_name = self._extract_function_name(node.func)
+        if function_name is not None:
+            self._check_positional_args(node, function_name)
+
     def _extract_function_name(self, func_node: ast.expr) -> str | None:
         """Extract the function name from a call expression.
 
@@ -14,7 +14,8 @@ Dependencies: ast module for AST parsing, dataclasses for pattern structure,
 
 Exports: ComparisonTracker class, ComparisonPattern dataclass
 
-Interfaces: ComparisonTracker.find_patterns(tree) -> list[ComparisonPattern]
+Interfaces: ComparisonTracker.find_patterns(tree) -> list[ComparisonPattern],
+    check_compare(node) for callers that traverse the tree themselves
 
 Implementation: AST NodeVisitor pattern with Compare node handling for string comparisons
 
@@ -107,9 +108,17 @@ class ComparisonTracker(ast.NodeVisitor):  # thailint: ignore[srp]
         Args:
             node: The Compare node to analyze
         """
-        self._check_comparison(node)
+        self.check_compare(node)
         self.generic_visit(node)
 
+    def check_compare(self, node: ast.Compare) -> None:
+        """Record the string comparison of one Compare node, without visiting its children.
+
+        Args:
+            node: The Compare node to analyze
+        """
+        self._check_comparison(node)
+
     def _check_comparison(self, node: ast.Compare) -> None:
         """Check if comparison is a string comparison to track.
 
@@ -15,7 +15,9 @@ Dependencies: ast module for AST parsing, dataclasses for pattern structure,
 
 Exports: ConditionalPatternDetector class, EqualityChainPattern dataclass
 
-Interfaces: ConditionalPatternDetector.find_patterns(tree) -> list[EqualityChainPattern]
+Interfaces: ConditionalPatternDetector.find_patterns(tree) -> list[EqualityChainPattern],
+    check_if(node), check_match(node) for callers that traverse the tree themselves (in
+    pre-order, so an if/elif chain is seen from its first If)
 
 Implementation: AST NodeVisitor pattern with If node chain traversal and Match statement handling
 
@@ -98,23 +100,39 @@ class ConditionalPatternDetector(ast.NodeVisitor):
     def visit_If(self, node: ast.If) -> None:  # pylint: disable=invalid-name
         """Visit an If node to check for equality chain patterns.
 
+        Args:
+            node: The If node to analyze
+        """
+        self.check_if(node)
+        self.generic_visit(node)
+
+    def check_if(self, node: ast.If) -> None:
+        """Record the equality chain starting at one If node, without visiting its children.
+
         Args:
             node: The If node to analyze
         """
         if id(node) not in self._processed_if_nodes:
             self._analyze_if_chain(node)
-        self.generic_visit(node)
 
     def visit_Match(self, node: ast.Match) -> None:  # pylint: disable=invalid-name
         """Visit a Match node to check for string case patterns.
 
+        Args:
+            node: The Match node to analyze
+        """
+        self.check_match(node)
+        self.generic_visit(node)
+
+    def check_match(self, node: ast.Match) -> None:
+        """Record the string cases of one Match node, without visiting its children.
+
         Args:
             node: The Match node to analyze
         """
         pattern = analyze_match_statement(node, EqualityChainPattern)
         if pattern is not None:
             self.patterns.append(pattern)
-        self.generic_visit(node)
 
     def _analyze_if_chain(self, node: ast.If) -> None:
         """Analyze an if/elif chain for equality patterns.
@@ -0,0 +1,81 @@
+"""
+Purpose: Collect every Python stringly-typed pattern of a file in one AST traversal
+
+Scope: Combined extraction pass over one parsed module for all four Python detectors
+
+Overview: Each detector (membership validation, conditional chains, function calls, string
+    comparisons) is an ast.NodeVisitor that walks the whole tree on its own, so analyzing a file
+    meant four full traversals with a visit_* lookup per node each. collect_patterns walks the
+    tree once, in the same pre-order NodeVisitor uses, and hands each Compare, If, Match and Call
+    node to the detectors interested in it through their per-node check_* methods. Results are
+    identical to running each detector's find_patterns, in the same order.
+
+Dependencies: ast, collections.abc, dataclasses, MembershipValidationDetector,
+    ConditionalPatternDetector, FunctionCallTracker, ComparisonTracker
+
+Exports: FilePatterns dataclass, collect_patterns
+
+Interfaces: collect_patterns(tree) -> FilePatterns
+
+Implementation: Explicit-stack pre-order traversal with a node-type dispatch table built per call
+    from fresh detector instances
+"""
+
+import ast
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .call_tracker import FunctionCallPattern, FunctionCallTracker
+from .comparison_tracker import ComparisonPattern, ComparisonTracker
+from .conditional_detector import ConditionalPatternDetector, EqualityChainPattern
+from .validation_detector import MembershipPattern, MembershipValidationDetector
+
+
+@dataclass
+class FilePatterns:
+    """Every pattern the Python detectors found in one file."""
+
+    membership: list[MembershipPattern]
+    conditional: list[EqualityChainPattern]
+    calls: list[FunctionCallPattern]
+    comparisons: list[ComparisonPattern]
+
+
+def collect_patterns(tree: ast.AST) -> FilePatterns:
+    """Run all four Python detectors over a tree in a single traversal.
+
+    Args:
+        tree: Parsed module
+
+    Returns:
+        The patterns each detector's find_patterns would return for the tree
+    """
+    membership = MembershipValidationDetector()
+    conditional = ConditionalPatternDetector()
+    calls = FunctionCallTracker()
+    comparisons = ComparisonTracker()
+    handlers: dict[type[ast.AST], tuple[Callable[[Any], None], ...]] = {
+        ast.Compare: (membership.check_compare, comparisons.check_compare),
+        ast.If: (conditional.check_if,),
+        ast.Match: (conditional.check_match,),
+        ast.Call: (calls.check_call,),
+    }
+    for node in _pre_order(tree):
+        for handle in handlers.get(type(node), ()):
+            handle(node)
+    return FilePatterns(
+        membership=membership.patterns,
+        conditional=conditional.patterns,
+        calls=calls.patterns,
+        comparisons=comparisons.patterns,
+    )
+
+
+def _pre_order(tree: ast.AST) -> Iterator[ast.AST]:
+    """Yield nodes in the order ast.NodeVisitor visits them."""
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
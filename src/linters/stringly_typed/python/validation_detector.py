@@ -15,7 +15,8 @@ Dependencies: ast module for AST parsing, dataclasses for pattern structure,
 
 Exports: MembershipValidationDetector class, MembershipPattern dataclass
 
-Interfaces: MembershipValidationDetector.find_patterns(tree) -> list[MembershipPattern]
+Interfaces: MembershipValidationDetector.find_patterns(tree) -> list[MembershipPattern],
+    check_compare(node) for callers that traverse the tree themselves
 
 Implementation: AST NodeVisitor pattern with Compare node handling for In/NotIn operators
 
@@ -85,12 +86,20 @@ class MembershipValidationDetector(ast.NodeVisitor):
         Handles Compare nodes with In or NotIn operators where the
         comparator is a literal collection of strings.
 
+        Args:
+            node: The Compare node to analyze
+        """
+        self.check_compare(node)
+        self.generic_visit(node)
+
+    def check_compare(self, node: ast.Compare) -> None:
+        """Record membership patterns of one Compare node, without visiting its children.
+
         Args:
             node: The Compare node to analyze
         """
         for op_index, operator in enumerate(node.ops):
             self._check_membership_operator(node, operator, op_index)
-        self.generic_visit(node)
 
     def _check_membership_operator(
         self, node: ast.Compare, operator: ast.cmpop, op_index: int
@@ -0,0 +1,79 @@
+"""
+Purpose: Freshness verification for files a persistent stringly-typed index reports on
+
+Scope: Reconciles reported files that were not part of this run's file list
+
+Overview: A persistent, cross-run index can report a violation in a file this run never
+    checked - it was indexed by a prior invocation, and its on-disk content may have changed
+    or been deleted since. Before such a report is trusted, each of those files is reconciled
+    against its current state: a file that no longer exists is purged so it can't produce
+    phantom violations, and one whose content hash no longer matches the index is re-extracted
+    so its rows reflect current content. Files this run checked directly are skipped - they
+    are already known-fresh.
+
+Dependencies: StringlyTypedStorage, compute_content_hash, pathlib.Path
+
+Exports: reconcile_stale_files function, FileRows and RowExtractor type aliases
+
+Interfaces: reconcile_stale_files(storage, file_paths, extract) -> bool
+
+Implementation: Module-level functions (no state to justify a class); extraction is delegated to
+    the rule through a callable, so the same analyzers index checked and reconciled files
+"""
+
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from .hashing import compute_content_hash
+from .storage import StoredComparison, StoredFunctionCall, StoredPattern, StringlyTypedStorage
+
+FileRows = tuple[list[StoredPattern], list[StoredFunctionCall], list[StoredComparison]]
+
+# Extracts a file's rows from its path and content; None when no analyzer handles the file
+RowExtractor = Callable[[Path, str], FileRows | None]
+
+
+def reconcile_stale_files(
+    storage: StringlyTypedStorage, file_paths: Iterable[Path], extract: RowExtractor
+) -> bool:
+    """Purge deleted files and re-extract changed ones before their rows are trusted.
+
+    Args:
+        storage: Storage backed by the persistent index
+        file_paths: Indexed files reported on that this run did not check
+        extract: Extracts a file's rows, for re-indexing a changed file
+
+    Returns:
+        True if any file was purged or re-extracted
+    """
+    changed = False
+    for file_path in file_paths:
+        changed = _reconcile_file(file_path, storage, extract) or changed
+    return changed
+
+
+def _reconcile_file(file_path: Path, storage: StringlyTypedStorage, extract: RowExtractor) -> bool:
+    """Purge a deleted file, or re-extract one whose content hash has drifted."""
+    content = _read_file(file_path)
+    if content is None:
+        storage.purge_file(file_path)
+        return True
+
+    content_hash = compute_content_hash(content)
+    if not storage.needs_rescan(file_path, content_hash):
+        return False
+
+    rows = extract(file_path, content)
+    if rows is None:
+        storage.purge_file(file_path)
+    else:
+        storage.replace_file(file_path, content_hash, *rows)
+    return True
+
+
+def _read_file(file_path: Path) -> str | None:
+    """Read a file's content, or None if it's missing/unreadable."""
+    try:
+        return file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
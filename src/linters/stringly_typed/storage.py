@@ -5,37 +5,52 @@ Purpose: SQLite storage manager for stringly-typed pattern detection
 Scope: String validation pattern storage, function call tracking, comparison tracking, and
     cross-file detection
 
-Overview: Implements in-memory or temporary-file SQLite storage for stringly-typed pattern
-    detection. Stores string validation patterns with hash values computed from the string
-    values, enabling cross-file duplicate detection during a single linter run. Also tracks
-    function calls with string arguments to detect parameters that should be enums. Tracks
-    scattered string comparisons (`var == "string"`) to detect variables compared to multiple
-    string values across files. Supports both :memory: mode (fast, RAM-only) and tempfile mode
-    (disk-backed for large projects). No persistence between runs - storage is cleared when
-    linter completes. Includes indexes for fast hash lookups enabling efficient cross-file
-    detection.
+Overview: Implements in-memory, temporary-file, or persistent SQLite storage for stringly-typed
+    pattern detection. Stores string validation patterns with hash values computed from the
+    string values, enabling cross-file duplicate detection. Also tracks function calls with
+    string arguments to detect parameters that should be enums. Tracks scattered string
+    comparisons (`var == "string"`) to detect variables compared to multiple string values
+    across files. "memory" (fast, RAM-only) and "tempfile" (disk-backed for large projects)
+    modes are cleared when the linter completes; "persistent" mode keeps the index on disk
+    between runs, so every file's rows are written through replace_file, which explicitly
+    deletes the file's old rows from every table before inserting new ones and records the
+    content hash they were extracted from (files table) in the same transaction. needs_rescan
+    compares that hash to the file's current content, purge_file drops a deleted file,
+    schema_meta rebuilds an on-disk file from another SCHEMA_VERSION, and index_settings
+    discards an index built under other settings. Includes indexes for fast hash lookups
+    enabling efficient cross-file detection. finalize-time reads go through the iter_*_groups
+    methods: one JOIN against a GROUP BY subquery per table, streamed from the cursor and
+    grouped in order, instead of a follow-up query per duplicate hash, function or variable.
 
 Dependencies: Python sqlite3 module (stdlib), tempfile module (stdlib), pathlib.Path,
-    dataclasses, json module (stdlib)
+    dataclasses, json module (stdlib), itertools.groupby
 
 Exports: StoredPattern dataclass, StoredFunctionCall dataclass, StoredComparison dataclass,
     StringlyTypedStorage class
 
-Interfaces: StringlyTypedStorage.__init__(storage_mode), add_pattern(pattern),
-    add_patterns(patterns), get_duplicate_hashes(min_files), get_patterns_by_hash(hash_value),
-    add_function_call(call), add_function_calls(calls), get_limited_value_functions(min_values,
-    max_values, min_files), get_calls_by_function(function_name, param_index),
-    add_comparison(comparison), add_comparisons(comparisons),
-    get_variables_with_multiple_values(min_values, min_files),
-    get_comparisons_by_variable(variable_name), get_all_comparisons(), clear(), close()
+Interfaces: StringlyTypedStorage.__init__(storage_mode, db_path), replace_file(file_path,
+    content_hash, patterns, calls, comparisons), needs_rescan(file_path, content_hash),
+    purge_file(file_path), reset_if_settings_changed(fingerprint), all_file_paths,
+    add_pattern(pattern), add_patterns(patterns), get_duplicate_hashes(min_files),
+    get_patterns_by_hash(hash_value), add_function_call(call), add_function_calls(calls),
+    get_limited_value_functions(min_values, max_values, min_files),
+    get_calls_by_function(function_name, param_index), add_comparison(comparison),
+    add_comparisons(comparisons), get_variables_with_multiple_values(min_values, min_files),
+    get_comparisons_by_variable(variable_name), get_all_comparisons(),
+    iter_duplicate_pattern_groups(min_files), iter_limited_value_function_groups(min_values,
+    max_values, min_files), iter_multi_value_variable_groups(min_values, min_files), clear(),
+    close()
 
 Implementation: SQLite with string_validations, function_calls, and string_comparisons tables,
-    indexed on string_set_hash, function_name+param_index, and variable_name for performance
+    indexed on string_set_hash, function_name+param_index, variable_name and file_path, plus
+    files, index_settings and schema_meta tables for the persistent index
 
 Suppressions:
     - too-many-lines: Storage module for three related data types with dataclasses, SQL schemas, and CRUD methods
     - too-many-instance-attributes: StoredPattern is a pure DTO with 8 necessary fields for SQLite storage
     - consider-using-with: NamedTemporaryFile must remain open for SQLite connection lifetime (closed in close())
+    - too-many-arguments,too-many-positional-arguments: replace_file takes a file's three row
+        lists together so they are written in one transaction
     - srp: Storage class manages SQLite for three pattern types (validations, calls, comparisons).
         Splitting would fragment related storage operations.
 """
@@ -45,7 +60,10 @@ from __future__ import annotations
 import json
 import sqlite3
 import tempfile
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 from src.core.constants import StorageMode
@@ -118,6 +136,41 @@ _CREATE_COMPARISONS_FILE_INDEX_SQL = (
     "CREATE INDEX IF NOT EXISTS idx_comparison_file ON string_comparisons(file_path)"
 )
 
+# Indexed files and the content hash each one's rows were extracted from
+_CREATE_FILES_TABLE_SQL = """CREATE TABLE IF NOT EXISTS files (
+    file_path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)"""
+
+# Fingerprint of the settings (see StringlyTypedConfig.index_fingerprint) the index was built
+# under - at most one row
+_CREATE_INDEX_SETTINGS_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS index_settings (fingerprint TEXT NOT NULL)"
+)
+
+_CREATE_SCHEMA_META_TABLE_SQL = "CREATE TABLE IF NOT EXISTS schema_meta (version INTEGER NOT NULL)"
+
+_SCHEMA_SQL = (
+    _CREATE_TABLE_SQL,
+    _CREATE_HASH_INDEX_SQL,
+    _CREATE_FILE_INDEX_SQL,
+    _CREATE_FUNCTION_CALLS_TABLE_SQL,
+    _CREATE_FUNCTION_PARAM_INDEX_SQL,
+    _CREATE_FUNCTION_FILE_INDEX_SQL,
+    _CREATE_COMPARISONS_TABLE_SQL,
+    _CREATE_COMPARISONS_VAR_INDEX_SQL,
+    _CREATE_COMPARISONS_FILE_INDEX_SQL,
+    _CREATE_FILES_TABLE_SQL,
+    _CREATE_INDEX_SETTINGS_TABLE_SQL,
+)
+
+# Tables holding rows extracted from one file, each keyed by file_path
+_FILE_ROW_TABLES = ("string_validations", "function_calls", "string_comparisons")
+
+# Every table dropped when an on-disk file has another SCHEMA_VERSION
+_APP_TABLES = (*_FILE_ROW_TABLES, "files", "index_settings")
+
 # Row index constants for function_calls query results
 _CALL_COL_FILE_PATH = 0
 _CALL_COL_LINE_NUMBER = 1
@@ -290,6 +343,9 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
     that appear across multiple files, enabling cross-file duplicate detection.
     """
 
+    # 1: first on-disk schema: files (content hashes), index_settings, schema_meta, and a
+    # string_set_hash that is stable across processes.
+    SCHEMA_VERSION = 1
     # Seconds to wait for a lock before raising "database is locked", when connecting
     # to a shared on-disk file that multiple --parallel worker processes write to.
     SHARED_DB_CONNECT_TIMEOUT = 30
@@ -298,51 +354,175 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
         """Initialize storage with SQLite database.
 
         Args:
-            storage_mode: Storage mode - "memory" (default) or "tempfile"
-            db_path: Explicit on-disk path to use for "tempfile" mode instead of a
-                random auto-deleting tempfile. Callers pass this to share one database
-                file across multiple processes (e.g. --parallel worker processes plus
-                the main process) for the duration of a single run - the file is not
-                managed/deleted by this class in that case. Ignored for "memory" mode.
+            storage_mode: Storage mode - "memory" (default), "tempfile", or "persistent"
+            db_path: Explicit on-disk path to connect to instead of a random
+                auto-deleting tempfile. Required for "persistent" mode. Callers also
+                pass this for "tempfile" mode to share one database file across
+                multiple processes (e.g. --parallel worker processes plus the main
+                process) for the duration of a single run. The file is not
+                managed/deleted by this class when db_path is given. Ignored for
+                "memory" mode.
         """
         self._storage_mode = storage_mode
-        self._tempfile = None
+        self._tempfile: tempfile._TemporaryFileWrapper[bytes] | None = None
 
         # Create SQLite connection based on storage mode
         if storage_mode == StorageMode.MEMORY:
             self._db = sqlite3.connect(":memory:")
-        elif storage_mode == StorageMode.TEMPFILE:
-            if db_path is not None:
-                db_path.parent.mkdir(parents=True, exist_ok=True)
-                self._db = sqlite3.connect(str(db_path), timeout=self.SHARED_DB_CONNECT_TIMEOUT)
-                # WAL mode lets multiple processes read/write the same file
-                # concurrently with far less lock-contention than the default
-                # rollback journal - needed now that this file can be shared
-                # across --parallel worker processes.
-                self._db.execute("PRAGMA journal_mode=WAL")
-                # NORMAL (vs the default FULL) skips fsync on every commit, only
-                # syncing at WAL checkpoints - WAL mode's own crash-recovery
-                # guarantees make this safe, and this file only lives for one run.
-                self._db.execute("PRAGMA synchronous=NORMAL")
-            else:
-                # pylint: disable=consider-using-with
-                self._tempfile = tempfile.NamedTemporaryFile(suffix=".db", delete=True)
-                self._db = sqlite3.connect(self._tempfile.name)
+        elif storage_mode in (StorageMode.TEMPFILE, StorageMode.PERSISTENT):
+            self._db = self._connect_on_disk(storage_mode, db_path)
         else:
             raise ValueError(f"Invalid storage_mode: {storage_mode}")
 
-        # Create schema inline
-        self._db.execute(_CREATE_TABLE_SQL)
-        self._db.execute(_CREATE_HASH_INDEX_SQL)
-        self._db.execute(_CREATE_FILE_INDEX_SQL)
-        self._db.execute(_CREATE_FUNCTION_CALLS_TABLE_SQL)
-        self._db.execute(_CREATE_FUNCTION_PARAM_INDEX_SQL)
-        self._db.execute(_CREATE_FUNCTION_FILE_INDEX_SQL)
-        self._db.execute(_CREATE_COMPARISONS_TABLE_SQL)
-        self._db.execute(_CREATE_COMPARISONS_VAR_INDEX_SQL)
-        self._db.execute(_CREATE_COMPARISONS_FILE_INDEX_SQL)
+        self._ensure_schema()
+
+    def _connect_on_disk(self, storage_mode: str, db_path: Path | None) -> sqlite3.Connection:
+        """Connect to an explicit on-disk file, or fall back to a random tempfile."""
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(db_path), timeout=self.SHARED_DB_CONNECT_TIMEOUT)
+            # WAL mode lets multiple processes read/write the same file concurrently with
+            # far less lock-contention than the default rollback journal - needed since
+            # this file can be shared across --parallel worker processes, or reopened by a
+            # later, unrelated CLI invocation in persistent mode.
+            db.execute("PRAGMA journal_mode=WAL")
+            # NORMAL (vs the default FULL) skips fsync on every commit, only syncing at
+            # WAL checkpoints - WAL mode's own crash-recovery guarantees make this safe,
+            # and replace_file() commits once per file.
+            db.execute("PRAGMA synchronous=NORMAL")
+            return db
+        if storage_mode == StorageMode.PERSISTENT:
+            raise ValueError("storage_mode='persistent' requires an explicit db_path")
+        # pylint: disable=consider-using-with
+        self._tempfile = tempfile.NamedTemporaryFile(suffix=".db", delete=True)
+        return sqlite3.connect(self._tempfile.name)
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, self-healing (drop and recreate) an incompatible on-disk one.
+
+        A persistent file written under another SCHEMA_VERSION is rebuilt from scratch
+        rather than queried with a shape it doesn't have.
+        """
+        self._db.execute(_CREATE_SCHEMA_META_TABLE_SQL)
+        row = self._db.execute("SELECT version FROM schema_meta").fetchone()
+        if row is not None and row[0] != self.SCHEMA_VERSION:
+            for table in _APP_TABLES:
+                self._db.execute(f"DROP TABLE IF EXISTS {table}")  # nosec B608 - fixed names
+        for statement in _SCHEMA_SQL:
+            self._db.execute(statement)
+        self._db.execute("DELETE FROM schema_meta")
+        self._db.execute("INSERT INTO schema_meta (version) VALUES (?)", (self.SCHEMA_VERSION,))
+        self._db.commit()
+
+    def reset_if_settings_changed(self, fingerprint: str) -> bool:
+        """Discard every indexed file if it was indexed with other settings.
+
+        A file's content_hash only says its text is unchanged; whether its rows belong in
+        the index at all also depends on settings such as the ignore patterns.
+        needs_rescan() can only be trusted once the index is known to match them.
+
+        Args:
+            fingerprint: Fingerprint of the index settings in effect for this run
+
+        Returns:
+            True if the index was cleared
+        """
+        row = self._db.execute("SELECT fingerprint FROM index_settings").fetchone()
+        if row is not None and row[0] == fingerprint:
+            return False
+        has_files = self._db.execute("SELECT 1 FROM files LIMIT 1").fetchone() is not None
+        if has_files:
+            self._delete_all_rows()
+        self._db.execute("DELETE FROM index_settings")
+        self._db.execute("INSERT INTO index_settings (fingerprint) VALUES (?)", (fingerprint,))
+        self._db.commit()
+        return has_files
+
+    def replace_file(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        file_path: Path,
+        content_hash: str,
+        patterns: list[StoredPattern],
+        calls: list[StoredFunctionCall],
+        comparisons: list[StoredComparison],
+    ) -> None:
+        """Replace everything stored for a file with fresh rows, in one transaction.
+
+        Always deletes the file's existing rows from every table first - explicitly,
+        never through ON DELETE CASCADE, which SQLite only enforces with PRAGMA
+        foreign_keys=ON - so a file edited to drop its last pattern loses its stale rows.
+        Recording content_hash even when every list is empty lets needs_rescan()
+        recognize the file as up to date on a later run.
+
+        Args:
+            file_path: Path to source file
+            content_hash: Hash of the file's current content, for later freshness checks
+            patterns: Validation patterns found in the file (may be empty)
+            calls: Function calls with string arguments found in the file (may be empty)
+            comparisons: String comparisons found in the file (may be empty)
+        """
+        self._delete_file_rows(file_path)
+        self._db.execute(
+            """INSERT INTO files (file_path, content_hash, last_scanned)
+               VALUES (?, ?, CURRENT_TIMESTAMP)
+               ON CONFLICT(file_path) DO UPDATE SET
+                   content_hash = excluded.content_hash,
+                   last_scanned = excluded.last_scanned""",
+            (str(file_path), content_hash),
+        )
+        self._insert_patterns(patterns)
+        self._insert_function_calls(calls)
+        self._insert_comparisons(comparisons)
+        self._db.commit()
+
+    def needs_rescan(self, file_path: Path, current_content_hash: str) -> bool:
+        """Check whether a file's indexed content is stale relative to current_content_hash.
+
+        Args:
+            file_path: Path to source file
+            current_content_hash: Hash of the file's current on-disk content
+
+        Returns:
+            True if the file has never been indexed, or was indexed with other content
+        """
+        row = self._db.execute(
+            "SELECT content_hash FROM files WHERE file_path = ?", (str(file_path),)
+        ).fetchone()
+        return row is None or row[0] != current_content_hash
+
+    def purge_file(self, file_path: Path) -> None:
+        """Remove a file's entries entirely (e.g. it was deleted from disk since indexing).
+
+        Args:
+            file_path: Path to source file
+        """
+        self._delete_file_rows(file_path)
+        self._db.execute("DELETE FROM files WHERE file_path = ?", (str(file_path),))
         self._db.commit()
 
+    def _delete_file_rows(self, file_path: Path) -> None:
+        """Delete a file's rows from every pattern table (no-op for a never-indexed file)."""
+        for table in _FILE_ROW_TABLES:
+            self._db.execute(
+                f"DELETE FROM {table} WHERE file_path = ?",  # nosec B608 - fixed table names
+                (str(file_path),),
+            )
+
+    def _delete_all_rows(self) -> None:
+        """Delete every pattern row and indexed file."""
+        for table in (*_FILE_ROW_TABLES, "files"):
+            self._db.execute(f"DELETE FROM {table}")  # nosec B608 - fixed table names
+
+    @property
+    def all_file_paths(self) -> set[str]:
+        """Every file path currently indexed.
+
+        Returns:
+            Set of all file_path strings in the files table
+        """
+        cursor = self._db.execute("SELECT file_path FROM files")
+        return {row[0] for row in cursor.fetchall()}
+
     def add_pattern(self, pattern: StoredPattern) -> None:
         """Add a single pattern to storage.
 
@@ -357,15 +537,20 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
         Args:
             patterns: List of StoredPattern instances to store
         """
+        self._insert_patterns(patterns)
+        self._db.commit()
+
+    def _insert_patterns(self, patterns: list[StoredPattern]) -> None:
+        """Insert rows without committing, for add_patterns and replace_file."""
         if not patterns:
             return
 
-        for pattern in patterns:
-            self._db.execute(
-                """INSERT OR REPLACE INTO string_validations
-                   (file_path, line_number, column_number, variable_name,
-                    string_set_hash, string_values, pattern_type, details)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        self._db.executemany(
+            """INSERT OR REPLACE INTO string_validations
+               (file_path, line_number, column_number, variable_name,
+                string_set_hash, string_values, pattern_type, details)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
                 (
                     str(pattern.file_path),
                     pattern.line_number,
@@ -375,10 +560,10 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
                     json.dumps(pattern.string_values),
                     pattern.pattern_type,
                     pattern.details,
-                ),
-            )
-
-        self._db.commit()
+                )
+                for pattern in patterns
+            ],
+        )
 
     def get_duplicate_hashes(self, min_files: int = 2) -> list[int]:
         """Get hash values that appear in min_files or more files.
@@ -446,15 +631,20 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
         Args:
             calls: List of StoredFunctionCall instances to store
         """
+        self._insert_function_calls(calls)
+        self._db.commit()
+
+    def _insert_function_calls(self, calls: list[StoredFunctionCall]) -> None:
+        """Insert rows without committing, for add_function_calls and replace_file."""
         if not calls:
             return
 
-        for call in calls:
-            self._db.execute(
-                """INSERT INTO function_calls
-                   (file_path, line_number, column_number, function_name,
-                    param_index, string_value)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+        self._db.executemany(
+            """INSERT INTO function_calls
+               (file_path, line_number, column_number, function_name,
+                param_index, string_value)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [
                 (
                     str(call.file_path),
                     call.line_number,
@@ -462,10 +652,10 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
                     call.function_name,
                     call.param_index,
                     call.string_value,
-                ),
-            )
-
-        self._db.commit()
+                )
+                for call in calls
+            ],
+        )
 
     def get_limited_value_functions(
         self, min_values: int, max_values: int, min_files: int = 1
@@ -547,15 +737,20 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
         Args:
             comparisons: List of StoredComparison instances to store
         """
+        self._insert_comparisons(comparisons)
+        self._db.commit()
+
+    def _insert_comparisons(self, comparisons: list[StoredComparison]) -> None:
+        """Insert rows without committing, for add_comparisons and replace_file."""
         if not comparisons:
             return
 
-        for comparison in comparisons:
-            self._db.execute(
-                """INSERT INTO string_comparisons
-                   (file_path, line_number, column_number, variable_name,
-                    compared_value, operator)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+        self._db.executemany(
+            """INSERT INTO string_comparisons
+               (file_path, line_number, column_number, variable_name,
+                compared_value, operator)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [
                 (
                     str(comparison.file_path),
                     comparison.line_number,
@@ -563,10 +758,10 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
                     comparison.variable_name,
                     comparison.compared_value,
                     comparison.operator,
-                ),
-            )
-
-        self._db.commit()
+                )
+                for comparison in comparisons
+            ],
+        )
 
     def get_variables_with_multiple_values(
         self, min_values: int = 2, min_files: int = 1
@@ -629,11 +824,109 @@ class StringlyTypedStorage:  # thailint: ignore[srp]
 
         return [_row_to_comparison(row) for row in cursor.fetchall()]
 
+    def iter_duplicate_pattern_groups(self, min_files: int = 2) -> Iterator[list[StoredPattern]]:
+        """Stream the patterns of every hash found in min_files or more files, one group per hash.
+
+        Same groups as get_patterns_by_hash over get_duplicate_hashes, in one query.
+
+        Args:
+            min_files: Minimum number of distinct files (default: 2)
+
+        Yields:
+            Patterns sharing one string_set_hash, ordered by file and line
+        """
+        cursor = self._db.execute(
+            """SELECT v.file_path, v.line_number, v.column_number, v.variable_name,
+                      v.string_set_hash, v.string_values, v.pattern_type, v.details
+               FROM string_validations v
+               JOIN (SELECT string_set_hash FROM string_validations
+                     GROUP BY string_set_hash
+                     HAVING COUNT(DISTINCT file_path) >= ?) d
+                 ON v.string_set_hash = d.string_set_hash
+               ORDER BY v.string_set_hash, v.file_path, v.line_number""",
+            (min_files,),
+        )
+        for _, rows in groupby(cursor, key=itemgetter(_COL_STRING_SET_HASH)):
+            yield [_row_to_pattern(row) for row in rows]
+
+    def iter_limited_value_function_groups(
+        self, min_values: int, max_values: int, min_files: int = 1
+    ) -> Iterator[tuple[str, int, set[str], list[StoredFunctionCall]]]:
+        """Stream every function+param with a limited value set, together with its calls.
+
+        Same groups as get_calls_by_function over get_limited_value_functions, in one query.
+
+        Args:
+            min_values: Minimum unique values to consider
+            max_values: Maximum unique values to consider
+            min_files: Minimum files the pattern must appear in (default: 1)
+
+        Yields:
+            (function_name, param_index, unique_values, calls) per function+param
+        """
+        cursor = self._db.execute(
+            """SELECT c.file_path, c.line_number, c.column_number, c.function_name,
+                      c.param_index, c.string_value, f.string_values
+               FROM function_calls c
+               JOIN (SELECT function_name, param_index,
+                            json_group_array(DISTINCT string_value) AS string_values
+                     FROM function_calls
+                     GROUP BY function_name, param_index
+                     HAVING COUNT(DISTINCT string_value) >= ?
+                        AND COUNT(DISTINCT string_value) <= ?
+                        AND COUNT(DISTINCT file_path) >= ?) f
+                 ON c.function_name = f.function_name AND c.param_index = f.param_index
+               ORDER BY c.function_name, c.param_index, c.file_path, c.line_number""",
+            (min_values, max_values, min_files),
+        )
+        group_key = itemgetter(_CALL_COL_FUNCTION_NAME, _CALL_COL_PARAM_INDEX)
+        for (function_name, param_index), rows in groupby(cursor, key=group_key):
+            calls = list(rows)
+            unique_values = set(json.loads(calls[0][-1]))
+            yield (
+                function_name,
+                param_index,
+                unique_values,
+                [_row_to_function_call(row) for row in calls],
+            )
+
+    def iter_multi_value_variable_groups(
+        self, min_values: int = 2, min_files: int = 1
+    ) -> Iterator[tuple[str, set[str], list[StoredComparison]]]:
+        """Stream every variable compared to several string values, with its comparisons.
+
+        Same groups as get_comparisons_by_variable over get_variables_with_multiple_values,
+        in one query.
+
+        Args:
+            min_values: Minimum unique values to consider (default: 2)
+            min_files: Minimum files the pattern must appear in (default: 1)
+
+        Yields:
+            (variable_name, unique_values, comparisons) per variable
+        """
+        cursor = self._db.execute(
+            """SELECT c.file_path, c.line_number, c.column_number, c.variable_name,
+                      c.compared_value, c.operator, v.compared_values
+               FROM string_comparisons c
+               JOIN (SELECT variable_name,
+                            json_group_array(DISTINCT compared_value) AS compared_values
+                     FROM string_comparisons
+                     GROUP BY variable_name
+                     HAVING COUNT(DISTINCT compared_value) >= ?
+                        AND COUNT(DISTINCT file_path) >= ?) v
+                 ON c.variable_name = v.variable_name
+               ORDER BY c.variable_name, c.file_path, c.line_number""",
+            (min_values, min_files),
+        )
+        for variable_name, rows in groupby(cursor, key=itemgetter(_COMP_COL_VARIABLE_NAME)):
+            comparisons = list(rows)
+            unique_values = set(json.loads(comparisons[0][-1]))
+            yield variable_name, unique_values, [_row_to_comparison(row) for row in comparisons]
+
     def clear(self) -> None:
-        """Clear all stored patterns, function calls, and comparisons."""
-        self._db.execute("DELETE FROM string_validations")
-        self._db.execute("DELETE FROM function_calls")
-        self._db.execute("DELETE FROM string_comparisons")
+        """Clear all stored patterns, function calls, comparisons, and indexed files."""
+        self._delete_all_rows()
         self._db.commit()
 
     def close(self) -> None:
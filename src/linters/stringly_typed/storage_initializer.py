@@ -4,38 +4,67 @@ Purpose: Storage initialization for stringly-typed linter
 Scope: Initializes StringlyTypedStorage with SQLite storage
 
 Overview: Handles storage initialization for stringly-typed pattern detection. Creates SQLite
-    storage in either memory or tempfile mode based on config.storage_mode. Separates
+    storage in memory, tempfile, or persistent mode based on config.storage_mode. Resolves the
+    on-disk path for persistent mode to a stable, project-relative location so it survives
+    between separate CLI invocations, and discards a persistent index built with different
+    index settings so its stored rows can be reused for unchanged files. Separates
     initialization logic from main linter rule to maintain SRP compliance.
 
-Dependencies: StringlyTypedConfig, StringlyTypedStorage
+Dependencies: DEFAULT_CACHE_DIR_NAME, StringlyTypedConfig, StringlyTypedStorage, pathlib.Path
 
-Exports: StorageInitializer class
+Exports: StorageInitializer class, INDEX_FILE_NAME constant
 
-Interfaces: StorageInitializer.initialize(config) -> StringlyTypedStorage
+Interfaces: StorageInitializer.initialize(config, project_root) -> StringlyTypedStorage
 
-Implementation: Creates StringlyTypedStorage with storage_mode, and an explicit shared db_path
-    when config.shared_db_path is set (parallel execution)
+Implementation: Creates StringlyTypedStorage with storage_mode, and an explicit db_path when
+    config.shared_db_path is set (parallel execution) or storage_mode is "persistent"
 """
 
 from pathlib import Path
 
+from src.core.constants import DEFAULT_CACHE_DIR_NAME
+
 from .config import StringlyTypedConfig
 from .storage import StringlyTypedStorage
 
+# File name of the persistent cross-run index, inside DEFAULT_CACHE_DIR_NAME next to the
+# DRY linter's index.
+INDEX_FILE_NAME = "stringly_typed.db"
+
 
 class StorageInitializer:
     """Initializes storage for stringly-typed pattern detection."""
 
-    def initialize(self, config: StringlyTypedConfig) -> StringlyTypedStorage:
+    def initialize(
+        self, config: StringlyTypedConfig, project_root: Path | None = None
+    ) -> StringlyTypedStorage:
         """Initialize storage based on configuration.
 
         Args:
             config: Stringly-typed configuration
+            project_root: Project root, used to resolve the default persistent index path.
+                Ignored unless storage_mode is "persistent" and no shared_db_path is set.
 
         Returns:
             StringlyTypedStorage instance with SQLite storage
         """
-        # When config.shared_db_path is set (parallel execution), every worker plus the
-        # main process connect to the same on-disk file for this one run.
-        db_path = Path(config.shared_db_path) if config.shared_db_path else None
-        return StringlyTypedStorage(storage_mode=config.storage_mode, db_path=db_path)
+        db_path = _resolve_db_path(config, project_root)
+        storage = StringlyTypedStorage(storage_mode=config.storage_mode, db_path=db_path)
+        if config.storage_mode == "persistent":
+            storage.reset_if_settings_changed(config.index_fingerprint())
+        return storage
+
+
+def _resolve_db_path(config: StringlyTypedConfig, project_root: Path | None) -> Path | None:
+    """Resolve the on-disk path to connect to, if any.
+
+    config.shared_db_path (set by the orchestrator under --parallel) always takes
+    precedence: every worker plus the main process connect to the same on-disk file for
+    that one run, regardless of the configured storage_mode.
+    """
+    if config.shared_db_path:
+        return Path(config.shared_db_path)
+    if config.storage_mode == "persistent":
+        root = project_root or Path.cwd()
+        return root / DEFAULT_CACHE_DIR_NAME / INDEX_FILE_NAME
+    return None
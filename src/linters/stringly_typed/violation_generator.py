@@ -5,12 +5,14 @@ Scope: Generates violations from duplicate pattern hashes, function call pattern
     scattered string comparisons
 
 Overview: Handles violation generation for stringly-typed patterns that appear across multiple
-    files. Queries storage for duplicate hashes, retrieves patterns for each hash, builds
+    files. Streams each duplicate-hash group of patterns from storage in a single query, builds
     violations with cross-references to other files, and filters patterns based on enum value
     thresholds. Delegates function call violation generation to FunctionCallViolationBuilder.
     Generates violations for scattered string comparisons (e.g., `if env == "production"`)
     where a variable is compared to multiple unique string values across files.
-    Applies inline ignore directives via IgnoreChecker to filter suppressed violations.
+    Function call and comparison groups are streamed the same way (one query per table, never
+    a query per function or variable). Applies inline ignore directives via IgnoreChecker to
+    filter suppressed violations.
     Separates violation generation logic from main linter rule to maintain SRP compliance.
 
 Dependencies: StringlyTypedStorage, StoredPattern, StoredComparison, StringlyTypedConfig,
@@ -26,7 +28,7 @@ Implementation: Queries storage, validates pattern thresholds, builds violations
 
 Suppressions:
     - too-many-arguments,too-many-positional-arguments: _process_variable helper passes
-        accumulated state (storage, config, covered_variables, violations) to avoid
+        accumulated state (comparisons, config, covered_variables, violations) to avoid
         global state or complex return types
 """
 
@@ -262,51 +264,31 @@ def _is_valid_function(name: str, idx: int, vals: set[str], config: StringlyType
     return context_filter.should_include(name, idx, vals)
 
 
-def _get_valid_functions(
+def _build_call_violations(
     storage: StringlyTypedStorage,
     config: StringlyTypedConfig,
-) -> list[tuple[str, int, set[str]]]:
-    """Get functions that pass all filters."""
+) -> list[Violation]:
+    """Build violations for every limited-value function that passes all filters."""
     min_files = config.min_occurrences if config.require_cross_file else 1
-    limited_funcs = storage.get_limited_value_functions(
+    groups = storage.iter_limited_value_function_groups(
         min_values=config.min_values_for_enum,
         max_values=config.max_values_for_enum,
         min_files=min_files,
     )
-    return [(n, i, v) for n, i, v in limited_funcs if _is_valid_function(n, i, v, config)]
-
-
-def _build_call_violations(
-    valid_funcs: list[tuple[str, int, set[str]]],
-    storage: StringlyTypedStorage,
-) -> list[Violation]:
-    """Build violations for valid function patterns."""
     violations: list[Violation] = []
-    for function_name, param_index, unique_values in valid_funcs:
-        calls = storage.get_calls_by_function(function_name, param_index)
-        violations.extend(build_function_call_violations(calls, unique_values))
+    for function_name, param_index, unique_values, calls in groups:
+        if _is_valid_function(function_name, param_index, unique_values, config):
+            violations.extend(build_function_call_violations(calls, unique_values))
     return violations
 
 
 # --- Helper functions for comparison processing ---
 
 
-def _get_variables_to_check(
-    storage: StringlyTypedStorage,
-    config: StringlyTypedConfig,
-) -> list[tuple[str, set[str]]]:
-    """Get variables with multiple values that should be checked."""
-    min_files = config.min_occurrences if config.require_cross_file else 1
-    return storage.get_variables_with_multiple_values(
-        min_values=config.min_values_for_enum,
-        min_files=min_files,
-    )
-
-
 def _process_variable(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     variable_name: str,
     unique_values: set[str],
-    storage: StringlyTypedStorage,
+    comparisons: list[StoredComparison],
     config: StringlyTypedConfig,
     covered_variables: set[str],
     violations: list[Violation],
@@ -318,7 +300,6 @@ def _process_variable(  # pylint: disable=too-many-arguments,too-many-positional
         return
     if _should_skip_comparison(unique_values, config):
         return
-    comparisons = storage.get_comparisons_by_variable(variable_name)
     violations.extend(
         _build_comparison_violation(c, comparisons, unique_values) for c in comparisons
     )
@@ -370,12 +351,10 @@ class ViolationGenerator:
         config: StringlyTypedConfig,
     ) -> tuple[list[Violation], set[str]]:
         """Generate violations for duplicate validation patterns."""
-        duplicate_hashes = storage.get_duplicate_hashes(min_files=config.min_occurrences)
         violations: list[Violation] = []
         covered_variables: set[str] = set()
 
-        for hash_value in duplicate_hashes:
-            patterns = storage.get_patterns_by_hash(hash_value)
+        for patterns in storage.iter_duplicate_pattern_groups(min_files=config.min_occurrences):
             _process_pattern_group(patterns, config, rule_id, violations, covered_variables)
 
         return violations, covered_variables
@@ -386,8 +365,7 @@ class ViolationGenerator:
         config: StringlyTypedConfig,
     ) -> list[Violation]:
         """Generate violations for function call patterns."""
-        valid_funcs = _get_valid_functions(storage, config)
-        return _build_call_violations(valid_funcs, storage)
+        return _build_call_violations(storage, config)
 
     def _generate_comparison_violations(
         self,
@@ -397,12 +375,15 @@ class ViolationGenerator:
     ) -> list[Violation]:
         """Generate violations for scattered string comparisons."""
         covered_variables = covered_variables or set()
-        variables = _get_variables_to_check(storage, config)
+        min_files = config.min_occurrences if config.require_cross_file else 1
+        groups = storage.iter_multi_value_variable_groups(
+            min_values=config.min_values_for_enum, min_files=min_files
+        )
 
         violations: list[Violation] = []
-        for variable_name, unique_values in variables:
+        for variable_name, unique_values, comparisons in groups:
             _process_variable(
-                variable_name, unique_values, storage, config, covered_variables, violations
+                variable_name, unique_values, comparisons, config, covered_variables, violations
             )
 
         return violations
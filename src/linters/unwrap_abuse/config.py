@@ -22,7 +22,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class UnwrapAbuseConfig:
     """Configuration for unwrap abuse detection."""
 
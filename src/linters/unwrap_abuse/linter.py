@@ -20,6 +20,7 @@ Implementation: Single-file analysis with config-driven filtering and tree-sitte
 """
 
 from src.core.base import BaseLintContext, BaseLintRule
+from src.core.constants import Language
 from src.core.linter_utils import (
     has_file_content,
     is_ignored_path,
@@ -64,6 +65,11 @@ class UnwrapAbuseRule(BaseLintRule):
             "or match/if-let expressions."
         )
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """Rust only."""
+        return frozenset({Language.RUST})
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """Check for unwrap/expect abuse in Rust code.
 
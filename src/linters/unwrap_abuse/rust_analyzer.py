@@ -16,7 +16,8 @@ Exports: RustUnwrapAnalyzer, UnwrapCall
 
 Interfaces: find_unwrap_calls(code: str) -> list[UnwrapCall]
 
-Implementation: Recursive AST traversal with field_expression pattern matching for method calls
+Implementation: call_expression lookup via walk_tree with field_expression pattern matching for
+    method calls
 """
 
 from dataclasses import dataclass
@@ -27,6 +28,8 @@ from src.core.linter_utils import get_line_context
 if TREE_SITTER_RUST_AVAILABLE:
     from tree_sitter import Node
 
+_NODE_TYPE_CALL_EXPRESSION = "call_expression"
+
 
 @dataclass
 class UnwrapCall:
@@ -59,32 +62,30 @@ class RustUnwrapAnalyzer(RustBaseAnalyzer):
             return []
 
         calls: list[UnwrapCall] = []
-        self._find_unwrap_recursive(root, code, calls)
+        for node in self.walk_tree(root, _NODE_TYPE_CALL_EXPRESSION):
+            method_name = self._get_method_name(node)
+            if method_name in ("unwrap", "expect"):
+                calls.append(self._build_call(node, method_name, code))
         return calls
 
-    def _find_unwrap_recursive(self, node: "Node", code: str, calls: list[UnwrapCall]) -> None:
-        """Recursively find unwrap/expect method calls in AST.
+    def _build_call(self, node: "Node", method_name: str, code: str) -> UnwrapCall:
+        """Build the record for one unwrap/expect call.
 
         Args:
-            node: Current tree-sitter node to inspect
+            node: The call_expression node
+            method_name: "unwrap" or "expect"
             code: Original source code for context extraction
-            calls: Accumulator list for detected calls
+
+        Returns:
+            UnwrapCall with location and context
         """
-        if node.type == "call_expression":
-            method_name = self._get_method_name(node)
-            if method_name in ("unwrap", "expect"):
-                calls.append(
-                    UnwrapCall(
-                        line=node.start_point[0] + 1,
-                        column=node.start_point[1],
-                        method=method_name,
-                        is_in_test=self.is_inside_test(node),
-                        context=get_line_context(code, node.start_point[0]),
-                    )
-                )
-
-        for child in node.children:
-            self._find_unwrap_recursive(child, code, calls)
+        return UnwrapCall(
+            line=node.start_point[0] + 1,
+            column=node.start_point[1],
+            method=method_name,
+            is_in_test=self.is_inside_test(node),
+            context=get_line_context(code, node.start_point[0]),
+        )
 
     def _get_method_name(self, call_node: "Node") -> str:
         """Extract method name from a call expression.
@@ -23,7 +23,7 @@ from typing import Any
 DEFAULT_CACHE_TTL_HOURS = 24
 
 
-@dataclass
+@dataclass(frozen=True)
 class VersionFreshnessConfig:
     """Configuration for version-freshness linter."""
 
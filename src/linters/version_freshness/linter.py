@@ -70,6 +70,11 @@ class VersionFreshnessRule(BaseLintRule):
         """Description of what this rule checks."""
         return "Checks runtime/infrastructure versions against endoflife.date lifecycle data"
 
+    @property
+    def supported_languages(self) -> frozenset[str]:
+        """No languages: check_paths() scans files itself, so none are dispatched here."""
+        return frozenset()
+
     def check(self, context: BaseLintContext) -> list[Violation]:
         """No-op: this linter uses check_paths() instead of the orchestrator pipeline.
 
@@ -0,0 +1,95 @@
+"""
+Purpose: Lint run limited to the files a git change set marks as changed
+
+Scope: iter_changed_violations, the orchestrator run behind --changed-since and --staged
+
+Overview: Every rule checks the changed files. Cross-file rules then also check the unchanged files
+    they select (see BaseLintRule.select_unchanged_files), so changed files are still compared
+    against the rest of the project, and only finalize() violations located in changed files are
+    reported. Unchanged files are fed to those rules for their cross-file state only; their own
+    per-file results are never produced. Runs in the calling process: a changed-files run is meant
+    to be small.
+
+Dependencies: pathlib, src.orchestrator.core.Orchestrator run steps, src.orchestrator.git_changes,
+    src.orchestrator.file_collector, src.orchestrator.language_detector
+
+Exports: iter_changed_violations
+
+Interfaces: iter_changed_violations(orchestrator, change_set) -> Iterator[Violation]
+
+Implementation: Built from Orchestrator.start_run / lint_file / check_rules / iter_finalized;
+    unchanged files are matched to rules by language before the rules select from them
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.core.base import BaseLintRule
+from src.core.types import Violation
+
+from .file_collector import is_hardcoded_excluded
+from .git_changes import ChangeSet
+from .language_detector import detect_language
+
+if TYPE_CHECKING:
+    from .core import Orchestrator
+
+
+def iter_changed_violations(
+    orchestrator: Orchestrator, change_set: ChangeSet
+) -> Iterator[Violation]:
+    """Lint only the files a git change set marks as changed.
+
+    Args:
+        orchestrator: Orchestrator holding the run's config and selected rules
+        change_set: Changed files and access to the unchanged ones (git_changes)
+
+    Yields:
+        Violations in the changed files
+    """
+    orchestrator.start_run()
+    for file_path in change_set.changed:
+        yield from orchestrator.lint_file(file_path)
+
+    _check_unchanged_files(orchestrator, change_set)
+    changed = {file_path.resolve() for file_path in change_set.changed}
+    yield from (v for v in orchestrator.iter_finalized() if Path(v.file_path).resolve() in changed)
+
+
+def _check_unchanged_files(orchestrator: Orchestrator, change_set: ChangeSet) -> None:
+    """Run check() for each unchanged file on the cross-file rules that selected it."""
+    rules = [rule for rule in orchestrator.registry.list_loaded() if not rule.results_cacheable]
+    if not rules:
+        return
+    languages = _unchanged_file_languages(orchestrator, change_set)
+    selected = {
+        rule: set(
+            rule.select_unchanged_files(
+                [path for path, language in languages.items() if _handles(rule, language)]
+            )
+        )
+        for rule in rules
+    }
+    for file_path, language in languages.items():
+        file_rules = [rule for rule in rules if file_path in selected[rule]]
+        if file_rules:
+            orchestrator.check_rules(file_path, language, file_rules)
+
+
+def _unchanged_file_languages(orchestrator: Orchestrator, change_set: ChangeSet) -> dict[Path, str]:
+    """Detect the language of every unchanged file that is not excluded or ignored."""
+    is_ignored = orchestrator.ignore_parser.is_ignored
+    return {
+        file_path: detect_language(file_path)
+        for file_path in change_set.unchanged()
+        if not is_hardcoded_excluded(file_path) and not is_ignored(file_path)
+    }
+
+
+def _handles(rule: BaseLintRule, language: str) -> bool:
+    """Check whether a rule's supported_languages include a language."""
+    languages = rule.supported_languages
+    return languages is None or language in languages
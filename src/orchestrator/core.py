@@ -16,19 +16,32 @@ Overview: Provides the main entry point for linting operations by coordinating e
 
 Dependencies: pathlib for file operations, BaseLintRule and BaseLintContext from core.base,
     Violation from core.types, RuleRegistry from core.registry, LinterConfigLoader from
-    linter_config.loader, IgnoreDirectiveParser from linter_config.ignore, detect_language
-    from language_detector, concurrent.futures for parallel processing
+    linter_config.loader, get_ignore_parser from linter_config.ignore, detect_language
+    from language_detector, collect_files_fast from file_collector, ResultCache from
+    result_cache, worker_pool and concurrent.futures for parallel processing
 
-Exports: Orchestrator class, FileLintContext implementation class
+Exports: Orchestrator class, FileLintContext implementation class (from file_context)
 
-Interfaces: Orchestrator(project_root: Path | None), lint_file(file_path: Path) -> list[Violation],
+Interfaces: Orchestrator(project_root: Path | None, config: dict | None, rules: Sequence[str] | None)
+    where rules pre-selects rule ids/categories (unselected rules are never registered),
+    lint_file(file_path: Path) -> list[Violation],
     lint_directory(dir_path: Path, recursive: bool) -> list[Violation],
-    lint_files_parallel(file_paths, max_workers) -> list[Violation]
-
-Implementation: Directory glob pattern matching for traversal (** for recursive, * for shallow),
-    ignore pattern checking before file processing, dynamic context creation per file,
-    rule filtering by applicability, violation collection and aggregation across files,
-    ProcessPoolExecutor for parallel file processing
+    lint_files_parallel(file_paths, max_workers) -> list[Violation],
+    iter_violations(paths, recursive, parallel, max_workers) -> Iterator[Violation] (streams
+    per-file results as they complete, then cross-file finalize() results),
+    start_run(), check_rules(file_path, language, rules), iter_finalized() (run steps used by
+    changed_files.iter_changed_violations for git changed-files runs)
+
+Implementation: Pruned os.walk directory traversal (file_collector), also skipping directories every
+    selected rule's own ignore patterns cover (BaseLintRule.ignored_path_patterns), ignore pattern
+    checking before file processing, one FileLintContext per file sharing its content and parses
+    across rules (file_context), language-indexed rule dispatch (files no rule handles are never
+    read), opt-in cross-run result cache (result_cache) reusing unchanged files' per-rule results,
+    generator-based violation pipeline (the list APIs materialize it), changed-files runs
+    (changed_files) built from the same run steps, one suppression stage applying ignore directives
+    to every rule's check() and finalize() results from the file's shared DirectiveIndex
+    (BaseLintRule.honors_ignore_directives), ProcessPoolExecutor with long-lived workers
+    (worker_pool) linting size-balanced file batches
 
 Suppressions:
     - srp: Orchestrator class coordinates multiple subsystems by design (registry, config, ignore,
@@ -39,129 +52,47 @@ from __future__ import annotations
 
 import logging
 import multiprocessing
-import os
 import shutil
 import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from functools import cached_property, partial
 from pathlib import Path
 from typing import Any
 
 from src.core.base import BaseLintContext, BaseLintRule
+from src.core.config_resolution import ResolvedConfigs
 from src.core.registry import RuleRegistry
 from src.core.types import Violation
 from src.linter_config.ignore import IgnoreDirectiveParser, get_ignore_parser
 from src.linter_config.loader import LinterConfigLoader
 
+from .file_collector import collect_files_fast, is_hardcoded_excluded, rule_ignored_dir_check
+from .file_context import FileLintContext
 from .language_detector import detect_language
+from .profiler import (
+    FILE_DISCOVERY,
+    FILE_READING,
+    IGNORE_FILTERING,
+    RunProfile,
+    check_timer,
+    finalize_timer,
+    phase_timer,
+)
+from .result_cache import ResultCache, config_fingerprint, resolve_result_cache_path
+from .worker_pool import (
+    init_worker,
+    lint_batch,
+    plan_balanced_batches,
+    profile_batch,
+    unpack_batch_result,
+)
 
 logger = logging.getLogger(__name__)
 
 # Default max workers for parallel processing (capped to avoid resource contention)
 DEFAULT_MAX_WORKERS = 8
 
-# Hardcoded exclusions for files/directories that should never be linted
-# These are always skipped regardless of configuration to improve performance
-_HARDCODED_EXCLUDE_EXTENSIONS: frozenset[str] = frozenset(
-    {
-        ".pyc",
-        ".pyo",
-        ".pyd",  # Python bytecode
-        ".so",
-        ".dll",
-        ".dylib",  # Compiled libraries
-        ".class",  # Java bytecode
-        ".o",
-        ".obj",  # Object files
-    }
-)
-_HARDCODED_EXCLUDE_DIRS: frozenset[str] = frozenset(
-    {
-        "__pycache__",
-        "node_modules",
-        ".git",
-        ".svn",
-        ".hg",
-        ".venv",
-        "venv",
-        ".tox",
-        ".eggs",
-        "*.egg-info",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".ruff_cache",
-        "dist",
-        "build",
-        "htmlcov",
-    }
-)
-
-
-def _is_hardcoded_excluded(file_path: Path) -> bool:
-    """Check if file should be excluded based on hardcoded patterns.
-
-    Args:
-        file_path: Path to check
-
-    Returns:
-        True if file should be skipped (compiled file, cache directory, etc.)
-    """
-    # Check file extension
-    if file_path.suffix in _HARDCODED_EXCLUDE_EXTENSIONS:
-        return True
-
-    # Check if any parent directory is in the exclude list
-    for part in file_path.parts:
-        if part in _HARDCODED_EXCLUDE_DIRS:
-            return True
-        # Handle wildcard patterns like *.egg-info
-        if part.endswith(".egg-info"):
-            return True
-
-    return False
-
-
-def _should_include_dir(dirname: str, dir_path: Path, ignore_parser: IgnoreDirectiveParser) -> bool:
-    """Check if directory should be traversed (not hardcoded- or config-excluded)."""
-    if dirname in _HARDCODED_EXCLUDE_DIRS or dirname.endswith(".egg-info"):
-        return False
-    return not ignore_parser.is_dir_ignored(dir_path)
-
-
-def _collect_files_from_walk(root: str, filenames: list[str]) -> list[Path]:
-    """Collect non-excluded files from a single directory."""
-    root_path = Path(root)
-    return [root_path / f for f in filenames if Path(f).suffix not in _HARDCODED_EXCLUDE_EXTENSIONS]
-
-
-def _collect_files_fast(
-    dir_path: Path, ignore_parser: IgnoreDirectiveParser, recursive: bool = True
-) -> list[Path]:
-    """Collect files, skipping excluded directories entirely.
-
-    Uses os.walk() instead of glob to avoid traversing into excluded
-    directories like .venv, node_modules, __pycache__, etc., as well as
-    any directory matched by the project's configured `ignore:` patterns -
-    pruning those during the walk (rather than filtering the resulting file
-    list afterward) avoids paying an enumeration cost proportional to the
-    size of directories the user has already said to ignore.
-
-    Args:
-        dir_path: Directory to collect files from.
-        ignore_parser: Parser holding the project's configured ignore patterns.
-        recursive: Whether to traverse subdirectories.
-
-    Returns:
-        List of file paths, excluding hardcoded and configured exclusions.
-    """
-    files: list[Path] = []
-    for root, dirs, filenames in os.walk(dir_path):
-        root_path = Path(root)
-        dirs[:] = [d for d in dirs if _should_include_dir(d, root_path / d, ignore_parser)]
-        files.extend(_collect_files_from_walk(root, filenames))
-        if not recursive:
-            break
-    return files
-
 
 def _merge_config_override(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     """Shallow-merge a rule's parallel-shared config override into a base config.
@@ -180,85 +111,24 @@ def _merge_config_override(base: dict[str, Any], override: dict[str, Any]) -> di
     return merged
 
 
-def _lint_file_worker(args: tuple[Path, Path, dict]) -> list[dict]:
-    """Worker function for parallel file linting.
-
-    This function runs in a separate process and creates its own Orchestrator
-    instance to lint a single file. Results are returned as dicts to avoid
-    pickling issues with Violation dataclass.
+def _expand_path(
+    path: Path,
+    ignore_parser: IgnoreDirectiveParser,
+    recursive: bool,
+    prune_dir: Callable[[Path], bool] | None = None,
+) -> list[Path]:
+    """Get the files to lint for one input path (missing paths yield none)."""
+    if path.is_dir():
+        return collect_files_fast(path, ignore_parser, recursive, prune_dir)
+    return [path] if path.is_file() else []
 
-    Args:
-        args: Tuple of (file_path, project_root, config)
 
-    Returns:
-        List of violation dicts (serializable for cross-process transfer)
-    """
-    file_path, project_root, config = args
+def _read_text_or_empty(file_path: Path) -> str:
+    """Read a file for suppression checks, treating unreadable files as empty."""
     try:
-        # Create isolated orchestrator for this worker process
-        orchestrator = Orchestrator(project_root=project_root, config=config)
-        violations = orchestrator.lint_file(file_path)
-        # Convert to dicts for pickling
-        return [v.to_dict() for v in violations]
-    except Exception:
-        logger.exception("Worker error processing file: %s", file_path)
-        return []
-
-
-class FileLintContext(BaseLintContext):
-    """Concrete implementation of lint context for file analysis."""
-
-    def __init__(
-        self, path: Path, lang: str, content: str | None = None, metadata: dict | None = None
-    ):
-        """Initialize file lint context.
-
-        Args:
-            path: Path to the file being analyzed.
-            lang: Programming language identifier.
-            content: Optional pre-loaded file content.
-            metadata: Optional metadata dict containing configuration.
-        """
-        self._path = path
-        self._language = lang
-        self._content = content
-        self._lines: list[str] | None = None  # Cached line split
-        self.metadata = metadata or {}
-
-    @property
-    def file_path(self) -> Path | None:
-        """Get file path being analyzed."""
-        return self._path
-
-    @property
-    def file_content(self) -> str | None:
-        """Get file content being analyzed."""
-        if self._content is not None:
-            return self._content
-        if not self._path or not self._path.exists():
-            return None
-        try:
-            self._content = self._path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
-            self._content = None
-        return self._content
-
-    @property
-    def language(self) -> str:
-        """Get programming language of file."""
-        return self._language
-
-    @property
-    def file_lines(self) -> list[str]:
-        """Get file content as list of lines (cached).
-
-        Returns:
-            List of lines from file content, empty list if no content.
-        """
-        if self._lines is None:
-            content = self.file_content
-            self._lines = content.split("\n") if content else []
-        return self._lines
+        return file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return ""
 
 
 class Orchestrator:  # thailint: ignore[srp]
@@ -269,20 +139,29 @@ class Orchestrator:  # thailint: ignore[srp]
 
     SRP Exception: Method count (12) exceeds guideline (8) because this is the
     central orchestration point. Methods are organized into logical groups:
-    - Core linting: lint_file, lint_files, lint_directory
+    - Core linting: lint_file, lint_files, lint_directory, iter_violations
     - Parallel linting: lint_files_parallel, lint_directory_parallel
     - Helper methods: _execute_rules, _safe_check_rule, _ensure_rules_discovered, etc.
     All methods support the single responsibility of coordinating lint operations.
     """
 
-    def __init__(self, project_root: Path | None = None, config: dict | None = None):
+    def __init__(
+        self,
+        project_root: Path | None = None,
+        config: dict | None = None,
+        rules: Sequence[str] | None = None,
+    ):
         """Initialize orchestrator.
 
         Args:
             project_root: Root directory of project. Defaults to current directory.
             config: Optional pre-loaded configuration dict. If provided, skips config file loading.
+            rules: Optional rule ids or categories (e.g. ["dry"], ["performance.regex-in-loop"])
+                to run. Rules outside the selection are never registered, checked, or
+                finalized. Defaults to all discovered rules.
         """
         self.project_root = project_root or Path.cwd()
+        self.rule_selection: tuple[str, ...] | None = tuple(rules) if rules is not None else None
         self.registry = RuleRegistry()
         self.config_loader = LinterConfigLoader()
         self.ignore_parser = get_ignore_parser(self.project_root)
@@ -290,6 +169,10 @@ class Orchestrator:  # thailint: ignore[srp]
         # Performance optimization: Defer rule discovery until first file is linted
         # This eliminates ~0.077s overhead for commands that don't need rules (--help, config, etc.)
         self._rules_discovered = False
+        # Typed configs resolved from self.config, shared by every file of a run
+        self._resolved_configs: ResolvedConfigs | None = None
+        # Set by --profile / Linter(profile=True) to time rules and phases (see profiler)
+        self.profile: RunProfile | None = None
 
         # Use provided config or load from project root
         if config is not None:
@@ -312,21 +195,70 @@ class Orchestrator:  # thailint: ignore[srp]
         Returns:
             List of violations found in the file.
         """
-        # Fast path: skip compiled files and common excluded directories
-        if _is_hardcoded_excluded(file_path):
-            return []
-
-        if self.ignore_parser.is_ignored(file_path):
+        if self._is_excluded(file_path):
             return []
 
         language = detect_language(file_path)
         rules = self._get_rules_for_file(file_path, language)
+        if not rules:
+            # No rule handles this language; don't build a context or read the file
+            return []
+
+        return self._execute_rules(rules, self._make_context(file_path, language))
+
+    def _is_excluded(self, file_path: Path) -> bool:
+        """Check whether a file is excluded by default or by the repo-level ignore patterns."""
+        with phase_timer(self.profile, IGNORE_FILTERING):
+            # Fast path: skip compiled files and common excluded directories
+            return is_hardcoded_excluded(file_path) or self.ignore_parser.is_ignored(file_path)
+
+    def _make_context(self, file_path: Path, language: str) -> FileLintContext:
+        """Build the lint context for a file."""
+        return FileLintContext(
+            file_path,
+            language,
+            metadata=self._rule_metadata,
+            resolved_configs=self._run_configs,
+            profile=self.profile,
+        )
 
-        # Add project_root to metadata for rules that need it (e.g., DRY linter cache)
-        metadata = {**self.config, "_project_root": self.project_root}
-        context = FileLintContext(file_path, language, metadata=metadata)
+    @property
+    def _run_configs(self) -> ResolvedConfigs:
+        """Get the typed-config memo for self.config.
+
+        Rebuilt when self.config is replaced (CLI commands may swap it after construction)
+        and at the start of every multi-file run, so config edits made between runs apply.
+        """
+        if self._resolved_configs is None or self._resolved_configs.config is not self.config:
+            self._resolved_configs = ResolvedConfigs(self.config)
+        return self._resolved_configs
+
+    @property
+    def _rule_metadata(self) -> dict[str, Any]:
+        """Get the config rules read, with project_root added (e.g., for the DRY linter cache)."""
+        return {**self.config, "_project_root": self.project_root}
+
+    def _rule_ignored_dir_check(self) -> Callable[[Path], bool] | None:
+        """Build a check for directories that every selected rule is configured to ignore.
+
+        Only runs limited to selected rules get one: consulting every rule would import
+        every linter, including ones the run's files never need.
+        """
+        if self.rule_selection is None:
+            return None
+        self._ensure_rules_discovered()
+        return rule_ignored_dir_check(self.registry.list_all(), self._rule_metadata)
 
-        return self._execute_rules(rules, context)
+    @cached_property
+    def _result_cache(self) -> ResultCache | None:
+        """Result cache opened on first use, or None unless the config enables it.
+
+        Resolved lazily because CLI commands may replace self.config after construction.
+        """
+        db_path = resolve_result_cache_path(self.config, self.project_root)
+        if db_path is None:
+            return None
+        return ResultCache(db_path, config_fingerprint(self.config, self.project_root))
 
     def lint_files(self, file_paths: list[Path]) -> list[Violation]:
         """Lint multiple files.
@@ -337,21 +269,78 @@ class Orchestrator:  # thailint: ignore[srp]
         Returns:
             List of violations found across all files.
         """
-        violations = []
+        return list(self._iter_files(file_paths))
+
+    def iter_violations(
+        self,
+        paths: Sequence[Path],
+        recursive: bool = True,
+        parallel: bool = False,
+        max_workers: int | None = None,
+    ) -> Iterator[Violation]:
+        """Lint files and directories, yielding violations as soon as each file is done.
+
+        Per-file violations are yielded as each file (or, in parallel, each worker
+        batch) finishes; cross-file finalize() violations are yielded once at the end.
+        Nothing is accumulated, so memory stays bounded however many violations a
+        run produces.
 
+        Args:
+            paths: Files and/or directories to lint (missing paths are skipped).
+            recursive: Whether to traverse subdirectories recursively.
+            parallel: Whether to lint with a process pool.
+            max_workers: Maximum worker processes when parallel.
+
+        Yields:
+            Violations in completion order.
+        """
+        file_paths = self._expand_paths(paths, recursive)
+        if parallel:
+            yield from self._iter_files_parallel(file_paths, max_workers)
+        else:
+            yield from self._iter_files(file_paths)
+
+    def _expand_paths(self, paths: Sequence[Path], recursive: bool) -> list[Path]:
+        """Expand directories into the files they contain, keeping explicit files."""
+        prune_dir = self._rule_ignored_dir_check()
+        file_paths: list[Path] = []
+        with phase_timer(self.profile, FILE_DISCOVERY):
+            for path in paths:
+                file_paths.extend(_expand_path(path, self.ignore_parser, recursive, prune_dir))
+        return file_paths
+
+    def _iter_files(self, file_paths: Iterable[Path]) -> Iterator[Violation]:
+        """Yield each file's violations in turn, then the rules' finalize() violations."""
+        self.start_run()
         for file_path in file_paths:
-            violations.extend(self.lint_file(file_path))
+            yield from self.lint_file(file_path)
+        yield from self.iter_finalized()
 
-        # Call finalize() on all rules after processing all files
-        for rule in self.registry.list_all():
-            violations.extend(rule.finalize())
+    def start_run(self) -> None:
+        """Begin a multi-file run, so config edits made since the last run apply."""
+        self._resolved_configs = None
 
-        return violations
+    def check_rules(self, file_path: Path, language: str, rules: list[BaseLintRule]) -> None:
+        """Run check() of the given rules on a file for their cross-file state only."""
+        context = self._make_context(file_path, language)
+        for rule in rules:
+            self._safe_check_rule(rule, context)
+
+    def iter_finalized(self) -> Iterator[Violation]:
+        """Yield the unsuppressed finalize() violations of every rule that saw a file.
+
+        Rules never loaded have nothing to report, and listing all of them would import
+        every linter.
+        """
+        for rule in self.registry.list_loaded():
+            with finalize_timer(self.profile, rule.rule_id):
+                finalized = rule.finalize()
+            yield from self._drop_suppressed_finalized(rule, finalized)
 
     def _execute_rules(
         self, rules: list[BaseLintRule], context: BaseLintContext
     ) -> list[Violation]:
-        """Execute rules and collect violations.
+        """Execute rules and collect violations, through the result cache when enabled.
 
         Args:
             rules: List of rules to execute.
@@ -360,6 +349,10 @@ class Orchestrator:  # thailint: ignore[srp]
         Returns:
             List of violations found.
         """
+        cache = self._result_cache
+        if cache is not None and context.file_path and context.file_content is not None:
+            run_rule = partial(self._try_check_rule, context=context)
+            return cache.check_file(context.file_path, context.file_content, rules, run_rule)
         violations = []
         for rule in rules:
             rule_violations = self._safe_check_rule(rule, context)
@@ -368,14 +361,59 @@ class Orchestrator:  # thailint: ignore[srp]
 
     def _safe_check_rule(self, rule: BaseLintRule, context: BaseLintContext) -> list[Violation]:
         """Safely check a rule, returning empty list on error."""
+        return self._try_check_rule(rule, context) or []
+
+    def _try_check_rule(
+        self, rule: BaseLintRule, context: BaseLintContext
+    ) -> list[Violation] | None:
+        """Check a rule, returning None (after logging) if the rule failed."""
         try:
-            return rule.check(context)
+            with check_timer(self.profile, rule.rule_id, context.file_path):
+                violations = rule.check(context)
         except ValueError:
             # Re-raise configuration validation errors (these are user-facing)
             raise
         except Exception:
             logger.exception("Rule %s failed on %s", rule.rule_id, context.file_path)
-            return []
+            return None
+        return self._drop_suppressed(rule, violations, context.file_content or "")
+
+    def _drop_suppressed(
+        self, rule: BaseLintRule, violations: list[Violation], file_content: str
+    ) -> list[Violation]:
+        """Drop violations covered by ignore directives in the file they were found in.
+
+        The single suppression stage every rule's results pass through. Directives are
+        looked up in the file's DirectiveIndex, built once per file content and shared
+        with the rules' own checks, so each violation costs a few dictionary lookups.
+        """
+        if not violations or not rule.honors_ignore_directives:
+            return violations
+        should_ignore = self.ignore_parser.should_ignore_violation
+        with phase_timer(self.profile, IGNORE_FILTERING):
+            return [v for v in violations if not should_ignore(v, file_content)]
+
+    def _drop_suppressed_finalized(
+        self, rule: BaseLintRule, violations: list[Violation]
+    ) -> list[Violation]:
+        """Drop suppressed cross-file violations, reading each reported file once."""
+        if not violations or not rule.honors_ignore_directives:
+            return violations
+        with phase_timer(self.profile, IGNORE_FILTERING):
+            return self._keep_unsuppressed(violations)
+
+    def _keep_unsuppressed(self, violations: list[Violation]) -> list[Violation]:
+        """Keep the cross-file violations no ignore directive covers."""
+        contents: dict[str, str] = {}
+        kept = []
+        for violation in violations:
+            if violation.file_path not in contents:
+                with phase_timer(self.profile, FILE_READING):
+                    contents[violation.file_path] = _read_text_or_empty(Path(violation.file_path))
+            content = contents[violation.file_path]
+            if not self.ignore_parser.should_ignore_violation(violation, content):
+                kept.append(violation)
+        return kept
 
     def lint_directory(self, dir_path: Path, recursive: bool = True) -> list[Violation]:
         """Lint all files in a directory.
@@ -387,18 +425,14 @@ class Orchestrator:  # thailint: ignore[srp]
         Returns:
             List of all violations found across all files.
         """
-        violations = []
-        # Use fast file collection that skips excluded directories entirely
-        file_paths = _collect_files_fast(dir_path, self.ignore_parser, recursive)
-
-        for file_path in file_paths:
-            violations.extend(self.lint_file(file_path))
-
-        # Call finalize() on all rules after processing all files
-        for rule in self.registry.list_all():
-            violations.extend(rule.finalize())
+        file_paths = self._collect_directory(dir_path, recursive)
+        return list(self._iter_files(file_paths))
 
-        return violations
+    def _collect_directory(self, dir_path: Path, recursive: bool) -> list[Path]:
+        """Collect a directory's files to lint, pruning excluded directories entirely."""
+        prune_dir = self._rule_ignored_dir_check()
+        with phase_timer(self.profile, FILE_DISCOVERY):
+            return collect_files_fast(dir_path, self.ignore_parser, recursive, prune_dir)
 
     def lint_files_parallel(
         self, file_paths: list[Path], max_workers: int | None = None
@@ -415,23 +449,27 @@ class Orchestrator:  # thailint: ignore[srp]
         Returns:
             List of violations found across all files.
         """
+        return list(self._iter_files_parallel(file_paths, max_workers))
+
+    def _iter_files_parallel(
+        self, file_paths: list[Path], max_workers: int | None
+    ) -> Iterator[Violation]:
+        """Yield violations from a process pool as worker batches complete, then finalize."""
         if not file_paths:
-            return []
+            return
 
         effective_workers = max_workers or min(DEFAULT_MAX_WORKERS, multiprocessing.cpu_count())
 
         # For small file counts, sequential is faster due to process overhead
         if len(file_paths) < effective_workers * 2:
-            return self.lint_files(file_paths)
+            yield from self._iter_files(file_paths)
+            return
 
         shared_dir = Path(tempfile.mkdtemp(prefix="thailint-parallel-"))
         try:
             worker_config = self._build_parallel_worker_config(shared_dir)
-            violations = self._execute_parallel_linting(
-                file_paths, effective_workers, worker_config
-            )
-            violations.extend(self._finalize_rules_after_parallel(worker_config))
-            return violations
+            yield from self._execute_parallel_linting(file_paths, effective_workers, worker_config)
+            yield from self._finalize_rules_after_parallel(worker_config)
         finally:
             shutil.rmtree(shared_dir, ignore_errors=True)
 
@@ -453,25 +491,40 @@ class Orchestrator:  # thailint: ignore[srp]
 
     def _execute_parallel_linting(
         self, file_paths: list[Path], max_workers: int, worker_config: dict[str, Any]
-    ) -> list[Violation]:
-        """Execute parallel linting using process pool."""
-        work_items = [(fp, self.project_root, worker_config) for fp in file_paths]
+    ) -> Iterator[Violation]:
+        """Execute parallel linting using a pool of long-lived workers.
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(_lint_file_worker, item) for item in work_items]
-            return self._collect_parallel_results(futures)
+        Each worker builds its Orchestrator once (init_worker) and then lints
+        size-balanced batches of files; results are yielded as batches complete. A
+        profiled run has each batch profiled in its worker (profile_batch) and merges
+        the worker profiles into this one.
+        """
+        initargs = (self.project_root, worker_config, self.rule_selection)
+        batches = plan_balanced_batches(file_paths, max_workers)
+        task = lint_batch if self.profile is None else profile_batch
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=init_worker, initargs=initargs
+        ) as executor:
+            pending = {executor.submit(task, batch) for batch in batches}
+            yield from self._iter_parallel_results(pending)
+
+    def _iter_parallel_results(self, pending: set[Future[Any]]) -> Iterator[Violation]:
+        """Yield results from parallel futures as they complete.
+
+        Each future is dropped from the pending set once consumed, so a finished
+        batch's results are released instead of being held until the run ends.
+        """
+        for future in as_completed(pending):
+            pending.discard(future)
+            yield from self._extract_violations_from_future(future)
 
-    def _collect_parallel_results(self, futures: list[Future[list[dict]]]) -> list[Violation]:
-        """Collect results from parallel futures."""
-        violations: list[Violation] = []
-        for future in as_completed(futures):
-            violations.extend(self._extract_violations_from_future(future))
-        return violations
+    def _extract_violations_from_future(self, future: Future[Any]) -> list[Violation]:
+        """Extract violations from a completed future, handling errors.
 
-    def _extract_violations_from_future(self, future: Future[list[dict]]) -> list[Violation]:
-        """Extract violations from a completed future, handling errors."""
+        The future holds a ViolationBatch, or (ViolationBatch, RunProfile) in a profiled run.
+        """
         try:
-            return [Violation.from_dict(d) for d in future.result()]
+            return unpack_batch_result(future.result(), self.profile).to_violations()
         except Exception:
             logger.exception("Error extracting violations from worker future")
             return []
@@ -486,7 +539,9 @@ class Orchestrator:  # thailint: ignore[srp]
         self._ensure_rules_discovered()
         violations: list[Violation] = []
         for rule in self.registry.list_all():
-            violations.extend(rule.finalize_after_parallel(worker_config))
+            with finalize_timer(self.profile, rule.rule_id):
+                finalized = rule.finalize_after_parallel(worker_config)
+            violations.extend(self._drop_suppressed_finalized(rule, finalized))
         return violations
 
     def lint_directory_parallel(
@@ -502,19 +557,21 @@ class Orchestrator:  # thailint: ignore[srp]
         Returns:
             List of all violations found across all files.
         """
-        # Use fast file collection that skips excluded directories entirely
-        file_paths = _collect_files_fast(dir_path, self.ignore_parser, recursive)
+        file_paths = self._collect_directory(dir_path, recursive)
         return self.lint_files_parallel(file_paths, max_workers=max_workers)
 
     def _ensure_rules_discovered(self) -> None:
         """Ensure rules have been discovered and registered (lazy initialization)."""
         if not self._rules_discovered:
-            self.registry.discover_rules("src.linters")
+            self.registry.discover_rules("src.linters", selection=self.rule_selection)
             self._rules_discovered = True
 
     def _get_rules_for_file(self, file_path: Path, language: str) -> list[BaseLintRule]:
         """Get rules applicable to this file.
 
+        Looks the language up in the registry's dispatch table, so rules that do not
+        handle the language (per their supported_languages) are never called.
+
         Args:
             file_path: Path to file being linted.
             language: Detected programming language.
@@ -524,7 +581,4 @@ class Orchestrator:  # thailint: ignore[srp]
         """
         # Lazy initialization: discover rules on first lint operation
         self._ensure_rules_discovered()
-
-        # For now, return all registered rules
-        # Future: filter by language, configuration, etc.
-        return self.registry.list_all()
+        return self.registry.rules_for_language(language)
@@ -0,0 +1,172 @@
+"""
+Purpose: Lint context for one file, sharing its content and parses across every rule
+
+Scope: FileLintContext, the BaseLintContext the orchestrator builds for each linted file
+
+Overview: Every rule that lints a file receives the same FileLintContext. The file is read at most
+    once, on first access to its content, and files no rule reads are never opened. Python files
+    get one lazily parsed PythonSource (AST, node index, parent map and SyntaxError) and
+    TypeScript, JavaScript and Rust files one tree-sitter Tree, so rules never re-parse the same
+    file. The context also carries the config metadata and the run-wide memo of typed linter
+    configs (ResolvedConfigs), and, in a profiled run, times the file read and the parse as their
+    own phases instead of charging them to the first rule that asks.
+
+Dependencies: ast, pathlib, src.core.base, src.core.python_source, src.analyzers.tree_sitter_source,
+    src.core.config_resolution, src.orchestrator.profiler
+
+Exports: FileLintContext
+
+Interfaces: FileLintContext(path, lang, content, metadata, resolved_configs, profile),
+    file_content, file_lines, python_source / python_ast / python_index / python_parent_map /
+    python_syntax_error, tree_sitter_source
+
+Implementation: Lazily filled per-instance caches; tree-sitter grammars imported only for the
+    languages that use them
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+from src.analyzers.ast_index import AstIndex
+from src.analyzers.tree_sitter_source import TreeSitterSource
+from src.core.base import BaseLintContext
+from src.core.config_resolution import ResolvedConfigs
+from src.core.constants import Language
+from src.core.python_source import PythonSource, get_python_source
+
+from .profiler import FILE_READING, PARSING, RunProfile, phase_timer
+
+
+def _load_tree_sitter_source(language: str, content: str) -> TreeSitterSource | None:
+    """Parse content with the tree-sitter grammar for language, if it has one."""
+    if language in (Language.TYPESCRIPT, Language.JAVASCRIPT):
+        from src.analyzers.typescript_base import get_typescript_source
+
+        return get_typescript_source(content)
+    if language == Language.RUST:
+        from src.analyzers.rust_base import get_rust_source
+
+        return get_rust_source(content)
+    return None
+
+
+class FileLintContext(BaseLintContext):
+    """Concrete implementation of lint context for file analysis."""
+
+    def __init__(
+        self,
+        path: Path,
+        lang: str,
+        content: str | None = None,
+        metadata: dict | None = None,
+        resolved_configs: ResolvedConfigs | None = None,
+        profile: RunProfile | None = None,
+    ):
+        """Initialize file lint context.
+
+        Args:
+            path: Path to the file being analyzed.
+            lang: Programming language identifier.
+            content: Optional pre-loaded file content.
+            metadata: Optional metadata dict containing configuration.
+            resolved_configs: Optional run-wide memo of typed configs built from metadata,
+                read by load_linter_config instead of rebuilding a config per file.
+            profile: Optional run profile timing the file read and parse as their own phases.
+        """
+        self._path = path
+        self._language = lang
+        self._content = content
+        self._lines: list[str] | None = None  # Cached line split
+        self._python_source: PythonSource | None = None  # Shared parse cache (Python only)
+        self._tree_sitter_source: TreeSitterSource | None = None  # Shared parse cache (TS/Rust)
+        self.metadata = metadata or {}
+        self.resolved_configs = resolved_configs
+        self._profile = profile
+
+    @property
+    def file_path(self) -> Path | None:
+        """Get file path being analyzed."""
+        return self._path
+
+    @property
+    def file_content(self) -> str | None:
+        """Get file content being analyzed."""
+        if self._content is not None:
+            return self._content
+        if not self._path or not self._path.exists():
+            return None
+        try:
+            with phase_timer(self._profile, FILE_READING):
+                self._content = self._path.read_text(encoding="utf-8")
+        except (UnicodeDecodeError, OSError):
+            self._content = None
+        return self._content
+
+    @property
+    def language(self) -> str:
+        """Get programming language of file."""
+        return self._language
+
+    @property
+    def file_lines(self) -> list[str]:
+        """Get file content as list of lines (cached).
+
+        Returns:
+            List of lines from file content, empty list if no content.
+        """
+        if self._lines is None:
+            content = self.file_content
+            self._lines = content.split("\n") if content else []
+        return self._lines
+
+    @property
+    def python_source(self) -> PythonSource:
+        """Get the shared, lazily parsed Python source for this file.
+
+        Every rule linting this file reads the same PythonSource, so the file is
+        parsed with ast.parse at most once regardless of how many rules need it.
+        """
+        if self._python_source is None:
+            source = get_python_source(self.file_content or "")
+            if self._profile is not None:
+                # Parse now rather than inside the first rule, so parsing is its own phase
+                with self._profile.phase(PARSING):
+                    _ = source.tree
+            self._python_source = source
+        return self._python_source
+
+    @property
+    def python_ast(self) -> ast.Module | None:
+        """Get the memoized Python AST, or None if the file has a syntax error."""
+        return self.python_source.tree
+
+    @property
+    def python_index(self) -> AstIndex | None:
+        """Get the shared node index for the Python AST, or None on a syntax error."""
+        return self.python_source.index
+
+    @property
+    def python_parent_map(self) -> dict[ast.AST, ast.AST]:
+        """Get the memoized node-to-parent map for the Python AST."""
+        return self.python_source.parent_map
+
+    @property
+    def python_syntax_error(self) -> SyntaxError | None:
+        """Get the cached SyntaxError from parsing, or None if the file parsed."""
+        return self.python_source.syntax_error
+
+    @property
+    def tree_sitter_source(self) -> TreeSitterSource | None:
+        """Get the shared tree-sitter parse (Tree plus utf-8 bytes) for TS/JS/Rust files.
+
+        Returns:
+            TreeSitterSource parsed at most once per file, or None for other languages
+            or when the grammar is unavailable
+        """
+        if self._tree_sitter_source is None:
+            content = self.file_content or ""
+            with phase_timer(self._profile, PARSING):
+                self._tree_sitter_source = _load_tree_sitter_source(self._language, content)
+        return self._tree_sitter_source
@@ -0,0 +1,152 @@
+"""
+Purpose: Git-aware selection of the files a changed-files lint run checks
+
+Scope: Changed and unchanged file lists from the local git repository for --changed-since/--staged
+
+Overview: A pull-request-sized change touches a handful of files, yet a normal run walks and lints
+    the whole tree. collect_change_set asks local git which files differ instead: with a ref, the
+    files changed between the merge base of that ref and HEAD plus uncommitted and untracked (not
+    git-ignored) files; with --staged, the files in the index that differ from HEAD (or from the
+    merge base of the ref, when both are given). Deleted files are dropped. The result is limited
+    to the paths the user asked to lint (honoring --no-recursive) and expressed the way directory
+    traversal would spell them, so per-file results and the DRY index keep the same path keys as a
+    full run. The unchanged files in scope come from git ls-files, only when a cross-file rule asks
+    for them, so nothing walks the file system.
+
+Dependencies: subprocess, dataclasses, pathlib
+
+Exports: ChangeSet, GitChangesError, collect_change_set
+
+Interfaces: collect_change_set(paths, recursive, since, staged) -> ChangeSet,
+    ChangeSet.changed (files to lint), ChangeSet.unchanged() -> list[Path]
+
+Implementation: git rev-parse / merge-base / diff --name-only / ls-files with NUL-separated
+    output, run from the repository top level; scope matching by resolved path prefix
+"""
+
+import subprocess  # nosec B404 - runs the local git executable with fixed arguments
+from dataclasses import dataclass
+from pathlib import Path
+
+
+class GitChangesError(Exception):
+    """Raised when the changed files cannot be determined from git."""
+
+
+@dataclass(frozen=True)
+class _Scope:
+    """One requested lint path, as given and resolved."""
+
+    given: Path
+    resolved: Path
+    is_dir: bool
+
+    def spell(self, file_path: Path, recursive: bool) -> Path | None:
+        """Spell a resolved file path relative to this scope, or None if outside it."""
+        if not self.is_dir:
+            return self.given if file_path == self.resolved else None
+        if not file_path.is_relative_to(self.resolved):
+            return None
+        relative = file_path.relative_to(self.resolved)
+        if not recursive and len(relative.parts) > 1:
+            return None
+        return self.given / relative
+
+
+@dataclass
+class ChangeSet:
+    """Files a changed-files run lints, and access to the unchanged files around them."""
+
+    top_level: Path
+    scopes: list[_Scope]
+    recursive: bool
+    changed: list[Path]
+
+    def unchanged(self) -> list[Path]:
+        """List the files in scope that git tracks or sees as untracked, minus changed ones.
+
+        Returns:
+            Unchanged files, spelled like the changed ones
+        """
+        changed = set(self.changed)
+        names = _git(self.top_level, "ls-files", "-z", "--cached", "--others", "--exclude-standard")
+        in_scope = _scoped_files(names, self.top_level, self.scopes, self.recursive)
+        return [path for path in in_scope if path not in changed]
+
+
+def collect_change_set(
+    paths: list[Path], recursive: bool, since: str | None = None, staged: bool = False
+) -> ChangeSet:
+    """Determine the files under paths that changed, according to local git.
+
+    Args:
+        paths: Files and directories the user asked to lint
+        recursive: Whether directories include their subdirectories
+        since: Git ref to compare against (its merge base with HEAD)
+        staged: Compare the staged index instead of the working tree
+
+    Returns:
+        ChangeSet whose changed files are limited to paths
+
+    Raises:
+        GitChangesError: If git is unavailable, paths are outside a repository, or since is
+            not a valid ref
+    """
+    anchor = next((p if p.is_dir() else p.parent for p in paths), Path.cwd())
+    top_level = Path(_git(anchor, "rev-parse", "--show-toplevel", separator="\n")[0]).resolve()
+    scopes = [_Scope(path, path.resolve(), path.is_dir()) for path in paths]
+    names = _changed_names(top_level, since, staged)
+    return ChangeSet(
+        top_level, scopes, recursive, _scoped_files(names, top_level, scopes, recursive)
+    )
+
+
+def _scoped_files(
+    names: list[str], top_level: Path, scopes: list[_Scope], recursive: bool
+) -> list[Path]:
+    """Map repository-relative names to existing files in scope, spelled by their scope."""
+    paths: list[Path] = []
+    seen: set[Path] = set()
+    for name in names:
+        spelled = _spell(top_level / name, scopes, recursive)
+        if spelled is not None and spelled not in seen and spelled.is_file():
+            seen.add(spelled)
+            paths.append(spelled)
+    return paths
+
+
+def _spell(file_path: Path, scopes: list[_Scope], recursive: bool) -> Path | None:
+    """Spell a file through the first scope containing it."""
+    for scope in scopes:
+        spelled = scope.spell(file_path, recursive)
+        if spelled is not None:
+            return spelled
+    return None
+
+
+def _changed_names(top_level: Path, since: str | None, staged: bool) -> list[str]:
+    """Repository-relative names of the changed, non-deleted files."""
+    base = [_merge_base(top_level, since)] if since else []
+    if staged:
+        return _git(top_level, "diff", "--name-only", "-z", "--diff-filter=d", "--cached", *base)
+    changed = _git(top_level, "diff", "--name-only", "-z", "--diff-filter=d", *base)
+    return changed + _git(top_level, "ls-files", "-z", "--others", "--exclude-standard")
+
+
+def _merge_base(top_level: Path, ref: str) -> str:
+    """Commit where the current branch forked from ref."""
+    return _git(top_level, "merge-base", ref, "HEAD", separator="\n")[0]
+
+
+def _git(cwd: Path, *args: str, separator: str = "\0") -> list[str]:
+    """Run a git command and split its output, raising GitChangesError on failure."""
+    try:
+        result = subprocess.run(  # nosec B603 B607 - fixed git arguments, no shell
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+        )
+    except FileNotFoundError as e:
+        raise GitChangesError("git is not installed or not on PATH") from e
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.strip() or f"git {' '.join(args)} failed"
+        raise GitChangesError(message) from e
+    return [name for name in result.stdout.split(separator) if name]
@@ -0,0 +1,252 @@
+"""
+Purpose: Per-rule and per-phase timing of a lint run for the --profile report
+
+Scope: RunProfile accumulating wall/CPU time per rule (check, finalize) and per run phase
+
+Overview: Records where a lint run spends its time so the cost of each linter can be tracked and
+    .thailint.yaml tuned. Rules are timed per check() call, keeping the slowest files of each
+    rule, and per finalize(); run phases (file discovery, file reading, parsing, ignore
+    filtering, output formatting) are timed where the orchestrator and the CLI perform them.
+    Measurements are exclusive: a file read or parse triggered lazily inside a rule's check() is
+    charged to its phase and not to the rule, so each second is counted once. Parallel workers
+    profile each batch separately and the parent merges the returned profiles, so rule and
+    phase times are summed over every process (they can exceed the run's elapsed wall time).
+    When profiling is off the orchestrator holds no profile and the timers are no-op contexts.
+
+Dependencies: heapq, time.perf_counter/process_time, contextlib, dataclasses
+
+Exports: RunProfile, PhaseTiming, RuleProfile, phase_timer, check_timer, finalize_timer, phase
+    name constants, DEFAULT_SLOWEST_FILES
+
+Interfaces: RunProfile.phase(name), RunProfile.rule_check(rule_id, file_path),
+    RunProfile.rule_finalize(rule_id), RunProfile.time_output(items), RunProfile.merge(other),
+    RunProfile.finish(), RunProfile.to_dict() -> dict
+
+Implementation: A stack of child-time accumulators makes nested measurements exclusive; the
+    slowest files of each rule are kept in a bounded min-heap
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter, process_time
+from typing import Any, TypeVar
+
+# Run phases reported alongside the rules
+FILE_DISCOVERY = "file_discovery"
+FILE_READING = "file_reading"
+PARSING = "parsing"
+IGNORE_FILTERING = "ignore_filtering"
+OUTPUT_FORMATTING = "output_formatting"
+PHASES = (FILE_DISCOVERY, FILE_READING, PARSING, IGNORE_FILTERING, OUTPUT_FORMATTING)
+
+# Slowest files kept per rule unless the caller asks for another number
+DEFAULT_SLOWEST_FILES = 10
+
+# Decimal places kept for seconds in the report (microseconds)
+_REPORT_DIGITS = 6
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class PhaseTiming:
+    """Accumulated wall and CPU seconds of one measured activity."""
+
+    wall: float = 0.0
+    cpu: float = 0.0
+    calls: int = 0
+
+    def add(self, wall: float, cpu: float) -> None:
+        """Add one measurement."""
+        self.wall += wall
+        self.cpu += cpu
+        self.calls += 1
+
+    def merge(self, other: PhaseTiming) -> None:
+        """Add another accumulation of the same activity."""
+        self.wall += other.wall
+        self.cpu += other.cpu
+        self.calls += other.calls
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the timing as JSON-ready values."""
+        return {
+            "wall": round(self.wall, _REPORT_DIGITS),
+            "cpu": round(self.cpu, _REPORT_DIGITS),
+            "calls": self.calls,
+        }
+
+
+@dataclass(slots=True)
+class RuleProfile:
+    """Timings of one rule: its check() calls, its finalize() and its slowest files."""
+
+    check: PhaseTiming = field(default_factory=PhaseTiming)
+    finalize: PhaseTiming = field(default_factory=PhaseTiming)
+    # Min-heap of (check wall seconds, file path), at most the profile's slowest_files entries
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    @property
+    def total_wall(self) -> float:
+        """Wall seconds spent in check() and finalize() together."""
+        return self.check.wall + self.finalize.wall
+
+    def note_file(self, wall: float, file_path: str, keep: int) -> None:
+        """Offer a file's check() time to the slowest-files heap."""
+        if len(self.slowest) < keep:
+            heapq.heappush(self.slowest, (wall, file_path))
+        elif self.slowest and wall > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (wall, file_path))
+
+    def slowest_files(self) -> list[tuple[str, float]]:
+        """Get the slowest files, slowest first."""
+        return [(path, wall) for wall, path in sorted(self.slowest, reverse=True)]
+
+
+class RunProfile:
+    """Wall/CPU time of one lint run, per rule and per phase."""
+
+    def __init__(self, slowest_files: int = DEFAULT_SLOWEST_FILES) -> None:
+        """Start profiling a run.
+
+        Args:
+            slowest_files: Number of slowest files to keep per rule
+        """
+        self.slowest_files = slowest_files
+        self.phases: dict[str, PhaseTiming] = {}
+        self.rules: dict[str, RuleProfile] = {}
+        self.total_wall: float | None = None
+        self._started = perf_counter()
+        # Wall/CPU seconds already charged by measurements nested in each open measurement
+        self._nested: list[list[float]] = []
+        self._output_started: tuple[float, float] | None = None
+        self._producer_time = [0.0, 0.0]
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        """Time a block as part of a run phase (e.g. FILE_READING)."""
+        timing = self.phases.setdefault(name, PhaseTiming())
+        return self._measure(timing.add)
+
+    def rule_check(
+        self, rule_id: str, file_path: Path | str | None
+    ) -> AbstractContextManager[None]:
+        """Time one rule's check() of one file."""
+        rule = self._rule(rule_id)
+
+        def record(wall: float, cpu: float) -> None:
+            rule.check.add(wall, cpu)
+            if file_path is not None:
+                rule.note_file(wall, str(file_path), self.slowest_files)
+
+        return self._measure(record)
+
+    def rule_finalize(self, rule_id: str) -> AbstractContextManager[None]:
+        """Time one rule's finalize()."""
+        return self._measure(self._rule(rule_id).finalize.add)
+
+    def time_output(self, items: Iterable[T]) -> Iterator[T]:
+        """Pass a violation stream through, charging the consumer's time to output formatting.
+
+        Time spent producing the items is linting (already measured where it happens);
+        everything else from the first item requested until finish() is the consumer
+        formatting and writing the results.
+        """
+        self._output_started = (perf_counter(), process_time())
+        iterator = iter(items)
+        while True:
+            wall, cpu = perf_counter(), process_time()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._producer_time[0] += perf_counter() - wall
+                self._producer_time[1] += process_time() - cpu
+            yield item
+
+    def finish(self) -> None:
+        """Stop the run clock and settle the output-formatting time of time_output()."""
+        self.total_wall = perf_counter() - self._started
+        if self._output_started is None:
+            return
+        wall = perf_counter() - self._output_started[0] - self._producer_time[0]
+        cpu = process_time() - self._output_started[1] - self._producer_time[1]
+        self.phases.setdefault(OUTPUT_FORMATTING, PhaseTiming()).add(max(wall, 0.0), max(cpu, 0.0))
+        self._output_started = None
+
+    def merge(self, other: RunProfile) -> None:
+        """Add the timings of another profile (e.g. one parallel worker batch)."""
+        for name, timing in other.phases.items():
+            self.phases.setdefault(name, PhaseTiming()).merge(timing)
+        for rule_id, theirs in other.rules.items():
+            ours = self._rule(rule_id)
+            ours.check.merge(theirs.check)
+            ours.finalize.merge(theirs.finalize)
+            for wall, file_path in theirs.slowest:
+                ours.note_file(wall, file_path, self.slowest_files)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the profile as a JSON-ready report, rules ordered by total wall time."""
+        rules = sorted(self.rules.items(), key=lambda item: item[1].total_wall, reverse=True)
+        total = self.total_wall
+        return {
+            "total_wall": round(total, _REPORT_DIGITS) if total is not None else None,
+            "phases": {name: self.phases[name].to_dict() for name in PHASES if name in self.phases},
+            "rules": {rule_id: _rule_to_dict(rule) for rule_id, rule in rules},
+        }
+
+    def _rule(self, rule_id: str) -> RuleProfile:
+        """Get the profile of a rule, creating it on first use."""
+        rule = self.rules.get(rule_id)
+        if rule is None:
+            rule = self.rules[rule_id] = RuleProfile()
+        return rule
+
+    @contextmanager
+    def _measure(self, record: Callable[[float, float], None]) -> Iterator[None]:
+        """Time a block, recording its time minus that of measurements nested in it."""
+        self._nested.append([0.0, 0.0])
+        wall, cpu = perf_counter(), process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = perf_counter() - wall, process_time() - cpu
+            nested_wall, nested_cpu = self._nested.pop()
+            if self._nested:
+                self._nested[-1][0] += wall
+                self._nested[-1][1] += cpu
+            record(wall - nested_wall, cpu - nested_cpu)
+
+
+def _rule_to_dict(rule: RuleProfile) -> dict[str, Any]:
+    """Get one rule's timings as JSON-ready values."""
+    return {
+        "check": rule.check.to_dict(),
+        "finalize": rule.finalize.to_dict(),
+        "slowest_files": [
+            {"file": path, "wall": round(wall, _REPORT_DIGITS)}
+            for path, wall in rule.slowest_files()
+        ],
+    }
+
+
+def phase_timer(profile: RunProfile | None, name: str) -> AbstractContextManager[None]:
+    """Time a block as a run phase, or do nothing when the run is not profiled."""
+    return profile.phase(name) if profile is not None else nullcontext()
+
+
+def check_timer(
+    profile: RunProfile | None, rule_id: str, file_path: Path | str | None
+) -> AbstractContextManager[None]:
+    """Time a rule's check(), or do nothing when the run is not profiled."""
+    return profile.rule_check(rule_id, file_path) if profile is not None else nullcontext()
+
+
+def finalize_timer(profile: RunProfile | None, rule_id: str) -> AbstractContextManager[None]:
+    """Time a rule's finalize(), or do nothing when the run is not profiled."""
+    return profile.rule_finalize(rule_id) if profile is not None else nullcontext()
@@ -0,0 +1,220 @@
+"""
+Purpose: Opt-in persistent cache of per-file, per-rule lint results across runs
+
+Scope: SQLite-backed storage of check() violations keyed by content hash, config and version
+
+Overview: Every per-file rule recomputes its results from scratch on every invocation, although
+    in pre-commit hooks and local edit-lint loops most files have not changed since the last run.
+    With result_cache enabled in the config, the orchestrator stores each cacheable rule's check()
+    violations per file in an on-disk SQLite database under the project (next to the DRY index,
+    in WAL mode so --parallel workers can share it), keyed by the file's content hash plus a
+    fingerprint of the effective config, project root and thailint version. A later run reuses
+    the stored violations for unchanged files without parsing them, and only re-checks files whose
+    content changed. Changing the config or upgrading thailint changes the fingerprint, so every
+    entry misses and is recomputed. Rules with cross-file state (finalize()) opt out through
+    BaseLintRule.results_cacheable and always run.
+
+Dependencies: sqlite3, hashlib, json, pathlib, src.core.base.BaseLintRule, src.core.types.Violation,
+    DEFAULT_CACHE_DIR_NAME
+
+Exports: ResultCache, resolve_result_cache_path, config_fingerprint,
+    DEFAULT_RESULT_CACHE_FILE_NAME
+
+Interfaces: resolve_result_cache_path(config, project_root) -> Path | None,
+    ResultCache(db_path, fingerprint).check_file(file_path, content, rules, run_rule),
+    config_fingerprint(config, project_root) -> str
+
+Implementation: One row per (file, rule) holding the violations as JSON; a lookup fetches every
+    matching row for a file in one query, misses are checked and written back in one commit
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any
+
+from src.core.base import BaseLintRule
+from src.core.constants import DEFAULT_CACHE_DIR_NAME
+from src.core.types import Violation
+
+# File name of the result cache, inside DEFAULT_CACHE_DIR_NAME next to the DRY index
+DEFAULT_RESULT_CACHE_FILE_NAME = "results.db"
+
+
+def resolve_result_cache_path(config: dict[str, Any], project_root: Path) -> Path | None:
+    """Resolve the result cache database path, or None when the cache is not enabled.
+
+    Accepts ``result_cache: true`` or a mapping with ``enabled`` and an optional ``path``
+    (relative paths resolve against the project root).
+
+    Args:
+        config: Effective linter configuration
+        project_root: Project root directory
+
+    Returns:
+        Database path when the cache is enabled, otherwise None
+    """
+    setting = config.get("result_cache")
+    if isinstance(setting, dict):
+        if not setting.get("enabled", False):
+            return None
+        custom_path = setting.get("path")
+        if custom_path:
+            return project_root / str(custom_path)
+    elif setting is not True:
+        return None
+    return project_root / DEFAULT_CACHE_DIR_NAME / DEFAULT_RESULT_CACHE_FILE_NAME
+
+
+def config_fingerprint(config: dict[str, Any], project_root: Path) -> str:
+    """Fingerprint everything besides file content that a rule's results depend on.
+
+    Args:
+        config: Effective linter configuration
+        project_root: Project root directory
+
+    Returns:
+        Hex digest of the thailint version, project root and canonical config
+    """
+    from src import __version__
+
+    canonical = json.dumps(config, sort_keys=True, default=str)
+    return _digest(f"{__version__}\0{project_root}\0{canonical}")
+
+
+def _digest(text: str) -> str:
+    """Hash text to a hex-encoded blake2b digest."""
+    return hashlib.blake2b(text.encode("utf-8", errors="surrogateescape")).hexdigest()
+
+
+class ResultCache:
+    """SQLite-backed store of per-file, per-rule check() results."""
+
+    SCHEMA_VERSION = 1
+    # Seconds to wait for a lock while --parallel workers share the database file
+    CONNECT_TIMEOUT = 30
+
+    def __init__(self, db_path: Path, fingerprint: str) -> None:
+        """Open (creating if needed) the cache database.
+
+        Args:
+            db_path: Database file path
+            fingerprint: Config/version fingerprint entries must match to be reused
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(db_path), timeout=self.CONNECT_TIMEOUT)
+        # WAL lets --parallel worker processes read and write concurrently; NORMAL sync
+        # skips the per-commit fsync (one commit per file) that WAL makes unnecessary
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self._fingerprint = fingerprint
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        """Create the schema, dropping the results table if its layout is outdated."""
+        self.db.execute("CREATE TABLE IF NOT EXISTS schema_meta (version INTEGER NOT NULL)")
+        row = self.db.execute("SELECT version FROM schema_meta").fetchone()
+        if row is not None and row[0] != self.SCHEMA_VERSION:
+            self.db.execute("DROP TABLE IF EXISTS results")
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS results (
+                file_path TEXT NOT NULL,
+                rule_id TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                violations TEXT NOT NULL,
+                PRIMARY KEY (file_path, rule_id)
+            )"""
+        )
+        self.db.execute("DELETE FROM schema_meta")
+        self.db.execute("INSERT INTO schema_meta (version) VALUES (?)", (self.SCHEMA_VERSION,))
+        self.db.commit()
+
+    def check_file(
+        self,
+        file_path: Path,
+        content: str,
+        rules: Sequence[BaseLintRule],
+        run_rule: Callable[[BaseLintRule], list[Violation] | None],
+    ) -> list[Violation]:
+        """Get a file's violations, reusing cached results for unchanged files.
+
+        Args:
+            file_path: File being linted
+            content: The file's current content
+            rules: Rules dispatched for the file, in execution order
+            run_rule: Runs one rule's check() on the file, returning None if the rule
+                failed (a failed rule contributes nothing and is not cached)
+
+        Returns:
+            Violations from every rule, in rule order
+        """
+        content_hash = _digest(content)
+        cached = self._load(file_path, content_hash)
+        misses: list[tuple[str, list[Violation]]] = []
+        violations: list[Violation] = []
+        for rule in rules:
+            result = cached.get(rule.rule_id) if rule.results_cacheable else None
+            if result is None:
+                result = _run_and_record(rule, run_rule, misses)
+            violations.extend(result)
+        self._store(file_path, content_hash, misses)
+        return violations
+
+    def _load(self, file_path: Path, content_hash: str) -> dict[str, list[Violation]]:
+        """Load every still-valid rule result for a file in one query."""
+        rows = self.db.execute(
+            """SELECT rule_id, violations FROM results
+               WHERE file_path = ? AND content_hash = ? AND fingerprint = ?""",
+            (str(file_path), content_hash, self._fingerprint),
+        ).fetchall()
+        return {rule_id: _decode(payload) for rule_id, payload in rows}
+
+    def _store(
+        self, file_path: Path, content_hash: str, results: list[tuple[str, list[Violation]]]
+    ) -> None:
+        """Write freshly computed rule results for a file in one commit."""
+        if not results:
+            return
+        self.db.executemany(
+            """INSERT OR REPLACE INTO results
+               (file_path, rule_id, content_hash, fingerprint, violations)
+               VALUES (?, ?, ?, ?, ?)""",
+            [
+                (str(file_path), rule_id, content_hash, self._fingerprint, _encode(violations))
+                for rule_id, violations in results
+            ],
+        )
+        self.db.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.db.close()
+
+
+def _run_and_record(
+    rule: BaseLintRule,
+    run_rule: Callable[[BaseLintRule], list[Violation] | None],
+    misses: list[tuple[str, list[Violation]]],
+) -> list[Violation]:
+    """Run a rule that had no cached result, recording successful cacheable results."""
+    result = run_rule(rule)
+    if result is None:
+        return []
+    if rule.results_cacheable:
+        misses.append((rule.rule_id, result))
+    return result
+
+
+def _encode(violations: list[Violation]) -> str:
+    """Serialize violations for storage."""
+    return json.dumps([v.to_dict() for v in violations])
+
+
+def _decode(payload: str) -> list[Violation]:
+    """Deserialize stored violations."""
+    return [Violation.from_dict(data) for data in json.loads(payload)]
@@ -0,0 +1,196 @@
+"""
+Purpose: Long-lived worker process state and size-balanced batching for parallel linting
+
+Scope: ProcessPoolExecutor initializer, per-process Orchestrator, batch worker, batch planning
+
+Overview: lint_files_parallel used to submit one task per file, and every task pickled the full
+    worker config and built a brand-new Orchestrator (config, ignore parser, rule discovery) in
+    the worker before linting a single file, so on large trees the per-file setup cost exceeded
+    the linting itself. Each worker builds its Orchestrator once, in the pool initializer, and
+    keeps it for the life of the process. Files are sent in batches from
+    plan_balanced_batches: longest-processing-time-first assignment by file size, with several
+    batches per worker so a worker that finishes early picks up more work and results stream
+    back batch by batch as they complete. Each batch's violations travel back as one
+    ViolationBatch (columnar, every distinct string once) rather than a list of per-violation
+    dicts, so noisy rules do not make pickling the bottleneck. A profiled run submits
+    profile_batch instead, which times the batch with a fresh RunProfile on the worker's
+    Orchestrator and returns it with the violations; unpack_batch_result merges it into the
+    parent's profile.
+
+Dependencies: heapq, logging, pathlib, ViolationBatch, RunProfile, Orchestrator (imported lazily
+    to avoid a cycle)
+
+Exports: init_worker, lint_batch, profile_batch, unpack_batch_result, plan_balanced_batches,
+    BATCHES_PER_WORKER
+
+Interfaces: ProcessPoolExecutor(initializer=init_worker, initargs=(project_root, config, rules)),
+    executor.submit(lint_batch, paths) -> ViolationBatch,
+    executor.submit(profile_batch, paths) -> (ViolationBatch, RunProfile),
+    unpack_batch_result(result, profile) -> ViolationBatch,
+    plan_balanced_batches(paths, workers)
+
+Implementation: Module-level per-process Orchestrator singleton set by the initializer; greedy
+    min-heap bin packing over file sizes
+
+Suppressions:
+    - global-statement: Per-process worker state must be module-level to survive across tasks
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+from src.core.types import Violation, ViolationBatch
+
+from .profiler import RunProfile
+
+if TYPE_CHECKING:
+    from .core import Orchestrator
+
+logger = logging.getLogger(__name__)
+
+# Batches planned per worker: enough that a worker finishing early picks up more work, few
+# enough that per-task overhead stays negligible
+BATCHES_PER_WORKER = 4
+
+# Orchestrator owned by this worker process (set once by init_worker)
+_WORKER_ORCHESTRATOR: Orchestrator | None = None
+
+
+def init_worker(project_root: Path, config: dict[str, Any], rules: tuple[str, ...] | None) -> None:
+    """Pool initializer: build this worker process's Orchestrator once.
+
+    Args:
+        project_root: Project root of the parent orchestrator
+        config: Worker config (parent config plus parallel-shared overrides)
+        rules: Parent orchestrator's rule selection (None for all rules)
+    """
+    global _WORKER_ORCHESTRATOR  # pylint: disable=global-statement
+    from .core import Orchestrator
+
+    _WORKER_ORCHESTRATOR = Orchestrator(project_root=project_root, config=config, rules=rules)
+
+
+def lint_batch(file_paths: list[Path]) -> ViolationBatch:
+    """Lint a batch of files with this worker process's Orchestrator.
+
+    A failure on one file is logged and does not discard the rest of the batch.
+
+    Args:
+        file_paths: Files to lint
+
+    Returns:
+        Violations of the whole batch, packed for cross-process transfer
+    """
+    orchestrator = _worker_orchestrator()
+    results: list[Violation] = []
+    for file_path in file_paths:
+        results.extend(_lint_one(orchestrator, file_path))
+    return ViolationBatch.from_violations(results)
+
+
+def profile_batch(file_paths: list[Path]) -> tuple[ViolationBatch, RunProfile]:
+    """Lint a batch of files like lint_batch, timing it with a profile of its own.
+
+    Args:
+        file_paths: Files to lint
+
+    Returns:
+        Violations of the whole batch and the batch's profile
+    """
+    orchestrator = _worker_orchestrator()
+    profile = RunProfile()
+    orchestrator.profile = profile
+    try:
+        batch = lint_batch(file_paths)
+    finally:
+        orchestrator.profile = None
+    return batch, profile
+
+
+def unpack_batch_result(result: Any, profile: RunProfile | None) -> ViolationBatch:
+    """Get the violations of a finished batch task, merging its profile in a profiled run.
+
+    Args:
+        result: lint_batch result, or profile_batch result when profile is set
+        profile: The parent's run profile, or None
+
+    Returns:
+        The batch's violations
+    """
+    if profile is None:
+        return cast(ViolationBatch, result)
+    batch, batch_profile = result
+    profile.merge(batch_profile)
+    return cast(ViolationBatch, batch)
+
+
+def _worker_orchestrator() -> Orchestrator:
+    """Get this worker process's Orchestrator, failing outside an initialized worker."""
+    if _WORKER_ORCHESTRATOR is None:
+        raise RuntimeError("lint_batch called in a process not set up by init_worker")
+    return _WORKER_ORCHESTRATOR
+
+
+def _lint_one(orchestrator: Orchestrator, file_path: Path) -> list[Violation]:
+    """Lint one file, containing errors."""
+    try:
+        return orchestrator.lint_file(file_path)
+    except Exception:
+        logger.exception("Worker error processing file: %s", file_path)
+        return []
+
+
+def plan_balanced_batches(file_paths: Sequence[Path], worker_count: int) -> list[list[Path]]:
+    """Split files into batches of roughly equal total size.
+
+    Assigns files largest first to the batch with the smallest running total
+    (longest-processing-time-first), using file size as the cost estimate.
+
+    Args:
+        file_paths: Files to distribute
+        worker_count: Number of worker processes
+
+    Returns:
+        Non-empty batches, heaviest first
+    """
+    batch_count = max(1, min(len(file_paths), worker_count * BATCHES_PER_WORKER))
+    batches: list[list[Path]] = [[] for _ in range(batch_count)]
+    heap = [(0, index) for index in range(batch_count)]
+    for size, path in _largest_first(file_paths):
+        _add_to_lightest(heap, batches, path, size)
+    return _non_empty_heaviest_first(heap, batches)
+
+
+def _largest_first(file_paths: Sequence[Path]) -> list[tuple[int, Path]]:
+    """Pair each file with its size, largest first."""
+    return sorted(((_file_size(path), path) for path in file_paths), reverse=True)
+
+
+def _add_to_lightest(
+    heap: list[tuple[int, int]], batches: list[list[Path]], path: Path, size: int
+) -> None:
+    """Append a file to the batch with the smallest running total, updating the heap."""
+    total, index = heapq.heappop(heap)
+    batches[index].append(path)
+    heapq.heappush(heap, (total + size, index))
+
+
+def _non_empty_heaviest_first(
+    heap: list[tuple[int, int]], batches: list[list[Path]]
+) -> list[list[Path]]:
+    """Order batches by total size, heaviest first, dropping empty ones."""
+    ordered = [batches[index] for _, index in sorted(heap, reverse=True)]
+    return [batch for batch in ordered if batch]
+
+
+def _file_size(path: Path) -> int:
+    """Get a file's size in bytes as its cost estimate (0 if it cannot be stat'ed)."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
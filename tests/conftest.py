@@ -24,6 +24,9 @@ from pathlib import Path
 
 import pytest
 
+from src.analyzers.ast_index import clear_ast_index_cache
+from src.analyzers.tree_sitter_source import clear_tree_sitter_source_cache
+from src.core.python_source import clear_python_source_cache
 from src.linter_config.ignore import clear_ignore_parser_cache
 
 
@@ -37,10 +40,18 @@ def _clear_caches():
 
     The IgnoreDirectiveParser singleton is cleared to ensure each test
     gets a fresh parser instance with proper project root configuration.
+    The shared Python source, AST index and tree-sitter source memos are cleared so parse-count tests
+    start cold.
     """
     clear_ignore_parser_cache()
+    clear_python_source_cache()
+    clear_ast_index_cache()
+    clear_tree_sitter_source_cache()
     yield
     clear_ignore_parser_cache()
+    clear_python_source_cache()
+    clear_ast_index_cache()
+    clear_tree_sitter_source_cache()
 
 
 @pytest.fixture
@@ -0,0 +1,190 @@
+"""
+Purpose: Test the single-traversal AST node index shared by the Python analyzers
+
+Scope: src.analyzers.ast_index.AstIndex and get_ast_index, plus the one-index-per-file guarantee
+
+Overview: AstIndex gives the Python analyzers one shared traversal of each module instead of an
+    ast.walk pass per analyzer. Verifies that type queries return exactly what an isinstance filter
+    over ast.walk would (in source order, with abstract bases such as ast.stmt), that within=
+    restricts queries to one subtree or a statement body, that parent links, nearest-ancestor
+    lookups and the enclosing function/class/loop scopes are right, that get_ast_index shares one
+    index per tree, and - as a benchmark - that linting a Python file with every rule enabled
+    indexes the module once and never runs ast.walk over it.
+
+Dependencies: ast, pathlib.Path, typing.Any, unittest.mock, src.analyzers.ast_index,
+    src.orchestrator.core
+
+Exports: TestNodeQueries, TestTreeStructure, TestSharedIndex, TestSingleTraversal test classes
+
+Interfaces: Exercises AstIndex.nodes, walk, parent, ancestor, enclosing_* and get_ast_index
+
+Implementation: The shared sample module compared against ast.walk; the traversal benchmark wraps
+    AstIndex._traverse and ast.walk with counters while a real Orchestrator lints the file
+"""
+
+import ast
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from src.analyzers import ast_index
+from src.analyzers.ast_index import AstIndex, get_ast_index
+from src.orchestrator.core import Orchestrator
+
+# Context and operator nodes CPython shares between every use (no single parent)
+_SHARED_SINGLETONS = (ast.expr_context, ast.operator, ast.unaryop, ast.boolop, ast.cmpop)
+
+
+def _walk_filter(root: ast.AST, node_type: type | tuple[type, ...]) -> list[ast.AST]:
+    """Reference result: isinstance filter over ast.walk, sorted into source order."""
+    order = {node: i for i, node in enumerate(AstIndex(root).walk())}
+    return sorted((n for n in ast.walk(root) if isinstance(n, node_type)), key=order.__getitem__)
+
+
+def _function(tree: ast.Module, name: str) -> ast.FunctionDef:
+    """Find a function definition by name."""
+    return next(n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef) and n.name == name)
+
+
+class TestNodeQueries:
+    """nodes() and walk() agree with ast.walk."""
+
+    def test_whole_tree_matches_walk(self, python_sample: str) -> None:
+        """Every node type query returns the same nodes as an isinstance filter."""
+        tree = ast.parse(python_sample)
+        index = AstIndex(tree)
+        for node_type in (ast.Call, ast.Name, ast.FunctionDef, (ast.For, ast.While)):
+            assert index.nodes(node_type) == _walk_filter(tree, node_type)
+
+    def test_abstract_bases_match_subclasses(self, python_sample: str) -> None:
+        """ast.stmt and ast.expr select every concrete statement and expression."""
+        tree = ast.parse(python_sample)
+        index = AstIndex(tree)
+        assert index.nodes(ast.stmt) == _walk_filter(tree, ast.stmt)
+        assert len(index.walk()) == len(list(ast.walk(tree)))
+
+    def test_absent_type_is_empty(self, python_sample: str) -> None:
+        """A type that does not occur yields no nodes."""
+        assert AstIndex(ast.parse(python_sample)).nodes(ast.AsyncWith) == []
+
+    def test_within_subtree(self, python_sample: str) -> None:
+        """within= restricts a query to one node's subtree, including the node itself."""
+        tree = ast.parse(python_sample)
+        load = _function(tree, "load")
+        index = AstIndex(tree)
+        assert index.nodes(ast.Call, within=load) == _walk_filter(load, ast.Call)
+        assert index.nodes(ast.FunctionDef, within=load) == [load]
+
+    def test_within_statement_body(self, python_sample: str) -> None:
+        """within= accepts a statement body and spans all of its statements."""
+        tree = ast.parse(python_sample)
+        body = _function(tree, "load").body
+        names = AstIndex(tree).nodes(ast.Name, within=body)
+        assert names == [n for stmt in body for n in _walk_filter(stmt, ast.Name)]
+        assert AstIndex(tree).nodes(ast.Name, within=[]) == []
+
+    def test_within_foreign_node(self, python_sample: str) -> None:
+        """A node from another tree is indexed on its own rather than failing."""
+        other = ast.parse("f(g(x))")
+        assert len(AstIndex(ast.parse(python_sample)).nodes(ast.Call, within=other)) == 2
+
+
+class TestTreeStructure:
+    """Parent links and enclosing scopes."""
+
+    def test_parent_map_matches_children(self, python_sample: str) -> None:
+        """Every child maps to the node it was yielded from; the root has no parent."""
+        tree = ast.parse(python_sample)
+        index = AstIndex(tree)
+        for node in ast.walk(tree):
+            for child in ast.iter_child_nodes(node):
+                if not isinstance(child, _SHARED_SINGLETONS):
+                    assert index.parent(child) is node
+        assert index.parent(tree) is None
+
+    def test_ancestor(self, python_sample: str) -> None:
+        """ancestor() finds the nearest proper ancestor of a type."""
+        tree = ast.parse(python_sample)
+        index = AstIndex(tree)
+        call = next(n for n in index.nodes(ast.Call) if isinstance(n.func, ast.Attribute))
+        assert isinstance(index.ancestor(call, ast.For), ast.For)
+        assert index.ancestor(call, ast.While) is None
+
+    def test_enclosing_scopes(self, python_sample: str) -> None:
+        """Calls inside the loop see the method, the class and the loop."""
+        tree = ast.parse(python_sample)
+        index = AstIndex(tree)
+        call = index.nodes(ast.Call, within=_function(tree, "load"))[0]
+        assert index.enclosing_function(call) is _function(tree, "load")
+        assert index.enclosing_class(call).name == "Store"
+        assert isinstance(index.enclosing_loop(call), ast.For)
+
+    def test_nested_def_starts_fresh_loop_scope(self, python_sample: str) -> None:
+        """A def nested in a method has its own loop scope and keeps the class."""
+        tree = ast.parse(python_sample)
+        index = AstIndex(tree)
+        inner = _function(tree, "inner")
+        brk = index.nodes(ast.Break)[0]
+        assert index.enclosing_function(brk) is inner
+        assert isinstance(index.enclosing_loop(brk), ast.While)
+        assert index.enclosing_loop(inner.body[0]) is None
+
+    def test_module_level_scope_is_empty(self, python_sample: str) -> None:
+        """Top-level statements have no enclosing function, class or loop."""
+        tree = ast.parse(python_sample)
+        assert AstIndex(tree).scope(tree.body[1]) == ast_index.Scope(None, None, None)
+
+    def test_deep_tree_does_not_recurse(self) -> None:
+        """Traversal is iterative, so very deep expressions index fine."""
+        tree = ast.parse("x = " + "-" * 2000 + "1")
+        assert len(AstIndex(tree).nodes(ast.UnaryOp)) == 2000
+
+
+class TestSharedIndex:
+    """get_ast_index memoizes by tree identity."""
+
+    def test_same_tree_same_index(self, python_sample: str) -> None:
+        """Repeated lookups for one tree share one index."""
+        tree = ast.parse(python_sample)
+        assert get_ast_index(tree) is get_ast_index(tree)
+
+    def test_equal_source_different_tree(self, python_sample: str) -> None:
+        """Separately parsed trees get separate indexes."""
+        assert get_ast_index(ast.parse(python_sample)) is not get_ast_index(
+            ast.parse(python_sample)
+        )
+
+
+class TestSingleTraversal:
+    """Benchmark: one traversal of a module per lint run, whatever the number of rules."""
+
+    def test_lint_file_indexes_module_once(
+        self, tmp_path: Path, python_sample: str, all_rules_config: dict[str, Any]
+    ) -> None:
+        """Linting with every rule indexes the module once and never ast.walks it."""
+        sample = tmp_path / "sample.py"
+        sample.write_text(python_sample)
+        traversed: list[ast.AST] = []
+        walked_modules: list[ast.AST] = []
+        original_traverse = AstIndex._traverse
+        original_walk = ast.walk
+
+        def counting_traverse(self: AstIndex, tree: ast.AST) -> None:
+            traversed.append(tree)
+            original_traverse(self, tree)
+
+        def counting_walk(node: ast.AST):
+            if isinstance(node, ast.Module):
+                walked_modules.append(node)
+            return original_walk(node)
+
+        orchestrator = Orchestrator(project_root=tmp_path, config=all_rules_config)
+        with (
+            patch.object(AstIndex, "_traverse", counting_traverse),
+            patch("ast.walk", counting_walk),
+        ):
+            orchestrator.lint_files([sample])
+
+        module_traversals = [t for t in traversed if isinstance(t, ast.Module) and t.body]
+        assert len(module_traversals) == 1
+        assert walked_modules == []
@@ -0,0 +1,150 @@
+"""
+Purpose: Test the dispatch-table visitor that fuses several detectors into one AST pass
+
+Scope: src.analyzers.dispatch_visitor.DispatchVisitor and run_detectors, plus the fused LBYL pass
+
+Overview: DispatchVisitor lets a multi-detector linter run all of its detectors in one traversal
+    instead of one NodeVisitor pass per detector. Verifies that handlers see exactly the nodes of
+    their registered type in source order (abstract bases included), that several handlers for a
+    type run in registration order, that a visit can be restricted to a subtree, and that the LBYL
+    analyzer runs all eight detectors in a single dispatch pass while reporting the same patterns
+    each detector finds on its own.
+
+Dependencies: ast, unittest.mock, src.analyzers.dispatch_visitor, src.linters.lbyl
+
+Exports: TestDispatch, TestFusedLBYLPass test classes
+
+Interfaces: Exercises DispatchVisitor.register, DispatchVisitor.visit and run_detectors
+
+Implementation: Small parsed modules compared against ast.walk; the LBYL check counts
+    DispatchVisitor.visit calls with a wrapped method
+"""
+
+import ast
+from unittest.mock import patch
+
+from src.analyzers.dispatch_visitor import DispatchVisitor, run_detectors
+from src.linters.lbyl.config import LBYLConfig
+from src.linters.lbyl.python_analyzer import PythonLBYLAnalyzer
+
+LBYL_SOURCE = """
+def load(cache, key, path):
+    if key in cache:
+        return cache[key]
+    if hasattr(cache, "items"):
+        return cache.items()
+    if len(path) > 0:
+        return path[0]
+    for item in path:
+        if item is not None:
+            print(item)
+    return None
+"""
+
+
+def _walk_order(tree: ast.AST, node_type: type) -> list[ast.AST]:
+    """Reference result: nodes of a type in pre-order."""
+    found: list[ast.AST] = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, node_type):
+            found.append(node)
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+    return found
+
+
+class TestDispatch:
+    """Handler registration and dispatch order."""
+
+    def test_handlers_see_matching_nodes_in_source_order(self) -> None:
+        """Each handler receives every node of its type, in pre-order."""
+        tree = ast.parse(LBYL_SOURCE)
+        seen_ifs: list[ast.AST] = []
+        seen_calls: list[ast.AST] = []
+        visitor = DispatchVisitor()
+        visitor.register(ast.If, seen_ifs.append)
+        visitor.register(ast.Call, seen_calls.append)
+        visitor.visit(tree)
+        assert seen_ifs == _walk_order(tree, ast.If)
+        assert seen_calls == _walk_order(tree, ast.Call)
+
+    def test_abstract_base_receives_subclasses(self) -> None:
+        """A handler registered for ast.stmt sees every statement."""
+        tree = ast.parse(LBYL_SOURCE)
+        seen: list[ast.AST] = []
+        visitor = DispatchVisitor()
+        visitor.register(ast.stmt, seen.append)
+        visitor.visit(tree)
+        assert seen == _walk_order(tree, ast.stmt)
+
+    def test_handlers_for_one_node_run_in_registration_order(self) -> None:
+        """Two handlers on one node type run one after the other for each node."""
+        tree = ast.parse("if a:\n    pass\n")
+        calls: list[str] = []
+        visitor = DispatchVisitor()
+        visitor.register(ast.If, lambda node: calls.append("first"))
+        visitor.register(ast.stmt, lambda node: calls.append("stmt"))
+        visitor.register(ast.If, lambda node: calls.append("second"))
+        visitor.visit(tree)
+        assert calls[:3] == ["first", "second", "stmt"]
+
+    def test_visit_subtree(self) -> None:
+        """Visiting a node of an indexed tree restricts dispatch to its subtree."""
+        tree = ast.parse(LBYL_SOURCE)
+        loop = _walk_order(tree, ast.For)[0]
+        seen: list[ast.AST] = []
+        visitor = DispatchVisitor()
+        visitor.register(ast.If, seen.append)
+        visitor.visit(loop)
+        assert seen == _walk_order(loop, ast.If)
+
+    def test_run_detectors_registers_every_detector(self) -> None:
+        """run_detectors hands one visitor to each detector before the pass."""
+
+        class CountingDetector:
+            def __init__(self) -> None:
+                self.count = 0
+
+            def register(self, visitor: DispatchVisitor) -> None:
+                visitor.register(ast.Return, self.record)
+
+            def record(self, node: ast.Return) -> None:
+                self.count += 1
+
+        detectors = [CountingDetector(), CountingDetector()]
+        run_detectors(ast.parse(LBYL_SOURCE), detectors)
+        assert [d.count for d in detectors] == [4, 4]
+
+
+class TestFusedLBYLPass:
+    """All LBYL detectors share one traversal."""
+
+    def test_analyzer_runs_one_dispatch_pass(self) -> None:
+        """All enabled detectors share one dispatch pass over the module."""
+        passes: list[ast.AST] = []
+        original_visit = DispatchVisitor.visit
+
+        def counting_visit(self: DispatchVisitor, tree: ast.AST, index=None) -> None:
+            passes.append(tree)
+            original_visit(self, tree, index)
+
+        with patch.object(DispatchVisitor, "visit", counting_visit):
+            violations = PythonLBYLAnalyzer().analyze(LBYL_SOURCE, "sample.py", LBYLConfig())
+
+        assert len(passes) == 1
+        assert {v.rule_id for v in violations} >= {"lbyl.dict-key-check", "lbyl.hasattr-check"}
+
+    def test_fused_pass_matches_individual_detectors(self) -> None:
+        """The fused pass reports what each detector finds when run on its own."""
+        tree = ast.parse(LBYL_SOURCE)
+        analyzer = PythonLBYLAnalyzer()
+        config = LBYLConfig(detect_isinstance=True, detect_none_check=True)
+        fused = analyzer.analyze(LBYL_SOURCE, "sample.py", config)
+        separate = [
+            (pattern.line_number, pattern.column)
+            for detector, _, _ in analyzer._detector_configs
+            for pattern in detector.find_patterns(tree)
+        ]
+        assert fused
+        assert sorted((v.line, v.column) for v in fused) == sorted(separate)
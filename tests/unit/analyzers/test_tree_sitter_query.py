@@ -0,0 +1,167 @@
+"""
+Purpose: Test the query-based tree-sitter node lookup behind walk_tree
+
+Scope: src.analyzers.tree_sitter_query.find_nodes / find_nodes_by_type and the base analyzers'
+    walk_tree / walk_tree_by_types
+
+Overview: walk_tree runs a compiled tree-sitter Query, falling back to an iterative TreeCursor walk
+    where queries are unavailable. Verifies that both paths return exactly what a recursive Python
+    walk over every node's children returns (same nodes, same pre-order, types that are both named
+    nodes and anonymous tokens, ancestors before children sharing their span), that searches are
+    limited to the given subtree, that several types come back from one call either merged or
+    grouped, that compiled queries are reused, and that very deep files are handled without a
+    RecursionError.
+
+Dependencies: pytest, src.analyzers.tree_sitter_query, src.analyzers.typescript_base,
+    src.analyzers.rust_base
+
+Exports: TestQueryLookup, TestCursorFallback, TestBaseAnalyzers test classes
+
+Interfaces: Exercises find_nodes, find_nodes_by_type, walk_tree and walk_tree_by_types
+
+Implementation: Results compared against a recursive reference walk over the shared samples; the
+    fallback is forced by disabling query support and clearing the query memo
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from src.analyzers import tree_sitter_query, typescript_base
+from src.analyzers.rust_base import TREE_SITTER_RUST_AVAILABLE, RustBaseAnalyzer
+from src.analyzers.tree_sitter_query import find_nodes, find_nodes_by_type
+from src.analyzers.typescript_base import TREE_SITTER_AVAILABLE, TypeScriptBaseAnalyzer
+
+pytestmark = pytest.mark.skipif(not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed")
+
+_TS_TYPES = [
+    ("call_expression",),
+    ("string",),
+    ("=>",),
+    ("member_expression", "call_expression", "arrow_function"),
+    ("expression_statement", "call_expression"),
+    ("not_a_node_type",),
+]
+
+
+def _reference(node: Any, node_types: tuple[str, ...]) -> list[Any]:
+    """Reference result: a recursive pre-order type comparison over every node."""
+    found = [node] if node.type in node_types else []
+    for child in node.children:
+        found.extend(_reference(child, node_types))
+    return found
+
+
+def _ts_root(code: str) -> Any:
+    """Parse TypeScript source."""
+    return TypeScriptBaseAnalyzer().parse_typescript(code)
+
+
+@pytest.fixture
+def cursor_only() -> Iterator[None]:
+    """Force the iterative cursor fallback by disabling query compilation."""
+    tree_sitter_query.clear_query_cache()
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(tree_sitter_query, "QUERIES_AVAILABLE", False)
+        yield
+    tree_sitter_query.clear_query_cache()
+
+
+class TestQueryLookup:
+    """Compiled query lookup matches the recursive walk."""
+
+    @pytest.mark.parametrize("node_types", _TS_TYPES)
+    def test_matches_recursive_walk(
+        self, node_types: tuple[str, ...], typescript_sample: str
+    ) -> None:
+        """Same nodes in the same pre-order for named, anonymous and unknown types."""
+        root = _ts_root(typescript_sample)
+        assert find_nodes(typescript_base.TS_LANGUAGE, root, node_types) == _reference(
+            root, node_types
+        )
+
+    def test_ancestor_precedes_child_with_same_span(self) -> None:
+        """A statement without a semicolon spans exactly its call but still comes first."""
+        root = _ts_root("foo()")
+        found = find_nodes(
+            typescript_base.TS_LANGUAGE, root, ("call_expression", "expression_statement")
+        )
+        assert [node.type for node in found] == ["expression_statement", "call_expression"]
+
+    def test_subtree_only(self, typescript_sample: str) -> None:
+        """Searching from a node returns nothing outside its subtree."""
+        method = _reference(_ts_root(typescript_sample), ("method_definition",))[0]
+        found = find_nodes(typescript_base.TS_LANGUAGE, method, ("call_expression",))
+        assert found == _reference(method, ("call_expression",))
+        assert all(method.start_byte <= node.start_byte < method.end_byte for node in found)
+
+    def test_grouped_by_type(self, typescript_sample: str) -> None:
+        """find_nodes_by_type returns every requested type, even ones with no matches."""
+        root = _ts_root(typescript_sample)
+        grouped = find_nodes_by_type(
+            typescript_base.TS_LANGUAGE, root, ["member_expression", "while_statement"]
+        )
+        assert grouped["member_expression"] == _reference(root, ("member_expression",))
+        assert grouped["while_statement"] == []
+
+    def test_query_compiled_once(self, typescript_sample: str) -> None:
+        """Repeated lookups for one grammar and type set reuse the compiled query."""
+        tree_sitter_query.clear_query_cache()
+        find_nodes(typescript_base.TS_LANGUAGE, _ts_root(typescript_sample), ("call_expression",))
+        find_nodes(typescript_base.TS_LANGUAGE, _ts_root("bar()"), ["call_expression"])
+        assert len(tree_sitter_query._QUERIES) == 1
+
+
+@pytest.mark.usefixtures("cursor_only")
+class TestCursorFallback:
+    """The iterative TreeCursor walk gives the same results."""
+
+    @pytest.mark.parametrize("node_types", _TS_TYPES)
+    def test_matches_recursive_walk(
+        self, node_types: tuple[str, ...], typescript_sample: str
+    ) -> None:
+        """Same nodes in the same pre-order without queries."""
+        root = _ts_root(typescript_sample)
+        assert find_nodes(typescript_base.TS_LANGUAGE, root, node_types) == _reference(
+            root, node_types
+        )
+
+    def test_subtree_only(self, typescript_sample: str) -> None:
+        """A cursor started at a node never walks into its siblings."""
+        method = _reference(_ts_root(typescript_sample), ("method_definition",))[0]
+        found = find_nodes(typescript_base.TS_LANGUAGE, method, ("call_expression",))
+        assert found == _reference(method, ("call_expression",))
+
+    def test_deep_file_does_not_recurse(self) -> None:
+        """A file nested far past the recursion limit is walked iteratively."""
+        depth = 3000
+        root = _ts_root("x = " + "[" * depth + "1" + "]" * depth + ";")
+        assert len(find_nodes(typescript_base.TS_LANGUAGE, root, ("array",))) == depth
+
+
+class TestBaseAnalyzers:
+    """walk_tree and walk_tree_by_types on the TypeScript and Rust base analyzers."""
+
+    def test_typescript_walk_tree_accepts_several_types(self, typescript_sample: str) -> None:
+        """A tuple of types returns one merged pre-order list."""
+        analyzer = TypeScriptBaseAnalyzer()
+        root = _ts_root(typescript_sample)
+        types = ("if_statement", "return_statement")
+        assert analyzer.walk_tree(root, types) == _reference(root, types)
+
+    def test_typescript_walk_tree_by_types(self, typescript_sample: str) -> None:
+        """Grouped lookups match separate single-type walks."""
+        analyzer = TypeScriptBaseAnalyzer()
+        root = _ts_root(typescript_sample)
+        grouped = analyzer.walk_tree_by_types(root, ("call_expression", "member_expression"))
+        assert grouped["call_expression"] == analyzer.walk_tree(root, "call_expression")
+        assert grouped["member_expression"] == analyzer.walk_tree(root, "member_expression")
+
+    @pytest.mark.skipif(not TREE_SITTER_RUST_AVAILABLE, reason="tree-sitter-rust not installed")
+    def test_rust_walk_tree_matches_recursive_walk(self, rust_sample: str) -> None:
+        """Rust lookups use the Rust grammar's queries."""
+        analyzer = RustBaseAnalyzer()
+        root = analyzer.parse_rust(rust_sample)
+        types = ("integer_literal", "float_literal", "call_expression")
+        assert analyzer.walk_tree(root, types) == _reference(root, types)
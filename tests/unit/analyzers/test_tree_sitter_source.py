@@ -0,0 +1,122 @@
+"""
+Purpose: Benchmark test guarding the one-parse-per-file guarantee of the shared tree-sitter cache
+
+Scope: tree-sitter parse counts for TypeScript and Rust files linted through a real Orchestrator
+
+Overview: Around twenty analyzers (nesting, srp, magic_numbers, performance, print_statements, cqs,
+    law_of_demeter, dry, stringly_typed, unwrap_abuse, clone_abuse, blocking_async, ...) call
+    TypeScriptBaseAnalyzer.parse_typescript or RustBaseAnalyzer.parse_rust for the same file, and
+    all of them share one memoized tree. Lints the shared TypeScript and Rust samples with every
+    rule enabled, counting Parser.parse calls through a wrapped module-level parser, and asserts
+    each file is parsed exactly once. Also covers TreeSitterSource byte slicing and
+    FileLintContext.tree_sitter_source.
+
+Dependencies: pytest, typing.Any, unittest.mock, src.analyzers.typescript_base,
+    src.analyzers.rust_base, src.analyzers.tree_sitter_source, src.orchestrator.core
+
+Exports: TestSharedTreeSitterParse, TestTreeSitterSource test classes
+
+Interfaces: Exercises Orchestrator.lint_files and FileLintContext.tree_sitter_source
+
+Implementation: Patches TS_PARSER/RUST_PARSER with counting wrappers around the real parsers
+"""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from src.analyzers import rust_base, typescript_base
+from src.analyzers.tree_sitter_source import clear_tree_sitter_source_cache
+from src.orchestrator.core import FileLintContext, Orchestrator
+
+pytestmark = pytest.mark.skipif(
+    not typescript_base.TREE_SITTER_AVAILABLE, reason="tree-sitter not installed"
+)
+
+
+class _CountingParser:
+    """Wraps a tree-sitter Parser and counts parse() calls."""
+
+    def __init__(self, parser):
+        self._parser = parser
+        self.calls = 0
+
+    def parse(self, source, *args, **kwargs):
+        self.calls += 1
+        return self._parser.parse(source, *args, **kwargs)
+
+
+class TestSharedTreeSitterParse:
+    """A TS/Rust file must be parsed once per run no matter how many rules need its tree."""
+
+    @pytest.mark.parametrize(
+        ("filename", "sample", "module", "attr"),
+        [
+            ("handler.ts", "typescript_sample", typescript_base, "TS_PARSER"),
+            pytest.param(
+                "loader.rs",
+                "rust_sample",
+                rust_base,
+                "RUST_PARSER",
+                marks=pytest.mark.skipif(
+                    not rust_base.TREE_SITTER_RUST_AVAILABLE,
+                    reason="tree-sitter-rust not installed",
+                ),
+            ),
+        ],
+    )
+    def test_lint_file_parses_once(
+        self,
+        request: pytest.FixtureRequest,
+        tmp_path: Path,
+        all_rules_config: dict[str, Any],
+        filename,
+        sample,
+        module,
+        attr,
+    ) -> None:
+        """Every rule linting the file shares a single tree-sitter parse."""
+        path = tmp_path / filename
+        path.write_text(request.getfixturevalue(sample))
+        clear_tree_sitter_source_cache()
+        counting = _CountingParser(getattr(module, attr))
+
+        orchestrator = Orchestrator(project_root=tmp_path, config=all_rules_config)
+        with patch.object(module, attr, counting):
+            orchestrator.lint_files([path])
+
+        assert counting.calls == 1, f"expected one parse per file, got {counting.calls}"
+
+
+class TestTreeSitterSource:
+    """TreeSitterSource keeps the utf-8 bytes and slices node text from them."""
+
+    def test_node_text_slices_utf8_bytes(self) -> None:
+        """node_text slices by byte offsets, so non-ASCII text round-trips."""
+        source = typescript_base.get_typescript_source('const greeting = "héllo";\n')
+        assert source is not None
+
+        string_node = typescript_base.TypeScriptBaseAnalyzer().walk_tree(
+            source.root_node, "string"
+        )[0]
+        assert source.node_text(string_node) == '"héllo"'
+
+    def test_same_source_shares_one_tree(self) -> None:
+        """Repeated lookups of the same source return one shared, memoized tree."""
+        first = typescript_base.get_typescript_source("let x = 1;\n")
+        second = typescript_base.get_typescript_source("let x = 1;\n")
+
+        assert first is second
+        assert first is not None
+        assert first.tree is first.tree
+
+    def test_context_exposes_tree_for_typescript_only(self, tmp_path: Path) -> None:
+        """Only languages with a tree-sitter grammar get a parsed source."""
+        ts_context = FileLintContext(tmp_path / "a.ts", "typescript", content="let x = 1;\n")
+        md_context = FileLintContext(tmp_path / "a.md", "markdown", content="# Title\n")
+
+        assert ts_context.tree_sitter_source is not None
+        assert ts_context.tree_sitter_source.root_node.type == "program"
+        assert md_context.tree_sitter_source is None
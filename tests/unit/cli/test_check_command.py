@@ -0,0 +1,171 @@
+"""
+Purpose: Test the single-pass multi-linter thailint check command
+
+Scope: Linter selection, combined text/JSON/SARIF output, per-linter exit status
+
+Overview: Verifies thailint check runs the requested linters through one orchestrator pass and
+    reports them together: only the selected linters' violations appear, the JSON and SARIF
+    reports carry a per-linter total and exit code, the text report ends with one PASS/FAIL line
+    per linter, the overall exit code is 1 only when some linter failed, comma-separated and
+    repeated --linters values are merged, and unknown linter names are rejected with exit code 2.
+    Also checks each file is parsed once even with every linter enabled.
+
+Dependencies: pytest, click.testing.CliRunner, src.cli, src.cli.linters.check
+
+Exports: TestCheckCommand, TestGroupViolationsByLinter test classes
+
+Interfaces: Invokes the check command through the root CLI group
+
+Implementation: Small Python fixtures that trip known linters; JSON/SARIF parsed from stdout
+"""
+
+import ast
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.cli.linters.check import DEFAULT_CHECK_LINTERS, group_violations_by_linter
+from src.core.types import Violation
+
+CONCAT_LOOP_SOURCE = '''"""Module."""
+
+
+def build(items):
+    total = ""
+    for item in items:
+        total += str(item)
+    print(total)
+    return total
+'''
+
+
+def _write_source(tmp_path: Path) -> Path:
+    """Write a file with one string-concat-loop and one print-statement violation."""
+    path = tmp_path / "module.py"
+    path.write_text(CONCAT_LOOP_SOURCE)
+    return path
+
+
+class TestCheckCommand:
+    """thailint check behaviour through the CLI."""
+
+    def test_json_report_has_per_linter_status(self, tmp_path: Path) -> None:
+        """Each requested linter gets its own total and exit code."""
+        _write_source(tmp_path)
+        result = CliRunner().invoke(
+            cli, ["check", "--linters", "perf,nesting", "--format", "json", str(tmp_path)]
+        )
+
+        report = json.loads(result.output)
+        assert result.exit_code == 1
+        assert {v["rule_id"] for v in report["violations"]} == {"performance.string-concat-loop"}
+        assert report["linters"] == {
+            "perf": {"total": 1, "exit_code": 1},
+            "nesting": {"total": 0, "exit_code": 0},
+        }
+
+    def test_repeated_linters_option_merges_names(self, tmp_path: Path) -> None:
+        """--linters can be repeated as well as comma-separated."""
+        _write_source(tmp_path)
+        result = CliRunner().invoke(
+            cli,
+            ["check", "-l", "perf", "-l", "improper-logging", "--format", "json", str(tmp_path)],
+        )
+
+        report = json.loads(result.output)
+        assert list(report["linters"]) == ["perf", "improper-logging"]
+        assert report["total"] == 2
+
+    def test_exit_code_zero_when_every_linter_passes(self, tmp_path: Path) -> None:
+        """No violations from the selected linters means exit 0."""
+        _write_source(tmp_path)
+        result = CliRunner().invoke(cli, ["check", "--linters", "nesting", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "nesting  PASS" in result.output
+
+    def test_text_report_lists_failing_linter(self, tmp_path: Path) -> None:
+        """The text summary marks linters that found violations."""
+        _write_source(tmp_path)
+        result = CliRunner().invoke(cli, ["check", "--linters", "perf,nesting", str(tmp_path)])
+
+        assert "perf     FAIL (1)" in result.output
+        assert "nesting  PASS" in result.output
+
+    def test_sarif_report_records_per_linter_exit_codes(self, tmp_path: Path) -> None:
+        """SARIF output is one run carrying the per-linter summary and overall exit code."""
+        _write_source(tmp_path)
+        result = CliRunner().invoke(
+            cli, ["check", "--linters", "perf", "--format", "sarif", str(tmp_path)]
+        )
+
+        run = json.loads(result.output)["runs"][0]
+        assert len(run["results"]) == 1
+        assert run["invocations"][0]["exitCode"] == 1
+        assert run["properties"]["linters"]["perf"] == {"total": 1, "exit_code": 1}
+
+    def test_jsonl_report_streams_lines_then_summary(self, tmp_path: Path) -> None:
+        """JSON-lines output is one line per violation and a closing per-linter summary."""
+        _write_source(tmp_path)
+        result = CliRunner().invoke(
+            cli, ["check", "--linters", "perf,nesting", "--format", "jsonl", str(tmp_path)]
+        )
+
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["rule_id"] for r in records[:-1]] == ["performance.string-concat-loop"]
+        assert records[-1] == {
+            "linters": {
+                "perf": {"total": 1, "exit_code": 1},
+                "nesting": {"total": 0, "exit_code": 0},
+            }
+        }
+        assert result.exit_code == 1
+
+    def test_unknown_linter_is_rejected(self, tmp_path: Path) -> None:
+        """Unknown linter names are a usage error."""
+        result = CliRunner().invoke(cli, ["check", "--linters", "nope", str(tmp_path)])
+
+        assert result.exit_code == 2
+        assert "Unknown linter(s): nope" in result.output
+
+    def test_all_linters_share_one_parse(self, tmp_path: Path) -> None:
+        """Running every linter still parses the file once."""
+        _write_source(tmp_path)
+        original_parse = ast.parse
+        parses = 0
+
+        def counting(source, *args, **kwargs):
+            nonlocal parses
+            parses += source == CONCAT_LOOP_SOURCE
+            return original_parse(source, *args, **kwargs)
+
+        with patch("ast.parse", counting):
+            CliRunner().invoke(cli, ["check", "--format", "json", str(tmp_path)])
+
+        assert parses == 1
+
+
+class TestGroupViolationsByLinter:
+    """Splitting combined violations back into per-linter results."""
+
+    def test_violations_are_grouped_by_rule_category(self) -> None:
+        """Violations land under the linter whose rule selection matches them."""
+        violation = Violation(
+            rule_id="srp.violation", file_path="a.py", line=1, column=0, message="too big"
+        )
+
+        results = group_violations_by_linter([violation], ("srp", "nesting"))
+
+        assert [(r.name, r.total, r.exit_code) for r in results] == [
+            ("srp", 1, 1),
+            ("nesting", 0, 0),
+        ]
+
+    def test_default_linters_do_not_overlap(self) -> None:
+        """Narrower alias names are not run by default, so no violation is counted twice."""
+        assert "print-statements" not in DEFAULT_CHECK_LINTERS
+        assert "regex-in-loop" not in DEFAULT_CHECK_LINTERS
+        assert "perf" in DEFAULT_CHECK_LINTERS
@@ -0,0 +1,85 @@
+"""
+Purpose: Test the --profile option of the linter commands
+
+Scope: --profile / --profile-format on standard and hand-built linter commands and thailint check
+
+Overview: --profile writes a per-rule, per-phase timing report to stderr when a linter command
+    ends, including commands that exit through sys.exit. Verifies the table report lists the
+    phases and the command's rule, that the JSON report parses and leaves JSON results on stdout
+    untouched, that commands built with standard_linter_options and hand-built commands both
+    accept the option, and that nothing is reported without it.
+
+Dependencies: json, pathlib.Path, click.testing.CliRunner, src.cli
+
+Exports: TestProfileOption test class
+
+Interfaces: Invokes linter commands through the root CLI group
+
+Implementation: Small Python fixture files; stdout and stderr read separately from the result
+"""
+
+import json
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from src.cli import cli
+
+
+def _write_module(tmp_path: Path) -> Path:
+    path = tmp_path / "module.py"
+    path.write_text('"""Module."""\n\n\ndef f(x):\n    if x:\n        return 1\n    return 0\n')
+    return path
+
+
+class TestProfileOption:
+    """--profile reports timings on stderr."""
+
+    def test_table_report_on_stderr(self, tmp_path: Path) -> None:
+        """The table names the phases and the command's rule."""
+        _write_module(tmp_path)
+
+        result = CliRunner().invoke(cli, ["nesting", "--profile", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Phase" in result.stderr
+        assert "parsing" in result.stderr
+        assert "nesting.excessive-depth" in result.stderr
+        assert "Profile" not in result.stdout
+
+    def test_json_report_keeps_json_results_parseable(self, tmp_path: Path) -> None:
+        """JSON results on stdout and the JSON profile on stderr both parse."""
+        _write_module(tmp_path)
+
+        result = CliRunner().invoke(
+            cli,
+            ["magic-numbers", "--format", "json", "--profile", "--profile-format", "json"]
+            + [str(tmp_path)],
+        )
+
+        assert json.loads(result.stdout)["total"] == 0
+        report = json.loads(result.stderr)
+        assert set(report) == {"total_wall", "phases", "rules"}
+        assert "output_formatting" in report["phases"]
+        assert report["rules"]["magic-numbers.numeric-literal"]["check"]["calls"] == 1
+
+    def test_check_command_profiles_every_linter(self, tmp_path: Path) -> None:
+        """thailint check reports each selected linter's rules."""
+        _write_module(tmp_path)
+
+        result = CliRunner().invoke(
+            cli,
+            ["check", "--linters", "nesting,srp", "--profile", "--profile-format", "json"]
+            + [str(tmp_path)],
+        )
+
+        rules = json.loads(result.stderr)["rules"]
+        assert {"nesting.excessive-depth", "srp.violation"} <= set(rules)
+
+    def test_no_report_without_option(self, tmp_path: Path) -> None:
+        """Nothing is profiled unless asked for."""
+        _write_module(tmp_path)
+
+        result = CliRunner().invoke(cli, ["nesting", str(tmp_path)])
+
+        assert "Profile" not in result.stderr
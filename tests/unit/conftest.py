@@ -0,0 +1,128 @@
+"""
+Purpose: Shared sample sources and rule configuration for the unit-level performance tests
+
+Scope: Fixtures used by the parse-once, traversal and tree-sitter lookup tests across packages
+
+Overview: Several tests lint or parse one realistic file per language and check how often it is
+    parsed or traversed while many rules look at it. They share the same inputs: a Python module
+    with a class, nested functions and loops, a TypeScript class with an arrow function and a
+    trailing call statement, a Rust async function calling unwrap and clone, and an Orchestrator
+    config enabling every opt-in rule that understands those languages. Defining them here keeps
+    one copy of each.
+
+Dependencies: pytest, typing.Any
+
+Exports: all_rules_config, python_sample, typescript_sample, rust_sample fixtures
+
+Interfaces: Pytest fixture protocol - request a fixture by naming it as a test argument
+
+Implementation: Plain fixtures returning module-level constants; the config is copied per test
+    so a test mutating it cannot leak into another
+"""
+
+import copy
+from typing import Any
+
+import pytest
+
+_PYTHON_SAMPLE = '''"""Module."""
+import os
+
+
+class Store:
+    def load(self, keys):
+        for key in keys:
+            if key:
+                self.cache[key] = os.getenv(key)
+        return [k for k in keys]
+
+    def reset(self):
+        def inner():
+            while True:
+                break
+        return inner
+
+
+def helper(data):
+    return len(data)
+'''
+
+_TYPESCRIPT_SAMPLE = """
+export class Store {
+    load(keys: string[], mode: string): string {
+        const seen = keys.map((k) => k.trim()).filter(Boolean);
+        if (mode === "fast" && seen.length > 42) {
+            console.log("long");
+            return seen[0];
+        }
+        return "none";
+    }
+}
+foo()
+"""
+
+_RUST_SAMPLE = """
+use std::fs;
+
+pub async fn load(path: &str) -> String {
+    let data = fs::read_to_string(path).unwrap();
+    let copy = data.clone();
+    if copy.len() > compute(1, 2.5) {
+        println!("long");
+    }
+    copy
+}
+"""
+
+_ALL_RULES_CONFIG: dict[str, Any] = {
+    "dry": {"enabled": True, "min_duplicate_lines": 3, "storage_mode": "memory"},
+    "stringly_typed": {"enabled": True},
+    "cqs": {"enabled": True},
+    "lbyl": {"enabled": True},
+    "stateless_class": {"enabled": True},
+    "method_property": {"enabled": True},
+    "collection_pipeline": {"enabled": True},
+    "unwrap_abuse": {"enabled": True},
+    "clone_abuse": {"enabled": True},
+    "blocking_async": {"enabled": True},
+}
+
+
+@pytest.fixture
+def all_rules_config() -> dict[str, Any]:
+    """Orchestrator config enabling every opt-in rule, with an in-memory DRY store.
+
+    Returns:
+        Fresh copy of the config dict
+    """
+    return copy.deepcopy(_ALL_RULES_CONFIG)
+
+
+@pytest.fixture
+def python_sample() -> str:
+    """Python module with a class, a method loop, a nested def and a module-level function.
+
+    Returns:
+        Module source; statement 1 is the top-level import
+    """
+    return _PYTHON_SAMPLE
+
+
+@pytest.fixture
+def typescript_sample() -> str:
+    """TypeScript class with an arrow function and a trailing call without a semicolon.
+
+    Returns:
+        Module source containing no while loops
+    """
+    return _TYPESCRIPT_SAMPLE
+
+
+@pytest.fixture
+def rust_sample() -> str:
+    """Rust async function with unwrap, clone, integer and float literals and a macro call.
+
+    Returns:
+        Module source
+    """
+    return _RUST_SAMPLE
@@ -0,0 +1,207 @@
+"""
+Purpose: Test typed-config resolution and the per-run ResolvedConfigs memo
+
+Scope: src.core.config_resolution and load_linter_config on orchestrator-built contexts
+
+Overview: Rules used to rebuild their typed config from the raw config section on every check()
+    call, and classes whose from_dict takes no language argument were constructed twice via a
+    TypeError retry. Verifies that an orchestrator run builds each (section, class, language)
+    config once across many files, that a replaced section or a swapped orchestrator config is
+    picked up, that from_dict is called with a language only when it accepts one, that
+    non-dict sections fall back to defaults, that config objects are frozen, and that DRY's
+    constant-name patterns are compiled once per config.
+
+Dependencies: dataclasses, pytest, pathlib.Path, Orchestrator, ResolvedConfigs,
+    resolve_linter_config, NestingConfig, DRYConfig
+
+Exports: TestResolveLinterConfig, TestResolvedConfigs, TestOrchestratorRun, TestFrozenConfigs
+
+Interfaces: Exercises resolve_linter_config, ResolvedConfigs.resolve, Orchestrator.lint_files
+
+Implementation: Counts NestingConfig.from_dict calls with a pass-through classmethod wrapper
+"""
+
+import dataclasses
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.config_resolution import ResolvedConfigs, resolve_linter_config
+from src.linters.dry.config import DRYConfig
+from src.linters.nesting.config import NestingConfig
+from src.orchestrator.core import Orchestrator
+
+
+@pytest.fixture
+def nesting_builds(monkeypatch: pytest.MonkeyPatch) -> list[str | None]:
+    """Record the language of every NestingConfig.from_dict call."""
+    calls: list[str | None] = []
+    original = NestingConfig.from_dict
+
+    def counting_from_dict(
+        cls: type[NestingConfig], config: dict[str, Any], language: str | None = None
+    ) -> NestingConfig:
+        calls.append(language)
+        return original(config, language)
+
+    monkeypatch.setattr(NestingConfig, "from_dict", classmethod(counting_from_dict))
+    return calls
+
+
+class _NoLanguageConfig:
+    """Config class whose from_dict takes no language argument."""
+
+    built = 0
+
+    def __init__(self, value: int = 0) -> None:
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> "_NoLanguageConfig":
+        cls.built += 1
+        return cls(config.get("value", 0))
+
+
+class TestResolveLinterConfig:
+    """resolve_linter_config builds one config per call."""
+
+    def test_from_dict_without_language_is_called_once(self) -> None:
+        """A from_dict without a language parameter is not retried after a TypeError."""
+        _NoLanguageConfig.built = 0
+
+        config = resolve_linter_config({"value": 3}, _NoLanguageConfig, "python")
+
+        assert config.value == 3
+        assert _NoLanguageConfig.built == 1
+
+    def test_language_is_passed_when_accepted(self) -> None:
+        """Language-specific overrides apply for classes that take a language."""
+        section = {"max_nesting_depth": 4, "python": {"max_nesting_depth": 2}}
+
+        assert resolve_linter_config(section, NestingConfig, "python").max_nesting_depth == 2
+        assert resolve_linter_config(section, NestingConfig, "typescript").max_nesting_depth == 4
+
+    def test_non_dict_section_yields_defaults(self) -> None:
+        """A malformed section falls back to the class defaults."""
+        assert resolve_linter_config("oops", NestingConfig, None) == NestingConfig()
+
+
+class TestResolvedConfigs:
+    """ResolvedConfigs memoizes per key, class and language."""
+
+    def test_same_language_shares_one_instance(self, nesting_builds: list[str | None]) -> None:
+        """Repeated lookups return the instance built first."""
+        memo = ResolvedConfigs({"nesting": {"max_nesting_depth": 5}})
+
+        first = memo.resolve("nesting", NestingConfig, "python")
+
+        assert memo.resolve("nesting", NestingConfig, "python") is first
+        assert nesting_builds == ["python"]
+
+    def test_languages_resolve_separately(self, nesting_builds: list[str | None]) -> None:
+        """Each language gets its own config."""
+        memo = ResolvedConfigs({"nesting": {}})
+
+        memo.resolve("nesting", NestingConfig, "python")
+        memo.resolve("nesting", NestingConfig, "typescript")
+
+        assert nesting_builds == ["python", "typescript"]
+
+    def test_replaced_section_is_rebuilt(self) -> None:
+        """Assigning a new section after the first lookup is picked up."""
+        config: dict[str, Any] = {"nesting": {"max_nesting_depth": 5}}
+        memo = ResolvedConfigs(config)
+        memo.resolve("nesting", NestingConfig, "python")
+
+        config["nesting"] = {"max_nesting_depth": 2}
+
+        assert memo.resolve("nesting", NestingConfig, "python").max_nesting_depth == 2
+
+    def test_missing_section_yields_defaults(self) -> None:
+        """An absent section resolves to the defaults, and a later one is picked up."""
+        config: dict[str, Any] = {}
+        memo = ResolvedConfigs(config)
+
+        assert memo.resolve("nesting", NestingConfig, None) == NestingConfig()
+        config["nesting"] = {"max_nesting_depth": 7}
+        assert memo.resolve("nesting", NestingConfig, None).max_nesting_depth == 7
+
+
+# Nesting depth 3: within the limit of 3, over the limit of 2
+_NESTED_CODE = (
+    "def f(x):\n    for a in x:\n        if a:\n            while a:\n                a -= 1\n"
+)
+
+
+def _write_files(tmp_path: Path, count: int) -> list[Path]:
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text(_NESTED_CODE)
+        paths.append(path)
+    return paths
+
+
+def _nesting_orchestrator(tmp_path: Path, max_depth: int) -> Orchestrator:
+    config = {"nesting": {"max_nesting_depth": max_depth}}
+    return Orchestrator(tmp_path, config, rules=["nesting"])
+
+
+class TestOrchestratorRun:
+    """An orchestrator run resolves each rule's config once per language."""
+
+    def test_config_built_once_across_files(
+        self, tmp_path: Path, nesting_builds: list[str | None]
+    ) -> None:
+        """Linting many files builds the nesting config a single time."""
+        files = _write_files(tmp_path, 5)
+        orchestrator = _nesting_orchestrator(tmp_path, 3)
+
+        orchestrator.lint_files(files)
+
+        assert nesting_builds == ["python"]
+
+    def test_section_update_applies_to_next_run(
+        self, tmp_path: Path, nesting_builds: list[str | None]
+    ) -> None:
+        """Mutating a section in place between runs is not hidden by the memo."""
+        files = _write_files(tmp_path, 2)
+        orchestrator = _nesting_orchestrator(tmp_path, 3)
+        assert not orchestrator.lint_files(files)
+
+        orchestrator.config["nesting"]["max_nesting_depth"] = 2
+        violations = orchestrator.lint_files(files)
+
+        assert {v.rule_id for v in violations} == {"nesting.excessive-depth"}
+        assert nesting_builds == ["python", "python"]
+
+    def test_swapped_config_is_picked_up(self, tmp_path: Path) -> None:
+        """Replacing orchestrator.config wholesale resolves from the new dict."""
+        files = _write_files(tmp_path, 1)
+        orchestrator = _nesting_orchestrator(tmp_path, 3)
+        orchestrator.lint_files(files)
+
+        orchestrator.config = {"nesting": {"max_nesting_depth": 2}}
+
+        assert orchestrator.lint_files(files)
+
+
+class TestFrozenConfigs:
+    """Resolved configs are shared, so they cannot be mutated."""
+
+    def test_config_fields_are_read_only(self) -> None:
+        """Assigning a field of a resolved config raises."""
+        config = resolve_linter_config({}, NestingConfig, "python")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_nesting_depth = 10  # type: ignore[misc]
+
+    def test_dry_constant_patterns_compiled_once(self) -> None:
+        """DRY's constant-name regexes are compiled on first use and reused."""
+        config = DRYConfig.from_dict({"ignore_constant_patterns": ["^LOG_.*$"]})
+
+        regexes = config.ignore_constant_regexes
+
+        assert config.ignore_constant_regexes is regexes
+        assert regexes[0].fullmatch("LOG_LEVEL")
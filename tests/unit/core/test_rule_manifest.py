@@ -0,0 +1,146 @@
+"""
+Purpose: Test the precomputed rule manifest and the lazy CLI startup it enables
+
+Scope: src.core.rule_manifest, manifest-backed RuleRegistry discovery, LazyGroup command resolution
+
+Overview: Verifies the committed rule manifest matches what full discovery finds (so a rule added
+    without regenerating fails here), that manifest-backed discovery registers rules without
+    importing any linter and then imports only the linters handling a dispatched file's language,
+    that rules keep discovery order however they are loaded, and that a manifest listing other
+    linter packages than the ones on disk is ignored. Also checks that importing the package and
+    rendering --help import no linter, and that every command registered by the command modules
+    is known to the lazy group.
+
+Dependencies: pytest, json, subprocess, click.testing.CliRunner, src.core.rule_manifest,
+    src.core.registry, src.cli.main
+
+Exports: TestRuleManifest, TestManifestRegistry, TestLazyStartup test classes
+
+Interfaces: Exercises load_manifest, render_manifest, RuleRegistry.discover_rules and the cli group
+
+Implementation: Import side effects checked in a fresh interpreter so earlier tests' imports do
+    not leak in
+"""
+
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from src.core import rule_manifest
+from src.core.registry import RuleRegistry
+from src.core.rule_manifest import MANIFEST_PACKAGE, build_manifest, load_manifest
+
+
+def _imported_linters(code: str) -> list[str]:
+    """Run code in a fresh interpreter and list the src.linters packages it imported."""
+    script = (
+        f"{code}\nimport json, sys\n"
+        "print(json.dumps(sorted({m.split('.')[2] for m in sys.modules"
+        " if m.startswith('src.linters.')})))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestRuleManifest:
+    """The committed manifest must match live discovery."""
+
+    def test_manifest_is_up_to_date(self) -> None:
+        """Regenerate with `just rule-manifest` when this fails."""
+        assert rule_manifest.main(["--check"]) == 0
+
+    def test_manifest_matches_discovery(self) -> None:
+        """Every discovered rule is in the manifest with its module and languages."""
+        assert load_manifest(MANIFEST_PACKAGE) == build_manifest(MANIFEST_PACKAGE)
+
+    def test_stale_manifest_is_ignored(self) -> None:
+        """A manifest generated from other linter packages falls back to full discovery."""
+        with patch.object(rule_manifest, "_package_modules", return_value=("nesting",)):
+            assert load_manifest(MANIFEST_PACKAGE) is None
+
+    def test_other_packages_have_no_manifest(self) -> None:
+        """Only src.linters is covered by the manifest."""
+        assert load_manifest("tests.unit.core") is None
+
+
+class TestManifestRegistry:
+    """Manifest-backed discovery imports linters only when they are needed."""
+
+    def test_discovery_imports_no_linter(self) -> None:
+        """Registering every rule from the manifest imports nothing under src.linters."""
+        code = (
+            "from src.core.registry import RuleRegistry\n"
+            "RuleRegistry().discover_rules('src.linters')"
+        )
+        assert _imported_linters(code) == []
+
+    def test_dispatch_imports_only_language_rules(self) -> None:
+        """Dispatching a Rust file loads the rules handling Rust, not the Python-only ones."""
+        code = (
+            "from src.core.registry import RuleRegistry\n"
+            "r = RuleRegistry()\n"
+            "r.discover_rules('src.linters')\n"
+            "r.rules_for_language('rust')"
+        )
+        imported = _imported_linters(code)
+        assert "unwrap_abuse" in imported
+        assert "lbyl" not in imported
+        assert "stateless_class" not in imported
+
+    def test_rules_keep_discovery_order(self) -> None:
+        """Loading by language first does not reorder the full rule list."""
+        registry = RuleRegistry()
+        registry.discover_rules(MANIFEST_PACKAGE)
+        registry.rules_for_language("rust")
+        listed = [rule.rule_id for rule in registry.list_all()]
+        assert listed == [entry.rule_id for entry in build_manifest(MANIFEST_PACKAGE)]
+
+    def test_get_loads_pending_rule(self) -> None:
+        """Requesting a rule by id imports it on demand."""
+        registry = RuleRegistry()
+        registry.discover_rules(MANIFEST_PACKAGE, ["nesting"])
+        assert registry.list_loaded() == []
+        rule = registry.get("nesting.excessive-depth")
+        assert rule is not None
+        assert registry.list_loaded() == [rule]
+
+
+class TestLazyStartup:
+    """The CLI imports a command's module only when the command runs."""
+
+    def test_importing_package_imports_no_linter(self) -> None:
+        """import src (what the console script does) loads no linter."""
+        assert _imported_linters("import src") == []
+
+    def test_help_lists_every_command(self) -> None:
+        """--help shows commands whose modules have not been imported."""
+        from src.cli import cli
+
+        result = CliRunner().invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        assert "nesting" in result.output
+        assert "unwrap-abuse" in result.output
+
+    def test_command_modules_cover_registered_commands(self) -> None:
+        """Every command a module registers is listed in COMMAND_MODULES."""
+        import importlib
+
+        from src.cli.main import COMMAND_MODULES, cli
+
+        for module in set(COMMAND_MODULES.values()):
+            importlib.import_module(module)
+        assert set(cli.commands) == set(COMMAND_MODULES)
+
+    def test_version_option(self) -> None:
+        """--version still reports the package version."""
+        from src import __version__
+        from src.cli import cli
+
+        result = CliRunner().invoke(cli, ["--version"])
+        assert result.exit_code == 0
+        assert __version__ in result.output
@@ -10,17 +10,18 @@ Overview: Validates the dynamic rule discovery and registration system that enab
     from Python packages. Verifies that auto-discovery correctly identifies BaseLintRule subclasses,
     filters out abstract base classes, skips non-rule classes, and handles import errors gracefully.
     Ensures the registry enables the extensible plugin system where new rules can be added simply
-    by creating classes in the appropriate package structure.
+    by creating classes in the appropriate package structure, and that a rule selection limits
+    discovery to the requested rule ids/categories.
 
 Dependencies: pytest for testing framework, pathlib for temporary directory creation,
     tmp_path fixture for isolated test environments
 
-Exports: TestRuleRegistry, TestRuleDiscovery test classes
+Exports: TestRuleRegistry, TestRuleDiscovery, TestRuleSelection test classes
 
 Interfaces: Tests register(), get(), list_all(), discover_rules() methods, validates rule
     filtering logic and error handling paths
 
-Implementation: 9 tests using pytest fixtures for temporary packages, dynamic module creation
+Implementation: 12 tests using pytest fixtures for temporary packages, dynamic module creation
     for discovery testing, mock rule classes for registration validation, sys.path manipulation
     for package imports
 """
@@ -116,3 +117,38 @@ class TestRuleDiscovery:
             assert count == 0
         finally:
             sys.path.remove(str(tmp_path))
+
+
+class TestRuleSelection:
+    """Test discovery restricted to a rule selection."""
+
+    def test_selection_registers_only_matching_category(self):
+        """A category selection keeps every rule in the category and nothing else."""
+        from src.core.registry import RuleRegistry
+
+        registry = RuleRegistry()
+        registry.discover_rules("src.linters", selection=["performance"])
+
+        rule_ids = sorted(rule.rule_id for rule in registry.list_all())
+        assert rule_ids == ["performance.regex-in-loop", "performance.string-concat-loop"]
+
+    def test_selection_accepts_exact_rule_id(self):
+        """An exact rule id selects just that rule."""
+        from src.core.registry import RuleRegistry
+
+        registry = RuleRegistry()
+        count = registry.discover_rules("src.linters", selection=["dry.duplicate-code"])
+
+        assert count == 1
+        assert registry.get("dry.duplicate-code") is not None
+
+    def test_no_selection_registers_everything(self):
+        """Without a selection every discovered rule is registered."""
+        from src.core.registry import RuleRegistry, is_rule_selected
+
+        registry = RuleRegistry()
+        count = registry.discover_rules("src.linters")
+
+        assert count == len(registry.list_all())
+        assert is_rule_selected("srp.violation", None)
+        assert not is_rule_selected("srp.violation", ["nesting"])
@@ -0,0 +1,89 @@
+"""
+Purpose: Test streaming violation output and the JSON-lines format
+
+Scope: src.core.cli_utils.stream_violations and format_violations with "jsonl"
+
+Overview: Verifies text and jsonl output print each violation as it is produced rather than after
+    the whole run, text ends with the total (or the no-violations message), jsonl emits one JSON
+    object per line, JSON and SARIF still print one complete document, and every format returns
+    the number of violations printed.
+
+Dependencies: pytest, json, src.core.cli_utils, src.core.types
+
+Exports: TestStreamViolations test class
+
+Interfaces: Exercises stream_violations(violations, output_format) -> int
+
+Implementation: Generators that record stdout (via capsys) at the moment each violation is pulled
+"""
+
+import json
+from collections.abc import Iterator
+
+import pytest
+
+from src.core.cli_utils import format_violations, stream_violations
+from src.core.types import Violation
+
+
+def _violation(index: int) -> Violation:
+    """Build a distinguishable violation."""
+    return Violation(
+        rule_id="nesting.excessive-depth",
+        file_path=f"file_{index}.py",
+        line=index + 1,
+        column=0,
+        message=f"problem {index}",
+    )
+
+
+class TestStreamViolations:
+    """stream_violations output per format."""
+
+    @pytest.mark.parametrize("output_format", ["text", "jsonl"])
+    def test_violation_printed_before_next_is_produced(self, capsys, output_format) -> None:
+        """Each violation reaches stdout before the producer is asked for the next one."""
+        seen_before_second: list[str] = []
+
+        def produce() -> Iterator[Violation]:
+            yield _violation(0)
+            seen_before_second.append(capsys.readouterr().out)
+            yield _violation(1)
+
+        stream_violations(produce(), output_format)
+
+        assert "file_0.py" in seen_before_second[0]
+
+    def test_text_total_follows_violations(self, capsys) -> None:
+        """The text summary line comes after the violations."""
+        count = stream_violations(iter([_violation(0), _violation(1)]), "text")
+
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert count == 2
+        assert lines[-1] == "Found 2 violation(s)"
+
+    def test_text_without_violations(self, capsys) -> None:
+        """An empty stream prints the no-violations message."""
+        assert stream_violations(iter([]), "text") == 0
+        assert "No violations found" in capsys.readouterr().out
+
+    def test_jsonl_is_one_object_per_line(self, capsys) -> None:
+        """Each jsonl line parses to one violation."""
+        stream_violations(iter([_violation(0), _violation(1)]), "jsonl")
+
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [r["file_path"] for r in records] == ["file_0.py", "file_1.py"]
+        assert records[0]["severity"] == "ERROR"
+
+    def test_json_is_one_document(self, capsys) -> None:
+        """JSON output is still a single document with the total."""
+        count = stream_violations(iter([_violation(0)]), "json")
+
+        assert count == 1
+        assert json.loads(capsys.readouterr().out)["total"] == 1
+
+    def test_format_violations_supports_jsonl(self, capsys) -> None:
+        """The list-based formatter accepts jsonl too."""
+        format_violations([_violation(0)], "jsonl")
+
+        assert json.loads(capsys.readouterr().out)["line"] == 1
@@ -0,0 +1,93 @@
+"""
+Purpose: Test the compact Violation representation and its columnar transfer form
+
+Scope: Violation immutability and interning, ViolationBatch packing and unpacking
+
+Overview: Violations are frozen, slotted and intern their rule_id and file_path, and --parallel
+    workers return them as a ViolationBatch that stores every distinct string once. Verifies that
+    violations reject mutation and carry no per-instance dict, that equal rule ids and paths end up
+    as one shared string object, that a Path file_path is still accepted, that a batch round-trips
+    every field (including a missing suggestion) through pickle in order, and that repeated strings
+    are stored once.
+
+Dependencies: pickle, dataclasses, pathlib.Path, typing.Any, pytest, src.core.types
+
+Exports: TestViolation, TestViolationBatch test classes
+
+Interfaces: Exercises Violation, ViolationBatch.from_violations, ViolationBatch.to_violations
+
+Implementation: Builds violations directly; strings are built at runtime so interning is observable
+"""
+
+import dataclasses
+import pickle
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.types import Violation, ViolationBatch
+
+
+def _violation(line: int, suggestion: str | None = None) -> Violation:
+    return Violation(
+        rule_id="".join(["magic-numbers"]),
+        file_path="".join(["src/", "legacy.py"]),
+        line=line,
+        column=4,
+        message=f"Magic number {line}",
+        suggestion=suggestion,
+    )
+
+
+class TestViolation:
+    """Violations are immutable, compact and share their repeated strings."""
+
+    def test_is_frozen_and_slotted(self) -> None:
+        """Fields cannot be reassigned and there is no instance dict."""
+        violation = _violation(1)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            violation.line = 2  # type: ignore[misc]
+        assert not hasattr(violation, "__dict__")
+        assert dataclasses.replace(violation, line=2).line == 2
+
+    def test_rule_id_and_file_path_are_interned(self) -> None:
+        """Separately built equal strings become one object."""
+        first, second = _violation(1), _violation(2)
+
+        assert first.rule_id is second.rule_id
+        assert first.file_path is second.file_path
+
+    def test_path_file_path_is_accepted(self) -> None:
+        """A rule that builds its violation with a Path still gets one, path unchanged."""
+        path: Any = Path("src/a.py")
+
+        violation = Violation(rule_id="custom.rule", file_path=path, line=1, column=0, message="")
+
+        assert violation.file_path == Path("src/a.py")
+
+
+class TestViolationBatch:
+    """A batch carries violations across processes in columnar form."""
+
+    def test_round_trips_through_pickle(self) -> None:
+        """Every field, order and a missing suggestion survive packing and pickling."""
+        violations = [_violation(3, suggestion="Use a constant"), _violation(1), _violation(2)]
+
+        batch = pickle.loads(pickle.dumps(ViolationBatch.from_violations(violations)))
+
+        assert len(batch) == 3
+        assert batch.to_violations() == violations
+
+    def test_repeated_strings_are_stored_once(self) -> None:
+        """Rule id, path and severity appear once in the string table."""
+        batch = ViolationBatch.from_violations([_violation(7), _violation(7), _violation(8)])
+
+        assert sorted(batch.strings) == sorted(
+            ["magic-numbers", "src/legacy.py", "Magic number 7", "Magic number 8", "error"]
+        )
+
+    def test_empty_batch(self) -> None:
+        """A batch with no violations unpacks to an empty list."""
+        assert ViolationBatch.from_violations([]).to_violations() == []
@@ -0,0 +1,305 @@
+"""
+Purpose: Tests for the thailint serve daemon, its warm config state and the forwarding client
+
+Scope: src.daemon.server, src.daemon.client, src.daemon.warm_state
+
+Overview: Verifies the client picks the subcommand out of argv past the global options, that warm
+    configs are handed out as copies and dropped when the config or ignore file changes, and that a
+    command forwarded to a running daemon produces the same exit code and output as running it
+    locally, including after the config file is edited. Also checks that ping and shutdown requests
+    work, that a stale socket left by a dead daemon is replaced, that a second daemon for the same
+    project is refused, and that the client falls back to local execution when no daemon is serving
+    or THAILINT_NO_DAEMON is set. Checks that a malformed lint request or one whose working
+    directory cannot be entered is answered with an error, that a stalled client is dropped after
+    the read timeout, that sockets live in $XDG_RUNTIME_DIR when it is set, and that a socket
+    directory open to other users or replaced by a symlink is neither served from nor trusted by the
+    client.
+
+Dependencies: pytest, threading, click.testing.CliRunner, src.daemon, src.cli
+
+Exports: TestParseGlobalOptions, TestWarmConfigs, TestDaemonRoundTrip, TestNoDaemon,
+    TestSocketDirectory test classes
+
+Interfaces: Exercises parse_global_options, WarmConfigs, LintServer, forward_to_daemon,
+    send_request
+
+Implementation: Server runs serve_until_stopped in a background thread on the project's real
+    socket path; warm state is reset per test so no other test sees it
+"""
+
+import socket
+import stat
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.daemon import server as server_module
+from src.daemon import warm_state
+from src.daemon.client import forward_to_daemon, parse_global_options, send_request
+from src.daemon.protocol import (
+    NO_DAEMON_ENV,
+    OP_LINT,
+    OP_PING,
+    OP_SHUTDOWN,
+    SOCKET_DIR_MODE,
+    socket_path,
+)
+from src.daemon.server import DaemonAlreadyRunningError, InsecureSocketDirError, LintServer
+from src.daemon.warm_state import WarmConfigs
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+NESTED = """def deep(items):
+    for item in items:
+        if item:
+            while item:
+                if item > 1:
+                    item -= 1
+"""
+
+LINTERS = {"nesting"}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_warm_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the daemon's process-wide warm configs from leaking into other tests."""
+    monkeypatch.setattr(warm_state, "_ACTIVE", None)
+    monkeypatch.delenv(NO_DAEMON_ENV, raising=False)
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project whose one file nests four levels deep."""
+    (tmp_path / ".thailint.yaml").write_text("nesting:\n  max_nesting_depth: 3\n")
+    (tmp_path / "deep.py").write_text(NESTED)
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(project: Path) -> Iterator[LintServer]:
+    """A daemon serving the project from a background thread."""
+    server = LintServer(project, prewarm=False)
+    thread = threading.Thread(target=server.serve_until_stopped, daemon=True)
+    thread.start()
+    yield server
+    server.stopping = True
+    thread.join(timeout=5)
+
+
+class TestParseGlobalOptions:
+    """The client finds the subcommand the way Click would."""
+
+    def test_plain_command(self) -> None:
+        """The first argument is the command."""
+        assert parse_global_options(["nesting", "src/"]) == ("nesting", {})
+
+    def test_skips_global_options(self) -> None:
+        """Global options and their values before the command are skipped and recorded."""
+        command, options = parse_global_options(
+            ["-v", "--config", "x.yaml", "--project-root=/repo", "dry", "."]
+        )
+        assert command == "dry"
+        assert options == {"-v": "", "--config": "x.yaml", "--project-root": "/repo"}
+
+    def test_help_and_version_stay_local(self) -> None:
+        """Unknown leading options mean no forwardable command."""
+        assert parse_global_options(["--version"])[0] is None
+        assert parse_global_options(["--help", "nesting"])[0] is None
+
+
+class TestWarmConfigs:
+    """Configs are reused until the files they came from change."""
+
+    def test_returns_independent_copies(self, project: Path) -> None:
+        """Mutating a returned config does not change what later callers get."""
+        configs = WarmConfigs()
+        configs.put(project, None, {"nesting": {"max_nesting_depth": 3}})
+        first = configs.get(project, None)
+        assert first is not None
+        first["nesting"]["max_nesting_depth"] = 9
+        assert configs.get(project, None) == {"nesting": {"max_nesting_depth": 3}}
+
+    def test_config_change_invalidates(self, project: Path) -> None:
+        """Editing .thailint.yaml drops the warm config."""
+        configs = WarmConfigs()
+        configs.put(project, None, {"nesting": {}})
+        (project / ".thailint.yaml").write_text("nesting:\n  max_nesting_depth: 10\n")
+        assert configs.get(project, None) is None
+
+    def test_new_ignore_file_invalidates(self, project: Path) -> None:
+        """Adding .thailintignore drops the warm config."""
+        configs = WarmConfigs()
+        configs.put(project, None, {})
+        (project / ".thailintignore").write_text("deep.py\n")
+        assert configs.get(project, None) is None
+
+
+class TestDaemonRoundTrip:
+    """Forwarded commands behave exactly like local ones."""
+
+    def test_forwarded_matches_local(
+        self, project: Path, daemon: LintServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Exit code and output of a forwarded command equal the local run."""
+        monkeypatch.chdir(project)
+        local = CliRunner().invoke(cli, ["nesting", "deep.py"])
+        forwarded = forward_to_daemon(["nesting", "deep.py"], project, LINTERS)
+
+        assert forwarded is not None
+        assert forwarded.exit_code == local.exit_code == 1
+        assert forwarded.stdout == local.stdout
+
+    def test_repeated_requests_see_config_edits(self, project: Path, daemon: LintServer) -> None:
+        """A config edit between requests takes effect on the next request."""
+        first = forward_to_daemon(["nesting", "deep.py"], project, LINTERS)
+        (project / ".thailint.yaml").write_text("nesting:\n  max_nesting_depth: 10\n")
+        second = forward_to_daemon(["nesting", "deep.py"], project, LINTERS)
+
+        assert first is not None and first.exit_code == 1
+        assert second is not None and second.exit_code == 0
+
+    def test_forwarded_from_subdirectory(self, project: Path, daemon: LintServer) -> None:
+        """A client in a subdirectory finds the project's daemon."""
+        subdir = project / "pkg"
+        subdir.mkdir()
+        response = forward_to_daemon(["nesting", "../deep.py"], subdir, LINTERS)
+        assert response is not None
+        assert response.exit_code == 1
+
+    def test_other_commands_run_locally(self, project: Path, daemon: LintServer) -> None:
+        """Commands outside the forwardable set are never sent."""
+        assert forward_to_daemon(["config", "show"], project, LINTERS) is None
+
+    def test_opt_out_env(
+        self, project: Path, daemon: LintServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """THAILINT_NO_DAEMON forces local execution."""
+        monkeypatch.setenv(NO_DAEMON_ENV, "1")
+        assert forward_to_daemon(["nesting", "deep.py"], project, LINTERS) is None
+
+    def test_ping_and_shutdown(self, project: Path, daemon: LintServer) -> None:
+        """Ping reports the root; shutdown stops the server and removes its socket."""
+        assert send_request(daemon.socket_file, {"op": OP_PING}) == {
+            "project_root": str(project.resolve()),
+            "version": 1,
+        }
+        assert send_request(daemon.socket_file, {"op": OP_SHUTDOWN}) is not None
+        for _ in range(50):
+            if not daemon.socket_file.exists():
+                break
+            threading.Event().wait(0.1)
+        assert not daemon.socket_file.exists()
+
+    def test_stalled_client_does_not_block_others(
+        self, project: Path, daemon: LintServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A client that connects and sends nothing is dropped after the read timeout."""
+        monkeypatch.setattr(server_module._RequestConnection, "timeout", 0.2)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+            stalled.connect(str(daemon.socket_file))
+            reply = send_request(daemon.socket_file, {"op": OP_PING})
+        assert reply is not None
+
+    @pytest.mark.parametrize(
+        "request_fields",
+        [
+            {},
+            {"argv": ["nesting"]},
+            {"argv": "nesting deep.py", "cwd": "."},
+            {"argv": ["nesting", 3], "cwd": "."},
+            {"argv": ["nesting"], "cwd": None},
+        ],
+    )
+    def test_malformed_lint_request_gets_an_error(
+        self, daemon: LintServer, request_fields: dict
+    ) -> None:
+        """A lint request without a string argv list and cwd is answered, not dropped."""
+        reply = send_request(daemon.socket_file, {"op": OP_LINT, **request_fields})
+
+        assert reply is not None
+        assert "error" in reply
+
+    def test_unusable_cwd_gets_an_error(self, project: Path, daemon: LintServer) -> None:
+        """A working directory the daemon cannot enter is reported back to the client."""
+        request = {"op": OP_LINT, "argv": ["nesting", "deep.py"], "cwd": str(project / "gone")}
+
+        reply = send_request(daemon.socket_file, request)
+
+        assert reply is not None
+        assert "gone" in reply["error"]
+        assert send_request(daemon.socket_file, {"op": OP_PING}) is not None
+
+    def test_second_daemon_is_refused(self, project: Path, daemon: LintServer) -> None:
+        """Only one daemon serves a project root."""
+        with pytest.raises(DaemonAlreadyRunningError):
+            LintServer(project, prewarm=False)
+
+
+class TestNoDaemon:
+    """Without a live daemon the CLI runs locally."""
+
+    def test_no_daemon_returns_none(self, project: Path) -> None:
+        """No socket, nothing forwarded."""
+        assert forward_to_daemon(["nesting", "deep.py"], project, LINTERS) is None
+
+    def test_stale_socket_is_replaced(self, project: Path) -> None:
+        """A socket file left by a dead daemon is neither used nor blocking a new one."""
+        path = socket_path(project)
+        path.parent.mkdir(mode=SOCKET_DIR_MODE, parents=True, exist_ok=True)
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+
+        assert forward_to_daemon(["nesting", "deep.py"], project, LINTERS) is None
+        server = LintServer(project, prewarm=False)
+        server.server_close()
+        assert not path.exists()
+
+
+class TestSocketDirectory:
+    """Sockets are only trusted in a directory private to the user."""
+
+    @pytest.fixture
+    def runtime_dir(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+        """Point the socket directory at a fresh runtime dir (short, for the socket path limit)."""
+        with tempfile.TemporaryDirectory(prefix="tl-") as runtime:
+            monkeypatch.setenv("XDG_RUNTIME_DIR", runtime)
+            yield Path(runtime) / "thailint"
+
+    def test_runtime_dir_is_preferred(self, project: Path, runtime_dir: Path) -> None:
+        """$XDG_RUNTIME_DIR holds the sockets when set."""
+        assert socket_path(project).parent == runtime_dir
+
+    def test_server_creates_private_dir(self, project: Path, runtime_dir: Path) -> None:
+        """The daemon creates the socket directory with mode 0700."""
+        server = LintServer(project, prewarm=False)
+        server.server_close()
+        assert stat.S_IMODE(runtime_dir.stat().st_mode) == SOCKET_DIR_MODE
+
+    def test_shared_dir_is_refused(self, project: Path, runtime_dir: Path) -> None:
+        """A socket directory others can enter is neither served from nor trusted."""
+        runtime_dir.mkdir(mode=SOCKET_DIR_MODE)
+        runtime_dir.chmod(0o755)
+        planted = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        planted.bind(str(socket_path(project)))
+        planted.listen()
+        try:
+            with pytest.raises(InsecureSocketDirError):
+                LintServer(project, prewarm=False)
+            assert forward_to_daemon(["nesting", "deep.py"], project, LINTERS) is None
+            assert send_request(socket_path(project), {"op": OP_PING}) is None
+        finally:
+            planted.close()
+
+    def test_symlinked_dir_is_refused(self, project: Path, runtime_dir: Path) -> None:
+        """A symlink in place of the socket directory is not followed."""
+        target = runtime_dir.parent / "elsewhere"
+        target.mkdir(mode=SOCKET_DIR_MODE)
+        runtime_dir.symlink_to(target)
+        with pytest.raises(InsecureSocketDirError):
+            LintServer(project, prewarm=False)
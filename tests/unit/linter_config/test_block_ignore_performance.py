@@ -1,27 +1,29 @@
 """
 Purpose: Regression tests for IgnoreDirectiveParser block-ignore scaling and behavior preservation
 
-Scope: IgnoreDirectiveParser.should_ignore_violation block-ignore scanning and per-file caching
+Scope: IgnoreDirectiveParser.should_ignore_violation block-ignore scanning and the per-file
+    DirectiveIndex cache
 
 Overview: Guards against an O(violations x filesize) blowup discovered while benchmarking the DRY
     linter against a real multi-thousand-file monorepo: should_ignore_violation re-read the whole
     file from disk (has_file_ignore) and re-scanned every line of the file (_check_block_ignore)
     from scratch for every single violation, instead of once per file. A file with thousands of
     duplicate-code violations - plausible for repetitive generated/migration code - paid that
-    disk-read-plus-full-scan cost thousands of times over. Verifies the parser builds its
-    block-ignore index once per distinct file content and answers each violation in near-constant
-    time, by counting disk reads and timing many violations against one large file. Also pins
-    behavior: because the scan being optimized is an order-dependent state machine that returns as
-    it reaches the violation's own line inside an open block (never considering blocks further
-    down the file for that violation), a naive independent-per-block rewrite could silently change
-    results. An inline brute-force reference reproducing the original line-by-line algorithm is
-    compared against the parser's real (optimized) result across randomized block/violation inputs
-    to confirm the rewrite is behavior-preserving.
+    disk-read-plus-full-scan cost thousands of times over. Verifies the parser builds its directive
+    index (directive_index.index_for_content) once per distinct file content and answers each
+    violation in near-constant time, by counting disk reads and timing many violations against one
+    large file. Also pins behavior: because the scan being optimized is an order-dependent state
+    machine that returns as it reaches the violation's own line inside an open block (never
+    considering blocks further down the file for that violation), a naive independent-per-block
+    rewrite could silently change results. An inline brute-force reference reproducing the original
+    line-by-line algorithm is compared against the parser's real (optimized) result across
+    randomized block/violation inputs to confirm the rewrite is behavior-preserving.
 
 Dependencies: pytest, random, pathlib.Path, unittest.mock, src.core.types.Violation,
-    src.linter_config.ignore
+    src.linter_config.ignore, src.linter_config.directive_index
 
-Exports: TestBlockIgnorePerformance, TestBlockIgnoreEquivalence test classes
+Exports: TestBlockIgnorePerformance, TestBlockIgnoreEquivalence, TestCacheIdentityCollisionSafety
+    test classes
 
 Interfaces: Tests IgnoreDirectiveParser.should_ignore_violation(violation, file_content) -> bool
 
@@ -38,6 +40,8 @@ from pathlib import Path
 from unittest.mock import patch
 
 from src.core.types import Violation
+from src.linter_config import directive_index
+from src.linter_config.directive_index import _BlockIndex, index_for_content
 from src.linter_config.ignore import IgnoreDirectiveParser
 
 MANY_VIOLATIONS = 2000
@@ -174,19 +178,18 @@ class TestBlockIgnoreEquivalence:
     def test_matches_reference_across_randomized_inputs(self) -> None:
         """Randomized blocks/violations must produce identical block-ignore decisions."""
         rng = random.Random(1234)
-        parser = IgnoreDirectiveParser()
 
         for trial in range(20):
             content = _build_random_content(80, rng)
             lines = content.splitlines()
+            index = _BlockIndex.build(lines)
 
             for _ in range(50):
                 violation_line = rng.randint(1, len(lines))
                 rule_id = rng.choice(["dry.duplicate-code", "other-rule"])
-                violation = _make_violation("random.py", violation_line, rule_id)
 
                 expected = _reference_check_block_ignore(lines, violation_line, rule_id)
-                actual = parser._check_block_ignore(violation, lines)  # noqa: SLF001
+                actual = index.is_ignored(violation_line, rule_id)
                 assert actual == expected, (
                     f"trial {trial}: block-ignore mismatch at line {violation_line} "
                     f"rule={rule_id}: reference={expected} actual={actual}"
@@ -200,46 +203,39 @@ class TestCacheIdentityCollisionSafety:
     may have the same id() value." Under --parallel, one long-lived worker process handles
     many files in sequence: each file's content string is created, used briefly, and then
     freed once that file's task returns - exactly the short-lived-object pattern where an
-    address gets recycled for a later, unrelated file's content. _lines_cache and
-    _block_index_cache are keyed by id() alone with no stored reference to verify the key
-    still refers to the same object, so a collision silently serves a previous file's
-    cached lines/block-index for the new file's violation checks. These tests force the
-    exact collision an id()-reuse race would produce (by writing directly into the cache
-    dict rather than relying on GC/allocator timing, which would make the test itself
-    flaky) and assert the parser recomputes instead of trusting the stale entry.
+    address gets recycled for a later, unrelated file's content. index_for_content keys its
+    cache by id() and must verify the stored content object is still the requested one, or a
+    collision silently serves a previous file's directive index for the new file's violation
+    checks. These tests force the exact collision an id()-reuse race would produce (by writing
+    directly into the cache rather than relying on GC/allocator timing, which would make the
+    test itself flaky) and assert the index is rebuilt instead of trusting the stale entry.
     """
 
-    def test_get_cached_lines_recomputes_on_id_collision(self) -> None:
+    def test_index_for_content_recomputes_on_id_collision(self) -> None:
         """A stale entry at a colliding id() must not be returned for different content."""
-        parser = IgnoreDirectiveParser(project_root=Path("/tmp"))
         content_a = "line1\nline2 from file A\nline3\n"
-        lines_a = parser._get_cached_lines(content_a)  # noqa: SLF001
+        index_a = index_for_content(content_a)
 
         content_b = "totally different content from file B\n"
         # Simulate content_a's address having been recycled for content_b: the stale
-        # entry is the real (content_a, lines_a) tuple the cache would still hold, now
+        # entry is the real (content_a, index_a) tuple the cache would still hold, now
         # sitting at the id content_b happens to occupy.
-        parser._lines_cache[id(content_b)] = (content_a, lines_a)  # noqa: SLF001
-
-        result = parser._get_cached_lines(content_b)  # noqa: SLF001
+        directive_index._index_cache[id(content_b)] = (content_a, index_a)  # noqa: SLF001
 
-        assert result == content_b.splitlines(), "cache served file A's stale lines for file B"
+        result = index_for_content(content_b)
 
-    def test_get_block_index_recomputes_on_id_collision(self) -> None:
-        """A stale block index at a colliding id(lines) must not be returned for other lines."""
-        parser = IgnoreDirectiveParser(project_root=Path("/tmp"))
-        lines_a = ["# thailint: ignore-start foo", "violate()", "# thailint: ignore-end"]
-        index_a = parser._get_block_index(lines_a)  # noqa: SLF001
+        assert result.lines == content_b.splitlines(), "cache served file A's stale index"
 
-        lines_b = ["no", "ignore", "directives", "here"]
-        # Simulate lines_a's address having been recycled for lines_b: the stale cache
-        # entry is the real (lines_a, index_a) tuple the cache would still hold, now
-        # sitting at the id lines_b happens to occupy.
-        parser._block_index_cache[id(lines_b)] = (lines_a, index_a)  # noqa: SLF001
+    def test_stale_block_index_is_not_served(self) -> None:
+        """A stale block index at a colliding id() must not suppress lines of other content."""
+        content_a = "# thailint: ignore-start foo\nviolate()\n# thailint: ignore-end\n"
+        index_a = index_for_content(content_a)
+        assert index_a.ignores_line(2, "foo"), "sanity check: the block covers line 2"
 
-        index_b = parser._get_block_index(lines_b)  # noqa: SLF001
+        content_b = "no\nignore\ndirectives\nhere\n"
+        directive_index._index_cache[id(content_b)] = (content_a, index_a)  # noqa: SLF001
 
-        assert not index_b.is_ignored(2, "foo"), "cache served file A's stale block index"
+        assert not index_for_content(content_b).ignores_line(2, "foo")
 
     def test_should_ignore_violation_unaffected_by_colliding_cache_entry(self) -> None:
         """End-to-end: a colliding stale entry must not suppress an unrelated violation."""
@@ -249,11 +245,11 @@ class TestCacheIdentityCollisionSafety:
         v_a = _make_violation("/tmp/a.py", 1, "foo")
         assert parser.should_ignore_violation(v_a, content_a) is True
 
-        stale_lines = parser._get_cached_lines(content_a)  # noqa: SLF001
+        stale_index = index_for_content(content_a)
         content_b = "y = 2  # no ignore directive here\n"
         # Simulate content_a's address having been recycled for content_b: the stale
-        # entry is the real (content_a, stale_lines) tuple the cache would still hold.
-        parser._lines_cache[id(content_b)] = (content_a, stale_lines)  # noqa: SLF001
+        # entry is the real (content_a, stale_index) tuple the cache would still hold.
+        directive_index._index_cache[id(content_b)] = (content_a, stale_index)  # noqa: SLF001
 
         v_b = _make_violation("/tmp/b.py", 1, "foo")
         assert parser.should_ignore_violation(v_b, content_b) is False, (
@@ -0,0 +1,94 @@
+"""
+Purpose: Test the per-file ignore directive index
+
+Scope: DirectiveIndex.build and index_for_content
+
+Overview: The directive index scans a file once and answers every suppression lookup for it.
+    Verifies that content without directives is never split into lines, that ignore-file directives
+    only count within the header, that ignore-next-line covers exactly the following line, that
+    inline and block directives honor their rule lists, that a bare inline ignore covers every rule,
+    that line_text bounds-checks, and that index_for_content hands every caller holding the same
+    content the same index.
+
+Dependencies: src.linter_config.directive_index
+
+Exports: TestDirectiveIndex, TestIndexForContent test classes
+
+Interfaces: Exercises DirectiveIndex.is_suppressed, ignores_file, ignores_line, line_text,
+    index_for_content
+
+Implementation: Builds indexes from small inline sources
+"""
+
+from src.linter_config.directive_index import DirectiveIndex, index_for_content
+
+
+class TestDirectiveIndex:
+    """Lookups answer from the directive lines recorded in one scan."""
+
+    def test_content_without_directives_is_not_split(self) -> None:
+        """The keyword pre-check skips the line scan entirely."""
+        index = DirectiveIndex.build("x = 1\ny = 2\n")
+
+        assert not index.is_suppressed("nesting.excessive-depth", 1)
+        assert "lines" not in vars(index)
+
+    def test_ignore_file_only_counts_in_header(self) -> None:
+        """An ignore-file directive below the header scan window has no effect."""
+        late = "\n" * 20 + "# thailint: ignore-file[nesting]\n"
+
+        assert DirectiveIndex.build("# thailint: ignore-file[nesting]\n").ignores_file("nesting")
+        assert not DirectiveIndex.build(late).ignores_file("nesting")
+
+    def test_ignore_next_line_covers_the_following_line(self) -> None:
+        """Only the line after the directive is suppressed, for the listed rules."""
+        index = DirectiveIndex.build("# thailint: ignore-next-line[srp]\nclass A: ...\nB = 1\n")
+
+        assert index.ignores_line(2, "srp")
+        assert not index.ignores_line(2, "nesting")
+        assert not index.ignores_line(3, "srp")
+
+    def test_inline_and_block_directives(self) -> None:
+        """Inline rule lists and ignore-start/ignore-end spans both apply."""
+        content = (
+            "# thailint: ignore-start nesting\n"
+            "deep()\n"
+            "# thailint: ignore-end\n"
+            "x = 3600  # thailint: ignore[magic-numbers]\n"
+        )
+        index = DirectiveIndex.build(content)
+
+        assert index.is_suppressed("nesting", 2)
+        assert not index.is_suppressed("magic-numbers", 2)
+        assert index.is_suppressed("magic-numbers", 4)
+        assert not index.is_suppressed("nesting", 4)
+
+    def test_bare_inline_ignore_covers_every_rule(self) -> None:
+        """An inline ignore without a rule list suppresses any rule on its line."""
+        index = DirectiveIndex.build(
+            "x = 3600  # thailint: ignore\nconsole.log(x);  // thailint: ignore\n"
+        )
+
+        assert index.is_suppressed("magic-numbers.numeric-literal", 1)
+        assert index.is_suppressed("print-statements.console-statement", 2)
+        assert not DirectiveIndex.build("x = 3600  # thailint: ignore dry\n").is_suppressed(
+            "magic-numbers.numeric-literal", 1
+        )
+
+    def test_line_text_is_bounds_checked(self) -> None:
+        """Lines outside the file have no text."""
+        index = DirectiveIndex.build("a\nb\n")
+
+        assert index.line_text(2) == "b"
+        assert index.line_text(0) is None
+        assert index.line_text(3) is None
+
+
+class TestIndexForContent:
+    """The index is built once per content object."""
+
+    def test_same_content_object_shares_one_index(self) -> None:
+        """Repeated lookups for one file's content reuse its index."""
+        content = "x = 1  # thailint: ignore\n"
+
+        assert index_for_content(content) is index_for_content(content)
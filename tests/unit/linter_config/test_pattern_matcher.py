@@ -0,0 +1,154 @@
+"""
+Purpose: Test the compiled gitignore-style PatternMatcher
+
+Scope: src.linter_config.pattern_matcher file verdicts, negation and directory verdicts
+
+Overview: Pattern lists are compiled once into a PatternMatcher instead of being re-split and
+    fnmatch'd for every path. Verifies the compiled matcher keeps matches_pattern's semantics
+    ("**" spanning whole segments, "*" never crossing "/", directory patterns matching a path
+    component or leading part), that "!" patterns re-include paths with the last match winning,
+    that covers_directory only reports directories whose every descendant is excluded (and
+    never one a later negation could reach into), and that equal pattern lists share one
+    compiled matcher.
+
+Dependencies: pytest, src.linter_config.pattern_matcher, src.linter_config.pattern_utils
+
+Exports: TestFileVerdicts, TestNegation, TestDirectoryVerdicts, TestCompilation test classes
+
+Interfaces: Exercises compile_patterns, PatternMatcher.matches, PatternMatcher.covers_directory,
+    matches_pattern
+
+Implementation: Table-driven cases, no filesystem access
+"""
+
+import pytest
+
+from src.linter_config.pattern_matcher import PatternMatcher, compile_patterns
+from src.linter_config.pattern_utils import matches_pattern
+
+
+class TestFileVerdicts:
+    """Single patterns match exactly as matches_pattern always has."""
+
+    @pytest.mark.parametrize(
+        ("path", "pattern", "expected"),
+        [
+            ("src/a.py", "src/**", True),
+            ("src", "src/**", True),
+            ("srcx/a.py", "src/**", False),
+            ("a/b/c/test_x.py", "**/test_*.py", True),
+            ("test_dir/a.py", "**/test_*.py", False),
+            ("/tmp/pytest-1/test_x0/mod.py", "**/test_*.py", False),
+            ("a.py", "*.py", True),
+            ("pkg/a.py", "*.py", False),
+            ("a/x/y/b", "a/**/b", True),
+            ("a/b", "a/**/b", True),
+            ("a/b", "a/**/**", True),
+            ("a", "a/**/**", True),
+            ("vendor/mod.py", "vendor/", True),
+            ("lib/vendor/mod.py", "vendor/", True),
+            ("not_vendor/mod.py", "vendor/", False),
+            ("src/gen_a/x.py", "src/gen*/", True),
+            ("src/a.py", "src/[ab].py", True),
+            ("src/c.py", "src/[!ab].py", True),
+            ("src/a.py", "src/[!ab].py", False),
+            ("src/[x.py", "src/[x.py", True),
+        ],
+    )
+    def test_single_pattern(self, path: str, pattern: str, expected: bool) -> None:
+        """Compiled and single-pattern matching agree with the documented semantics."""
+        assert compile_patterns((pattern,)).matches(path) is expected
+        assert matches_pattern(path, pattern) is expected
+
+    def test_any_pattern_of_a_list_excludes(self) -> None:
+        """Without negations a path is excluded by whichever pattern matches it."""
+        matcher = PatternMatcher(["docs/**", "**/*.min.js", "build/"])
+
+        assert matcher.matches("docs/index.md")
+        assert matcher.matches("web/app.min.js")
+        assert matcher.matches("pkg/build/out.py")
+        assert not matcher.matches("src/main.py")
+
+    def test_empty_list_excludes_nothing(self) -> None:
+        """An empty pattern list never matches."""
+        assert not PatternMatcher([]).matches("anything.py")
+
+
+class TestNegation:
+    """A "!" pattern re-includes paths; the last matching pattern wins."""
+
+    def test_later_negation_reincludes(self) -> None:
+        """A file re-included after a broad exclusion is not ignored."""
+        matcher = PatternMatcher(["generated/**", "!generated/keep.py"])
+
+        assert matcher.matches("generated/other.py")
+        assert not matcher.matches("generated/keep.py")
+
+    def test_later_exclusion_overrides_negation(self) -> None:
+        """An exclusion after a negation wins for the paths it matches."""
+        matcher = PatternMatcher(["generated/**", "!generated/*.py", "generated/bad.py"])
+
+        assert not matcher.matches("generated/ok.py")
+        assert matcher.matches("generated/bad.py")
+
+    def test_escaped_bang_is_literal(self) -> None:
+        """A leading backslash makes "!" part of the pattern."""
+        assert PatternMatcher(["\\!important.py"]).matches("!important.py")
+
+    def test_negation_alone_excludes_nothing(self) -> None:
+        """A list with only negations never excludes a path."""
+        assert not PatternMatcher(["!keep.py"]).matches("keep.py")
+
+
+class TestDirectoryVerdicts:
+    """covers_directory reports directories whose entire contents are excluded."""
+
+    @pytest.mark.parametrize(
+        ("patterns", "directory", "expected"),
+        [
+            (["**/cache/**"], "cache", True),
+            (["**/cache/**"], "a/b/cache", True),
+            (["**/cache/**"], "a/cache_old", False),
+            (["build/"], "pkg/build", True),
+            (["build/"], "pkg/build/sub", True),
+            (["src/**"], "src", True),
+            (["src/*"], "src", False),
+            (["**/*.py"], "pkg", False),
+            (["**"], "anything", True),
+            (["/abs/out/**"], "/abs/out", True),
+        ],
+    )
+    def test_positive_patterns(self, patterns: list[str], directory: str, expected: bool) -> None:
+        """Only patterns matching everything appended below the directory cover it."""
+        assert PatternMatcher(patterns).covers_directory(directory) is expected
+
+    def test_negation_reaching_into_directory_blocks_pruning(self) -> None:
+        """A later negation that could re-include a descendant keeps the directory."""
+        matcher = PatternMatcher(["generated/**", "!generated/keep/*.py"])
+
+        assert not matcher.covers_directory("generated")
+        assert matcher.matches("generated/a.py")
+
+    def test_negation_elsewhere_does_not_block_pruning(self) -> None:
+        """A negation whose literal prefix points at another directory is irrelevant."""
+        matcher = PatternMatcher(["generated/**", "!src/keep.py"])
+
+        assert matcher.covers_directory("generated")
+
+    def test_wildcard_negation_blocks_pruning(self) -> None:
+        """A negation without a literal prefix may match beneath any directory."""
+        assert not PatternMatcher(["generated/**", "!**/keep.py"]).covers_directory("generated")
+
+    def test_exclusion_after_negation_still_covers(self) -> None:
+        """A covering pattern listed after the negation wins for the whole directory."""
+        matcher = PatternMatcher(["!generated/keep.py", "generated/**"])
+
+        assert matcher.covers_directory("generated")
+
+
+class TestCompilation:
+    """Pattern lists are compiled once and reused."""
+
+    def test_equal_lists_share_a_matcher(self) -> None:
+        """compile_patterns memoizes per pattern tuple."""
+        assert compile_patterns(("a/**", "b/")) is compile_patterns(("a/**", "b/"))
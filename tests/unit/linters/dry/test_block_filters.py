@@ -46,7 +46,6 @@ from pathlib import Path
             file_path=Path("test.py"),
             start_line=1,
             end_line=3,
-            snippet="import os\nimport sys\nfrom pathlib import Path",
             hash_value=22222,
         )
 
@@ -79,7 +78,6 @@ obj = Constructor(
             file_path=Path("test.py"),
             start_line=2,
             end_line=3,
-            snippet="param1=value1,\nparam2=value2,",
             hash_value=44444,
         )
 
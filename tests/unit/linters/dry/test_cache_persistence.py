@@ -32,7 +32,6 @@ def _block(file_path: Path, hash_value: int, start: int = 1, end: int = 3) -> Co
         file_path=file_path,
         start_line=start,
         end_line=end,
-        snippet=f"snippet-{hash_value}",
         hash_value=hash_value,
     )
 
@@ -0,0 +1,189 @@
+"""
+Purpose: Test the compact DRY index schema and its size against the previous layout
+
+Scope: DRYCache schema version 4 and self-healing from version 3 files
+
+Overview: code_blocks holds one row per overlapping hash window, so storing each window's full
+    snippet text and file path stored every source line min_duplicate_lines times. The compact
+    schema references files by integer id and stores no snippet. Verifies the stored columns,
+    that blocks found by hash still carry their file path, that a version 3 database is rebuilt
+    on open, and - as a benchmark - that indexing a generated corpus takes
+    well under half the space the previous layout needed for the same blocks.
+
+Dependencies: sqlite3, time, pathlib.Path, src.linters.dry.cache, src.linters.dry.python_analyzer
+
+Exports: TestCompactSchema, TestSchemaMigration, TestIndexSizeBenchmark test classes
+
+Interfaces: Exercises DRYCache.upsert_file and find_duplicates_by_hashes
+
+Implementation: On-disk databases under tmp_path; the version 3 layout is recreated with raw SQL
+    so its size can be compared and its migration exercised
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+from src.linters.dry.cache import CodeBlock, DRYCache
+from src.linters.dry.config import DRYConfig
+from src.linters.dry.python_analyzer import PythonDuplicateAnalyzer
+
+# Version 3 layout: file path and full snippet text on every code_blocks row
+_V3_SCHEMA = """
+CREATE TABLE schema_meta (version INTEGER NOT NULL);
+INSERT INTO schema_meta (version) VALUES (3);
+CREATE TABLE files (
+    file_path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    last_scanned TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE code_blocks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT NOT NULL,
+    hash_value INTEGER NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    snippet TEXT NOT NULL
+);
+CREATE INDEX idx_hash_value ON code_blocks(hash_value);
+CREATE INDEX idx_file_path ON code_blocks(file_path);
+"""
+
+_MODULE_TEMPLATE = """def handler_{index}(request, session):
+    user = session.lookup_user(request.user_id)
+    if user is None:
+        raise PermissionError("unknown user {index}")
+    payload = request.json()
+    record = session.records.create(owner=user, payload=payload)
+    session.audit.log("created", record.identifier, user.identifier)
+    return record.serialize(include_owner=True)
+"""
+
+
+def _write_corpus(directory: Path, file_count: int, functions_per_file: int) -> list[Path]:
+    """Write a deep package path full of similar functions, as a large project would have."""
+    package = directory / "services" / "billing" / "handlers" / "internal"
+    package.mkdir(parents=True)
+    paths = []
+    for file_index in range(file_count):
+        path = package / f"handler_module_{file_index}.py"
+        functions = (
+            _MODULE_TEMPLATE.format(index=file_index * functions_per_file + n)
+            for n in range(functions_per_file)
+        )
+        path.write_text("\n\n".join(functions))
+        paths.append(path)
+    return paths
+
+
+def _snippet(block: CodeBlock) -> str:
+    """Read a block's line range back from its source file, as version 3 stored it."""
+    try:
+        lines = block.file_path.read_text().splitlines()
+    except OSError:
+        return ""
+    return "\n".join(lines[block.start_line - 1 : block.end_line])
+
+
+def _v3_size(db_path: Path, blocks: list[CodeBlock]) -> int:
+    """Store blocks in the version 3 layout and return the database size."""
+    db = sqlite3.connect(str(db_path))
+    db.executescript(_V3_SCHEMA)
+    for file_path in {block.file_path for block in blocks}:
+        db.execute("INSERT INTO files (file_path, content_hash) VALUES (?, 'x')", (str(file_path),))
+    db.executemany(
+        "INSERT INTO code_blocks (file_path, hash_value, start_line, end_line, snippet)"
+        " VALUES (?, ?, ?, ?, ?)",
+        [(str(b.file_path), b.hash_value, b.start_line, b.end_line, _snippet(b)) for b in blocks],
+    )
+    db.commit()
+    db.execute("VACUUM")
+    db.close()
+    return db_path.stat().st_size
+
+
+class TestCompactSchema:
+    """Stored columns and query results."""
+
+    def test_code_blocks_store_no_path_or_snippet(self, tmp_path: Path) -> None:
+        """Rows hold a file id and line range only."""
+        cache = DRYCache(storage_mode="tempfile", db_path=tmp_path / "dry.db")
+        try:
+            columns = [row[1] for row in cache.db.execute("PRAGMA table_info(code_blocks)")]
+        finally:
+            cache.close()
+        assert columns == ["file_id", "hash_value", "start_line", "end_line"]
+
+    def test_blocks_found_by_hash_carry_file_path(self, tmp_path: Path) -> None:
+        """Queries join the file path back in."""
+        cache = DRYCache()
+        file_a, file_b = tmp_path / "a.py", tmp_path / "b.py"
+        cache.upsert_file(file_a, "h1", [CodeBlock(file_a, 1, 3, 7)])
+        cache.upsert_file(file_b, "h2", [CodeBlock(file_b, 5, 7, 7)])
+
+        found = cache.find_duplicates_by_hashes(cache.duplicate_hashes)
+
+        assert found == {7: [CodeBlock(file_a, 1, 3, 7), CodeBlock(file_b, 5, 7, 7)]}
+        cache.close()
+
+    def test_rescan_keeps_file_id_and_replaces_blocks(self, tmp_path: Path) -> None:
+        """Re-indexing a file replaces its blocks without duplicating its files row."""
+        cache = DRYCache()
+        file_a = tmp_path / "a.py"
+        cache.upsert_file(file_a, "h1", [CodeBlock(file_a, 1, 3, 7)])
+        cache.upsert_file(file_a, "h2", [CodeBlock(file_a, 2, 4, 8)])
+
+        assert cache.db.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 1
+        assert cache.find_duplicates_by_hash(7) == []
+        assert cache.find_duplicates_by_hash(8) == [CodeBlock(file_a, 2, 4, 8)]
+        cache.close()
+
+
+class TestSchemaMigration:
+    """Version 3 files self-heal to the compact layout."""
+
+    def test_v3_database_is_rebuilt(self, tmp_path: Path) -> None:
+        """Opening a version 3 file drops its rows and recreates the compact tables."""
+        db_path = tmp_path / "dry.db"
+        old_block = CodeBlock(tmp_path / "old.py", 1, 3, 5)
+        _v3_size(db_path, [old_block])
+
+        cache = DRYCache(storage_mode="persistent", db_path=db_path)
+        try:
+            version = cache.db.execute("SELECT version FROM schema_meta").fetchone()[0]
+            assert version == DRYCache.SCHEMA_VERSION
+            assert cache.all_file_paths == set()
+            new_file = tmp_path / "new.py"
+            cache.upsert_file(new_file, "h", [CodeBlock(new_file, 1, 3, 5)])
+            assert cache.find_duplicates_by_hash(5) == [CodeBlock(new_file, 1, 3, 5)]
+        finally:
+            cache.close()
+
+
+class TestIndexSizeBenchmark:
+    """Database size and build time of a cold index build."""
+
+    def test_compact_index_is_under_half_the_previous_size(self, tmp_path: Path) -> None:
+        """A 40-file corpus indexes into well under half the version 3 footprint."""
+        paths = _write_corpus(tmp_path / "corpus", file_count=40, functions_per_file=12)
+        analyzer = PythonDuplicateAnalyzer()
+        config = DRYConfig(enabled=True, min_duplicate_lines=4)
+        db_path = tmp_path / "compact.db"
+
+        cache = DRYCache(storage_mode="persistent", db_path=db_path)
+        started = time.perf_counter()
+        blocks_by_file = {path: analyzer.analyze(path, path.read_text(), config) for path in paths}
+        for path, blocks in blocks_by_file.items():
+            cache.upsert_file(path, "content-hash", blocks)
+        build_seconds = time.perf_counter() - started
+        cache.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        cache.db.execute("VACUUM")
+        cache.close()
+
+        all_blocks = [block for blocks in blocks_by_file.values() for block in blocks]
+        compact_size = db_path.stat().st_size
+        previous_size = _v3_size(tmp_path / "v3.db", all_blocks)
+
+        assert all_blocks
+        assert compact_size < previous_size * 0.5, (compact_size, previous_size)
+        assert build_seconds < 10
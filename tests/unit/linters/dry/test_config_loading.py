@@ -110,6 +110,8 @@ dry:
   enabled: true
   storage_mode: "invalid"
 """)
+    # DRY is only dispatched Python/TypeScript files, so give it one to check
+    (tmp_path / "module.py").write_text("x = 1\n")
 
     with pytest.raises((ValueError, Exception)):
         linter = Linter(config_file=config, project_root=tmp_path)
@@ -159,6 +161,8 @@ dry:
   enabled: true
   min_duplicate_lines: -1
 """)
+    # DRY is only dispatched Python/TypeScript files, so give it one to check
+    (tmp_path / "module.py").write_text("x = 1\n")
 
     with pytest.raises((ValueError, Exception)):
         linter = Linter(config_file=config, project_root=tmp_path)
@@ -0,0 +1,244 @@
+"""
+Purpose: Tests for incremental re-analysis in the persistent DRY duplicate index
+
+Scope: DRYRule reuse of stored file state for unchanged files, and settings-change invalidation
+
+Overview: In persistent mode a file whose content hash matches its indexed state is neither
+    re-analyzed nor written again, yet its stored blocks, constants and ignore ranges still take
+    part in finalization. Verifies through a fresh Orchestrator per run (simulating separate CLI
+    invocations) that a warm run reuses every unchanged file without writing to the store and
+    reports the same violations as the cold run, that an edited file alone is rescanned, that stored
+    constants of unchecked files are matched only after being re-verified, that changing the
+    block-extraction settings discards the index instead of reusing blocks extracted under the old
+    settings, and that ephemeral modes never reuse anything.
+
+Dependencies: pytest, pathlib.Path, src.orchestrator.core.Orchestrator, DRYCache, DRYRule,
+    FileAnalyzer, FileStateStore, reset_if_settings_changed
+
+Exports: Test classes for warm-run reuse, edited files, stored constants, settings changes and
+    ephemeral modes
+
+Interfaces: Exercises DRYRule.index_stats, index_bookkeeping.reset_if_settings_changed
+
+Implementation: Counts FileAnalyzer.analyze, DRYCache.upsert_file and FileStateStore.record calls
+    with pass-through wrappers so reuse is observed directly, not just through the reported counts
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.linters.dry.cache import CodeBlock, DRYCache
+from src.linters.dry.config import DRYConfig
+from src.linters.dry.constant import ConstantInfo
+from src.linters.dry.file_analyzer import FileAnalyzer
+from src.linters.dry.file_state_store import FileStateStore
+from src.linters.dry.index_bookkeeping import reset_if_settings_changed
+from src.linters.dry.linter import DRYRule, IndexStats
+from src.orchestrator.core import Orchestrator
+
+_DUPLICATE_BODY = "\n".join(f"    value_{i} = compute({i})" for i in range(6))
+
+
+def _config(
+    storage_mode: str = "persistent", min_duplicate_lines: int = 3, constants: bool = False
+) -> dict:
+    return {
+        "dry": {
+            "enabled": True,
+            "min_duplicate_lines": min_duplicate_lines,
+            "storage_mode": storage_mode,
+            "detect_duplicate_constants": constants,
+        }
+    }
+
+
+def _run(tmp_path: Path, files: list[Path], config: dict | None = None) -> tuple[list, IndexStats]:
+    """Simulate one CLI invocation, returning its DRY violations and index stats."""
+    orchestrator = Orchestrator(project_root=tmp_path, config=config or _config())
+    violations = [v for v in orchestrator.lint_files(files) if v.rule_id.startswith("dry.")]
+    rule = orchestrator.registry.get("dry.duplicate-code")
+    assert isinstance(rule, DRYRule)
+    return violations, rule.index_stats
+
+
+@pytest.fixture
+def analyzed_files(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every file FileAnalyzer.analyze is called for."""
+    calls: list[Path] = []
+    original = FileAnalyzer.analyze
+
+    def counting_analyze(
+        self: FileAnalyzer, file_path: Path, content: str, language: str, config: DRYConfig
+    ) -> list[CodeBlock]:
+        calls.append(file_path)
+        return original(self, file_path, content, language, config)
+
+    monkeypatch.setattr(FileAnalyzer, "analyze", counting_analyze)
+    return calls
+
+
+@pytest.fixture
+def written_files(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every file whose blocks or constants/ignore ranges are written to the store."""
+    calls: list[Path] = []
+    original_upsert = DRYCache.upsert_file
+    original_record = FileStateStore.record
+
+    def counting_upsert(
+        self: DRYCache, file_path: Path, content_hash: str, blocks: list[CodeBlock]
+    ) -> None:
+        calls.append(file_path)
+        original_upsert(self, file_path, content_hash, blocks)
+
+    def counting_record(
+        self: FileStateStore,
+        file_path: Path,
+        constants: list[ConstantInfo],
+        ignore_ranges: list[tuple[int, int]],
+    ) -> None:
+        calls.append(file_path)
+        original_record(self, file_path, constants, ignore_ranges)
+
+    monkeypatch.setattr(DRYCache, "upsert_file", counting_upsert)
+    monkeypatch.setattr(FileStateStore, "record", counting_record)
+    return calls
+
+
+def _write_duplicates(tmp_path: Path) -> tuple[Path, Path, Path]:
+    """Write two duplicated files and one unrelated file."""
+    file_a = tmp_path / "file_a.py"
+    file_b = tmp_path / "file_b.py"
+    file_c = tmp_path / "file_c.py"
+    file_a.write_text(f"def handler():\n{_DUPLICATE_BODY}\n")
+    file_b.write_text(f"def handler():\n{_DUPLICATE_BODY}\n")
+    file_c.write_text("def other():\n    return 1\n")
+    return file_a, file_b, file_c
+
+
+class TestWarmRunReusesUnchangedFiles:
+    """A second run over unchanged files analyzes nothing and reports the same result."""
+
+    def test_unchanged_files_are_not_reanalyzed(
+        self, tmp_path: Path, analyzed_files: list[Path]
+    ) -> None:
+        """Every file of a warm run is reused from the index."""
+        files = list(_write_duplicates(tmp_path))
+        cold, cold_stats = _run(tmp_path, files)
+        analyzed_files.clear()
+
+        warm, warm_stats = _run(tmp_path, files)
+
+        assert analyzed_files == []
+        assert cold_stats == IndexStats(reused=0, rescanned=3)
+        assert warm_stats == IndexStats(reused=3, rescanned=0)
+        assert sorted((v.file_path, v.line) for v in warm) == sorted(
+            (v.file_path, v.line) for v in cold
+        )
+        assert len(warm) == 4
+
+    def test_unchanged_files_are_not_written(
+        self, tmp_path: Path, written_files: list[Path]
+    ) -> None:
+        """A warm run leaves the stored blocks, constants and ignore ranges untouched."""
+        files = list(_write_duplicates(tmp_path))
+        files[2].write_text("API_TIMEOUT = 30\n# dry: ignore-next\nOTHER = 1\n")
+        _run(tmp_path, files, _config(constants=True))
+        assert len(written_files) == 6, "sanity check: the cold run writes every file"
+        written_files.clear()
+
+        _, stats = _run(tmp_path, files, _config(constants=True))
+
+        assert written_files == []
+        assert stats == IndexStats(reused=3, rescanned=0)
+
+    def test_only_the_edited_file_is_rescanned(
+        self, tmp_path: Path, analyzed_files: list[Path]
+    ) -> None:
+        """Editing one file rescans just that file; its fix clears the duplicate."""
+        file_a, file_b, file_c = _write_duplicates(tmp_path)
+        _run(tmp_path, [file_a, file_b, file_c])
+        analyzed_files.clear()
+
+        file_b.write_text("def handler():\n    return 'no duplicate anymore'\n")
+        violations, stats = _run(tmp_path, [file_a, file_b, file_c])
+
+        assert analyzed_files == [file_b]
+        assert stats == IndexStats(reused=2, rescanned=1)
+        assert violations == []
+
+
+class TestStoredConstantsAreReconciled:
+    """Constants stored by a prior run are re-verified before they are reported against."""
+
+    def test_duplicate_in_unchecked_file_is_reported(self, tmp_path: Path) -> None:
+        """A checked file's constant is matched against an unchanged, unchecked file."""
+        file_a, file_b, _ = _write_duplicates(tmp_path)
+        file_b.write_text("API_TIMEOUT = 30\n")
+        _run(tmp_path, [file_b], _config(constants=True))
+        file_a.write_text("API_TIMEOUT = 30\n")
+
+        violations, _ = _run(tmp_path, [file_a], _config(constants=True))
+
+        assert [v.file_path for v in violations] == [str(file_a)]
+
+    def test_constant_removed_from_unchecked_file_is_not_reported(
+        self, tmp_path: Path, analyzed_files: list[Path]
+    ) -> None:
+        """An unchecked file edited since it was indexed is rescanned before matching."""
+        file_a, file_b, _ = _write_duplicates(tmp_path)
+        file_a.write_text("API_TIMEOUT = 30\n")
+        file_b.write_text("API_TIMEOUT = 30\n")
+        _run(tmp_path, [file_a, file_b], _config(constants=True))
+        analyzed_files.clear()
+        file_b.write_text("OTHER_SETTING = 1\n")
+
+        violations, stats = _run(tmp_path, [file_a], _config(constants=True))
+
+        assert analyzed_files == [file_b]
+        assert stats == IndexStats(reused=1, rescanned=0)
+        assert violations == []
+
+
+class TestSettingsChangeDiscardsIndex:
+    """Blocks extracted under other analysis settings are never reused."""
+
+    def test_changed_min_lines_rescans_every_file(
+        self, tmp_path: Path, analyzed_files: list[Path]
+    ) -> None:
+        """Raising min_duplicate_lines rescans everything and applies the new threshold."""
+        files = list(_write_duplicates(tmp_path))
+        first, _ = _run(tmp_path, files)
+        assert len(first) == 4, "sanity check: default threshold finds the duplicate"
+        analyzed_files.clear()
+
+        violations, stats = _run(tmp_path, files, _config(min_duplicate_lines=20))
+
+        assert stats == IndexStats(reused=0, rescanned=3)
+        assert len(analyzed_files) == 3
+        assert violations == []
+
+    def test_reset_if_settings_changed_keeps_index_for_same_settings(self, tmp_path: Path) -> None:
+        """Only a different fingerprint clears the stored files."""
+        cache = DRYCache(storage_mode="persistent", db_path=tmp_path / "dry.db")
+        assert reset_if_settings_changed(cache.db, "a") is False
+        cache.upsert_file(tmp_path / "x.py", "hash", [])
+
+        assert reset_if_settings_changed(cache.db, "a") is False
+        assert cache.all_file_paths == {str(tmp_path / "x.py")}
+        assert reset_if_settings_changed(cache.db, "b") is True
+        assert cache.all_file_paths == set()
+        cache.close()
+
+
+class TestEphemeralModesNeverReuse:
+    """Memory mode starts empty every run, so every file is analyzed."""
+
+    def test_memory_mode_rescans_every_run(self, tmp_path: Path) -> None:
+        """Nothing is reused without a persistent index."""
+        files = list(_write_duplicates(tmp_path))
+        _run(tmp_path, files, _config(storage_mode="memory"))
+
+        _, stats = _run(tmp_path, files, _config(storage_mode="memory"))
+
+        assert stats == IndexStats(reused=0, rescanned=3)
@@ -53,7 +53,6 @@ def make_block(start_line: int, line_count: int = 4) -> CodeBlock:
         file_path=Path("repetitive.py"),
         start_line=start_line,
         end_line=start_line + line_count - 1,
-        snippet="x = 1\ny = 2\nz = 3\nw = 4",
         hash_value=42,
     )
 
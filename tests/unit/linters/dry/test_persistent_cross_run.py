@@ -53,7 +53,7 @@ def _run(tmp_path: Path, files: list[Path]) -> list:
 class TestCachePathResolvesToTrueProjectRoot:
     """The persistent cache must land at project_root, not a scanned file's own directory.
 
-    Regression test: DRYRule._get_project_root previously read
+    Regression test: the DRY linter's _get_project_root previously read
     context.metadata["project_root"], but the orchestrator sets "_project_root" (see
     Orchestrator.lint_file) - the lookup always missed, silently falling back to
     Path(file_path).parent. Invisible when files sit directly in project_root (as in every
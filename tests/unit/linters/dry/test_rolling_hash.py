@@ -0,0 +1,74 @@
+"""
+Purpose: Test the incremental rolling window hash used for DRY duplicate detection
+
+Scope: token_hasher.rolling_hash
+
+Overview: rolling_hash hashes each line once and slides a polynomial window hash over the line
+    hashes instead of joining and re-hashing the text of every window. Verifies that the slid
+    hash of a window equals the hash of the same lines taken on their own (so identical blocks
+    match wherever they sit in a file), that different windows hash differently, that line
+    numbers are reported correctly, and that line fingerprints keep byte positions and leading
+    NUL bytes apart.
+
+Dependencies: src.linters.dry.token_hasher
+
+Exports: TestRollingHash test class
+
+Interfaces: Exercises rolling_hash(lines, window_size, line_numbers)
+
+Implementation: Direct calls on small line lists
+"""
+
+from src.linters.dry.token_hasher import rolling_hash
+
+_LINES = ["a = 1", "b = 2", "c = a + b", "print(c)", "a = 1", "b = 2", "c = a + b"]
+
+
+class TestRollingHash:
+    """Incremental polynomial window hashing."""
+
+    def test_slid_hash_matches_standalone_hash(self) -> None:
+        """Every window hashes the same as its lines hashed on their own."""
+        for offset, (hash_value, _, _) in enumerate(rolling_hash(_LINES, 3)):
+            standalone = rolling_hash(_LINES[offset : offset + 3], 3)
+            assert standalone[0][0] == hash_value
+
+    def test_repeated_block_hashes_equal(self) -> None:
+        """The same three lines at two positions share a hash."""
+        hashes = [window[0] for window in rolling_hash(_LINES, 3)]
+        assert hashes[0] == hashes[4]
+
+    def test_different_windows_hash_differently(self) -> None:
+        """Distinct windows, including reorderings of the same lines, get distinct hashes."""
+        hashes = [window[0] for window in rolling_hash(_LINES, 3)]
+        reordered = rolling_hash(["b = 2", "a = 1", "c = a + b"], 3)[0][0]
+        assert len(set(hashes[:4])) == 4
+        assert reordered != hashes[0]
+
+    def test_hash_fits_signed_64_bit(self) -> None:
+        """Hash values are storable in a SQLite INTEGER column."""
+        assert all(0 <= window[0] < 2**63 for window in rolling_hash(_LINES, 2))
+
+    def test_default_line_numbers_are_positions(self) -> None:
+        """Without line_numbers, windows report 1-indexed positions."""
+        windows = rolling_hash(_LINES, 3)
+        assert [(start, end) for _, start, end in windows][:2] == [(1, 3), (2, 4)]
+
+    def test_original_line_numbers_are_reported(self) -> None:
+        """Given line_numbers, windows report the original first and last line."""
+        windows = rolling_hash(["x", "y", "z"], 2, line_numbers=[3, 7, 8])
+        assert [(start, end) for _, start, end in windows] == [(3, 7), (7, 8)]
+
+    def test_too_few_lines(self) -> None:
+        """Fewer lines than the window size yields no windows."""
+        assert rolling_hash(["only"], 3) == []
+
+    def test_distant_byte_swaps_hash_differently(self) -> None:
+        """Swapping two characters far apart in a long line changes its hash."""
+        line = "x" * 30 + "a" + "y" * 60 + "b" + "z" * 30
+        swapped = "x" * 30 + "b" + "y" * 60 + "a" + "z" * 30
+        assert rolling_hash([line], 1)[0][0] != rolling_hash([swapped], 1)[0][0]
+
+    def test_leading_nul_bytes_are_significant(self) -> None:
+        """A line is not confused with the same line behind a NUL byte."""
+        assert rolling_hash(["a"], 1)[0][0] != rolling_hash(["\x00a"], 1)[0][0]
@@ -0,0 +1,276 @@
+"""
+Purpose: Tests for the persistent, incremental stringly-typed index
+
+Scope: StringlyTypedRule in storage_mode "persistent" and the StringlyTypedStorage freshness API
+
+Overview: In persistent mode the cross-file index lives on disk between runs and a file whose
+    content hash matches its indexed state is not re-analyzed. Verifies through a fresh Orchestrator
+    per run (simulating separate CLI invocations) that a warm run analyzes nothing and reports the
+    same violations, that an edited file alone is re-analyzed and loses its stale rows, that a
+    deleted or edited file reported from the index is purged or re-extracted before it is trusted,
+    that indexed files outside the linted paths are matched against but never reported, that a
+    changed-files run only selects unchanged files missing from the index, that changing the ignore
+    patterns discards the index, that an on-disk file from another schema version is rebuilt, and
+    that string-set hashes match across processes.
+
+Dependencies: pytest, subprocess, sys, pathlib.Path, Orchestrator, PythonStringlyTypedAnalyzer,
+    StringlyTypedRule, StringlyTypedStorage, Violation
+
+Exports: Test classes for warm runs, stale reported files, scoped runs, changed-files runs and
+    index upkeep
+
+Interfaces: Exercises StringlyTypedRule.select_unchanged_files, StringlyTypedStorage.replace_file,
+    needs_rescan, reset_if_settings_changed and schema self-healing
+
+Implementation: Counts PythonStringlyTypedAnalyzer.analyze_all calls with a pass-through wrapper
+    so reuse is observed directly
+"""
+
+import sqlite3
+import subprocess  # nosec B404 - runs this interpreter to compare hashes across processes
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.core.types import Violation
+from src.linters.stringly_typed.hashing import compute_string_set_hash
+from src.linters.stringly_typed.linter import StringlyTypedRule
+from src.linters.stringly_typed.python.analyzer import PythonStringlyTypedAnalyzer
+from src.linters.stringly_typed.storage import StringlyTypedStorage
+from src.orchestrator.core import Orchestrator
+
+_VALIDATION = 'def check(env):\n    if env in ("staging", "production"):\n        return True\n'
+_RULE_ID = "stringly-typed.repeated-validation"
+
+
+def _config(storage_mode: str = "persistent", ignore: list[str] | None = None) -> dict:
+    return {"stringly_typed": {"storage_mode": storage_mode, "ignore": ignore or []}}
+
+
+def _orchestrator(tmp_path: Path, config: dict | None) -> Orchestrator:
+    return Orchestrator(project_root=tmp_path, config=config or _config())
+
+
+def _run(tmp_path: Path, files: list[Path], config: dict | None = None) -> list[tuple[str, int]]:
+    """Simulate one CLI invocation, returning its repeated-validation violation locations."""
+    violations = _orchestrator(tmp_path, config).lint_files(files)
+    return sorted((v.file_path, v.line) for v in violations if v.rule_id == _RULE_ID)
+
+
+def _scoped_run(tmp_path: Path, directory: Path) -> list[Violation]:
+    """Simulate one CLI invocation over a directory, returning its repeated-validation violations."""
+    violations = _orchestrator(tmp_path, None).lint_directory(directory)
+    return [v for v in violations if v.rule_id == _RULE_ID]
+
+
+def _db_path(tmp_path: Path) -> Path:
+    return tmp_path / ".thailint-cache" / "stringly_typed.db"
+
+
+@pytest.fixture
+def analyzed_files(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every file PythonStringlyTypedAnalyzer.analyze_all is called for."""
+    calls: list[Path] = []
+    original = PythonStringlyTypedAnalyzer.analyze_all
+
+    def counting_analyze_all(
+        self: PythonStringlyTypedAnalyzer, code: str, file_path: Path
+    ) -> tuple[list, list, list]:
+        calls.append(file_path)
+        return original(self, code, file_path)
+
+    monkeypatch.setattr(PythonStringlyTypedAnalyzer, "analyze_all", counting_analyze_all)
+    return calls
+
+
+def _write_modules(tmp_path: Path) -> tuple[Path, Path, Path]:
+    """Write two modules repeating one validation and one unrelated module."""
+    file_a = tmp_path / "module_a.py"
+    file_b = tmp_path / "module_b.py"
+    file_c = tmp_path / "module_c.py"
+    file_a.write_text(_VALIDATION)
+    file_b.write_text(_VALIDATION)
+    file_c.write_text("def other():\n    return 1\n")
+    return file_a, file_b, file_c
+
+
+class TestWarmRunReusesUnchangedFiles:
+    """A second run over unchanged files analyzes nothing and reports the same result."""
+
+    def test_unchanged_files_are_not_reanalyzed(
+        self, tmp_path: Path, analyzed_files: list[Path]
+    ) -> None:
+        """Every file of a warm run comes from the on-disk index."""
+        files = list(_write_modules(tmp_path))
+        cold = _run(tmp_path, files)
+        analyzed_files.clear()
+
+        warm = _run(tmp_path, files)
+
+        assert analyzed_files == []
+        assert warm == cold
+        assert len(warm) == 2
+        assert _db_path(tmp_path).exists()
+
+    def test_only_the_edited_file_is_reanalyzed(
+        self, tmp_path: Path, analyzed_files: list[Path]
+    ) -> None:
+        """Editing one file re-analyzes just that file; its fix clears the violation."""
+        file_a, file_b, file_c = _write_modules(tmp_path)
+        _run(tmp_path, [file_a, file_b, file_c])
+        analyzed_files.clear()
+
+        file_b.write_text("def check(env):\n    return env\n")
+        violations = _run(tmp_path, [file_a, file_b, file_c])
+
+        assert analyzed_files == [file_b]
+        assert violations == []
+
+
+class TestStaleReportedFiles:
+    """Indexed files reported on but not checked this run are verified first."""
+
+    def test_deleted_file_is_purged(self, tmp_path: Path) -> None:
+        """A file deleted since it was indexed neither reports nor matches anything."""
+        file_a, file_b, _ = _write_modules(tmp_path)
+        assert len(_run(tmp_path, [file_a, file_b])) == 2
+
+        file_b.unlink()
+
+        assert _run(tmp_path, [file_a]) == []
+        storage = StringlyTypedStorage("persistent", db_path=_db_path(tmp_path))
+        assert storage.all_file_paths == {str(file_a)}
+        storage.close()
+
+    def test_edited_file_is_reextracted(self, tmp_path: Path) -> None:
+        """A file edited outside the run is matched with its current content."""
+        file_a, file_b, _ = _write_modules(tmp_path)
+        _run(tmp_path, [file_a, file_b])
+
+        file_b.write_text("def check(env):\n    return env\n")
+
+        assert _run(tmp_path, [file_a]) == []
+
+    def test_unchanged_file_still_matches(self, tmp_path: Path) -> None:
+        """Checking one file still finds the pattern repeated in the rest of the index."""
+        file_a, file_b, _ = _write_modules(tmp_path)
+        _run(tmp_path, [file_a, file_b])
+
+        assert _run(tmp_path, [file_a]) == [(str(file_a), 2)]
+
+
+class TestScopedRun:
+    """Indexed files outside the requested paths are compared against, never reported."""
+
+    def test_rerun_on_a_subdirectory_reports_only_its_files(self, tmp_path: Path) -> None:
+        """After indexing the whole tree, linting one directory reports nothing outside it."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "a" / "m.py").write_text("def other():\n    return 1\n")
+        (tmp_path / "b" / "m.py").write_text(_VALIDATION)
+        (tmp_path / "b" / "n.py").write_text(_VALIDATION)
+        assert len(_scoped_run(tmp_path, tmp_path)) == 2
+
+        assert _scoped_run(tmp_path, tmp_path / "a") == []
+
+
+class TestChangedFilesRun:
+    """A changed-files run only needs the unchanged files missing from the index."""
+
+    def _rule_after_checking(
+        self, tmp_path: Path, file_path: Path, config: dict
+    ) -> StringlyTypedRule:
+        orchestrator = _orchestrator(tmp_path, config)
+        orchestrator.lint_file(file_path)
+        rule = orchestrator.registry.get(_RULE_ID)
+        assert isinstance(rule, StringlyTypedRule)
+        return rule
+
+    def test_persistent_mode_selects_unindexed_files(self, tmp_path: Path) -> None:
+        """Indexed and ignored candidates are left out."""
+        file_a, file_b, file_c = _write_modules(tmp_path)
+        ignored = tmp_path / "generated.py"
+        ignored.write_text(_VALIDATION)
+        _run(tmp_path, [file_b], _config(ignore=["**/generated.py"]))
+
+        rule = self._rule_after_checking(tmp_path, file_a, _config(ignore=["**/generated.py"]))
+
+        assert rule.select_unchanged_files([file_b, file_c, ignored]) == [file_c]
+
+    def test_memory_mode_selects_every_candidate(self, tmp_path: Path) -> None:
+        """Ephemeral storage keeps nothing between runs."""
+        file_a, file_b, file_c = _write_modules(tmp_path)
+
+        rule = self._rule_after_checking(tmp_path, file_a, _config(storage_mode="memory"))
+
+        assert rule.select_unchanged_files([file_b, file_c]) == [file_b, file_c]
+
+
+class TestIndexUpkeep:
+    """Settings changes, schema changes and hashing keep the index trustworthy."""
+
+    def test_changed_ignore_patterns_discard_the_index(
+        self, tmp_path: Path, analyzed_files: list[Path]
+    ) -> None:
+        """Rows of files a new ignore pattern excludes do not linger."""
+        files = list(_write_modules(tmp_path))
+        _run(tmp_path, files)
+        analyzed_files.clear()
+
+        violations = _run(tmp_path, files, _config(ignore=["**/module_b.py"]))
+
+        assert violations == []
+        assert sorted(analyzed_files) == [files[0], files[2]]
+
+    def test_replace_file_drops_stale_rows(self, tmp_path: Path) -> None:
+        """Re-indexing a file with nothing found deletes its previous rows."""
+        storage = StringlyTypedStorage("persistent", db_path=tmp_path / "st.db")
+        rule = StringlyTypedRule()
+        path = tmp_path / "module_a.py"
+        rows = rule._extract_rows(path, _VALIDATION, "python")
+        assert rows is not None
+        storage.replace_file(path, "old", *rows)
+
+        storage.replace_file(path, "new", [], [], [])
+
+        assert storage.get_all_patterns() == []
+        assert not storage.needs_rescan(path, "new")
+        assert storage.needs_rescan(path, "old")
+        storage.close()
+
+    def test_other_schema_version_is_rebuilt(self, tmp_path: Path) -> None:
+        """An on-disk file from another schema version starts empty instead of failing."""
+        db_path = tmp_path / "st.db"
+        storage = StringlyTypedStorage("persistent", db_path=db_path)
+        storage.replace_file(tmp_path / "x.py", "hash", [], [], [])
+        storage.close()
+        with sqlite3.connect(db_path) as db:
+            db.execute("UPDATE schema_meta SET version = 0")
+
+        reopened = StringlyTypedStorage("persistent", db_path=db_path)
+
+        assert reopened.all_file_paths == set()
+        reopened.close()
+
+    def test_persistent_mode_requires_a_path(self) -> None:
+        """There is no implicit location for a persistent index at the storage level."""
+        with pytest.raises(ValueError, match="requires an explicit db_path"):
+            StringlyTypedStorage("persistent")
+
+    def test_string_set_hash_is_process_independent(self) -> None:
+        """Another interpreter with a different hash seed computes the same hash."""
+        script = (
+            "from src.linters.stringly_typed.hashing import compute_string_set_hash; "
+            "print(compute_string_set_hash({'staging', 'production'}))"
+        )
+        output = subprocess.run(  # nosec B603 - fixed arguments
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={"PYTHONHASHSEED": "12345"},
+            cwd=Path(__file__).parents[4],
+        ).stdout
+
+        assert int(output) == compute_string_set_hash({"production", "staging"})
@@ -0,0 +1,170 @@
+"""
+Purpose: Test the single-pass Python extraction and the batched finalize queries
+
+Scope: PythonStringlyTypedAnalyzer.analyze_all, collect_patterns and the
+    StringlyTypedStorage.iter_*_groups queries used by the violation generator
+
+Overview: A Python file is parsed and traversed once for all pattern kinds, and finalize reads each
+    table with one grouped query instead of a query per hash, function or variable. Verifies that
+    analyze_all returns exactly what the three per-kind methods return (including nested if/elif
+    chains and match statements, whose detection depends on traversal order), that no detector runs
+    its own NodeVisitor traversal, that each streamed group equals the per-key query for the same
+    key, and that the rule's finalize never issues a per-key query.
+
+Dependencies: pytest, unittest.mock, pathlib.Path, StringlyTypedRule, PythonStringlyTypedAnalyzer,
+    StringlyTypedStorage, FileLintContext
+
+Exports: TestAnalyzeAll, TestGroupedQueries test classes
+
+Interfaces: Exercises analyze_all, iter_duplicate_pattern_groups,
+    iter_limited_value_function_groups, iter_multi_value_variable_groups
+
+Implementation: Inline source samples and tmp_path files; per-key storage queries patched to fail
+"""
+
+import ast
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.linters.stringly_typed import StringlyTypedRule
+from src.linters.stringly_typed.python.analyzer import PythonStringlyTypedAnalyzer
+from src.linters.stringly_typed.storage import StringlyTypedStorage
+from src.orchestrator.core import FileLintContext
+
+_SAMPLE = """
+def route(env, mode, status):
+    if env == "dev":
+        setup("fast")
+    elif env == "staging":
+        if mode == "a" or mode == "b":
+            setup("slow")
+    elif env == "production":
+        setup("fast", level="x")
+    if status in ("open", "closed") and env != "prod":
+        notify("open")
+    match status:
+        case "open":
+            pass
+        case "closed":
+            pass
+"""
+
+_MODULE_A = """
+def check(env, status):
+    if env in ("staging", "production"):
+        deploy("blue")
+    if status == "open":
+        return True
+    return status == "closed"
+"""
+
+_MODULE_B = """
+def validate(env, status):
+    if env not in ("staging", "production"):
+        deploy("green")
+    return status == "merged"
+"""
+
+
+class TestAnalyzeAll:
+    """analyze_all matches the per-kind analysis in one traversal."""
+
+    def test_matches_per_kind_methods(self) -> None:
+        """Validation, call and comparison results equal the separate methods' results."""
+        analyzer = PythonStringlyTypedAnalyzer()
+        path = Path("sample.py")
+
+        validations, calls, comparisons = analyzer.analyze_all(_SAMPLE, path)
+
+        assert validations == analyzer.analyze(_SAMPLE, path)
+        assert calls == analyzer.analyze_function_calls(_SAMPLE, path)
+        assert comparisons == analyzer.analyze_comparisons(_SAMPLE, path)
+        assert validations and calls and comparisons
+
+    def test_detectors_do_not_traverse_on_their_own(self) -> None:
+        """The combined pass never enters a detector's NodeVisitor traversal."""
+        analyzer = PythonStringlyTypedAnalyzer()
+
+        with patch.object(ast.NodeVisitor, "visit", side_effect=AssertionError("traversed")):
+            validations, _, _ = analyzer.analyze_all(_SAMPLE, Path("sample.py"))
+
+        assert validations
+
+    def test_syntax_error_yields_nothing(self) -> None:
+        """Unparseable code produces empty results for every kind."""
+        assert PythonStringlyTypedAnalyzer().analyze_all("def (:", Path("x.py")) == ([], [], [])
+
+
+def _check_files(rule: StringlyTypedRule, tmp_path: Path, config: dict) -> None:
+    for name, source in (("module_a.py", _MODULE_A), ("module_b.py", _MODULE_B)):
+        path = tmp_path / name
+        path.write_text(source)
+        rule.check(FileLintContext(path, "python", source, {"stringly_typed": config}))
+
+
+@pytest.fixture
+def filled_storage(tmp_path: Path) -> StringlyTypedStorage:
+    """Storage holding the two sample modules' patterns, calls and comparisons."""
+    rule = StringlyTypedRule()
+    _check_files(rule, tmp_path, {})
+    return rule._active_storage
+
+
+class TestGroupedQueries:
+    """Each table is read with one grouped query."""
+
+    def test_pattern_groups_match_per_hash_queries(
+        self, filled_storage: StringlyTypedStorage
+    ) -> None:
+        """Every duplicate hash's group equals get_patterns_by_hash."""
+        groups = list(filled_storage.iter_duplicate_pattern_groups(min_files=2))
+
+        expected = [
+            filled_storage.get_patterns_by_hash(h)
+            for h in sorted(filled_storage.get_duplicate_hashes(min_files=2))
+        ]
+        assert groups == expected
+        assert groups
+
+    def test_function_groups_match_per_function_queries(
+        self, filled_storage: StringlyTypedStorage
+    ) -> None:
+        """Every limited-value function's group equals get_calls_by_function."""
+        groups = list(filled_storage.iter_limited_value_function_groups(2, 6, 1))
+
+        expected = [
+            (name, index, values, filled_storage.get_calls_by_function(name, index))
+            for name, index, values in filled_storage.get_limited_value_functions(2, 6, 1)
+        ]
+        assert groups == expected
+        assert groups
+
+    def test_variable_groups_match_per_variable_queries(
+        self, filled_storage: StringlyTypedStorage
+    ) -> None:
+        """Every multi-value variable's group equals get_comparisons_by_variable."""
+        groups = list(filled_storage.iter_multi_value_variable_groups(2, 1))
+
+        expected = [
+            (name, values, filled_storage.get_comparisons_by_variable(name))
+            for name, values in filled_storage.get_variables_with_multiple_values(2, 1)
+        ]
+        assert groups == expected
+        assert groups
+
+    def test_finalize_issues_no_per_key_queries(self, tmp_path: Path) -> None:
+        """Violations are produced without a follow-up query per group."""
+        rule = StringlyTypedRule()
+        _check_files(rule, tmp_path, {"require_cross_file": False})
+        per_key = ("get_patterns_by_hash", "get_calls_by_function", "get_comparisons_by_variable")
+
+        with (
+            patch.object(StringlyTypedStorage, per_key[0], side_effect=AssertionError),
+            patch.object(StringlyTypedStorage, per_key[1], side_effect=AssertionError),
+            patch.object(StringlyTypedStorage, per_key[2], side_effect=AssertionError),
+        ):
+            violations = rule.finalize()
+
+        assert violations
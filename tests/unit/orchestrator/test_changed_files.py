@@ -0,0 +1,219 @@
+"""
+Purpose: Test git changed-files runs (--changed-since / --staged)
+
+Scope: collect_change_set against a real git repository, iter_changed_violations,
+    and the global CLI options
+
+Overview: A changed-files run lints only the files git reports as changed under the requested
+    paths, while cross-file rules still compare them against the unchanged files. Verifies the
+    change set (merge-base diff plus uncommitted and untracked files, deleted files dropped, path
+    scoping, --no-recursive, staged-only), that a bad ref raises GitChangesError, that DRY still
+    finds a duplicate between a changed and an unchanged file and reports only the changed side,
+    that a warm persistent DRY index stands in for the unchanged files (their constants included),
+    and that the CLI options select the changed files end to end.
+
+Dependencies: pytest, subprocess, click.testing.CliRunner, src.orchestrator.git_changes,
+    src.orchestrator.changed_files, src.orchestrator.core.Orchestrator, src.cli.cli, DRYRule
+
+Exports: Test classes for the change set, the orchestrator run and the CLI options
+
+Interfaces: Exercises collect_change_set, ChangeSet.unchanged, iter_changed_violations
+
+Implementation: Builds a throwaway git repository in tmp_path with a main branch and a feature
+    commit; tests run from inside it via monkeypatch.chdir
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.linters.dry.linter import DRYRule, IndexStats
+from src.orchestrator.changed_files import iter_changed_violations
+from src.orchestrator.core import Orchestrator
+from src.orchestrator.git_changes import GitChangesError, collect_change_set
+
+_DUPLICATE_BODY = "\n".join(f"    value_{i} = compute({i})" for i in range(6))
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit_all(repo: Path, message: str) -> None:
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A repository with base.py, pkg/old.py and pkg/sub/deep.py committed on main."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "base.py").write_text(f"def handler():\n{_DUPLICATE_BODY}\n")
+    (tmp_path / "pkg" / "old.py").write_text("OLD = 1\n")
+    (tmp_path / "pkg" / "sub" / "deep.py").write_text("DEEP = 1\n")
+    _commit_all(tmp_path, "base")
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestCollectChangeSet:
+    """The changed files come from git, limited to the requested paths."""
+
+    def test_includes_committed_uncommitted_and_untracked_changes(self, repo: Path) -> None:
+        """Branch commits, working-tree edits and new files count; deletions do not."""
+        (repo / "pkg" / "committed.py").write_text("A = 1\n")
+        _commit_all(repo, "feature work")
+        (repo / "pkg" / "old.py").write_text("OLD = 2\n")
+        (repo / "pkg" / "untracked.py").write_text("B = 1\n")
+        (repo / "pkg" / "sub" / "deep.py").unlink()
+
+        change_set = collect_change_set([Path()], recursive=True, since="main")
+
+        assert sorted(change_set.changed) == [
+            Path("pkg/committed.py"),
+            Path("pkg/old.py"),
+            Path("pkg/untracked.py"),
+        ]
+        assert change_set.unchanged() == [Path("base.py")]
+
+    def test_changes_outside_the_paths_are_skipped(self, repo: Path) -> None:
+        """Only files under the requested paths are returned, spelled from those paths."""
+        (repo / "base.py").write_text("CHANGED = 1\n")
+        (repo / "pkg" / "old.py").write_text("OLD = 2\n")
+        (repo / "pkg" / "sub" / "deep.py").write_text("DEEP = 2\n")
+
+        change_set = collect_change_set([Path("pkg")], recursive=False, since="main")
+
+        assert change_set.changed == [Path("pkg/old.py")]
+
+    def test_staged_compares_the_index_with_head(self, repo: Path) -> None:
+        """--staged ignores unstaged edits and untracked files."""
+        (repo / "base.py").write_text("STAGED = 1\n")
+        _git(repo, "add", "base.py")
+        (repo / "pkg" / "old.py").write_text("UNSTAGED = 1\n")
+        (repo / "pkg" / "untracked.py").write_text("B = 1\n")
+
+        change_set = collect_change_set([Path()], recursive=True, staged=True)
+
+        assert change_set.changed == [Path("base.py")]
+
+    def test_unknown_ref_raises(self, repo: Path) -> None:
+        """A ref git cannot resolve is reported, not silently treated as no changes."""
+        with pytest.raises(GitChangesError):
+            collect_change_set([Path()], recursive=True, since="no-such-branch")
+
+
+def _dry_config(storage_mode: str, detect_constants: bool = False) -> dict:
+    return {
+        "dry": {
+            "enabled": True,
+            "min_duplicate_lines": 3,
+            "storage_mode": storage_mode,
+            "detect_duplicate_constants": detect_constants,
+            "ignore": [],
+        }
+    }
+
+
+def _changed_run(repo: Path, config: dict) -> tuple[list, DRYRule]:
+    orchestrator = Orchestrator(project_root=repo, config=config, rules=["dry"])
+    change_set = collect_change_set([Path()], recursive=True, since="main")
+    violations = list(iter_changed_violations(orchestrator, change_set))
+    rule = orchestrator.registry.get("dry.duplicate-code")
+    assert isinstance(rule, DRYRule)
+    return violations, rule
+
+
+class TestIterChangedViolations:
+    """Cross-file rules compare changed files against unchanged ones."""
+
+    def test_duplicate_of_unchanged_file_is_reported_in_changed_file_only(self, repo: Path) -> None:
+        """The new copy is flagged; the untouched original is not reported."""
+        (repo / "pkg" / "copy.py").write_text(f"def handler():\n{_DUPLICATE_BODY}\n")
+
+        violations, _ = _changed_run(repo, _dry_config("memory"))
+
+        assert violations
+        assert {v.file_path for v in violations} == {"pkg/copy.py"}
+        assert all("base.py" in v.message for v in violations)
+
+    def test_no_changes_reports_nothing(self, repo: Path) -> None:
+        """A clean branch lints no files."""
+        orchestrator = Orchestrator(project_root=repo, config=_dry_config("memory"), rules=["dry"])
+        change_set = collect_change_set([Path()], recursive=True, since="main")
+
+        assert change_set.changed == []
+        assert list(iter_changed_violations(orchestrator, change_set)) == []
+
+    def test_warm_persistent_index_stands_in_for_unchanged_files(self, repo: Path) -> None:
+        """Once the index holds the project, only the changed file is checked."""
+        full_run = Orchestrator(project_root=repo, config=_dry_config("persistent"), rules=["dry"])
+        assert list(full_run.iter_violations([Path()])) == []
+        (repo / "pkg" / "copy.py").write_text(f"def handler():\n{_DUPLICATE_BODY}\n")
+
+        violations, warm = _changed_run(repo, _dry_config("persistent"))
+
+        assert warm.index_stats == IndexStats(reused=0, rescanned=1)
+        assert {v.file_path for v in violations} == {"pkg/copy.py"}
+
+    def test_warm_persistent_index_supplies_unchanged_constants(self, repo: Path) -> None:
+        """Stored constants of unchanged files still expose a duplicate constant."""
+        config = _dry_config("persistent", detect_constants=True)
+        full_run = Orchestrator(project_root=repo, config=config, rules=["dry"])
+        assert list(full_run.iter_violations([Path()])) == []
+        (repo / "pkg" / "copy.py").write_text("OLD = 1\n")
+
+        violations, warm = _changed_run(repo, config)
+
+        assert warm.index_stats == IndexStats(reused=0, rescanned=1)
+        assert [v.file_path for v in violations] == ["pkg/copy.py"]
+        assert "old.py:1" in violations[0].message
+
+    def test_cold_persistent_index_is_filled_from_unchanged_files(self, repo: Path) -> None:
+        """Unchanged files missing from the index are checked once to fill it."""
+        (repo / "pkg" / "copy.py").write_text(f"def handler():\n{_DUPLICATE_BODY}\n")
+
+        violations, rule = _changed_run(repo, _dry_config("persistent"))
+
+        assert rule.index_stats == IndexStats(reused=0, rescanned=4)
+        assert {v.file_path for v in violations} == {"pkg/copy.py"}
+
+
+class TestChangedFilesCli:
+    """The global options switch linter commands to a changed-files run."""
+
+    def test_changed_since_lints_only_changed_files(self, repo: Path) -> None:
+        """An unchanged file's violations are not reported."""
+        _git(repo, "checkout", "-q", "main")
+        (repo / "legacy.py").write_text("def f():\n    return 3600\n")
+        _commit_all(repo, "legacy magic number")
+        _git(repo, "checkout", "-q", "-b", "topic")
+        (repo / "pkg" / "new.py").write_text("def g():\n    return 86400\n")
+
+        result = CliRunner().invoke(
+            cli, ["--changed-since", "main", "magic-numbers", "--format", "json", "."]
+        )
+
+        assert result.exit_code == 1
+        assert "pkg/new.py" in result.output
+        assert "legacy.py" not in result.output
+
+    def test_outside_a_repository_is_an_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without git history the run fails instead of linting nothing."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+        (tmp_path / "a.py").write_text("A = 1\n")
+
+        result = CliRunner().invoke(cli, ["--staged", "magic-numbers", "."])
+
+        assert result.exit_code == 2
+        assert "Cannot determine changed files" in result.output
@@ -0,0 +1,147 @@
+"""
+Purpose: Test the streaming violation pipeline of the orchestrator
+
+Scope: Orchestrator.iter_violations sequential and parallel behaviour
+
+Overview: iter_violations yields each file's violations right after that file is linted and the
+    rules' cross-file finalize() violations once at the end, instead of building one list for the
+    whole run. Verifies a file's violations are yielded before the next file is linted, finalize()
+    results come last and are produced once for a run mixing files and directories, missing paths
+    are skipped, and the parallel path yields the same violations as the sequential one.
+
+Dependencies: pytest, pathlib.Path, src.core.base, src.core.types, src.orchestrator.core
+
+Exports: TestIterViolations test class
+
+Interfaces: Exercises Orchestrator.iter_violations
+
+Implementation: Stub rule reporting one violation per checked file plus one finalize() violation,
+    registered directly on an orchestrator whose rule discovery is marked complete
+"""
+
+from pathlib import Path
+
+from src.core.base import BaseLintContext, BaseLintRule
+from src.core.types import Violation
+from src.orchestrator.core import Orchestrator
+
+
+class _PerFileRule(BaseLintRule):
+    """Stub rule: one violation per Python file and one cross-file violation at finalize()."""
+
+    def __init__(self) -> None:
+        self.checked: list[Path | None] = []
+        self.finalize_calls = 0
+
+    @property
+    def rule_id(self) -> str:
+        """Stub rule id."""
+        return "stub.per-file"
+
+    @property
+    def rule_name(self) -> str:
+        """Stub rule name."""
+        return "per-file stub"
+
+    @property
+    def description(self) -> str:
+        """Stub description."""
+        return "reports every file"
+
+    def check(self, context: BaseLintContext) -> list[Violation]:
+        """Report the file."""
+        self.checked.append(context.file_path)
+        return [self._violation(str(context.file_path))]
+
+    def finalize(self) -> list[Violation]:
+        """Report one cross-file violation."""
+        self.finalize_calls += 1
+        return [self._violation("<finalize>")]
+
+    def _violation(self, file_path: str) -> Violation:
+        return Violation(rule_id=self.rule_id, file_path=file_path, line=1, column=0, message="m")
+
+
+def _orchestrator_with(tmp_path: Path, rule: BaseLintRule) -> Orchestrator:
+    """Build an orchestrator whose registry holds only the given rule."""
+    orchestrator = Orchestrator(project_root=tmp_path, config={})
+    orchestrator.registry.register(rule)
+    orchestrator._rules_discovered = True
+    return orchestrator
+
+
+def _write_modules(directory: Path, count: int) -> list[Path]:
+    """Write count small Python files and return their paths."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = directory / f"mod_{index}.py"
+        path.write_text(f"x = {index}\n")
+        paths.append(path)
+    return paths
+
+
+class TestIterViolations:
+    """Orchestrator.iter_violations streams per-file results."""
+
+    def test_file_results_yielded_before_next_file_is_linted(self, tmp_path: Path) -> None:
+        """The first violation arrives after only the first file has been checked."""
+        paths = _write_modules(tmp_path, 3)
+        rule = _PerFileRule()
+        stream = _orchestrator_with(tmp_path, rule).iter_violations(paths)
+
+        first = next(stream)
+
+        assert first.file_path == str(paths[0])
+        assert rule.checked == [paths[0]]
+
+    def test_finalize_results_come_last(self, tmp_path: Path) -> None:
+        """Cross-file violations follow every per-file violation."""
+        paths = _write_modules(tmp_path, 3)
+
+        violations = list(_orchestrator_with(tmp_path, _PerFileRule()).iter_violations(paths))
+
+        assert [v.file_path for v in violations] == [str(p) for p in paths] + ["<finalize>"]
+
+    def test_files_and_directories_finalized_once(self, tmp_path: Path) -> None:
+        """A run over a file and a directory is one pass with a single finalize()."""
+        single = _write_modules(tmp_path / "a", 1)[0]
+        _write_modules(tmp_path / "b", 2)
+        rule = _PerFileRule()
+
+        violations = list(
+            _orchestrator_with(tmp_path, rule).iter_violations([single, tmp_path / "b"])
+        )
+
+        assert rule.finalize_calls == 1
+        assert len(violations) == 4
+
+    def test_missing_paths_are_skipped(self, tmp_path: Path) -> None:
+        """Paths that do not exist contribute nothing."""
+        rule = _PerFileRule()
+
+        violations = list(
+            _orchestrator_with(tmp_path, rule).iter_violations([tmp_path / "missing.py"])
+        )
+
+        assert rule.checked == []
+        assert [v.file_path for v in violations] == ["<finalize>"]
+
+    def test_parallel_matches_sequential(self, tmp_path: Path) -> None:
+        """Streaming through the worker pool yields the same violations."""
+        source = (
+            "def f(x):\n    if x:\n        for i in x:\n            if i:\n                pass\n"
+        )
+        paths = _write_modules(tmp_path, 8)
+        for path in paths[::2]:
+            path.write_text(source)
+        config = {"nesting": {"enabled": True, "max_nesting_depth": 2}}
+
+        def run(parallel: bool) -> list[tuple[str, int]]:
+            orchestrator = Orchestrator(project_root=tmp_path, config=config, rules=["nesting"])
+            stream = orchestrator.iter_violations(paths, parallel=parallel, max_workers=2)
+            return sorted((str(v.file_path), v.line) for v in stream)
+
+        sequential = run(parallel=False)
+        assert sequential
+        assert run(parallel=True) == sequential
@@ -0,0 +1,133 @@
+"""
+Purpose: Test language-aware rule dispatch in the orchestrator and rule registry
+
+Scope: BaseLintRule.supported_languages, RuleRegistry.rules_for_language, Orchestrator.lint_file
+
+Overview: Rules declare the languages they analyze and the registry keeps a language to rules
+    dispatch table, so the orchestrator only calls check() on rules that handle a file's language
+    and skips reading files no rule wants at all. Verifies rules are only dispatched their declared
+    languages, language-agnostic rules (supported_languages None) receive every file, undeclared
+    languages fall back to language-agnostic rules, multi-language rules only claim Rust when they
+    implement it, and a file with no applicable rule is never read from disk.
+
+Dependencies: pytest, pathlib.Path, unittest.mock, src.core.base, src.core.registry,
+    src.orchestrator.core
+
+Exports: TestRulesForLanguage, TestOrchestratorDispatch test classes
+
+Interfaces: Exercises RuleRegistry.rules_for_language and Orchestrator.lint_file
+
+Implementation: Recording stub rules registered directly on an orchestrator's registry, with
+    rule discovery marked complete so only the stubs run
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from src.core.base import BaseLintContext, BaseLintRule
+from src.core.registry import RuleRegistry
+from src.core.types import Violation
+from src.orchestrator.core import Orchestrator
+
+
+class _RecordingRule(BaseLintRule):
+    """Stub rule that records the files it was asked to check."""
+
+    def __init__(self, rule_id: str, languages: frozenset[str] | None) -> None:
+        self._rule_id = rule_id
+        self._languages = languages
+        self.checked: list[Path | None] = []
+
+    @property
+    def rule_id(self) -> str:
+        """Stub rule id."""
+        return self._rule_id
+
+    @property
+    def rule_name(self) -> str:
+        """Stub rule name."""
+        return self._rule_id
+
+    @property
+    def description(self) -> str:
+        """Stub description."""
+        return "records checked files"
+
+    @property
+    def supported_languages(self) -> frozenset[str] | None:
+        """Languages given at construction."""
+        return self._languages
+
+    def check(self, context: BaseLintContext) -> list[Violation]:
+        """Record the file and report nothing."""
+        self.checked.append(context.file_path)
+        return []
+
+
+def _orchestrator_with(tmp_path: Path, *rules: BaseLintRule) -> Orchestrator:
+    """Build an orchestrator whose registry holds only the given rules."""
+    orchestrator = Orchestrator(project_root=tmp_path, config={})
+    for rule in rules:
+        orchestrator.registry.register(rule)
+    orchestrator._rules_discovered = True
+    return orchestrator
+
+
+class TestRulesForLanguage:
+    """RuleRegistry dispatch table lookups."""
+
+    def test_declared_language_includes_agnostic_rules(self) -> None:
+        """A language maps to its declared rules plus language-agnostic ones, in order."""
+        python_rule = _RecordingRule("py", frozenset({"python"}))
+        any_rule = _RecordingRule("any", None)
+        rust_rule = _RecordingRule("rs", frozenset({"rust"}))
+        registry = RuleRegistry()
+        for rule in (python_rule, any_rule, rust_rule):
+            registry.register(rule)
+
+        assert registry.rules_for_language("python") == [python_rule, any_rule]
+        assert registry.rules_for_language("rust") == [any_rule, rust_rule]
+
+    def test_undeclared_language_falls_back_to_agnostic_rules(self) -> None:
+        """Languages no rule declares only reach language-agnostic rules."""
+        any_rule = _RecordingRule("any", None)
+        registry = RuleRegistry()
+        registry.register(_RecordingRule("py", frozenset({"python"})))
+        registry.register(any_rule)
+
+        assert registry.rules_for_language("markdown") == [any_rule]
+
+    def test_multi_language_rules_only_claim_rust_when_implemented(self) -> None:
+        """Nesting implements _check_rust; CQS does not."""
+        registry = RuleRegistry()
+        registry.discover_rules("src.linters", selection=["nesting", "cqs"])
+
+        rust_rule_ids = [rule.rule_id for rule in registry.rules_for_language("rust")]
+        assert rust_rule_ids == ["nesting.excessive-depth"]
+
+
+class TestOrchestratorDispatch:
+    """Orchestrator.lint_file only runs rules that handle the file's language."""
+
+    def test_rules_for_other_languages_are_not_called(self, tmp_path: Path) -> None:
+        """A Rust-only rule never sees a Python file."""
+        source = tmp_path / "module.py"
+        source.write_text("x = 1\n")
+        python_rule = _RecordingRule("py", frozenset({"python"}))
+        rust_rule = _RecordingRule("rs", frozenset({"rust"}))
+
+        _orchestrator_with(tmp_path, python_rule, rust_rule).lint_file(source)
+
+        assert python_rule.checked == [source]
+        assert rust_rule.checked == []
+
+    def test_file_without_applicable_rules_is_never_read(self, tmp_path: Path) -> None:
+        """A markdown file no rule handles is skipped before its content is read."""
+        readme = tmp_path / "README.md"
+        readme.write_text("# Title\n")
+        orchestrator = _orchestrator_with(tmp_path, _RecordingRule("py", frozenset({"python"})))
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("file was read")):
+            violations = orchestrator.lint_file(readme)
+
+        assert violations == []
@@ -86,7 +86,7 @@ class TestOrchestrator:
         import os
 
         from src.linter_config.ignore import IgnoreDirectiveParser
-        from src.orchestrator.core import _collect_files_fast
+        from src.orchestrator.file_collector import collect_files_fast
 
         visited_roots = []
         real_walk = os.walk
@@ -99,7 +99,7 @@ class TestOrchestrator:
         monkeypatch.setattr(os, "walk", spying_walk)
 
         ignore_parser = IgnoreDirectiveParser(tmp_path)
-        collected = _collect_files_fast(tmp_path, ignore_parser)
+        collected = collect_files_fast(tmp_path, ignore_parser)
 
         assert all("ignored_cache" not in str(p) for p in collected)
         assert not any("ignored_cache" in root for root in visited_roots)
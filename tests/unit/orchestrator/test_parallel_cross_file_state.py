@@ -4,17 +4,18 @@ Purpose: Regression test for parallel linting losing cross-file rule state
 Scope: Orchestrator.lint_files_parallel interaction with rules that override finalize()
 
 Overview: Guards against a correctness bug found while researching persistent DRY caching:
-    lint_files_parallel dispatches each file to a worker process via _lint_file_worker, and each
-    worker constructs its own fresh Orchestrator/DRYRule with an isolated in-memory store. Workers
-    always return [] for DRY (violations are deferred to finalize()). Back in the main process,
-    finalize() runs on a DRYRule instance that never had check() called on it (all processing
-    happened in throwaway worker processes), so its storage is never initialized and finalize()
-    short-circuits to []. Net effect: thai-lint dry --parallel silently reports zero duplicate-code
-    violations regardless of input. Verifies parallel execution finds the same cross-file duplicate
-    a sequential run finds, on a real DRYRule instance (not a mock), forcing enough files that the
-    parallel code path actually engages instead of falling back to sequential. Also covers
-    StringlyTypedRule, the only other rule in the codebase with a meaningful finalize(), which has
-    the exact same shape of bug.
+    lint_files_parallel dispatches files to worker processes (src.orchestrator.worker_pool), and
+    each worker constructs its own fresh Orchestrator/DRYRule with an isolated in-memory store.
+    Workers always return [] for DRY (violations are deferred to finalize()). Back in the main
+    process, finalize() runs on a DRYRule instance that never had check() called on it (all
+    processing happened in throwaway worker processes), so its storage is never initialized and
+    finalize() short-circuits to []. Net effect: thai-lint dry --parallel silently reports zero
+    duplicate-code violations regardless of input. Verifies parallel execution finds the same
+    cross-file duplicate a sequential run finds, on a real DRYRule instance (not a mock), forcing
+    enough files that the parallel code path actually engages instead of falling back to sequential,
+    including duplicate constants and "# dry:" ignore directives, whose per-file state workers
+    record in the shared store alongside the blocks. Also covers StringlyTypedRule, the only other
+    rule in the codebase with a meaningful finalize(), which has the exact same shape of bug.
 
 Dependencies: pytest, pathlib.Path, src.orchestrator.core.Orchestrator
 
@@ -55,6 +56,22 @@ def _dry_config() -> dict:
     return {"dry": {"enabled": True, "min_duplicate_lines": 3, "storage_mode": "memory"}}
 
 
+def _dry_sequential_and_parallel(tmp_path: Path, files: list[Path]) -> tuple[set, set]:
+    """Run DRY sequentially and in parallel; return each run's (file, line, message) set."""
+    runs = []
+    for parallel in (False, True):
+        orchestrator = Orchestrator(project_root=tmp_path, config=_dry_config())
+        violations = (
+            orchestrator.lint_files_parallel(files, max_workers=2)
+            if parallel
+            else orchestrator.lint_files(files)
+        )
+        runs.append(
+            {(v.file_path, v.line, v.message) for v in violations if v.rule_id.startswith("dry.")}
+        )
+    return runs[0], runs[1]
+
+
 class TestParallelCrossFileState:
     """Rules with cross-file state (finalize()) must work correctly under --parallel."""
 
@@ -77,6 +94,27 @@ class TestParallelCrossFileState:
             f"sequential found {len(dry_sequential)}: {dry_parallel} vs {dry_sequential}"
         )
 
+    def test_parallel_run_finds_same_duplicate_constants(self, tmp_path: Path) -> None:
+        """Constants extracted by workers are matched across files in the main process."""
+        files = _write_fixture(tmp_path)
+        files[2].write_text("API_TIMEOUT = 30\n")
+        files[3].write_text("API_TIMEOUT = 60\n")
+
+        sequential, parallel = _dry_sequential_and_parallel(tmp_path, files)
+
+        assert any("API_TIMEOUT" in message for _, _, message in sequential)
+        assert parallel == sequential
+
+    def test_parallel_run_honors_dry_ignore_directives(self, tmp_path: Path) -> None:
+        """An ignore-block directive parsed in a worker still suppresses the block."""
+        files = _write_fixture(tmp_path)
+        files[1].write_text(f"# dry: ignore-block\ndef handler_b():\n{DUPLICATE_BLOCK}\n")
+
+        sequential, parallel = _dry_sequential_and_parallel(tmp_path, files)
+
+        assert not any(str(files[1]) == path for path, _, _ in sequential)
+        assert parallel == sequential
+
 
 def _write_stringly_typed_fixture(tmp_path: Path) -> list[Path]:
     """Write a 4-file fixture: file_a/file_b share a membership-check pattern, c/d are filler."""
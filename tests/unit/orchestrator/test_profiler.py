@@ -0,0 +1,239 @@
+"""
+Purpose: Test per-rule and per-phase run profiling
+
+Scope: src.orchestrator.profiler RunProfile, Orchestrator profiling and worker batch profiles
+
+Overview: A profiled run records wall/CPU time per rule for check() and finalize(), the slowest
+    files of each rule, and the time spent discovering, reading, parsing and ignore-filtering files
+    and formatting the output. Verifies that nested measurements are exclusive, that the
+    slowest-files list is bounded and ordered, that merged and pickled profiles keep their timings,
+    that time_output charges only the consumer's time to output formatting, that an Orchestrator
+    with a profile times every selected rule and phase while one without records nothing, that
+    profile_batch returns a worker batch's profile and unpack_batch_result merges it into the
+    parent's, and that the Linter API keeps the latest profile.
+
+Dependencies: pickle, pytest, pathlib.Path, profiler, RunProfile, Orchestrator, worker_pool, Linter
+
+Exports: TestRunProfile, TestOrchestratorProfiling, TestWorkerProfiles, TestLinterProfile
+
+Interfaces: Exercises RunProfile.phase/rule_check/rule_finalize/time_output/merge/finish/to_dict,
+    Orchestrator.profile, profile_batch, unpack_batch_result, Linter(profile=True).last_profile
+
+Implementation: A fake clock patched over the profiler's perf_counter/process_time moves only when
+    a test advances it, so RunProfile timings are exact; real files under tmp_path
+"""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.api import Linter
+from src.orchestrator import profiler, worker_pool
+from src.orchestrator.core import Orchestrator
+from src.orchestrator.profiler import (
+    FILE_DISCOVERY,
+    FILE_READING,
+    IGNORE_FILTERING,
+    OUTPUT_FORMATTING,
+    PARSING,
+    RunProfile,
+)
+from src.orchestrator.worker_pool import init_worker, profile_batch, unpack_batch_result
+
+
+class _FakeClock:
+    """Stands in for perf_counter and process_time; only advance() moves it."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    """Drive the profiler's wall and CPU clocks by hand."""
+    fake = _FakeClock()
+    monkeypatch.setattr(profiler, "perf_counter", fake)
+    monkeypatch.setattr(profiler, "process_time", fake)
+    return fake
+
+
+def _write_modules(tmp_path: Path, count: int) -> list[Path]:
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"module_{index}.py"
+        path.write_text("def f(x):\n    if x:\n        return 1\n    return 0\n")
+        paths.append(path)
+    return paths
+
+
+class TestRunProfile:
+    """RunProfile bookkeeping."""
+
+    def test_nested_phase_is_not_charged_to_the_rule(self, clock: _FakeClock) -> None:
+        """A parse inside check() counts once, as parsing."""
+        profile = RunProfile()
+
+        with profile.rule_check("rule", "a.py"):
+            clock.advance(1.0)
+            with profile.phase(PARSING):
+                clock.advance(5.0)
+
+        assert profile.phases[PARSING].wall == 5.0
+        assert profile.phases[PARSING].cpu == 5.0
+        assert profile.rules["rule"].check.wall == 1.0
+        assert profile.rules["rule"].check.cpu == 1.0
+        assert profile.rules["rule"].check.calls == 1
+
+    def test_slowest_files_are_bounded_and_ordered(self) -> None:
+        """Only the N slowest files are kept, slowest first."""
+        profile = RunProfile(slowest_files=2)
+        rule = profile._rule("rule")
+        for wall, name in [(0.3, "c.py"), (0.1, "a.py"), (0.5, "e.py"), (0.2, "b.py")]:
+            rule.note_file(wall, name, profile.slowest_files)
+
+        assert rule.slowest_files() == [("e.py", 0.5), ("c.py", 0.3)]
+
+    def test_merge_adds_timings_and_keeps_slowest(self, clock: _FakeClock) -> None:
+        """Merging a pickled profile sums its timings into this one."""
+        worker = RunProfile(slowest_files=1)
+        with worker.rule_check("rule", "slow.py"):
+            clock.advance(1.0)
+        with worker.phase(FILE_READING):
+            pass
+        parent = RunProfile(slowest_files=1)
+        with parent.rule_check("rule", "fast.py"):
+            pass
+
+        parent.merge(pickle.loads(pickle.dumps(worker)))
+
+        assert parent.rules["rule"].check.calls == 2
+        assert parent.rules["rule"].check.wall == 1.0
+        assert parent.rules["rule"].slowest_files() == [("slow.py", 1.0)]
+        assert parent.phases[FILE_READING].calls == 1
+
+    def test_time_output_charges_only_the_consumer(self, clock: _FakeClock) -> None:
+        """Producing items is not output formatting; handling them is."""
+        profile = RunProfile()
+
+        def slow_items():
+            clock.advance(1.0)
+            yield 1
+
+        for _ in profile.time_output(slow_items()):
+            clock.advance(2.0)
+        profile.finish()
+
+        assert profile.phases[OUTPUT_FORMATTING].wall == 2.0
+        assert profile.total_wall == 3.0
+
+    def test_report_orders_rules_by_total_wall(self, clock: _FakeClock) -> None:
+        """The costliest rule comes first in the report."""
+        profile = RunProfile()
+        with profile.rule_check("cheap", None):
+            clock.advance(1.0)
+        with profile.rule_finalize("costly"):
+            clock.advance(2.0)
+
+        report = profile.to_dict()
+
+        assert list(report["rules"]) == ["costly", "cheap"]
+        assert report["rules"]["costly"]["finalize"]["calls"] == 1
+        assert report["rules"]["cheap"]["slowest_files"] == []
+
+
+class TestOrchestratorProfiling:
+    """The orchestrator times rules and phases only when it holds a profile."""
+
+    def test_profiled_run_times_rules_and_phases(self, tmp_path: Path) -> None:
+        """Every selected rule and every file phase is recorded."""
+        _write_modules(tmp_path, 3)
+        orchestrator = Orchestrator(tmp_path, {}, rules=["nesting", "dry"])
+        orchestrator.profile = RunProfile()
+
+        list(orchestrator.iter_violations([tmp_path]))
+
+        profile = orchestrator.profile
+        assert profile.rules["nesting.excessive-depth"].check.calls == 3
+        assert profile.rules["dry.duplicate-code"].finalize.calls == 1
+        assert len(profile.rules["nesting.excessive-depth"].slowest_files()) == 3
+        for phase in (FILE_DISCOVERY, FILE_READING, PARSING, IGNORE_FILTERING):
+            assert profile.phases[phase].calls >= 1
+
+    def test_unprofiled_run_records_nothing(self, tmp_path: Path) -> None:
+        """Without a profile no timing state is created."""
+        files = _write_modules(tmp_path, 2)
+        orchestrator = Orchestrator(tmp_path, {}, rules=["nesting"])
+
+        orchestrator.lint_files(files)
+
+        assert orchestrator.profile is None
+
+
+@pytest.fixture
+def reset_worker_state():
+    """Clear the per-process worker Orchestrator around a test."""
+    worker_pool._WORKER_ORCHESTRATOR = None
+    yield
+    worker_pool._WORKER_ORCHESTRATOR = None
+
+
+class TestWorkerProfiles:
+    """Parallel workers profile each batch for the parent to merge."""
+
+    def test_profile_batch_returns_the_batch_profile(
+        self, reset_worker_state: None, tmp_path: Path
+    ) -> None:
+        """The batch profile covers its files and the worker is left unprofiled."""
+        files = _write_modules(tmp_path, 2)
+        init_worker(tmp_path, {}, ("nesting",))
+
+        batch, profile = profile_batch(files)
+
+        assert len(batch) == 0
+        assert profile.rules["nesting.excessive-depth"].check.calls == 2
+        assert worker_pool._WORKER_ORCHESTRATOR is not None
+        assert worker_pool._WORKER_ORCHESTRATOR.profile is None
+
+    def test_unpack_merges_the_batch_profile(
+        self, reset_worker_state: None, tmp_path: Path
+    ) -> None:
+        """The parent gets the batch's violations and adds its timings to the run profile."""
+        files = _write_modules(tmp_path, 2)
+        init_worker(tmp_path, {}, ("nesting",))
+        parent = RunProfile()
+
+        batch = unpack_batch_result(profile_batch(files), parent)
+
+        assert len(batch) == 0
+        assert parent.rules["nesting.excessive-depth"].check.calls == 2
+
+
+class TestLinterProfile:
+    """Linter(profile=True) keeps the profile of its latest lint() call."""
+
+    def test_last_profile_is_set(self, tmp_path: Path) -> None:
+        """Each lint() call replaces last_profile with a finished profile."""
+        _write_modules(tmp_path, 2)
+        linter = Linter(project_root=tmp_path, profile=True)
+
+        linter.lint(tmp_path, rules=["nesting"])
+
+        assert linter.last_profile is not None
+        assert linter.last_profile.total_wall is not None
+        assert linter.last_profile.rules["nesting.excessive-depth"].check.calls == 2
+
+    def test_profile_off_by_default(self, tmp_path: Path) -> None:
+        """A plain Linter keeps no profile."""
+        _write_modules(tmp_path, 1)
+        linter = Linter(project_root=tmp_path)
+
+        linter.lint(tmp_path, rules=["nesting"])
+
+        assert linter.last_profile is None
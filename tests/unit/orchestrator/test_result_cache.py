@@ -0,0 +1,193 @@
+"""
+Purpose: Test the opt-in persistent per-file, per-rule result cache
+
+Scope: src.orchestrator.result_cache and its use by Orchestrator.lint_file
+
+Overview: Verifies the cache is off unless the config enables it, an unchanged file is served
+    from the cache on a later run without calling check(), a content change or a config change
+    re-checks the file, rules with cross-file state (finalize()) always run, a rule that crashed
+    is not cached, and real rules return identical violations from the cache.
+
+Dependencies: pytest, pathlib.Path, src.core.base, src.core.types, src.orchestrator
+
+Exports: TestResolveResultCachePath, TestResultCacheReuse test classes
+
+Interfaces: Exercises resolve_result_cache_path and Orchestrator.lint_file with result_cache set
+
+Implementation: Counting stub rules registered on fresh orchestrators that share one database
+"""
+
+from pathlib import Path
+
+from src.core.base import BaseLintContext, BaseLintRule
+from src.core.types import Violation
+from src.orchestrator.core import Orchestrator
+from src.orchestrator.result_cache import resolve_result_cache_path
+
+CACHE_CONFIG = {"result_cache": {"enabled": True}}
+
+
+class _CountingRule(BaseLintRule):
+    """Stub rule reporting one violation per file and counting check() calls."""
+
+    def __init__(self, rule_id: str = "stub.counting", fail: bool = False) -> None:
+        self._rule_id = rule_id
+        self._fail = fail
+        self.calls = 0
+
+    @property
+    def rule_id(self) -> str:
+        """Stub rule id."""
+        return self._rule_id
+
+    @property
+    def rule_name(self) -> str:
+        """Stub rule name."""
+        return self._rule_id
+
+    @property
+    def description(self) -> str:
+        """Stub description."""
+        return "counts checks"
+
+    def check(self, context: BaseLintContext) -> list[Violation]:
+        """Count the call and report the file's first line."""
+        self.calls += 1
+        if self._fail:
+            raise RuntimeError("rule crashed")
+        first_line = (context.file_content or "").splitlines()[0]
+        return [
+            Violation(
+                rule_id=self.rule_id,
+                file_path=str(context.file_path),
+                line=1,
+                column=0,
+                message=first_line,
+            )
+        ]
+
+
+class _CrossFileRule(_CountingRule):
+    """Stub rule with a finalize() hook, so its results must not be cached."""
+
+    def finalize(self) -> list[Violation]:
+        """Report nothing."""
+        return []
+
+
+def _lint(tmp_path: Path, path: Path, rule: BaseLintRule, config: dict) -> list[Violation]:
+    """Lint one file with a fresh orchestrator holding only the given rule."""
+    orchestrator = Orchestrator(project_root=tmp_path, config=config)
+    orchestrator.registry.register(rule)
+    orchestrator._rules_discovered = True
+    return orchestrator.lint_file(path)
+
+
+class TestResolveResultCachePath:
+    """Opt-in configuration of the cache location."""
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """No result_cache setting means no cache."""
+        assert resolve_result_cache_path({}, tmp_path) is None
+        assert resolve_result_cache_path({"result_cache": {"enabled": False}}, tmp_path) is None
+
+    def test_enabled_uses_project_cache_dir(self, tmp_path: Path) -> None:
+        """Enabled without a path stores under .thailint-cache in the project."""
+        expected = tmp_path / ".thailint-cache" / "results.db"
+        assert resolve_result_cache_path({"result_cache": True}, tmp_path) == expected
+        assert resolve_result_cache_path(CACHE_CONFIG, tmp_path) == expected
+
+    def test_custom_path_is_project_relative(self, tmp_path: Path) -> None:
+        """A configured path resolves against the project root."""
+        config = {"result_cache": {"enabled": True, "path": "build/lint.db"}}
+        assert resolve_result_cache_path(config, tmp_path) == tmp_path / "build" / "lint.db"
+
+
+class TestResultCacheReuse:
+    """Orchestrator.lint_file reuses cached results for unchanged files."""
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path: Path) -> None:
+        """The second run returns the same violations without calling check()."""
+        source = tmp_path / "module.py"
+        source.write_text("first\n")
+        first, second = _CountingRule(), _CountingRule()
+
+        expected = _lint(tmp_path, source, first, CACHE_CONFIG)
+        actual = _lint(tmp_path, source, second, CACHE_CONFIG)
+
+        assert (first.calls, second.calls) == (1, 0)
+        assert actual == expected
+
+    def test_changed_content_is_rechecked(self, tmp_path: Path) -> None:
+        """Editing the file invalidates its cached results."""
+        source = tmp_path / "module.py"
+        source.write_text("first\n")
+        _lint(tmp_path, source, _CountingRule(), CACHE_CONFIG)
+        source.write_text("second\n")
+        rule = _CountingRule()
+
+        violations = _lint(tmp_path, source, rule, CACHE_CONFIG)
+
+        assert rule.calls == 1
+        assert violations[0].message == "second"
+
+    def test_changed_config_is_rechecked(self, tmp_path: Path) -> None:
+        """Any config change invalidates cached results."""
+        source = tmp_path / "module.py"
+        source.write_text("first\n")
+        _lint(tmp_path, source, _CountingRule(), CACHE_CONFIG)
+        rule = _CountingRule()
+
+        _lint(tmp_path, source, rule, {**CACHE_CONFIG, "nesting": {"max_nesting_depth": 2}})
+
+        assert rule.calls == 1
+
+    def test_cross_file_rules_always_run(self, tmp_path: Path) -> None:
+        """Rules overriding finalize() are never served from the cache."""
+        source = tmp_path / "module.py"
+        source.write_text("first\n")
+        _lint(tmp_path, source, _CrossFileRule(), CACHE_CONFIG)
+        rule = _CrossFileRule()
+
+        _lint(tmp_path, source, rule, CACHE_CONFIG)
+
+        assert rule.calls == 1
+
+    def test_failed_rule_is_not_cached(self, tmp_path: Path) -> None:
+        """A crash is retried on the next run instead of being remembered as clean."""
+        source = tmp_path / "module.py"
+        source.write_text("first\n")
+        assert _lint(tmp_path, source, _CountingRule(fail=True), CACHE_CONFIG) == []
+        rule = _CountingRule()
+
+        _lint(tmp_path, source, rule, CACHE_CONFIG)
+
+        assert rule.calls == 1
+
+    def test_no_database_without_opt_in(self, tmp_path: Path) -> None:
+        """Without result_cache nothing is written to the project."""
+        source = tmp_path / "module.py"
+        source.write_text("first\n")
+
+        _lint(tmp_path, source, _CountingRule(), {})
+
+        assert not (tmp_path / ".thailint-cache").exists()
+
+    def test_real_rules_match_uncached_run(self, tmp_path: Path) -> None:
+        """Cached nesting violations equal a fresh, uncached run."""
+        source = tmp_path / "module.py"
+        source.write_text(
+            "def f(x):\n    if x:\n        for i in x:\n            if i:\n                pass\n"
+        )
+        config = {**CACHE_CONFIG, "nesting": {"enabled": True, "max_nesting_depth": 2}}
+        uncached = {"nesting": config["nesting"]}
+
+        def run(run_config: dict) -> list[Violation]:
+            orchestrator = Orchestrator(project_root=tmp_path, config=run_config, rules=["nesting"])
+            return orchestrator.lint_file(source)
+
+        run(config)
+        cached = run(config)
+
+        assert cached
+        assert cached == run(uncached)
@@ -0,0 +1,145 @@
+"""
+Purpose: Test that directory traversal prunes directories every selected rule ignores
+
+Scope: Orchestrator directory expansion with rule selections and BaseLintRule.ignored_path_patterns
+
+Overview: Only the global ignore patterns used to prune os.walk; a directory listed in a linter's
+    own `ignore:` was still enumerated and each file beneath it filtered out rule by rule.
+    Verifies that a single-linter run never walks into a directory its rule ignores, that the
+    directory is still walked when another selected rule may report there, when a negation
+    could re-include something inside it, or when no rule selection limits the run, and that a
+    rule whose languages ignore different paths offers no patterns.
+
+Dependencies: os, pytest, pathlib.Path, Orchestrator, NestingDepthRule, StringlyTypedRule
+
+Exports: TestRuleIgnorePruning, TestIgnoredPathPatterns test classes
+
+Interfaces: Exercises Orchestrator.iter_violations / lint_directory directory expansion and
+    MultiLanguageLintRule.ignored_path_patterns
+
+Implementation: Spies on os.walk to record every directory the traversal visits
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.linters.nesting.linter import NestingDepthRule
+from src.linters.stringly_typed.linter import StringlyTypedRule
+from src.orchestrator.core import Orchestrator
+
+
+@pytest.fixture
+def walked_roots(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every directory os.walk visits."""
+    visited: list[str] = []
+    real_walk = os.walk
+
+    def spying_walk(top, *args, **kwargs):
+        for root, dirs, files in real_walk(top, *args, **kwargs):
+            visited.append(root)
+            yield root, dirs, files
+
+    monkeypatch.setattr(os, "walk", spying_walk)
+    return visited
+
+
+def _write_tree(tmp_path: Path) -> Path:
+    """Write a source file and a generated directory, returning the generated directory."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("x = 1\n")
+    generated = tmp_path / "generated" / "deep"
+    generated.mkdir(parents=True)
+    (generated / "model.py").write_text("y = 2\n")
+    return tmp_path / "generated"
+
+
+def _walked_into(walked: list[str], directory: Path) -> bool:
+    return any(root.startswith(str(directory)) for root in walked)
+
+
+class TestRuleIgnorePruning:
+    """Directories are pruned only when every selected rule ignores them."""
+
+    def test_single_rule_ignore_prunes_walk(self, tmp_path: Path, walked_roots: list[str]) -> None:
+        """A directory the only selected rule ignores is never entered."""
+        generated = _write_tree(tmp_path)
+        config = {"nesting": {"ignore": ["**/generated/**"]}}
+
+        list(Orchestrator(tmp_path, config, rules=["nesting"]).iter_violations([tmp_path]))
+
+        assert not _walked_into(walked_roots, generated)
+        assert str(tmp_path / "src") in walked_roots
+
+    def test_lint_directory_prunes_walk(self, tmp_path: Path, walked_roots: list[str]) -> None:
+        """lint_directory applies the same pruning."""
+        generated = _write_tree(tmp_path)
+        config = {"nesting": {"ignore": ["**/generated/**"]}}
+
+        Orchestrator(tmp_path, config, rules=["nesting"]).lint_directory(tmp_path)
+
+        assert not _walked_into(walked_roots, generated)
+
+    def test_other_selected_rule_keeps_directory(
+        self, tmp_path: Path, walked_roots: list[str]
+    ) -> None:
+        """A directory one selected rule still checks is walked."""
+        generated = _write_tree(tmp_path)
+        config = {"nesting": {"ignore": ["**/generated/**"]}}
+
+        orchestrator = Orchestrator(tmp_path, config, rules=["nesting", "srp"])
+        list(orchestrator.iter_violations([tmp_path]))
+
+        assert _walked_into(walked_roots, generated)
+
+    def test_negation_keeps_directory(self, tmp_path: Path, walked_roots: list[str]) -> None:
+        """A rule pattern re-including a file beneath the directory keeps it walked."""
+        generated = _write_tree(tmp_path)
+        config = {"nesting": {"ignore": ["**/generated/**", "!**/model.py"]}}
+
+        list(Orchestrator(tmp_path, config, rules=["nesting"]).iter_violations([tmp_path]))
+
+        assert _walked_into(walked_roots, generated)
+
+    def test_unselected_run_keeps_directory(self, tmp_path: Path, walked_roots: list[str]) -> None:
+        """Without a rule selection, rule ignore lists do not prune the walk."""
+        generated = _write_tree(tmp_path)
+        config = {"nesting": {"ignore": ["**/generated/**"]}}
+
+        list(Orchestrator(tmp_path, config).iter_violations([tmp_path]))
+
+        assert _walked_into(walked_roots, generated)
+
+
+class TestIgnoredPathPatterns:
+    """Rules report the ignore patterns their check() applies."""
+
+    def test_reports_configured_patterns(self) -> None:
+        """The rule's configured ignore list is returned as-is."""
+        config = {"nesting": {"ignore": ["**/generated/**"]}}
+
+        assert NestingDepthRule().ignored_path_patterns(config) == ["**/generated/**"]
+
+    def test_disabled_rule_ignores_everything(self) -> None:
+        """A disabled rule reports on no path."""
+        assert NestingDepthRule().ignored_path_patterns({"nesting": {"enabled": False}}) == ["**"]
+
+    def test_unconfigured_rule_ignores_nothing(self) -> None:
+        """Without an ignore list the rule may report anywhere."""
+        assert NestingDepthRule().ignored_path_patterns({}) == []
+
+    def test_differing_language_overrides_offer_no_patterns(self) -> None:
+        """Languages ignoring different paths leave no single list to prune by."""
+        config = {"stringly_typed": {"ignore": ["a/**"], "python": {"ignore": ["b/**"]}}}
+
+        assert StringlyTypedRule().ignored_path_patterns(config) is None
+
+    def test_disabled_language_is_left_out(self) -> None:
+        """A language the config disables does not block the other languages' list."""
+        config = {"stringly_typed": {"ignore": ["a/**"], "python": {"enabled": False}}}
+
+        patterns = StringlyTypedRule().ignored_path_patterns(config)
+
+        assert patterns is not None
+        assert "a/**" in patterns
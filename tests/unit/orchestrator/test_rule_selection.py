@@ -0,0 +1,94 @@
+"""
+Purpose: Test that Orchestrator rule pre-selection only executes the requested rules
+
+Scope: Orchestrator(rules=...) across sequential and parallel linting plus the Linter API
+
+Overview: Single-linter commands used to run every registered rule on every file and then throw
+    away all but one linter's violations, so `thailint dry` paid for srp, nesting, magic numbers
+    and the rest. Verifies a rule selection keeps unselected rules out of the registry entirely:
+    they are never checked, never finalized, and produce no violations, both in-process and in
+    parallel worker processes. Also checks Linter.lint(rules=...) builds a pre-selected
+    orchestrator and reuses it across calls.
+
+Dependencies: pytest, pathlib.Path, src.orchestrator.core.Orchestrator, src.api.Linter
+
+Exports: TestOrchestratorRuleSelection, TestLinterRuleSelection test classes
+
+Interfaces: Exercises Orchestrator(rules=...).lint_files / lint_files_parallel and Linter.lint
+
+Implementation: Real rule discovery on small fixtures; parallel test forces the process pool path
+    by linting more files than twice the worker count
+"""
+
+from pathlib import Path
+
+from src.api import Linter
+from src.orchestrator.core import Orchestrator
+
+NOISY_SOURCE = """def handler(items):
+    total = ""
+    for item in items:
+        total += str(item) * 42
+        print(total)
+    return total
+"""
+
+
+def _write_files(tmp_path: Path, count: int) -> list[Path]:
+    """Write count copies of a file that trips several different linters."""
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"mod_{index}.py"
+        path.write_text(NOISY_SOURCE)
+        paths.append(path)
+    return paths
+
+
+class TestOrchestratorRuleSelection:
+    """Orchestrator(rules=...) registers and runs only the selected rules."""
+
+    def test_unselected_rules_are_not_registered(self, tmp_path: Path) -> None:
+        """Only the selected category reaches the registry."""
+        orchestrator = Orchestrator(project_root=tmp_path, config={}, rules=["magic-numbers"])
+        orchestrator.lint_files(_write_files(tmp_path, 1))
+
+        rule_ids = [rule.rule_id for rule in orchestrator.registry.list_all()]
+        assert rule_ids == ["magic-numbers.numeric-literal"]
+
+    def test_only_selected_rule_violations_are_produced(self, tmp_path: Path) -> None:
+        """Violations come exclusively from the selected rule."""
+        orchestrator = Orchestrator(
+            project_root=tmp_path, config={}, rules=["performance.string-concat-loop"]
+        )
+        violations = orchestrator.lint_files(_write_files(tmp_path, 1))
+
+        assert violations
+        assert {v.rule_id for v in violations} == {"performance.string-concat-loop"}
+
+    def test_selection_is_forwarded_to_parallel_workers(self, tmp_path: Path) -> None:
+        """Worker processes build their orchestrators with the same selection."""
+        orchestrator = Orchestrator(project_root=tmp_path, config={}, rules=["improper-logging"])
+        violations = orchestrator.lint_files_parallel(_write_files(tmp_path, 4), max_workers=2)
+
+        assert violations
+        assert all(v.rule_id.startswith("improper-logging.") for v in violations)
+
+
+class TestLinterRuleSelection:
+    """Linter.lint(rules=...) uses a pre-selected orchestrator."""
+
+    def test_lint_with_rules_uses_cached_selected_orchestrator(self, tmp_path: Path) -> None:
+        """The same rule list reuses one orchestrator that only knows those rules."""
+        (tmp_path / ".thailint.yaml").write_text("{}\n")
+        path = _write_files(tmp_path, 1)[0]
+        linter = Linter(project_root=tmp_path)
+
+        first = linter.lint(path, rules=["performance.string-concat-loop"])
+        linter.lint(path, rules=["performance.string-concat-loop"])
+
+        assert {v.rule_id for v in first} == {"performance.string-concat-loop"}
+        assert len(linter._selected_orchestrators) == 1
+        selected = next(iter(linter._selected_orchestrators.values()))
+        assert [r.rule_id for r in selected.registry.list_all()] == [
+            "performance.string-concat-loop"
+        ]
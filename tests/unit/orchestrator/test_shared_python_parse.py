@@ -0,0 +1,85 @@
+"""
+Purpose: Benchmark test guarding the one-parse-per-file guarantee of the shared Python AST cache
+
+Scope: Orchestrator.lint_file ast.parse usage across every registered Python rule
+
+Overview: Nearly every Python rule (magic_numbers, print_statements, method_property,
+    stateless_class, srp, cqs, lbyl, collection_pipeline, dry, stringly_typed, nesting,
+    performance, ...) needs the AST of the file being linted, and all of them share one memoized
+    parse. Lints the shared sample module through a real Orchestrator with every rule enabled and
+    counts ast.parse calls on the full file content, asserting it happens exactly once. Also
+    verifies FileLintContext exposes the memoized tree, parent map and cached SyntaxError.
+
+Dependencies: pytest, ast, typing.Any, unittest.mock, src.orchestrator.core, src.core.python_source
+
+Exports: TestSharedPythonParse, TestFileLintContextPythonCache test classes
+
+Interfaces: Exercises Orchestrator.lint_file and FileLintContext.python_ast/python_parent_map
+
+Implementation: Wraps ast.parse with a counter that only counts whole-file parses (snippet parses
+    inside individual analyzers are legitimate and excluded)
+"""
+
+import ast
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from src.core.python_source import clear_python_source_cache
+from src.orchestrator.core import FileLintContext, Orchestrator
+
+
+class TestSharedPythonParse:
+    """A Python file must be parsed once per run no matter how many rules need its AST."""
+
+    def test_lint_file_parses_file_content_once(
+        self, tmp_path: Path, python_sample: str, all_rules_config: dict[str, Any]
+    ) -> None:
+        """All Python rules share one ast.parse of the file being linted."""
+        sample = tmp_path / "sample.py"
+        sample.write_text(python_sample)
+        clear_python_source_cache()
+
+        original_parse = ast.parse
+        full_file_parses = 0
+
+        def counting(source, *args, **kwargs):
+            nonlocal full_file_parses
+            if source == python_sample:
+                full_file_parses += 1
+            return original_parse(source, *args, **kwargs)
+
+        orchestrator = Orchestrator(project_root=tmp_path, config=all_rules_config)
+        with patch("ast.parse", counting):
+            orchestrator.lint_files([sample])
+
+        assert full_file_parses == 1, f"expected one parse per file, got {full_file_parses}"
+
+
+class TestFileLintContextPythonCache:
+    """FileLintContext memoizes the AST, parent map, and syntax error."""
+
+    def test_python_ast_is_memoized(self, tmp_path: Path) -> None:
+        """Repeated access returns the same tree without re-parsing."""
+        context = FileLintContext(tmp_path / "a.py", "python", content="x = 1\n")
+
+        assert context.python_ast is not None
+        assert context.python_ast is context.python_ast
+        assert context.python_syntax_error is None
+
+    def test_parent_map_points_to_parents(self, tmp_path: Path) -> None:
+        """The memoized parent map links top-level statements to the module."""
+        context = FileLintContext(tmp_path / "a.py", "python", content="x = 1\n")
+
+        tree = context.python_ast
+        assert tree is not None
+        assign = tree.body[0]
+        assert context.python_parent_map[assign] is tree
+
+    def test_syntax_error_is_cached(self, tmp_path: Path) -> None:
+        """A file that fails to parse caches the error and yields no tree."""
+        context = FileLintContext(tmp_path / "a.py", "python", content="def broken(:\n")
+
+        assert context.python_ast is None
+        assert isinstance(context.python_syntax_error, SyntaxError)
+        assert context.python_parent_map == {}
@@ -0,0 +1,115 @@
+"""
+Purpose: Test the orchestrator's central suppression stage
+
+Scope: Ignore directives applied by the Orchestrator to check() and finalize() results
+
+Overview: The orchestrator applies every file's thailint ignore directives to the violations rules
+    return, so a rule does not need ignore handling of its own to honor them. Verifies with a
+    stub rule that has none that inline, next-line and ignore-file directives drop its per-file
+    violations, that cross-file finalize() violations are suppressed by the directives of the
+    file they point at, and that a rule reporting on directives themselves
+    (honors_ignore_directives = False) keeps its violations.
+
+Dependencies: pathlib.Path, src.core.base, src.core.types, src.orchestrator.core
+
+Exports: TestSuppressionStage test class
+
+Interfaces: Exercises Orchestrator.lint_files and BaseLintRule.honors_ignore_directives
+
+Implementation: Stub rule reporting every line containing "flag" (and, at finalize(), the first
+    line of every checked file), registered directly on an orchestrator whose rule discovery is
+    marked complete
+"""
+
+from pathlib import Path
+
+from src.core.base import BaseLintContext, BaseLintRule
+from src.core.types import Violation
+from src.orchestrator.core import Orchestrator
+
+
+class _FlagRule(BaseLintRule):
+    """Stub rule without ignore handling: flags lines containing "flag"."""
+
+    def __init__(self, honors_directives: bool = True) -> None:
+        self._honors_directives = honors_directives
+        self._seen: list[str] = []
+
+    @property
+    def rule_id(self) -> str:
+        """Stub rule id."""
+        return "stub.marker"
+
+    @property
+    def rule_name(self) -> str:
+        """Stub rule name."""
+        return "flag stub"
+
+    @property
+    def description(self) -> str:
+        """Stub description."""
+        return "flags lines"
+
+    @property
+    def honors_ignore_directives(self) -> bool:
+        """Configurable for the opt-out test."""
+        return self._honors_directives
+
+    def check(self, context: BaseLintContext) -> list[Violation]:
+        """Flag every line containing "flag"."""
+        self._seen.append(str(context.file_path))
+        lines = (context.file_content or "").splitlines()
+        return [
+            self._violation(str(context.file_path), number)
+            for number, line in enumerate(lines, 1)
+            if "flag" in line
+        ]
+
+    def finalize(self) -> list[Violation]:
+        """Report the first line of every checked file."""
+        return [self._violation(file_path, 1) for file_path in self._seen]
+
+    def _violation(self, file_path: str, line: int) -> Violation:
+        return Violation(
+            rule_id=self.rule_id, file_path=file_path, line=line, column=0, message="m"
+        )
+
+
+def _lint(tmp_path: Path, source: str, rule: _FlagRule) -> list[Violation]:
+    path = tmp_path / "module.py"
+    path.write_text(source)
+    orchestrator = Orchestrator(project_root=tmp_path, config={})
+    orchestrator.registry.register(rule)
+    orchestrator._rules_discovered = True
+    return orchestrator.lint_files([path])
+
+
+class TestSuppressionStage:
+    """Ignore directives apply to every rule's results in one place."""
+
+    def test_inline_and_next_line_directives_drop_check_violations(self, tmp_path: Path) -> None:
+        """Only the unsuppressed line of the rule's per-file violations remains."""
+        source = (
+            "a = 'flag'  # thailint: ignore[stub.marker]\n"
+            "# thailint: ignore-next-line[stub.marker]\n"
+            "b = 'flag'\n"
+            "c = 'flag'\n"
+        )
+
+        violations = _lint(tmp_path, source, _FlagRule())
+
+        assert [v.line for v in violations if v.line != 1] == [4]
+
+    def test_ignore_file_drops_finalize_violations(self, tmp_path: Path) -> None:
+        """Cross-file violations honor the directives of the file they report on."""
+        source = "# thailint: ignore-file[stub.marker]\nx = 'flag'\n"
+
+        assert _lint(tmp_path, source, _FlagRule()) == []
+
+    def test_rules_reporting_on_directives_can_opt_out(self, tmp_path: Path) -> None:
+        """A rule with honors_ignore_directives False keeps every violation."""
+        source = "a = 'flag'  # thailint: ignore\n"
+
+        violations = _lint(tmp_path, source, _FlagRule(honors_directives=False))
+
+        assert len(violations) == 2
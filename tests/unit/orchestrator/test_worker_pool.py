@@ -0,0 +1,169 @@
+"""
+Purpose: Tests for the long-lived parallel worker pool and size-balanced batch planning
+
+Scope: src.orchestrator.worker_pool init_worker, lint_batch and plan_balanced_batches
+
+Overview: Verifies batch planning covers every file exactly once, caps the batch count at the
+    worker budget, and balances total size across batches; that a worker's Orchestrator is built
+    once by init_worker and reused for every batch; that one failing file does not discard the
+    rest of its batch; and that lint_files_parallel through the pool matches a sequential run.
+
+Dependencies: pytest, unittest.mock, src.core.types, src.orchestrator.worker_pool,
+    src.orchestrator.core
+
+Exports: TestPlanBalancedBatches, TestWorkerState, TestParallelMatchesSequential test classes
+
+Interfaces: Exercises the public worker_pool functions and Orchestrator.lint_files_parallel
+
+Implementation: Real files under tmp_path for sizing; init_worker/lint_batch called in-process
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.core.types import Violation
+from src.orchestrator import worker_pool
+from src.orchestrator.core import Orchestrator
+from src.orchestrator.worker_pool import (
+    BATCHES_PER_WORKER,
+    init_worker,
+    lint_batch,
+    plan_balanced_batches,
+)
+
+
+def _write_sized_files(tmp_path: Path, sizes: list[int]) -> list[Path]:
+    """Write one file per requested size and return their paths."""
+    paths = []
+    for index, size in enumerate(sizes):
+        path = tmp_path / f"file_{index}.py"
+        path.write_text("x" * size)
+        paths.append(path)
+    return paths
+
+
+@pytest.fixture
+def reset_worker_state():
+    """Clear the per-process worker Orchestrator around a test."""
+    worker_pool._WORKER_ORCHESTRATOR = None
+    yield
+    worker_pool._WORKER_ORCHESTRATOR = None
+
+
+class TestPlanBalancedBatches:
+    """Size-balanced batch planning."""
+
+    def test_every_file_assigned_exactly_once(self, tmp_path):
+        """Every input file lands in exactly one batch."""
+        paths = _write_sized_files(tmp_path, [10 * (i + 1) for i in range(37)])
+        batches = plan_balanced_batches(paths, worker_count=3)
+        assigned = [p for batch in batches for p in batch]
+        assert sorted(assigned) == sorted(paths)
+
+    def test_batch_count_capped_by_worker_budget(self, tmp_path):
+        """Many files yield BATCHES_PER_WORKER batches per worker."""
+        paths = _write_sized_files(tmp_path, [5] * 100)
+        assert len(plan_balanced_batches(paths, worker_count=2)) == 2 * BATCHES_PER_WORKER
+
+    def test_fewer_files_than_batches_yields_one_file_each(self, tmp_path):
+        """Never more batches than files, and no empty batches."""
+        paths = _write_sized_files(tmp_path, [5, 6, 7])
+        batches = plan_balanced_batches(paths, worker_count=4)
+        assert sorted(len(b) for b in batches) == [1, 1, 1]
+
+    def test_large_file_not_stacked_with_others(self, tmp_path):
+        """A dominant file gets a batch of its own, listed first."""
+        paths = _write_sized_files(tmp_path, [1000] + [10] * 15)
+        batches = plan_balanced_batches(paths, worker_count=1)
+        heaviest = batches[0]
+        assert heaviest == [paths[0]]
+
+    def test_totals_are_balanced(self, tmp_path):
+        """Batch totals differ by at most the largest single file."""
+        sizes = [300, 250, 200, 150, 100, 100, 50, 50]
+        paths = _write_sized_files(tmp_path, sizes)
+        batches = plan_balanced_batches(paths, worker_count=1)
+        totals = [sum(p.stat().st_size for p in batch) for batch in batches]
+        assert max(totals) - min(totals) <= max(sizes)
+
+    def test_missing_file_still_assigned(self, tmp_path):
+        """Files that cannot be stat'ed are still linted."""
+        missing = tmp_path / "gone.py"
+        batches = plan_balanced_batches([missing], worker_count=2)
+        assert batches == [[missing]]
+
+    def test_no_files(self):
+        """No files yields no batches."""
+        assert plan_balanced_batches([], worker_count=4) == []
+
+
+class TestWorkerState:
+    """Per-process Orchestrator built once and reused across batches."""
+
+    def test_lint_batch_requires_initializer(self, reset_worker_state, tmp_path):
+        """lint_batch outside an initialized worker fails loudly."""
+        with pytest.raises(RuntimeError):
+            lint_batch([tmp_path / "a.py"])
+
+    def test_orchestrator_built_once_for_many_batches(self, reset_worker_state, tmp_path):
+        """Batches reuse the Orchestrator built by init_worker."""
+        paths = _write_sized_files(tmp_path, [5, 5, 5, 5])
+        init_worker(tmp_path, {}, ("nesting",))
+        orchestrator = worker_pool._WORKER_ORCHESTRATOR
+        with patch("src.orchestrator.core.Orchestrator", side_effect=AssertionError("rebuilt")):
+            lint_batch(paths[:2])
+            lint_batch(paths[2:])
+        assert worker_pool._WORKER_ORCHESTRATOR is orchestrator
+
+    def test_failing_file_does_not_drop_batch(self, reset_worker_state, tmp_path):
+        """An error on one file keeps the rest of the batch's results."""
+        init_worker(tmp_path, {}, None)
+        orchestrator = worker_pool._WORKER_ORCHESTRATOR
+        assert orchestrator is not None
+        paths = [tmp_path / "bad.py", tmp_path / "good.py"]
+        sentinel = Violation(rule_id="x", file_path="good.py", line=1, column=0, message="m")
+
+        def fake_lint_file(path):
+            if path.name == "bad.py":
+                raise ValueError("boom")
+            return [sentinel]
+
+        with patch.object(orchestrator, "lint_file", side_effect=fake_lint_file):
+            assert lint_batch(paths).to_violations() == [sentinel]
+
+
+class TestParallelMatchesSequential:
+    """lint_files_parallel through the pool reports the same violations as a sequential run."""
+
+    def test_same_violations(self, tmp_path):
+        """Parallel and sequential runs find identical violations."""
+        nested = "\n".join(
+            [
+                "def f(x):",
+                "    if x:",
+                "        for i in x:",
+                "            if i:",
+                "                while i:",
+                "                    pass",
+                "",
+            ]
+        )
+        paths = []
+        for index in range(8):
+            path = tmp_path / f"mod_{index}.py"
+            path.write_text(nested if index % 2 else "def ok():\n    return 1\n")
+            paths.append(path)
+        config = {"nesting": {"enabled": True, "max_nesting_depth": 2}}
+
+        sequential = Orchestrator(project_root=tmp_path, config=config, rules=["nesting"])
+        expected = [v for p in paths for v in sequential.lint_file(p)]
+        parallel = Orchestrator(project_root=tmp_path, config=config, rules=["nesting"])
+        actual = parallel.lint_files_parallel(paths, max_workers=2)
+
+        def key(v):
+            return (v.file_path, v.line, v.rule_id)
+
+        assert expected
+        assert sorted(actual, key=key) == sorted(expected, key=key)
@@ -30,6 +30,7 @@ Implementation: Loads the manifest once, then asserts per-hook invariants and cr
 
 from pathlib import Path
 
+import click
 import pytest
 import yaml
 
@@ -115,10 +116,11 @@ class TestEntryCommandCoverage:
 
     def test_entry_subcommands_are_registered(self, hooks):
         """Each entry subcommand must be a real, registered CLI command."""
-        registered = set(cli.commands.keys())
+        ctx = click.Context(cli)
         for hook in hooks:
             subcommand = hook["entry"].split()[1]
-            assert subcommand in registered, f"{hook['id']}: unknown command {subcommand!r}"
+            command = cli.get_command(ctx, subcommand)
+            assert command is not None, f"{hook['id']}: unknown command {subcommand!r}"
 
     def test_no_deprecated_commands_referenced(self, hooks):
         """Manifest must not surface deprecated aliases to consumers."""